@@ -24,12 +24,12 @@ def test_import_csv(tc):
     f = tc.frame.import_csv(path, header=True)
     assert(f.count() == 10)
     assert(len(f.schema) == 4)
-    assert(f.schema == [("string_column", str),
+    # the frame is scala-backed, and string columns come back from the JVM schema as unicode
+    assert(f.schema == [("string_column", unicode),
                         ("integer_column", int),
                         ("float_column", float),
                         ("datetime_column", dtypes.datetime)])
-    assert(f._is_python)
-    # Make sure that we can go to scala (let's do that by binning the integer column)]
+    assert(f._is_scala)
     f.bin_column("integer_column", [0,25,50,75,100])
     assert(len(f.schema) == 5)
     assert(f._is_scala)
@@ -48,7 +48,7 @@ def test_import_csv_with_custom_schema(tc):
     schema = [("a",int),("b",str),("c",int),("d",int),("e",str),("f",str)]
     f = tc.frame.import_csv(path, "|", header=True, schema=schema)
     assert(f.count() == 20)
-    assert(f.schema == schema)
+    assert(f.schema == [("a",int),("b",unicode),("c",int),("d",int),("e",unicode),("f",unicode)])
 
 def test_import_csv_with_custom_schema_parse_error(tc):
     # Test with good schema, but bad values in file --bad values should render as None
@@ -65,7 +65,7 @@ def test_import_csv_with_no_header(tc):
     f = tc.frame.import_csv(path, header=False)
     assert(f.count() == 10)
     assert(len(f.schema) == 4)
-    assert(f.schema == [('C0', str), ('C1', int), ('C2', float), ('C3', dtypes.datetime)])
+    assert(f.schema == [('C0', unicode), ('C1', int), ('C2', float), ('C3', dtypes.datetime)])
 
 def test_import_csv_with_column_names(tc):
     path = "../datasets/noheader.csv"
@@ -74,7 +74,7 @@ def test_import_csv_with_column_names(tc):
     f = tc.frame.import_csv(path, header=False, schema=column_names)
     assert(f.count() == 10)
     assert(len(f.schema) == 4)
-    assert(f.schema == [('a', str), ('b', int), ('c', float), ('d', dtypes.datetime)])
+    assert(f.schema == [('a', unicode), ('b', int), ('c', float), ('d', dtypes.datetime)])
 
 def test_import_csv_with_invalid_header(tc):
     path = "../datasets/cities.csv"
@@ -116,15 +116,15 @@ def test_import_with_unsupported_type(tc):
     # Specify the boolean column as a string instead.  This should pass
     frame = tc.frame.import_csv(path, ",", schema=schema)
     assert(frame.count() == 5)
-    assert(frame.schema == schema)
+    assert(frame.schema == [("id", int), ("name", unicode), ("bool", unicode), ("day", unicode)])
 
 def test_frame_loading_multiple_files_with_wildcard(tc):
         frame = tc.frame.import_csv("../datasets/movie-part*.csv", header=True)
         assert(frame.schema == [('user', int),
-                                ('vertex_type', str),
+                                ('vertex_type', unicode),
                                 ('movie', int),
                                 ('weight', int),
-                                ('edge_type', str)])
+                                ('edge_type', unicode)])
         assert(frame.take(frame.count()) == [[1, 'L', -131, 0, 'tr'],
                                                     [-131, 'R', 1, 0, 'tr'],
                                                     [1, 'L', -300, 2, 'tr'],
@@ -0,0 +1,105 @@
+# vim: set encoding=utf-8
+
+#  Copyright (c) 2016 Intel Corporation 
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+"""
+Report of the frames persisted with frame.persist (see tc.cache_report)
+"""
+
+from sparktk.propobj import PropertiesObject
+from sparktk.atable import ATable
+
+
+class CacheReport(list):
+    """List of CachedFrameInfo, which prints as a table"""
+
+    _schema = [("rdd_id", int),
+               ("storage_level", str),
+               ("cached_partitions", str),
+               ("memory_size", long),
+               ("disk_size", long),
+               ("reuse_count", int)]
+
+    def __str__(self):
+        rows = [[item.rdd_id,
+                 item.storage_level,
+                 "%s/%s" % (item.num_cached_partitions, item.num_partitions),
+                 item.memory_size,
+                 item.disk_size,
+                 item.reuse_count] for item in self]
+        return str(ATable(rows, self._schema, 0))
+
+    def __repr__(self):
+        return str(self)
+
+
+class CachedFrameInfo(PropertiesObject):
+    """Cache information for the data of one persisted frame"""
+
+    def __init__(self, scala_result):
+        self._rdd_id = scala_result.rddId()
+        self._description = scala_result.description()
+        self._storage_level = scala_result.storageLevel()
+        self._num_partitions = scala_result.numPartitions()
+        self._num_cached_partitions = scala_result.numCachedPartitions()
+        self._memory_size = scala_result.memorySize()
+        self._disk_size = scala_result.diskSize()
+        self._reuse_count = scala_result.reuseCount()
+
+    @property
+    def rdd_id(self):
+        """id of the persisted RDD"""
+        return self._rdd_id
+
+    @property
+    def description(self):
+        """RDD description, including where it was created"""
+        return self._description
+
+    @property
+    def storage_level(self):
+        """storage level description"""
+        return self._storage_level
+
+    @property
+    def num_partitions(self):
+        """number of partitions"""
+        return self._num_partitions
+
+    @property
+    def num_cached_partitions(self):
+        """number of partitions currently cached (0 until the first action computes the frame)"""
+        return self._num_cached_partitions
+
+    @property
+    def memory_size(self):
+        """bytes held in memory"""
+        return self._memory_size
+
+    @property
+    def disk_size(self):
+        """bytes held on disk"""
+        return self._disk_size
+
+    @property
+    def reuse_count(self):
+        """number of actions which read the cached data after the one that first computed it"""
+        return self._reuse_count
+
+
+def get_cache_report(tc):
+    """returns the CacheReport for the frames currently persisted in the given TkContext"""
+    scala_report = tc.sc._jvm.org.trustedanalytics.sparktk.frame.internal.FrameCache.report(tc.sc._jsc.sc())
+    return CacheReport([CachedFrameInfo(item) for item in tc.jutils.convert.from_scala_seq(scala_report)])
@@ -0,0 +1,197 @@
+# vim: set encoding=utf-8
+
+#  Copyright (c) 2016 Intel Corporation 
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+"""
+Columnar record batches for moving frame data between the Scala and Python backends
+
+A batch is a list [num_rows, column_0, column_1, ...], where each column is [validity, payload].  The
+validity is None when the column has no missing values, otherwise a bytearray with one byte per row
+(1 = present).  The payload depends on the column's data type:
+
+    int32             little-endian 4 byte ints
+    int64, datetime   little-endian 8 byte longs (datetime as ms since epoch)
+    float64           little-endian 8 byte doubles
+    vector(n)         little-endian 8 byte doubles, n per row
+    str/unicode       list of strings
+    matrix            list of [num_rows, num_cols, little-endian 8 byte doubles in row-major order]
+
+(see org.trustedanalytics.sparktk.frame.internal.rdd.ColumnarBatch for the Scala side)
+"""
+
+import numpy as np
+from datetime import datetime
+
+from sparktk.dtypes import dtypes, datetime_to_ms, _Vector, _Matrix
+
+# when False, frame backend conversions use the row-at-a-time pickle bridge
+enabled = True
+
+default_batch_size = 4096
+
+_fixed_width_numpy_types = {
+    int: '<i4',
+    long: '<i8',
+    datetime: '<i8',
+    float: '<f8',
+}
+
+
+def get_fixed_width_numpy_type(data_type):
+    """returns the numpy type of a fixed-width column's payload, or None if the data type is not fixed-width"""
+    return _fixed_width_numpy_types.get(dtypes.get_from_type(data_type), None)
+
+
+def _to_ms(value):
+    if isinstance(value, datetime):
+        return datetime_to_ms(value)
+    return dtypes.cast(value, datetime)
+
+
+def _to_cell(value, data_type, numpy_type):
+    """converts a value to what the column's payload holds, or None if it cannot be converted to the data type"""
+    if value is None:
+        return None
+    try:
+        if data_type is datetime:
+            return _to_ms(value)
+        if numpy_type is not None:
+            return dtypes.cast(value, data_type)
+        if isinstance(data_type, _Vector):
+            v = data_type.constructor(value)
+            return v if v.shape == (data_type.length,) else None
+        if isinstance(data_type, _Matrix):
+            m = np.array(value, dtype='<f8')
+            return m if m.ndim == 2 else None
+        return value
+    except Exception:
+        return None
+
+
+def _encode_column(values, data_type):
+    numpy_type = get_fixed_width_numpy_type(data_type)
+    values = [_to_cell(v, data_type, numpy_type) for v in values]
+    validity = None
+    if any(v is None for v in values):
+        validity = bytearray(0 if v is None else 1 for v in values)
+
+    if numpy_type is not None:
+        payload = bytearray(np.array([0 if v is None else v for v in values], dtype=numpy_type).tostring())
+    elif isinstance(data_type, _Vector):
+        zeros = np.zeros(data_type.length, dtype=np.float64)
+        array = np.array([zeros if v is None else v for v in values], dtype='<f8')
+        payload = bytearray(array.tostring())
+    elif isinstance(data_type, _Matrix):
+        payload = [None if m is None else [m.shape[0], m.shape[1], bytearray(m.tostring(order='C'))] for m in values]
+    else:
+        payload = values
+    return [validity, payload]
+
+
+def _decode_column(column, num_rows, data_type):
+    validity, payload = column
+    numpy_type = get_fixed_width_numpy_type(data_type)
+    if numpy_type is not None:
+        values = np.frombuffer(payload, dtype=numpy_type, count=num_rows).tolist()
+    elif isinstance(data_type, _Vector):
+        values = list(np.frombuffer(payload, dtype='<f8').reshape(num_rows, data_type.length).astype(np.float64))
+    elif isinstance(data_type, _Matrix):
+        values = [None if cell is None else np.frombuffer(cell[2], dtype='<f8').reshape(cell[0], cell[1]).astype(np.float64)
+                  for cell in payload]
+    else:
+        values = list(payload)
+    if validity is not None:
+        for i, present in enumerate(validity):
+            if not present:
+                values[i] = None
+    return values
+
+
+def encode_batch(rows, schema):
+    """packs a list of rows (lists of values) into a columnar record batch"""
+    batch = [len(rows)]
+    for index, (name, data_type) in enumerate(schema):
+        batch.append(_encode_column([row[index] for row in rows], data_type))
+    return batch
+
+
+def decode_batch(batch, schema):
+    """unpacks a columnar record batch into a list of rows (lists of values)"""
+    num_rows = batch[0]
+    columns = [_decode_column(batch[index + 1], num_rows, data_type) for index, (name, data_type) in enumerate(schema)]
+    return [list(row) for row in zip(*columns)] if columns else [[] for i in xrange(num_rows)]
+
+
+def decode_batch_arrays(batch, schema):
+    """
+    unpacks a columnar record batch into one (values, missing) pair per column, without building rows
+
+    For fixed-width columns, values is a numpy array viewing the payload (missing rows hold 0) and missing is a
+    boolean numpy array, or None if no values are missing.  For other columns, values is a list which already
+    has None for the missing rows, and missing is None.
+    """
+    num_rows = batch[0]
+    arrays = []
+    for index, (name, data_type) in enumerate(schema):
+        validity, payload = batch[index + 1]
+        numpy_type = get_fixed_width_numpy_type(data_type)
+        if numpy_type is not None:
+            missing = None if validity is None else np.frombuffer(validity, dtype=np.uint8, count=num_rows) == 0
+            arrays.append((np.frombuffer(payload, dtype=numpy_type, count=num_rows), missing))
+        else:
+            arrays.append((_decode_column(batch[index + 1], num_rows, data_type), None))
+    return arrays
+
+
+def encode_column_array(values, data_type, missing=None):
+    """
+    packs one column of values into a batch column without building rows
+
+    For fixed-width columns, values may be a numpy array already holding the payload values (datetimes as ms since
+    epoch), with missing an optional boolean numpy array marking the missing rows.  Otherwise values is a list of
+    python values, with None for the missing rows.
+    """
+    numpy_type = get_fixed_width_numpy_type(data_type)
+    if numpy_type is None or not isinstance(values, np.ndarray):
+        return _encode_column(list(values), data_type)
+    validity = None
+    if missing is not None and missing.any():
+        validity = bytearray((~missing).astype(np.uint8).tostring())
+        values = np.where(missing, 0, values)
+    return [validity, bytearray(np.ascontiguousarray(values, dtype=numpy_type).tostring())]
+
+
+def get_encode_partition_function(schema, batch_size=None):
+    """returns a function for mapPartitions which groups a partition's rows into record batches"""
+    batch_size = batch_size or default_batch_size
+
+    def encode_partition(iterator):
+        rows = []
+        for row in iterator:
+            rows.append(row)
+            if len(rows) == batch_size:
+                yield encode_batch(rows, schema)
+                rows = []
+        if rows:
+            yield encode_batch(rows, schema)
+    return encode_partition
+
+
+def get_decode_function(schema):
+    """returns a function for flatMap which unpacks a record batch into rows"""
+    def decode(batch):
+        return decode_batch(batch, schema)
+    return decode
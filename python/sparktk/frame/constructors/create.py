@@ -42,12 +42,15 @@ def create(data, schema=None, validate_schema=False, tc=TkContext.implicit):
     *  None, where the schema is automatically inferred based on the data.  Columns will be named
     generically ("C0", "C1", "C2", etc).
 
-    :param validate_schema: (Optional(bool)) When True, all data is checked to ensure that it matches the schema.
+    :param validate_schema: (Optional(bool or str)) When True, all data is checked to ensure that it matches the schema.
                             If the data does not match the schema's data type, it attempts to cast the data to the
                             proper data type.  When the data is unable to be casted to the schema's data type, a
                             missing value (None) is inserted in it's place. It is recommended that validate_schema is
                             enabled, unless it is certain that all of the data matches the specified schema.
-                            Defaults to False.
+                            Defaults to False.  When True, the data is validated right away, which takes a pass
+                            over it.  With 'lazy', the data is validated as part of the next operation that reads
+                            it, and frame.validation_report fills in then.  With 'cached', the validated data is
+                            also persisted, so the validation pass is not wasted.
     :param tc: TkContext
     :return: (Frame) Frame loaded with the specified data
 
@@ -16,10 +16,8 @@
 #
 
 from sparktk.tkcontext import TkContext
-from pyspark.rdd import RDD
 from pyspark.sql.types import *
 import sparktk.dtypes as dtypes
-from datetime import datetime
 from sparktk.frame import schema as sparktk_schema
 from sparktk.arguments import require_type
 
@@ -72,7 +70,7 @@ def import_csv(path, delimiter=",", header=False, schema=None, datetime_format="
         [9]    18  Redmond                27427            26215  4.62%   Deschutes
 
         >>> frame.schema
-        [('rank', <type 'int'>), ('city', <type 'str'>), ('population_2013', <type 'int'>), ('population_2010', <type 'int'>), ('change', <type 'str'>), ('county', <type 'str'>)]
+        [('rank', <type 'int'>), ('city', <type 'unicode'>), ('population_2013', <type 'int'>), ('population_2010', <type 'int'>), ('change', <type 'unicode'>), ('county', <type 'unicode'>)]
 
     The schema parameter can be used to specify a custom schema (column names and data types) or column names (and the
     data types are inferred based on the data).  Here, we will specify the column names, which will override the
@@ -83,7 +81,7 @@ def import_csv(path, delimiter=",", header=False, schema=None, datetime_format="
         -etc-
 
         >>> frame.schema
-        [('Rank', <type 'int'>), ('City', <type 'str'>), ('2013', <type 'int'>), ('2010', <type 'int'>), ('Percent_Change', <type 'str'>), ('County', <type 'str'>)]
+        [('Rank', <type 'int'>), ('City', <type 'unicode'>), ('2013', <type 'int'>), ('2010', <type 'int'>), ('Percent_Change', <type 'unicode'>), ('County', <type 'unicode'>)]
 
         <hide>
         >>> file_path = "../datasets/unicode.csv"
@@ -158,24 +156,13 @@ def import_csv(path, delimiter=",", header=False, schema=None, datetime_format="
                              "number of columns in the csv file data ({1}).".format(custom_column_count, df_column_count))
         df_schema = schema
 
-    def cast_datetime(row):
-        """
-        The spark data frame gives uses datetime objects.  Convert them to long (ms since epoch) for our frame.
-        """
-        data = []
-        for column_index in xrange(0, len(df_schema)):
-            if df_schema[column_index][1] == dtypes.datetime and isinstance(row[column_index], datetime):
-                data.append(long(dtypes.datetime_to_ms(row[column_index])))
-            else:
-                data.append(row[column_index])
-        return data
-
-    jrdd = tc.sc._jvm.org.trustedanalytics.sparktk.frame.internal.rdd.PythonJavaRdd.scalaToPython(df._jdf.rdd())
-    rdd = RDD(jrdd, tc.sc)
+    # convert in the JVM (date/times become ms since epoch there), so the frame stays Scala-backed
+    frame_rdd = tc.sc._jvm.org.trustedanalytics.sparktk.frame.internal.rdd.FrameRdd.toFrameRdd(df._jdf)
 
-    if any(c[1] == dtypes.datetime for c in df_schema):
-        # If any columns are date/time we must do this map
-        rdd = df.rdd.map(cast_datetime)
+    # the converted values have the data types of the JVM schema (e.g. int64 for a LongType column, which the python
+    # type table maps to int), so keep the column names but take the data types from there
+    jvm_schema = sparktk_schema.schema_to_python(tc.sc, frame_rdd.frameSchema())
+    df_schema = [(name, data_type) for (name, _), (_, data_type) in zip(df_schema, jvm_schema)]
 
     from sparktk.frame.frame import Frame  # circular dependency, so import late
-    return Frame(tc, rdd, df_schema)
+    return Frame(tc, frame_rdd, df_schema)
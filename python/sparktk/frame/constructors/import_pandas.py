@@ -17,6 +17,9 @@
 
 from sparktk.tkcontext import TkContext
 from sparktk import dtypes
+from sparktk.frame import columnar
+from sparktk.frame.schema import schema_to_scala
+import numpy as np
 import datetime
 import logging
 logger = logging.getLogger('sparktk')
@@ -123,12 +126,18 @@ def import_pandas(pandas_frame, schema=None, row_index=True, validate_schema=Fal
     if not row_index:
         pandas_frame = pandas_frame.reset_index()
 
-    pandas_frame = pandas_frame.dropna(thresh=len(pandas_frame.columns))
+    # drop rows with missing values (without copying the data frame when there are none)
+    has_missing = pandas_frame.isnull().any(axis=1)
+    if has_missing.any():
+        pandas_frame = pandas_frame[~has_missing]
     field_names = [x[0] for x in schema]
     if len(pandas_frame.columns) != len(field_names):
         raise ValueError("Number of columns in Pandasframe {0} does not match the number of columns in the"
                          " schema provided {1}.".format(len(pandas_frame.columns), len(field_names)))
 
+    if columnar.enabled:
+        return _import_columnar(pandas, pandas_frame, schema, validate_schema, tc)
+
     date_time_columns = [i for i, x in enumerate(pandas_frame.dtypes) if x == "datetime64[ns]"]
     has_date_time = len(date_time_columns) > 0
 
@@ -158,6 +167,90 @@ def import_pandas(pandas_frame, schema=None, row_index=True, validate_schema=Fal
 
     return frame
 
+def _import_columnar(pandas, pandas_frame, schema, validate_schema, tc):
+    """
+    Imports the data frame as columnar record batches (see sparktk.frame.columnar).  Each batch is a block of rows
+    whose columns are encoded straight from the data frame's column arrays, and the JVM decodes the batches into
+    rows in parallel, so no python object is created per cell and the data is validated while it is encoded.
+    """
+    columns = []
+    bad_value_count = 0
+    for index, (name, data_type) in enumerate(schema):
+        values, missing, bad_values = _get_column_values(pandas, pandas_frame.iloc[:, index], data_type, validate_schema)
+        columns.append((values, missing, data_type))
+        bad_value_count += bad_values
+    if validate_schema:
+        logger.debug("%s values were unable to be parsed to the schema's data type." % bad_value_count)
+
+    num_rows = len(pandas_frame.index)
+    batches = []
+    for start in xrange(0, num_rows, columnar.default_batch_size):
+        end = min(start + columnar.default_batch_size, num_rows)
+        batch = [end - start]
+        for values, missing, data_type in columns:
+            batch.append(columnar.encode_column_array(values[start:end],
+                                                      data_type,
+                                                      None if missing is None else missing[start:end]))
+        batches.append(batch)
+
+    batch_rdd = tc.sc.parallelize(batches, max(1, min(len(batches), tc.sc.defaultParallelism)))
+    python_java_rdd = tc.sc._jvm.org.trustedanalytics.sparktk.frame.internal.rdd.PythonJavaRdd
+    scala_rdd = python_java_rdd.pythonToScalaColumnar(batch_rdd._jrdd, schema_to_scala(tc.sc, schema))
+    return tc.frame.create(scala_rdd, schema)
+
+
+def _get_column_values(pandas, column, data_type, validate_schema):
+    """
+    Converts a pandas column to values for columnar.encode_column_array
+
+    Numeric and datetime columns going to a numeric or datetime type are converted as whole numpy arrays.  Other
+    columns become lists, cast value by value when validating the schema (values which fail to cast become None).
+
+    :return: (values, missing mask or None, number of values which failed to cast)
+    """
+    numpy_type = columnar.get_fixed_width_numpy_type(data_type)
+    kind = column.dtype.kind
+    if data_type is dtypes.datetime and kind == 'M':
+        ms = _datetime_column_to_ms(pandas, column)
+        if ms is not None:
+            return ms, None, 0
+    elif numpy_type is not None and kind in 'biuf':
+        values = column.values
+        if kind == 'f':
+            # like dtypes.cast, non-finite values are missing values
+            missing = ~np.isfinite(values)
+            if missing.any():
+                return np.where(missing, 0, values).astype(numpy_type), missing, 0
+        return values.astype(numpy_type), None, 0
+
+    values = column.tolist()
+    bad_value_count = 0
+    if validate_schema:
+        for i, value in enumerate(values):
+            try:
+                values[i] = dtypes.dtypes.cast(value, data_type)
+            except:
+                values[i] = None
+                bad_value_count += 1
+    return values, None, bad_value_count
+
+
+def _datetime_column_to_ms(pandas, column):
+    """
+    Converts a pandas datetime column to ms since epoch.  Like dtypes.datetime_to_ms, naive date/times are taken to
+    be local time.  Returns None if the column cannot be localized as a whole (for example, date/times which are
+    ambiguous because of daylight saving time), so it gets converted value by value instead.
+    """
+    index = pandas.DatetimeIndex(column)
+    if index.tz is None:
+        from dateutil.tz import tzlocal
+        try:
+            index = index.tz_localize(tzlocal())
+        except Exception:
+            return None
+    return index.asi8 // 1000000
+
+
 # map pandas data type strings to spark-tk schema types
 _pandas_type_to_type_table = {
     "datetime64[ns]": dtypes.datetime,
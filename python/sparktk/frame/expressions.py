@@ -0,0 +1,231 @@
+# vim: set encoding=utf-8
+
+#  Copyright (c) 2016 Intel Corporation 
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+"""
+Column expressions, which frame operations compile to Spark SQL and evaluate in the JVM instead of calling a python UDF
+"""
+
+import math
+import re
+from datetime import datetime
+
+from sparktk.dtypes import datetime_to_ms
+
+
+class Expression(object):
+    """
+    Expression over the columns of a frame (see tc.col, tc.expr and tc.lit)
+
+    Expressions combine with the python operators ==, !=, <, <=, >, >=, +, -, *, /, %, & (and), | (or) and ~ (not).
+    Use parentheses around comparisons combined with & and |, because those operators bind more tightly than
+    comparisons in python.  Note that / is always floating point division, as it is in Spark SQL.
+    """
+
+    def __init__(self, sql):
+        self._sql = sql
+
+    @property
+    def sql(self):
+        """Spark SQL text of the expression"""
+        return self._sql
+
+    def __repr__(self):
+        return "Expression(%s)" % self._sql
+
+    def __str__(self):
+        return self._sql
+
+    def __nonzero__(self):
+        raise TypeError("An Expression has no truth value.  Use & for 'and', | for 'or' and ~ for 'not'.")
+
+    def _binary(self, operator, other):
+        return Expression("(%s %s %s)" % (self._sql, operator, to_sql(other)))
+
+    def _reverse_binary(self, operator, other):
+        return Expression("(%s %s %s)" % (to_sql(other), operator, self._sql))
+
+    def __eq__(self, other):
+        return self._binary("=", other)
+
+    def __ne__(self, other):
+        return self._binary("!=", other)
+
+    def __lt__(self, other):
+        return self._binary("<", other)
+
+    def __le__(self, other):
+        return self._binary("<=", other)
+
+    def __gt__(self, other):
+        return self._binary(">", other)
+
+    def __ge__(self, other):
+        return self._binary(">=", other)
+
+    def __add__(self, other):
+        return self._binary("+", other)
+
+    def __radd__(self, other):
+        return self._reverse_binary("+", other)
+
+    def __sub__(self, other):
+        return self._binary("-", other)
+
+    def __rsub__(self, other):
+        return self._reverse_binary("-", other)
+
+    def __mul__(self, other):
+        return self._binary("*", other)
+
+    def __rmul__(self, other):
+        return self._reverse_binary("*", other)
+
+    def __div__(self, other):
+        return self._binary("/", other)
+
+    def __rdiv__(self, other):
+        return self._reverse_binary("/", other)
+
+    __truediv__ = __div__
+    __rtruediv__ = __rdiv__
+
+    def __mod__(self, other):
+        return self._binary("%", other)
+
+    def __rmod__(self, other):
+        return self._reverse_binary("%", other)
+
+    def __neg__(self):
+        return Expression("(- %s)" % self._sql)
+
+    def __and__(self, other):
+        return self._binary("AND", other)
+
+    def __rand__(self, other):
+        return self._reverse_binary("AND", other)
+
+    def __or__(self, other):
+        return self._binary("OR", other)
+
+    def __ror__(self, other):
+        return self._reverse_binary("OR", other)
+
+    def __invert__(self):
+        return Expression("(NOT %s)" % self._sql)
+
+    def is_null(self):
+        """expression which is true where this expression is null (missing)"""
+        return Expression("(%s IS NULL)" % self._sql)
+
+    def is_not_null(self):
+        """expression which is true where this expression is not null (not missing)"""
+        return Expression("(%s IS NOT NULL)" % self._sql)
+
+    def isin(self, *values):
+        """expression which is true where this expression equals one of the given values"""
+        if len(values) == 1 and isinstance(values[0], (list, tuple, set)):
+            values = list(values[0])
+        if not values:
+            raise ValueError("isin requires at least one value")
+        return Expression("(%s IN (%s))" % (self._sql, ", ".join(to_sql(v) for v in values)))
+
+    def between(self, lower, upper):
+        """expression which is true where this expression is between lower and upper (inclusive)"""
+        return Expression("(%s BETWEEN %s AND %s)" % (self._sql, to_sql(lower), to_sql(upper)))
+
+
+def col(name):
+    """
+    Expression for the value of a frame column
+
+    :param name: (str) column name
+    :return: (Expression) column expression
+    """
+    if not isinstance(name, basestring):
+        raise TypeError("column name must be a str, but got %s" % type(name))
+    # whitespace is stripped from column names when the frame is handed to Spark SQL
+    return Expression("`%s`" % re.sub(r"\s", "", name).replace("`", "``"))
+
+
+def lit(value):
+    """
+    Expression for a literal value (None, bool, int, long, float, str, unicode or datetime)
+
+    :param value: the literal value
+    :return: (Expression) literal expression
+    """
+    return Expression(_literal_to_sql(value))
+
+
+def expr(sql):
+    """
+    Expression written directly in Spark SQL, like "age * 2 + tenure" or "name LIKE 'J%'"
+
+    :param sql: (str) Spark SQL expression over the frame's columns
+    :return: (Expression) expression
+    """
+    if not isinstance(sql, basestring) or not sql.strip():
+        raise ValueError("expr requires a non-empty Spark SQL string, but got %s" % repr(sql))
+    return Expression("(%s)" % sql)
+
+
+def to_sql(value):
+    """returns the Spark SQL text for an Expression or a literal value"""
+    if isinstance(value, Expression):
+        return value.sql
+    return _literal_to_sql(value)
+
+
+def is_expression(item):
+    """answers whether the item is an Expression, or a list of Expressions"""
+    if isinstance(item, list):
+        return len(item) > 0 and all(isinstance(i, Expression) for i in item)
+    return isinstance(item, Expression)
+
+
+def _literal_to_sql(value):
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, long)):
+        return "%dL" % value if value > 2147483647 or value < -2147483648 else str(value)
+    if isinstance(value, float):
+        if math.isnan(value):
+            return "CAST('NaN' AS DOUBLE)"
+        if math.isinf(value):
+            return "CAST('%sInfinity' AS DOUBLE)" % ("-" if value < 0 else "")
+        return "CAST(%s AS DOUBLE)" % repr(value)
+    if isinstance(value, datetime):
+        return "%dL" % datetime_to_ms(value)  # frames hold date/times as ms since epoch
+    if isinstance(value, basestring):
+        return "'%s'" % value.replace("\\", "\\\\").replace("'", "\\'")
+    raise TypeError("unsupported literal type %s in expression" % type(value))
+
+
+def get_column_sql(expressions, schema):
+    """
+    returns the list of Spark SQL text for the given expression(s), one for each column of the given schema
+
+    :param expressions: (Expression or List[Expression]) expressions which compute the new column(s)
+    :param schema: ((str, type) or List[(str, type)]) schema of the new column(s)
+    """
+    if not isinstance(expressions, list):
+        expressions = [expressions]
+    num_columns = len(schema) if isinstance(schema, list) else 1
+    if len(expressions) != num_columns:
+        raise ValueError("got %s expressions for %s columns in the schema" % (len(expressions), num_columns))
+    return [to_sql(e) for e in expressions]
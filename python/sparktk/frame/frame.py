@@ -16,9 +16,15 @@
 #
 
 from pyspark.rdd import RDD
+from pyspark import StorageLevel
+from pyspark.accumulators import AccumulatorParam
 from pyspark.sql import DataFrame
 
 from sparktk.frame.pyframe import PythonFrame
+from sparktk.frame import columnar
+from sparktk.frame.metadata import FrameMetadata
+from sparktk.frame.expressions import Expression
+from sparktk.arguments import require_type, affirm_type
 from sparktk.frame.schema import schema_to_python, schema_to_scala, schema_is_coercible
 from sparktk import dtypes
 import logging
@@ -51,10 +57,15 @@ __all__ = ["create",
 
 
 class Frame(object):
+
+    _storage_level = None  # name of the storage level set by persist(), None when not persisted
+    _schema_validation = None  # SchemaValidationReturn, when created with validate_schema
+    _scala_metadata = None  # FrameMetadata cached for the Scala backend, see _metadata
     
     def __init__(self, tc, source, schema=None, validate_schema=False):
         """(Private constructor -- use tc.frame.create or other methods available from the TkContext)"""
         self._tc = tc
+        self._persisted_rdd_ids = []
         if self._is_scala_frame(source):
             self._frame = source
         elif self._is_scala_rdd(source):
@@ -106,14 +117,23 @@ class Frame(object):
 
                 source = tc.sc.parallelize(source)
             if schema and validate_schema:
+                if validate_schema not in _validation_modes:
+                    raise ValueError("Invalid validate_schema value %s.  Expected True, False, 'lazy' or 'cached'." % repr(validate_schema))
                 # Validate schema by going through the data and checking the data type and attempting to parse it
-                validate_schema_result = self.validate_pyrdd_schema(source, schema)
-                source = validate_schema_result.validated_rdd
-                logger.debug("%s values were unable to be parsed to the schema's data type." % validate_schema_result.bad_value_count)
+                self._schema_validation = self.validate_pyrdd_schema(source, schema, lazy=validate_schema in ["lazy", "cached"])
+                source = self._schema_validation.validated_rdd
+                if validate_schema not in ["lazy", "cached"]:
+                    logger.debug("%s values were unable to be parsed to the schema's data type." % self._schema_validation.bad_value_count)
 
             # If schema contains matrix datatype, then apply type_coercer to convert list[list] to numpy ndarray
             map_source = schema_is_coercible(source, list(schema))
-            self._frame = PythonFrame(map_source, schema)
+            self._frame = PythonFrame(map_source, schema, trusted_types=bool(schema and validate_schema))
+            if schema and validate_schema == "cached":
+                # persist the validated data, so the scan which validates it also fills the cache (and the row count)
+                self._storage_level = "MEMORY_AND_DISK"
+                self._persist_backend()
+                self._frame.partition_counts()
+                logger.debug("%s values were unable to be parsed to the schema's data type." % self._schema_validation.bad_value_count)
 
     def _merge_types(self, type_list_a, type_list_b):
         """
@@ -195,34 +215,52 @@ class Frame(object):
         else:
             return False
 
-    def validate_pyrdd_schema(self, pyrdd, schema):
+    def validate_pyrdd_schema(self, pyrdd, schema, lazy=False):
+        """
+        Casts the rdd's data to the schema's data types.  Values which cannot be cast become None and are counted as
+        bad values.  Unless lazy is True, the data is validated right away, otherwise it is validated by the next
+        action which reads all of it, and the bad value count fills in then.
+        """
         if isinstance(pyrdd, RDD):
             schema_length = len(schema)
-            num_bad_values = self._tc.sc.accumulator(0)
-
-            def validate_schema(row, accumulator):
-                data = []
-                if len(row) != schema_length:
-                    raise ValueError("Length of the row (%s) does not match the schema length (%s)." % (len(row), len(schema)))
-                for index, column in enumerate(schema):
-                    data_type = column[1]
-                    try:
-                        if row[index] is not None:
+            data_types = [column[1] for column in schema]
+            bad_value_counts = self._tc.sc.accumulator({}, _BadValueCountsParam())
+
+            def validate_schema(partition_index, iterator):
+                bad_values = 0
+                for row in iterator:
+                    if len(row) != schema_length:
+                        raise ValueError("Length of the row (%s) does not match the schema length (%s)." % (len(row), len(schema)))
+                    data = []
+                    for index, data_type in enumerate(data_types):
+                        try:
                             data.append(dtypes.dtypes.cast(row[index], data_type))
-                    except:
-                        data.append(None)
-                        accumulator += 1
-                return data
+                        except:
+                            data.append(None)
+                            bad_values += 1
+                    yield data
+                # only report fully read partitions, keyed by partition, so recomputed partitions are not counted twice
+                bad_value_counts.add({partition_index: bad_values})
 
-            validated_rdd = pyrdd.map(lambda row: validate_schema(row, num_bad_values))
+            validated_rdd = pyrdd.mapPartitionsWithIndex(validate_schema)
 
-            # Force rdd to load, so that we can get a bad value count
-            validated_rdd.count()
+            if not lazy:
+                # Force rdd to load, so that we can get a bad value count
+                validated_rdd.count()
 
-            return SchemaValidationReturn(validated_rdd, num_bad_values.value)
+            return SchemaValidationReturn(validated_rdd, bad_value_counts)
         else:
             raise TypeError("Unable to validate schema, because the pyrdd provided is not an RDD.")
 
+    @property
+    def validation_report(self):
+        """
+        Report of the values which could not be parsed to the schema's data types when the frame was created with
+        validate_schema, or None if the data was not validated.  With validate_schema='lazy', the report fills in
+        as actions read the data.
+        """
+        return self._schema_validation.validation_report if self._schema_validation is not None else None
+
     @staticmethod
     def _create_scala_frame(sc, scala_rdd, scala_schema):
         """call constructor in JVM"""
@@ -259,16 +297,31 @@ class Frame(object):
     @property
     def _is_scala(self):
         """answers whether the current frame is backed by a Scala Frame"""
-        answer = self._is_scala_frame(self._frame)
-        logger.info("frame._is_scala reference: %s" % answer)
-        return answer
+        # the backend is always either a PythonFrame or a Scala Frame, so no need to ask the JVM
+        return not isinstance(self._frame, PythonFrame)
 
     @property
     def _is_python(self):
         """answers whether the current frame is backed by a _PythonFrame"""
-        answer =  not self._is_scala_frame(self._frame)
-        logger.info("frame._is_python reference: %s" % answer)
-        return answer
+        return isinstance(self._frame, PythonFrame)
+
+    @property
+    def _metadata(self):
+        """
+        FrameMetadata of the current backend.  For a Scala backend, the metadata is cached and checked with a single
+        call for the Scala frame's state version, so the schema is only read from the JVM after the frame changes.
+        """
+        if self._is_python:
+            python_frame = self._frame
+            return FrameMetadata(python_frame, python_frame.schema, get_num_partitions=lambda: python_frame.num_partitions)
+        scala_frame = self._frame
+        state_version = scala_frame.stateVersion()
+        if self._scala_metadata is None or not self._scala_metadata.is_current(scala_frame, state_version):
+            self._scala_metadata = FrameMetadata(scala_frame,
+                                                 schema_to_python(self._tc.sc, scala_frame.schema()),  # need ()'s on schema because it's a def in scala
+                                                 state_version,
+                                                 lambda: scala_frame.numPartitions())
+        return self._scala_metadata
 
     @property
     def _scala(self):
@@ -276,13 +329,22 @@ class Frame(object):
 
         if self._is_python:
             logger.info("frame._scala reference: converting frame backend from Python to Scala")
-            # If schema contains matrix dataype,
-            # then apply type_coercer_pymlib to convert ndarray to pymlib DenseMatrix for serialization purpose at java
-            self._frame.rdd = schema_is_coercible(self._frame.rdd, list(self._frame.schema), True)
-            # convert PythonFrame to a Scala Frame"""
+            keep_cached = self._storage_level is not None and self.is_cached
             scala_schema = schema_to_scala(self._tc.sc, self._frame.schema)
-            scala_rdd = self._tc.sc._jvm.org.trustedanalytics.sparktk.frame.internal.rdd.PythonJavaRdd.pythonToScala(self._frame.rdd._jrdd, scala_schema)
+            python_java_rdd = self._tc.sc._jvm.org.trustedanalytics.sparktk.frame.internal.rdd.PythonJavaRdd
+            if columnar.enabled:
+                # convert PythonFrame to a Scala Frame, shipping columnar record batches
+                batch_rdd = self._frame.rdd.mapPartitions(columnar.get_encode_partition_function(self._frame.schema))
+                scala_rdd = python_java_rdd.pythonToScalaColumnar(batch_rdd._jrdd, scala_schema)
+            else:
+                # If schema contains matrix dataype,
+                # then apply type_coercer_pymlib to convert ndarray to pymlib DenseMatrix for serialization purpose at java
+                self._frame.rdd = schema_is_coercible(self._frame.rdd, list(self._frame.schema), True)
+                # convert PythonFrame to a Scala Frame"""
+                scala_rdd = python_java_rdd.pythonToScala(self._frame.rdd._jrdd, scala_schema)
             self._frame = self._create_scala_frame(self._tc.sc, scala_rdd, scala_schema)
+            if keep_cached:
+                self._persist_backend()
         else:
             logger.info("frame._scala reference: frame already has a scala backend")
         return self._frame
@@ -292,14 +354,23 @@ class Frame(object):
         """gets frame backend as _PythonFrame, causes conversion if it is current not"""
         if self._is_scala:
             logger.info("frame._python reference: converting frame backend from Scala to Python")
+            keep_cached = self._storage_level is not None and self._frame.isCached()
             # convert Scala Frame to a PythonFrame"""
             scala_schema = self._frame.schema()
-            java_rdd =  self._tc.sc._jvm.org.trustedanalytics.sparktk.frame.internal.rdd.PythonJavaRdd.scalaToPython(self._frame.rdd())
+            python_java_rdd = self._tc.sc._jvm.org.trustedanalytics.sparktk.frame.internal.rdd.PythonJavaRdd
             python_schema = schema_to_python(self._tc.sc, scala_schema)
-            python_rdd = RDD(java_rdd, self._tc.sc)
-            # If schema contains matrix datatype, then apply type_coercer to convert list[list] to numpy ndarray
-            map_python_rdd = schema_is_coercible(python_rdd, list(python_schema))
-            self._frame = PythonFrame(map_python_rdd, python_schema)
+            if columnar.enabled:
+                # convert Scala Frame to a PythonFrame, unpacking columnar record batches
+                java_rdd = python_java_rdd.scalaToPythonColumnar(self._frame.rdd(), scala_schema, columnar.default_batch_size)
+                map_python_rdd = RDD(java_rdd, self._tc.sc).flatMap(columnar.get_decode_function(python_schema))
+            else:
+                java_rdd = python_java_rdd.scalaToPython(self._frame.rdd())
+                python_rdd = RDD(java_rdd, self._tc.sc)
+                # If schema contains matrix datatype, then apply type_coercer to convert list[list] to numpy ndarray
+                map_python_rdd = schema_is_coercible(python_rdd, list(python_schema))
+            self._frame = PythonFrame(map_python_rdd, python_schema, trusted_types=True)
+            if keep_cached:
+                self._persist_backend()
         else:
             logger.info("frame._python reference: frame already has a python backend")
         return self._frame
@@ -308,6 +379,31 @@ class Frame(object):
     # API
     ##########################################################################
 
+    def _persist_backend(self):
+        """persists the current backend's data at the frame's storage level and registers it for the cache report"""
+        if self._is_scala:
+            self._frame.persist(self._storage_level)
+            rdd_id = self._frame.rdd().id()
+        else:
+            rdd = self._frame.rdd
+            level = getattr(StorageLevel, self._storage_level)
+            if repr(rdd.getStorageLevel()) != repr(level):
+                if rdd.is_cached:
+                    rdd.unpersist()
+                rdd.persist(level)
+            self._tc.sc._jvm.org.trustedanalytics.sparktk.frame.internal.FrameCache.register(rdd._jrdd.rdd())
+            rdd_id = rdd.id()
+        if rdd_id not in self._persisted_rdd_ids:
+            self._persisted_rdd_ids.append(rdd_id)
+
+    @property
+    def is_cached(self):
+        """answers whether the frame's current data is persisted (see persist)"""
+        if self._is_scala:
+            return self._frame.isCached()
+        level = self._frame.rdd.getStorageLevel()
+        return level.useMemory or level.useDisk or level.useOffHeap
+
     @property
     def rdd(self):
         """pyspark RDD  (causes conversion if currently backed by a Scala RDD)"""
@@ -321,7 +417,7 @@ class Frame(object):
     @property
     def schema(self):
         if self._is_scala:
-            return schema_to_python(self._tc.sc, self._frame.schema())  # need ()'s on schema because it's a def in scala
+            return list(self._metadata.schema)  # a copy, so callers cannot modify the cached schema
         return self._frame.schema
 
     @property
@@ -343,12 +439,13 @@ class Frame(object):
             </skip>
 
         """
-        return [name for name, data_type in self.schema]
+        return self._metadata.column_names
 
     # Frame Operations
 
     from sparktk.frame.ops.add_columns import add_columns
     from sparktk.frame.ops.append import append
+    from sparktk.frame.ops.approx_distinct import approx_distinct
     from sparktk.frame.ops.assign_sample import assign_sample
     from sparktk.frame.ops.bin_column import bin_column
     from sparktk.frame.ops.binary_classification_metrics import binary_classification_metrics
@@ -372,6 +469,7 @@ class Frame(object):
     from sparktk.frame.ops.drop_rows import drop_rows
     from sparktk.frame.ops.ecdf import ecdf
     from sparktk.frame.ops.entropy import entropy
+    from sparktk.frame.ops.explain_join import explain_join
     from sparktk.frame.ops.export_to_csv import export_to_csv
     from sparktk.frame.ops.export_to_jdbc import export_to_jdbc
     from sparktk.frame.ops.export_to_json import export_to_json
@@ -391,6 +489,8 @@ class Frame(object):
     from sparktk.frame.ops.matrix_pca import matrix_pca
     from sparktk.frame.ops.matrix_svd import matrix_svd
     from sparktk.frame.ops.multiclass_classification_metrics import multiclass_classification_metrics
+    from sparktk.frame.ops.partition_by import partition_by
+    from sparktk.frame.ops.persist import persist
     from sparktk.frame.ops.power_iteration_clustering import power_iteration_clustering
     from sparktk.frame.ops.quantile_bin_column import quantile_bin_column
     from sparktk.frame.ops.quantiles import quantiles
@@ -399,6 +499,7 @@ class Frame(object):
     from sparktk.frame.ops.save import save
     from sparktk.frame.ops.sort import sort
     from sparktk.frame.ops.sortedk import sorted_k
+    from sparktk.frame.ops.summary_statistics import summary_statistics
     from sparktk.frame.ops.take import take
     from sparktk.frame.ops.tally import tally
     from sparktk.frame.ops.tally_percent import tally_percent
@@ -408,15 +509,64 @@ class Frame(object):
     from sparktk.frame.ops.timeseries_durbin_watson_test import timeseries_durbin_watson_test
     from sparktk.frame.ops.timeseries_from_observations import timeseries_from_observations
     from sparktk.frame.ops.timeseries_slice import timeseries_slice
-    from sparktk.frame.ops.to_pandas import to_pandas
+    from sparktk.frame.ops.to_pandas import to_pandas, to_pandas_iter
     from sparktk.frame.ops.topk import top_k
     from sparktk.frame.ops.unflatten_columns import unflatten_columns
+    from sparktk.frame.ops.unpersist import unpersist
+
+
+def load(path, columns=None, where=None, tc=TkContext.implicit):
+    """
+    load Frame from given path
 
+    Parameters
+    ----------
 
-def load(path, tc=TkContext.implicit):
-    """load Frame from given path"""
+    :param path: (str) location of the saved frame
+    :param columns: (Optional[List[str]]) names of the columns to load.  Columns which are not requested are never
+                    read from disk.  The default is all columns.
+    :param where: (Optional[Expression or str]) condition selecting the rows to load, as an Expression (see tc.col
+                  and tc.expr) or Spark SQL text.  Simple comparisons of columns to literals are pushed down to the
+                  parquet reader, which skips row groups that cannot match.  The default is all rows.
+    :return: (Frame) loaded frame
+
+    Examples
+    --------
+
+    <skip>
+        >>> frame.save("sandbox/people")
+
+        >>> seniors = tc.frame.load("sandbox/people", columns=["name"], where=tc.col("age") >= 65)
+
+    </skip>
+
+    """
     TkContext.validate(tc)
-    return tc.load(path, Frame)
+    if columns is None and where is None:
+        return tc.load(path, Frame)
+    require_type(basestring, path, "path")
+    columns = affirm_type.list_of_str(columns, "columns", allow_none=True)
+    if where is not None and not isinstance(where, (Expression, basestring)):
+        raise TypeError("where must be an Expression or a str, but got %s" % type(where))
+    scala_columns = tc.jutils.convert.to_scala_option(tc.jutils.convert.to_scala_list_string(columns) if columns else None)
+    if isinstance(where, Expression):
+        where = where.sql
+    scala_where = tc.jutils.convert.to_scala_option(where)
+    return Frame(tc, tc.sc._jvm.org.trustedanalytics.sparktk.frame.Frame.load(tc.sc._jsc.sc(), path, scala_columns, scala_where))
+
+
+_validation_modes = [True, "lazy", "cached"]
+
+
+class _BadValueCountsParam(AccumulatorParam):
+    """accumulates bad value counts per partition index, where adding a partition's count again replaces it"""
+
+    def zero(self, value):
+        return {}
+
+    def addInPlace(self, value1, value2):
+        value1.update(value2)
+        return value1
 
 
 class SchemaValidationReturn(PropertiesObject):
@@ -425,9 +575,9 @@ class SchemaValidationReturn(PropertiesObject):
     that were found.
     """
 
-    def __init__(self, validated_rdd, bad_value_count):
+    def __init__(self, validated_rdd, bad_value_counts):
         self._validated_rdd = validated_rdd
-        self._bad_value_count = bad_value_count
+        self._bad_value_counts = bad_value_counts
 
     @property
     def validated_rdd(self):
@@ -441,6 +591,43 @@ class SchemaValidationReturn(PropertiesObject):
         """
         Number of values that were unable to be parsed to the data type specified by the schema.
         """
-        return self._bad_value_count
+        return sum(self._bad_value_counts.value.values())
+
+    @property
+    def is_complete(self):
+        """
+        False when the data was validated lazily and not all of it has been read yet, in which case bad_value_count
+        only covers the data validated so far.
+        """
+        return len(self._bad_value_counts.value) == self._validated_rdd.getNumPartitions()
+
+    @property
+    def validation_report(self):
+        """
+        ValidationReport with the current bad value count
+        """
+        return ValidationReport(self.bad_value_count, self.is_complete)
 
 
+class ValidationReport(PropertiesObject):
+    """
+    Number of values that were unable to be parsed to the data types specified by the schema.
+    """
+
+    def __init__(self, bad_value_count, is_complete):
+        self._bad_value_count = bad_value_count
+        self._is_complete = is_complete
+
+    @property
+    def bad_value_count(self):
+        """
+        Number of values that were unable to be parsed to the data type specified by the schema.
+        """
+        return self._bad_value_count
+
+    @property
+    def is_complete(self):
+        """
+        False when the data was validated lazily and not all of it has been read yet.
+        """
+        return self._is_complete
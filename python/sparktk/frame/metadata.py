@@ -0,0 +1,62 @@
+# vim: set encoding=utf-8
+
+#  Copyright (c) 2016 Intel Corporation 
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+"""
+Frame metadata cached on the python side, so frame operations do not ask the JVM for the schema (and convert it
+column by column) every time they need it
+"""
+
+
+class FrameMetadata(object):
+    """
+    Schema, column indices and partition count of a frame backend
+
+    :param backend: the backend object the metadata describes (a Scala Frame or a PythonFrame)
+    :param schema: the backend's schema, as a python schema list
+    :param state_version: for a Scala Frame, its stateVersion when the metadata was read
+    :param get_num_partitions: function which returns the backend's number of partitions, called once on demand
+    """
+
+    def __init__(self, backend, schema, state_version=None, get_num_partitions=None):
+        self.backend = backend
+        self.schema = schema
+        self.state_version = state_version
+        self._get_num_partitions = get_num_partitions
+        self._num_partitions = None
+        self._column_indices = None
+
+    def is_current(self, backend, state_version):
+        """answers whether the metadata still describes the given backend at the given state version"""
+        return backend is self.backend and state_version == self.state_version
+
+    @property
+    def column_names(self):
+        """list of the column names (a new list, which the caller may modify)"""
+        return [name for name, data_type in self.schema]
+
+    @property
+    def column_indices(self):
+        """dict of column name to column index"""
+        if self._column_indices is None:
+            self._column_indices = dict((name, index) for index, (name, data_type) in enumerate(self.schema))
+        return self._column_indices
+
+    @property
+    def num_partitions(self):
+        """number of partitions of the backend's data"""
+        if self._num_partitions is None:
+            self._num_partitions = self._get_num_partitions()
+        return self._num_partitions
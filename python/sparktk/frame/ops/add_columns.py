@@ -15,10 +15,12 @@
 #  limitations under the License.
 #
 
-from sparktk.frame.row import Row
+from sparktk.frame.row import get_row_class
 import sparktk.frame.schema as schema_helper
+from sparktk.frame import vectorized as vectorized_helper
+from sparktk.frame.expressions import is_expression, get_column_sql
 
-def add_columns(self, func, schema):
+def add_columns(self, func, schema, vectorized=False, batch_size=None):
     """
     Add columns to current frame.
 
@@ -33,8 +35,14 @@ def add_columns(self, func, schema):
     Parameters
     ----------
 
-    :param func: (UDF) Function which takes the values in the row and produces a value, or collection of values, for the new cell(s).
+    :param func: (UDF or Expression) Function which takes the values in the row and produces a value, or collection of values, for the new cell(s).
+                 Alternatively, an Expression (or list of Expressions, if the schema is a list) built with tc.col and
+                 tc.expr, which is evaluated in Spark SQL and is much faster than a UDF.
     :param schema: (List[(str,type)]) Schema for the column(s) being added.
+    :param vectorized: (Optional[bool]) If True, the UDF is called once per batch of rows instead of once per row.
+                       It receives an OrderedDict of column name to numpy array and must return a column array (or
+                       a list of column arrays, if the schema is a list) with one value per row in the batch.
+    :param batch_size: (Optional[int]) Maximum number of rows per batch when vectorized is True (default 10000).
 
     Examples
     --------
@@ -126,20 +134,66 @@ def add_columns(self, func, schema):
         [2]  Thur          Thu
         [3]  Ju            J
 
+    Numeric work is much faster as a vectorized UDF, which operates on numpy arrays of whole columns at a time
+    rather than one Row object per row.
+
+        >>> frame.add_columns(lambda cols: cols['age'] * 12, ('age_months', int), vectorized=True)
+
+        >>> frame.inspect(columns=['name', 'age', 'age_months'])
+        [#]  name      age  age_months
+        ==============================
+        [0]  Fred       39         468
+        [1]  Susan      33         396
+        [2]  Thurston   65         780
+        [3]  Judy       44         528
+
+    Column expressions are evaluated in Spark SQL, so the frame never leaves the JVM.  Each result is cast to the
+    type given in the schema.
+
+        >>> frame.add_columns([tc.col('age') - tc.col('tenure'), tc.expr("upper(name)")],
+        ...                   [('age_at_hire', int), ('upper_name', str)])
+
+        >>> frame.inspect(columns=['name', 'age', 'tenure', 'age_at_hire', 'upper_name'])
+        [#]  name      age  tenure  age_at_hire  upper_name
+        ===================================================
+        [0]  Fred       39      16           23  FRED
+        [1]  Susan      33       3           30  SUSAN
+        [2]  Thurston   65      26           39  THURSTON
+        [3]  Judy       44      14           30  JUDY
 
     """
 
     schema_helper.validate(schema)
     schema_helper.validate_is_mergeable(self._tc, self.schema, schema)
 
-    row = Row(self.schema)
+    is_list = isinstance(schema, list)
+
+    if is_expression(func):
+        new_schema = schema if is_list else [schema]
+        self._scala.addColumnsExpression(self._tc.jutils.convert.to_scala_list_string(get_column_sql(func, schema)),
+                                         schema_helper.schema_to_scala(self._tc.sc, new_schema).columns())
+        return
+
+    if vectorized:
+        frame_schema = list(self.schema)
+        batch_size = batch_size or vectorized_helper.default_batch_size
+
+        def add_columns_partition(iterator):
+            for batch in vectorized_helper.batches(iterator, batch_size):
+                results = func(vectorized_helper.rows_to_columns(batch, frame_schema))
+                columns = vectorized_helper.results_to_columns(results, schema, len(batch))
+                for r, values in zip(batch, zip(*columns)):
+                    yield r + list(values)
+    else:
+        row = get_row_class(self.schema, self._python.trusted_types)()
+
+        def add_columns_partition(iterator):
+            for r in iterator:
+                row._set_data(r)
+                yield r + func(row) if is_list else r + [func(row)]
 
-    def add_columns_func(r):
-        row._set_data(r)
-        return func(row)
-    if isinstance(schema, list):
-        self._python.rdd = self._python.rdd.map(lambda r: r + add_columns_func(r))
+    self._python.queue(add_columns_partition)
+    if is_list:
         self._python.schema.extend(schema)
     else:
-        self._python.rdd = self._python.rdd.map(lambda r: r + [add_columns_func(r)])
         self._python.schema.append(schema)
@@ -0,0 +1,57 @@
+# vim: set encoding=utf-8
+
+#  Copyright (c) 2016 Intel Corporation 
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+from sparktk.arguments import affirm_type, require_type
+
+
+def approx_distinct(self, columns, precision=12):
+    """
+    Estimates the number of distinct values in each of the given columns, in a single pass over the frame.
+
+    Parameters
+    ----------
+
+    :param columns: (str or List[str]) Name(s) of the column(s) to count the distinct values of.
+    :param precision: (int) Number of bits used to index the sketch registers, between 4 and 18.  The relative
+                      standard error of the estimates is about 1.04 / sqrt(2^precision), so 1.6% with the default
+                      of 12.
+    :return: (dict) Dictionary of column name to its estimated number of distinct values.
+
+    Each column is summarized by a HyperLogLog++ sketch of 2^precision registers, so the work and the data sent
+    between tasks do not grow with the number of distinct values.  Missing values are not counted.
+
+    When the default precision is used on a frame which has not been modified since it was saved or loaded, the
+    estimates come from the statistics gathered by save, without a pass over the data.
+
+    Examples
+    --------
+
+    <hide>
+        >>> frame = tc.frame.create([[1, "a"], [2, "b"], [2, "a"], [3, None]], [("n", int), ("s", str)])
+        -etc-
+
+    </hide>
+
+        >>> frame.approx_distinct(["n", "s"]) == {u'n': 3, u's': 2}
+        <progress>
+        True
+
+    """
+    columns = affirm_type.list_of_str(columns, "columns")
+    require_type.non_negative_int(precision, "precision")
+    return dict(self._tc.jutils.convert.scala_map_to_python(
+        self._scala.approxDistinct(self._tc.jutils.convert.to_scala_list_string(columns), precision)))
@@ -15,6 +15,8 @@
 #  limitations under the License.
 #
 
+import cPickle
+
 from sparktk.propobj import PropertiesObject
 from sparktk.frame.ops.inspect import ATable
 
@@ -31,9 +33,9 @@ class CategoricalSummaryOutput(PropertiesObject):
     """
     CategoricalSummaryOutput class containing the levels with their frequency and percentage for the specified column.
     """
-    def __init__(self, scala_result):
-        self._column_name = scala_result.column()
-        self._levels = [LevelData(item) for item in list(scala_result.levels())]
+    def __init__(self, column_name, levels):
+        self._column_name = column_name
+        self._levels = [LevelData(*item) for item in levels]
 
     @property
     def column_name(self):
@@ -57,10 +59,10 @@ class CategoricalSummaryOutput(PropertiesObject):
 
 
 class LevelData(PropertiesObject):
-    def __init__(self, scala_result):
-        self._level = scala_result.level()
-        self._frequency = scala_result.frequency()
-        self._percentage = scala_result.percentage()
+    def __init__(self, level, frequency, percentage):
+        self._level = level
+        self._frequency = frequency
+        self._percentage = percentage
 
     @property
     def level(self):
@@ -190,7 +192,9 @@ def categorical_summary(self, columns, top_k=None, threshold=None):
             threshold = [threshold]
         threshold = [self._tc.jutils.convert.to_scala_option(item) for item in threshold]
         threshold = self._tc.jutils.convert.to_scala_list(threshold)
-    result_list = list(self._scala.categoricalSummary(columns,
-                                                      self._tc.jutils.convert.to_scala_option(top_k),
-                                                      self._tc.jutils.convert.to_scala_option(threshold)))
-    return CategoricalSummaryOutputList([CategoricalSummaryOutput(item) for item in result_list])
+    # the summaries come back pickled, in one transfer rather than py4j calls per level
+    pickled_result = self._scala.categoricalSummaryPython(columns,
+                                                          self._tc.jutils.convert.to_scala_option(top_k),
+                                                          self._tc.jutils.convert.to_scala_option(threshold))
+    result_list = cPickle.loads(bytes(pickled_result))
+    return CategoricalSummaryOutputList([CategoricalSummaryOutput(*item) for item in result_list])
@@ -53,13 +53,13 @@ def collect(self, columns=None):
 
     """
     if columns is not None:
-        affirm_type.list_of_str(columns, "columns")
+        columns = affirm_type.list_of_str(columns, "columns")
         if not columns:
             return []
     if self._is_scala:
-        scala_data = self._scala.collect(self._tc.jutils.convert.to_scala_option_list_string(columns))
+        pickled_batch = self._scala.collectPython(self._tc.jutils.convert.to_scala_option_list_string(columns))
         schema = get_schema_for_columns(self.schema, columns) if columns else self.schema
-        data = TakeCollectHelper.scala_rows_to_python(self._tc, scala_data, schema)
+        data = TakeCollectHelper.pickled_batch_to_python(pickled_batch, schema)
     else:
         if columns:
             select = TakeCollectHelper.get_select_columns_function(self.schema, columns)
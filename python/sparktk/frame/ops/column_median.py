@@ -16,7 +16,7 @@
 #
 
 
-def column_median(self, data_column, weights_column=None):
+def column_median(self, data_column, weights_column=None, approximate=False, relative_error=0.01):
     """
     Calculate the (weighted) median of a column.
 
@@ -37,6 +37,13 @@ def column_median(self, data_column, weights_column=None):
     :param weights_column: (Option[str]) The column that provides weights (frequencies) for the median calculation.
                            Must contain numerical data.
                            Default is all items have a weight of 1.
+    :param approximate: (bool) If True, the median comes from a quantile sketch built in a single pass over the data
+                        (or from the statistics gathered when the frame was saved), instead of from a sort of the
+                        column.  It is then a value of the column whose rank is within
+                        relative_error * (number of values) of the middle, and missing or non-finite values are
+                        ignored.  A weights column is not supported.  Default is False.
+    :param relative_error: (float) Acceptable rank error of the approximate median, as a fraction of the number of
+                           values.  Default is 0.01.
     :return: (varies) The median of the values.
              If a weight column is provided and no weights are finite numbers greater
              than 0, None is returned.
@@ -102,7 +109,10 @@ def column_median(self, data_column, weights_column=None):
         3
 
     """
-    val = self._scala.columnMedian(data_column, self._tc.jutils.convert.to_scala_option(weights_column))
+    val = self._scala.columnMedian(data_column,
+                                   self._tc.jutils.convert.to_scala_option(weights_column),
+                                   approximate,
+                                   float(relative_error))
     optional_val = self._tc.jutils.convert.from_scala_option(val)
     if optional_val is None:
         return None
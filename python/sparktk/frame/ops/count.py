@@ -15,7 +15,7 @@
 #  limitations under the License.
 #
 
-from sparktk.frame.row import Row
+from sparktk.frame.row import get_row_class
 
 def count(self, where=None):
     """
@@ -54,7 +54,7 @@ def count(self, where=None):
 
     """
     if where:
-        row = Row(self.schema)
+        row = get_row_class(self.schema, self._python.trusted_types)()
 
         def count_where(r):
             row._set_data(r)
@@ -64,4 +64,4 @@ def count(self, where=None):
     else:
         if self._is_scala:
             return int(self._scala.rowCount())
-        return self.rdd.count()
+        return sum(self._python.partition_counts())
@@ -15,7 +15,8 @@
 #  limitations under the License.
 #
 
-from sparktk.frame.row import Row
+from sparktk.frame.row import get_row_class
+from sparktk.frame.expressions import Expression
 
 def drop_rows(self, predicate):
     """
@@ -23,8 +24,9 @@ def drop_rows(self, predicate):
 
     Parameters
     ----------
-    :param predicate: (UDF) Function which evaluates a row to a boolean; rows that answer True are dropped from
-                      the frame.
+    :param predicate: (UDF or Expression) Function which evaluates a row to a boolean; rows that answer True are
+                      dropped from the frame.  An Expression (see tc.col and tc.expr) is evaluated in Spark SQL,
+                      which is much faster than a UDF; rows for which it is null are kept.
 
     Examples
     --------
@@ -51,12 +53,27 @@ def drop_rows(self, predicate):
         [0]  Fred   39      16  555-1234
         [1]  Judy   44      14  555-2183
 
+    The same kind of predicate as a column expression runs in Spark SQL, without calling back into python:
+
+        >>> frame.drop_rows(tc.expr("name LIKE 'F%'"))
+
+        >>> frame.inspect()
+        [#]  name  age  tenure  phone
+        ================================
+        [0]  Judy   44      14  555-2183
+
     More information on a |UDF| can be found at :doc:`/ds_apir`.
     """
-    row = Row(self.schema)
+    if isinstance(predicate, Expression):
+        self._scala.dropRowsExpression(predicate.sql)
+        return
+
+    row = get_row_class(self.schema, self._python.trusted_types)()
 
-    def drop_rows_func(r):
-        row._set_data(r)
-        return not predicate(row)
-    self._python.rdd = self._python.rdd.filter(drop_rows_func)
+    def drop_rows_partition(iterator):
+        for r in iterator:
+            row._set_data(r)
+            if not predicate(row):
+                yield r
+    self._python.queue(drop_rows_partition, preserves_types=True)
 
@@ -16,7 +16,7 @@
 #
 
 
-def ecdf(self, column):
+def ecdf(self, column, approximate=False, relative_error=0.01):
     """
     Builds new frame with columns for data and distribution.
 
@@ -24,6 +24,12 @@ def ecdf(self, column):
     ----------
 
     :param column: (str) The name of the input column containing sample.
+    :param approximate: (bool) If True, the distribution comes from a quantile sketch built in a single pass over the
+                        data, instead of from a sort of the column.  It is then given at the sample values held by
+                        the sketch (a number which grows with 1 / relative_error, but only logarithmically with the
+                        number of rows), each within relative_error of the exact distribution, and missing or
+                        non-finite values are ignored.  Default is False.
+    :param relative_error: (float) Acceptable error of the approximate distribution values.  Default is 0.01.
     :return: (Frame) A new Frame containing each distinct value in the sample and its corresponding ECDF value.
 
     Generates the :term:`empirical cumulative distribution` for the input column.
@@ -65,4 +71,4 @@ def ecdf(self, column):
 
     """
     from sparktk.frame.frame import Frame
-    return Frame(self._tc, self._scala.ecdf(column))
\ No newline at end of file
+    return Frame(self._tc, self._scala.ecdf(column, approximate, float(relative_error)))
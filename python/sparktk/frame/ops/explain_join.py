@@ -0,0 +1,60 @@
+# vim: set encoding=utf-8
+
+#  Copyright (c) 2016 Intel Corporation 
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+def explain_join(self, right, how='inner'):
+    """
+    Explains how a join of this frame with another frame would be run with automatic broadcast selection
+    (use_broadcast="auto" for join_inner, use_broadcast_right="auto" for join_left, use_broadcast_left="auto" for
+    join_right).
+
+    Parameters
+    ----------
+
+    :param right: (Frame) Another frame to join with
+    :param how: (str) Join method: 'inner', 'left', 'right' or 'outer'.  Default is 'inner'.
+    :returns: (str) Which side would be broadcast, if any, with the size estimates and the threshold
+
+    The size of each side which can be broadcast is estimated from the size of its cached data when the frame is
+    fully cached.  Otherwise a few partitions are sampled, and the serialized size of their rows is scaled to the row
+    count of the frame, which comes from the statistics stored when the frame was saved, or is extrapolated from the
+    sampled partitions.  The smaller side is broadcast when its estimate is under the
+    spark.sparktk.join.autoBroadcastThreshold Spark setting (in bytes, 10 MB by default, -1 to never broadcast).
+    Only the right frame of a left join and the left frame of a right join can be broadcast, and outer joins are
+    never broadcast.
+
+    Examples
+    --------
+
+    <hide>
+    >>> codes = tc.frame.create([[1], [3], [1], [0], [2], [1], [5], [3]], [('numbers', int)])
+    -etc-
+
+    >>> colors = tc.frame.create([[1, 'red'], [2, 'yellow'], [3, 'green'], [4, 'blue']], [('numbers', int), ('color', str)])
+    -etc-
+
+    </hide>
+
+        >>> print codes.explain_join(colors)
+        inner join: broadcast right -etc-
+
+        >>> print codes.explain_join(colors, how='outer')
+        outer join: shuffle (no side of an outer join can be broadcast)
+
+    """
+    if how not in ['inner', 'left', 'right', 'outer']:
+        raise ValueError("how must be 'inner', 'left', 'right' or 'outer', got '%s'" % how)
+    return self._scala.explainJoin(right._scala, how)
@@ -15,9 +15,11 @@
 #  limitations under the License.
 #
 
-from sparktk.frame.row import Row
+from sparktk.frame.row import get_row_class
+from sparktk.frame import vectorized as vectorized_helper
+from sparktk.frame.expressions import Expression
 
-def filter(self, predicate):
+def filter(self, predicate, vectorized=False, batch_size=None):
     """
     Select all rows which satisfy a predicate.
 
@@ -27,8 +29,13 @@ def filter(self, predicate):
     Parameters
     ----------
 
-    :param predicate: (UDF) Function which evaluates a row to a boolean; rows that answer False are dropped
-                      from the frame.
+    :param predicate: (UDF or Expression) Function which evaluates a row to a boolean; rows that answer False are
+                      dropped from the frame.  An Expression (see tc.col and tc.expr) is evaluated in Spark SQL,
+                      which is much faster than a UDF; rows for which it is false or null are dropped.
+    :param vectorized: (Optional[bool]) If True, the predicate is called once per batch of rows instead of once per
+                       row.  It receives an OrderedDict of column name to numpy array and must return a boolean
+                       array with one entry per row in the batch.
+    :param batch_size: (Optional[int]) Maximum number of rows per batch when vectorized is True (default 10000).
 
     Examples
     --------
@@ -54,13 +61,48 @@ def filter(self, predicate):
         [0]  Fred       39      16  555-1234
         [1]  Thurston   65      26  555-4510
 
+    The same filter as a vectorized predicate, which evaluates whole columns at a time:
+
+        >>> frame.filter(lambda cols: cols['age'] > 50, vectorized=True)
+
+        >>> frame.inspect()
+        [#]  name      age  tenure  phone
+        ====================================
+        [0]  Thurston   65      26  555-4510
+
+    A predicate built from column expressions runs in Spark SQL, without calling back into python:
+
+        >>> frame.filter((tc.col('age') > 60) & (tc.col('tenure') >= 20))
+
+        >>> frame.inspect()
+        [#]  name      age  tenure  phone
+        ====================================
+        [0]  Thurston   65      26  555-4510
+
     More information on a |UDF| can be found at :doc:`/ds_apir`.
     """
-    row = Row(self.schema)
+    if isinstance(predicate, Expression):
+        self._scala.filterExpression(predicate.sql)
+        return
+
+    if vectorized:
+        frame_schema = list(self.schema)
+        batch_size = batch_size or vectorized_helper.default_batch_size
+
+        def filter_partition(iterator):
+            for batch in vectorized_helper.batches(iterator, batch_size):
+                mask = vectorized_helper.to_mask(predicate(vectorized_helper.rows_to_columns(batch, frame_schema)), len(batch))
+                for r, keep in zip(batch, mask):
+                    if keep:
+                        yield r
+    else:
+        row = get_row_class(self.schema, self._python.trusted_types)()
 
-    def filter_func(r):
-        row._set_data(r)
-        return predicate(row)
-    self._python.rdd = self._python.rdd.filter(filter_func)
+        def filter_partition(iterator):
+            for r in iterator:
+                row._set_data(r)
+                if predicate(row):
+                    yield r
+    self._python.queue(filter_partition, preserves_types=True)
 
 
@@ -34,12 +34,18 @@ class AggregationFunctions(object):
     def histogram(self, cutoffs, include_lowest=True, strict_binning=False):
         return repr(GroupByHistogram(cutoffs, include_lowest, strict_binning))
 
+    def count_distinct_approx(self, precision=12):
+        if not isinstance(precision, (int, long)) or not 4 <= precision <= 18:
+            raise ValueError("precision must be an int between 4 and 18, but got %s" % precision)
+        return 'COUNT_DISTINCT_APPROX=%d' % precision
+
     def __repr__(self):
         return ", ".join([k for k in AggregationFunctions.__dict__.keys()
                           if isinstance(k, basestring) and not k.startswith("__")])
 
     def __contains__(self, item):
-        return (item in AggregationFunctions.__dict__.values())
+        return (item in AggregationFunctions.__dict__.values()) or \
+               (isinstance(item, basestring) and item.startswith('COUNT_DISTINCT_APPROX='))
 
 
 agg = AggregationFunctions()
@@ -81,6 +87,7 @@ def group_by(self, group_by_columns, *aggregations):
             *   avg
             *   count
             *   count_distinct
+            *   count_distinct_approx()
             *   max
             *   min
             *   stdev
@@ -202,6 +209,24 @@ def group_by(self, group_by_columns, *aggregations):
         [0]  2                        [0.5, 0.5, 0.0]
         [1]  1  [0.0, 0.333333333333, 0.666666666667]
 
+    **Group by with approximate distinct count**.  The count_distinct_approx aggregation estimates the number of
+    distinct values in each group with a HyperLogLog++ sketch, whose size does not grow with the number of distinct
+    values (unlike count_distinct, which keeps every value).  Missing values are not counted.  It is configured with:
+
+    :param precision: (Optional[int]) Number of bits used to index the sketch registers, between 4 and 18.  The
+    relative standard error of the estimates is about 1.04 / sqrt(2^precision), so 1.6% with the default of 12.
+
+    Example
+    -------
+
+        >>> distinct = frame.group_by('a', {'b': [tc.agg.count_distinct, tc.agg.count_distinct_approx()]})
+
+        >>> distinct.inspect()
+        [#]  a  b_COUNT_DISTINCT  b_COUNT_DISTINCT_APPROX
+        =================================================
+        [0]  2                 2                        2
+        [1]  1                 2                        2
+
     """
     if group_by_columns is None:
         group_by_columns = []
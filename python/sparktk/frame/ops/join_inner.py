@@ -14,12 +14,16 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 #
+from sparktk.arguments import require_type
+
 
 def join_inner(self,
                right,
                left_on,
                right_on=None,
-               use_broadcast=None):
+               use_broadcast=None,
+               skew=None,
+               bloom_filter=False):
     """
     join_inner performs inner join operation on one or two frames, creating a new frame.
 
@@ -31,7 +35,18 @@ def join_inner(self,
     :param left_on: (List[str]) Names of the columns in the left frame used to match up the two frames.
     :param right_on: (Optional[List[str]]) Names of the columns in the right frame used to match up the two frames. Default is the same as the left frame.
     :param use_broadcast: (Optional[str]) If one of your tables is small enough to fit in the memory of a single machine, you can use a broadcast join.
-            Specify that table to broadcast (left or right) to possibly improve performance. Default is None.
+            Specify that table to broadcast (left or right) to possibly improve performance, or "auto" to broadcast
+            the smaller table when its estimated size is under the spark.sparktk.join.autoBroadcastThreshold Spark
+            setting (in bytes, 10 MB by default), and use a shuffle join otherwise.  The decision is logged, and
+            explain_join shows it without joining.  Default is None.
+    :param skew: (Optional[str]) "auto" to spread the rows of join keys which hold a large share of the larger frame's
+            rows over several tasks.  The rows of each hot key are split among salted sub-keys, and the matching rows
+            of the other frame are replicated for every sub-key.  The salted keys are logged.  Ignored for broadcast
+            joins.  Default is None.
+    :param bloom_filter: (bool) True to drop the rows of the larger frame which cannot match before the shuffle,
+            which pays off when few of them find a match.  A Bloom filter of the join keys of the other frame is built
+            and broadcast, and the estimated shuffle bytes saved are logged.  Ignored for broadcast joins.
+            Default is False.
 
     :returns: (Frame) A new frame with the results of the join
 
@@ -227,10 +242,17 @@ def join_inner(self,
         right_on = [right_on]
     if len(left_on) != len(right_on):
         raise ValueError("Please provide equal number of join columns")
+    if use_broadcast not in [None, "left", "right", "auto"]:
+        raise ValueError("use_broadcast must be 'left', 'right', 'auto' or None, got '%s'" % use_broadcast)
+    if skew is not None and skew != "auto":
+        raise ValueError("skew must be 'auto' or None, got '%s'" % skew)
+    require_type(bool, bloom_filter, "bloom_filter")
 
     from sparktk.frame.frame import Frame
     return Frame(self._tc, self._scala.joinInner(right._scala,
                                                  self._tc.jutils.convert.to_scala_list_string(left_on),
                                                  self._tc.jutils.convert.to_scala_option(
                                                      self._tc.jutils.convert.to_scala_list_string(right_on)),
-                                                 self._tc.jutils.convert.to_scala_option(use_broadcast)))
+                                                 self._tc.jutils.convert.to_scala_option(use_broadcast),
+                                                 self._tc.jutils.convert.to_scala_option(skew),
+                                                 bloom_filter))
@@ -14,12 +14,16 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 #
+from sparktk.arguments import require_type
+
 
 def join_left(self,
               right,
               left_on,
               right_on=None,
-              use_broadcast_right=False):
+              use_broadcast_right=False,
+              skew=None,
+              bloom_filter=False):
     """
     join_left performs left join(Left outer) operation on one or two frames, creating a new frame.
 
@@ -30,8 +34,19 @@ def join_left(self,
     :param right: (Frame) Another frame to join with
     :param left_on: (List[str]) Names of the columns in the left frame used to match up the two frames.
     :param right_on: (Optional[List[str]]) Names of the columns in the right frame used to match up the two frames. Default is the same as the left frame.
-    :param use_broadcast_right: (bool) If right table is small enough to fit in the memory of a single machine,
-            you can set use_broadcast_right to True to possibly improve performance using broadcast join. Default is False.
+    :param use_broadcast_right: (bool or str) If right table is small enough to fit in the memory of a single machine,
+            you can set use_broadcast_right to True to possibly improve performance using broadcast join.  "auto"
+            broadcasts the right table when its estimated size is under the spark.sparktk.join.autoBroadcastThreshold
+            Spark setting (in bytes, 10 MB by default), and uses a shuffle join otherwise.  The decision is logged,
+            and explain_join shows it without joining.  Default is False.
+    :param skew: (Optional[str]) "auto" to spread the rows of join keys which hold a large share of the left frame's
+            rows over several tasks.  The rows of each hot key are split among salted sub-keys, and the matching rows
+            of the right frame are replicated for every sub-key.  The salted keys are logged.  Ignored for broadcast
+            joins.  Default is None.
+    :param bloom_filter: (bool) True to drop the rows of the right frame which cannot match before the shuffle,
+            which pays off when few of them find a match.  A Bloom filter of the join keys of the left frame is built
+            and broadcast, and the estimated shuffle bytes saved are logged.  Ignored for broadcast joins.
+            Default is False.
 
     :returns: (Frame) A new frame with the results of the join
 
@@ -207,10 +222,19 @@ def join_left(self,
         right_on = [right_on]
     if len(left_on) != len(right_on):
         raise ValueError("Please provide equal number of join columns")
+    if use_broadcast_right not in [True, False, "auto"]:
+        raise ValueError("use_broadcast_right must be True, False or 'auto', got '%s'" % use_broadcast_right)
+    if skew is not None and skew != "auto":
+        raise ValueError("skew must be 'auto' or None, got '%s'" % skew)
+    require_type(bool, bloom_filter, "bloom_filter")
+    auto_broadcast = use_broadcast_right == "auto"
 
     from sparktk.frame.frame import Frame
     return Frame(self._tc, self._scala.joinLeft(right._scala,
                                                 self._tc.jutils.convert.to_scala_list_string(left_on),
                                                 self._tc.jutils.convert.to_scala_option(
                                                     self._tc.jutils.convert.to_scala_list_string(right_on)),
-                                                use_broadcast_right))
+                                                not auto_broadcast and bool(use_broadcast_right),
+                                                self._tc.jutils.convert.to_scala_option(skew),
+                                                auto_broadcast,
+                                                bloom_filter))
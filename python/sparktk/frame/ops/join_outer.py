@@ -18,7 +18,8 @@
 def join_outer(self,
                right,
                left_on,
-               right_on=None):
+               right_on=None,
+               skew=None):
     """
     join_outer performs outer join operation on one or two frames, creating a new frame.
 
@@ -29,6 +30,10 @@ def join_outer(self,
     :param right: (Frame) Another frame to join with
     :param left_on: (List[str]) Names of the columns in the left frame used to match up the two frames.
     :param right_on: (Optional[List[str]]) Names of the columns in the right frame used to match up the two frames. Default is the same as the left frame.
+    :param skew: (Optional[str]) "auto" to spread the rows of join keys which hold a large share of the left frame's
+            rows over several tasks.  The rows of hot keys are joined separately, split among salted sub-keys with the
+            matching rows of the right frame replicated for every sub-key.  The salted keys are logged.
+            Default is None.
 
     :returns: (Frame) A new frame with the results of the join
 
@@ -178,9 +183,12 @@ def join_outer(self,
         right_on = [right_on]
     if len(left_on) != len(right_on):
         raise ValueError("Please provide equal number of join columns")
+    if skew is not None and skew != "auto":
+        raise ValueError("skew must be 'auto' or None, got '%s'" % skew)
 
     from sparktk.frame.frame import Frame
     return Frame(self._tc, self._scala.joinOuter(right._scala,
                                                  self._tc.jutils.convert.to_scala_list_string(left_on),
                                                  self._tc.jutils.convert.to_scala_option(
-                                                     self._tc.jutils.convert.to_scala_list_string(right_on))))
+                                                     self._tc.jutils.convert.to_scala_list_string(right_on)),
+                                                 self._tc.jutils.convert.to_scala_option(skew)))
@@ -15,11 +15,13 @@
 #  limitations under the License.
 #
 
-from sparktk.frame.row import Row
+from sparktk.frame.row import get_row_class
 import sparktk.frame.schema as schema_helper
+from sparktk.frame import vectorized as vectorized_helper
+from sparktk.frame.expressions import is_expression, get_column_sql
 
 
-def map_columns(self, func, schema):
+def map_columns(self, func, schema, vectorized=False, batch_size=None):
     """
     Create a new frame from the output of a UDF which over each row of the current frame.
 
@@ -32,8 +34,14 @@ def map_columns(self, func, schema):
     Parameters
     ----------
 
-    :param func: (UDF) Function which takes the values in the row and produces a value, or collection of values, for the new cell(s).
+    :param func: (UDF or Expression) Function which takes the values in the row and produces a value, or collection of values, for the new cell(s).
+                 Alternatively, an Expression (or list of Expressions, if the schema is a list) built with tc.col and
+                 tc.expr, which is evaluated in Spark SQL and is much faster than a UDF.
     :param schema: (List[(str,type)]) Schema for the column(s) being added.
+    :param vectorized: (Optional[bool]) If True, the UDF is called once per batch of rows instead of once per row.
+                       It receives an OrderedDict of column name to numpy array and must return a column array (or
+                       a list of column arrays, if the schema is a list) with one value per row in the batch.
+    :param batch_size: (Optional[int]) Maximum number of rows per batch when vectorized is True (default 10000).
 
     Examples
     --------
@@ -70,18 +78,46 @@ def map_columns(self, func, schema):
     It is not necessary to use lambda syntax, any function will do, as long as it takes a single row argument.  We
     can also call other local functions within.
 
+    The same new frame from column expressions, which are evaluated in Spark SQL without calling back into python:
+
+        >>> adult = frame.map_columns([tc.col('name'), tc.col('age') - 18], [('name', str), ('adult_years', int)])
+
+        >>> adult.inspect()
+        [#]  name      adult_years
+        ==========================
+        [0]  Fred               21
+        [1]  Susan              15
+        [2]  Thurston           47
+        [3]  Judy               26
+
     (see also the 'add_columns' frame operation)
     """
 
     schema_helper.validate(schema)
-    row = Row(self.schema)
-
-    def map_columns_func(r):
-        row._set_data(r)
-        return func(row)
-    if isinstance(schema, list):
-        rdd = self._python.rdd.map(lambda r: map_columns_func(r))
+    is_list = isinstance(schema, list)
+
+    if is_expression(func):
+        from sparktk.frame.frame import Frame
+        new_schema = schema if is_list else [schema]
+        return Frame(self._tc, self._scala.mapColumnsExpression(self._tc.jutils.convert.to_scala_list_string(get_column_sql(func, schema)),
+                                                                schema_helper.schema_to_scala(self._tc.sc, new_schema).columns()))
+
+    if vectorized:
+        frame_schema = list(self.schema)
+        batch_size = batch_size or vectorized_helper.default_batch_size
+
+        def map_columns_partition(iterator):
+            for batch in vectorized_helper.batches(iterator, batch_size):
+                results = func(vectorized_helper.rows_to_columns(batch, frame_schema))
+                for values in zip(*vectorized_helper.results_to_columns(results, schema, len(batch))):
+                    yield list(values)
     else:
-        rdd = self._python.rdd.map(lambda r: [map_columns_func(r)])
+        row = get_row_class(self.schema, self._python.trusted_types)()
+
+        def map_columns_partition(iterator):
+            for r in iterator:
+                row._set_data(r)
+                yield func(row) if is_list else [func(row)]
+    rdd = self._python.map_partitions(map_columns_partition)
     return self._tc.frame.create(rdd, schema)
 
@@ -0,0 +1,80 @@
+# vim: set encoding=utf-8
+
+#  Copyright (c) 2016 Intel Corporation 
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+from sparktk.arguments import affirm_type, require_type
+
+
+def partition_by(self, columns, num_partitions):
+    """
+    Hash partition the rows of the frame by the values of the given columns.
+
+    Parameters
+    ----------
+
+    :param columns: (str or List[str]) Name(s) of the columns whose values pick the partition of each row.
+    :param num_partitions: (int) Number of partitions.
+
+    All the rows with the same values in the given columns end up in the same partition.  The frame remembers its
+    partitioning until it is modified, and save stores it, so the frame loaded from the saved path has it too (as long
+    as all the partitioning columns are loaded).
+
+    Operations on those columns then skip shuffling the rows:
+
+    * join_inner, join_left, join_right and join_outer of two frames partitioned by their join columns (in the order
+      given to the join, with the same data types) into the same number of partitions join each pair of partitions
+      on its own (except for broadcast and skew joins).
+    * group_by and drop_duplicates on columns which include all the partitioning columns work within each partition.
+
+    Partitioning a frame shuffles it once, so it pays off for frames which are joined or grouped on the same columns
+    several times, like dimension frames joined in many places of a pipeline.
+
+    Examples
+    --------
+
+        >>> codes = tc.frame.create([[1, 'a'], [2, 'b'], [3, 'c'], [2, 'd']], [('number', int), ('code', str)])
+        <progress>
+
+        >>> names = tc.frame.create([[1, 'one'], [2, 'two'], [3, 'three']], [('number', int), ('name', str)])
+        <progress>
+
+        >>> codes.partition_by('number', 4)
+        <progress>
+
+        >>> names.partition_by('number', 4)
+        <progress>
+
+    The partitions of the two frames are joined pairwise, without a shuffle:
+
+        >>> joined = codes.join_inner(names, 'number')
+        <progress>
+
+        >>> joined.sort('code')
+        <progress>
+
+        >>> joined.inspect()
+        [#]  number  code  name
+        =======================
+        [0]       1  a     one
+        [1]       2  b     two
+        [2]       3  c     three
+        [3]       2  d     two
+
+    """
+    columns = affirm_type.list_of_str(columns, "columns")
+    require_type(int, num_partitions, "num_partitions")
+    if num_partitions < 1:
+        raise ValueError("num_partitions must be greater than zero, got %s" % num_partitions)
+    self._scala.partitionBy(self._tc.jutils.convert.to_scala_list_string(columns), num_partitions)
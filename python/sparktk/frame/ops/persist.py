@@ -0,0 +1,66 @@
+# vim: set encoding=utf-8
+
+#  Copyright (c) 2016 Intel Corporation 
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+from pyspark import StorageLevel
+from sparktk.arguments import require_type
+
+
+def persist(self, storage_level="MEMORY_ONLY"):
+    """
+    Persist the frame's data, so later operations reuse it instead of recomputing it.
+
+    Parameters
+    ----------
+
+    :param storage_level: (Optional[str]) Spark storage level name, like "MEMORY_ONLY", "MEMORY_AND_DISK",
+                          "MEMORY_ONLY_SER" or "DISK_ONLY".  Default is "MEMORY_ONLY".
+
+    Without persisting, each action on a frame (count, inspect, take, statistics, model training, ...) recomputes
+    the frame from its source.  The data is stored the first time it is computed.
+
+    The persisted data stays attached to the frame when its backend is converted between Scala and Python.
+    Transforms on the frame build on the persisted data, which stays persisted until unpersist is called.
+    See tc.cache_report() for the frames that are currently persisted.
+
+    Examples
+    --------
+
+        >>> frame = tc.frame.create([['Fred',39],['Susan',33],['Thurston',65],['Judy',44]],
+        ...                         schema=[('name', str), ('age', int)])
+
+        >>> frame.is_cached
+        False
+
+        >>> frame.persist("MEMORY_AND_DISK")
+
+        >>> frame.is_cached
+        True
+
+        >>> frame.count()
+        4
+
+        >>> frame.unpersist()
+
+        >>> frame.is_cached
+        False
+
+    """
+    require_type.non_empty_str(storage_level, "storage_level")
+    if not hasattr(StorageLevel, storage_level):
+        raise ValueError("Invalid storage_level '%s'.  Expected the name of a pyspark.StorageLevel, like 'MEMORY_ONLY'."
+                         % storage_level)
+    self._storage_level = storage_level
+    self._persist_backend()
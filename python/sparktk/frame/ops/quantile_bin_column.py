@@ -16,7 +16,7 @@
 #
 
 
-def quantile_bin_column(self, column_name, num_bins=None, bin_column_name=None):
+def quantile_bin_column(self, column_name, num_bins=None, bin_column_name=None, approximate=False, relative_error=0.01):
     """
     Classify column into groups with the same frequency.
 
@@ -57,6 +57,12 @@ def quantile_bin_column(self, column_name, num_bins=None, bin_column_name=None):
                      :math:`\lfloor \sqrt{m} \rfloor`, where :math:`m` is the number of rows.
     :param bin_column_name: (Optional[str]) The name for the new column holding the grouping labels.
                             Default is <column_name>_binned
+    :param approximate: (bool) If True, the cutoffs come from a quantile sketch built in a single pass over the data,
+                        instead of from ranking every element.  Each cutoff is then a value of the column whose rank
+                        is within relative_error * m of the bin boundary, and elements are binned by the cutoffs
+                        (an element equal to a cutoff goes into the bin starting there).  Default is False.
+    :param relative_error: (float) Acceptable rank error of the approximate cutoffs, as a fraction of the number of
+                           rows.  Default is 0.01.
     :return: (List[float]) A list containing the edges of each bin
 
     Examples
@@ -116,4 +122,6 @@ def quantile_bin_column(self, column_name, num_bins=None, bin_column_name=None):
     """
     return self._tc.jutils.convert.from_scala_seq(self._scala.quantileBinColumn(column_name,
                                                   self._tc.jutils.convert.to_scala_option(num_bins),
-                                                  self._tc.jutils.convert.to_scala_option(bin_column_name)))
\ No newline at end of file
+                                                  self._tc.jutils.convert.to_scala_option(bin_column_name),
+                                                  approximate,
+                                                  float(relative_error)))
\ No newline at end of file
@@ -16,7 +16,7 @@
 #
 
 
-def quantiles(self, column_name, quantiles):
+def quantiles(self, column_name, quantiles, approximate=False, relative_error=0.01):
     """
     Returns a new frame with Quantiles and their values.
 
@@ -25,6 +25,13 @@ def quantiles(self, column_name, quantiles):
 
     :param column_name: (str) The column to calculate quantiles on
     :param quantiles: (List[float]) The quantiles being requested
+    :param approximate: (bool) If True, the values come from a quantile sketch built in a single pass over the data
+                        (or from the statistics gathered when the frame was saved), instead of from a sort of the
+                        column.  Each value is then a value of the column whose rank is within
+                        relative_error * (number of values) of the requested quantile, and missing or non-finite
+                        values are ignored.  Default is False.
+    :param relative_error: (float) Acceptable rank error of the approximate values, as a fraction of the number of
+                           values.  Default is 0.01.
     :return: (Frame) A new frame with two columns (float): requested Quantiles and their respective values.
 
     Calculates quantiles on the given column.
@@ -73,6 +80,21 @@ def quantiles(self, column_name, quantiles):
        [1]       50.0                           250.0
        [2]      100.0                           660.0
 
+    With approximate=True, each value is one of the column's values:
+
+        >>> approximate_frame = my_frame.quantiles('final_sale_price', [10, 50, 100], approximate=True)
+        <progress>
+
+        >>> approximate_frame.inspect()
+        [#]  Quantiles  final_sale_price_QuantileValue
+        ==============================================
+        [0]       10.0                            95.0
+        [1]       50.0                           250.0
+        [2]      100.0                           660.0
+
     """
     from sparktk.frame.frame import Frame
-    return Frame(self._tc, self._scala.quantiles(column_name, self._tc.jutils.convert.to_scala_list_double(quantiles)))
+    return Frame(self._tc, self._scala.quantiles(column_name,
+                                                 self._tc.jutils.convert.to_scala_list_double(quantiles),
+                                                 approximate,
+                                                 float(relative_error)))
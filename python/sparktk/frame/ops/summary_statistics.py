@@ -0,0 +1,60 @@
+# vim: set encoding=utf-8
+
+#  Copyright (c) 2016 Intel Corporation 
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+from sparktk.arguments import affirm_type, require_type
+
+
+def summary_statistics(self, columns, weights_column=None, use_population_variance=False):
+    """
+    Calculate summary statistics of several columns in a single pass over the frame.
+
+    Parameters
+    ----------
+
+    :param columns: (str or List[str]) The column(s) to be statistically summarized.
+                    Must contain numerical data; all NaNs and infinite values are excluded from the calculation.
+    :param weights_column: (Optional[str]) Name of column holding weights of column values.
+    :param use_population_variance: (Optional[bool]) If true, the variance is calculated as the population variance.
+                                    If false, the variance calculated as the sample variance.
+                                    Default is false.
+    :return: (Frame) A new frame with a row for each column, in the given order.
+
+    The statistics of each column are those of column_summary_statistics, with the same treatment of bad rows and
+    weights, but all the columns are summarized by a single Spark job instead of one job each.  The returned frame
+    has a *column* column holding the column name, followed by the columns *mean*, *geometric_mean*, *variance*,
+    *standard_deviation*, *total_weight*, *minimum*, *maximum*, *mean_confidence_lower*, *mean_confidence_upper*,
+    *bad_row_count*, *good_row_count*, *positive_weight_count* and *non_positive_weight_count*.
+
+    Examples
+    --------
+
+        >>> my_frame = tc.frame.create([[2, 1.0], [3, 2.0], [3, 3.0], [5, 4.0]], [('a', int), ('b', float)])
+        <progress>
+
+        >>> stats = my_frame.summary_statistics(['a', 'b'])
+        <progress>
+
+        >>> stats.take(2, columns=['column', 'mean', 'minimum', 'maximum', 'good_row_count'])
+        [['a', 3.25, 2.0, 5.0, 4], ['b', 2.5, 1.0, 4.0, 4]]
+
+    """
+    columns = affirm_type.list_of_str(columns, "columns")
+    require_type(bool, use_population_variance, "use_population_variance")
+    from sparktk.frame.frame import Frame
+    return Frame(self._tc, self._scala.summaryStatistics(self._tc.jutils.convert.to_scala_list_string(columns),
+                                                         self._tc.jutils.convert.to_scala_option(weights_column),
+                                                         use_population_variance))
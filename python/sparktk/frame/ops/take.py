@@ -16,9 +16,11 @@
 #
 
 from collections import namedtuple
+from itertools import islice
+import cPickle
 
 import sparktk.frame.schema
-from sparktk.dtypes import dtypes
+from sparktk.frame import columnar
 from sparktk.arguments import affirm_type, require_type
 from sparktk.frame.schema import get_schema_for_columns
 
@@ -86,9 +88,9 @@ def take(self, n, offset=0, columns=None):
             return []
 
     if self._is_scala:
-        scala_data = self._scala.take(n, offset, self._tc.jutils.convert.to_scala_option_list_string(columns))
+        pickled_batch = self._scala.takePython(n, offset, self._tc.jutils.convert.to_scala_option_list_string(columns))
         schema = get_schema_for_columns(self.schema, columns) if columns else self.schema
-        data = TakeCollectHelper.scala_rows_to_python(self._tc, scala_data, schema)
+        data = TakeCollectHelper.pickled_batch_to_python(pickled_batch, schema)
     else:
         require_type.non_negative_int(n, "n")
         if offset:
@@ -118,24 +120,44 @@ def take_rich(frame, n, offset=0, columns=None):
 
 
 def _take_offset(frame, n, offset, columns=None):
-    """Helper to take from an offset in python (this could be relatively slow)"""
+    """Helper to take from an offset in python, running a job only on the partitions which hold the rows"""
     select_columns = TakeCollectHelper.get_select_columns_function(frame.schema, columns) if columns else None
 
-    count = 0
-    data = []
-    iterator = frame._python.rdd.toLocalIterator()
-    try:
-        row = iterator.next()
-        while count < offset:
-            count += 1
-            row = iterator.next()
-        while count < offset+n:
-            data.append(select_columns(row) if select_columns else row)
-            count += 1
-            row = iterator.next()
-    except StopIteration:
-        pass
-    return data
+    ranges = get_partition_ranges(frame._python.partition_counts(), offset, n)
+    if not ranges:
+        return []
+
+    def take_partition(iterator):
+        return [select_columns(row) if select_columns else row for row in iterator]
+
+    def slice_partition(index, iterator):
+        if index in ranges:
+            start, end = ranges[index]
+            return islice(iterator, start, end)
+        return iter([])
+
+    sliced_rdd = frame._python.rdd.mapPartitionsWithIndex(slice_partition, preservesPartitioning=True)
+    return frame._tc.sc.runJob(sliced_rdd, take_partition, sorted(ranges.keys()))
+
+
+def get_partition_ranges(partition_counts, offset, n):
+    """
+    Finds the partitions which hold the rows [offset, offset + n)
+
+    :param partition_counts: number of rows in each partition
+    :param offset: index of the first row
+    :param n: number of rows
+    :return: dict of partition index to the (start, end) row slice of that partition
+    """
+    ranges = {}
+    end = offset + n
+    partition_start = 0
+    for index, count in enumerate(partition_counts):
+        partition_end = partition_start + count
+        if count > 0 and partition_end > offset and partition_start < end:
+            ranges[index] = (max(offset, partition_start) - partition_start, min(end, partition_end) - partition_start)
+        partition_start = partition_end
+    return ranges
 
 
 class TakeCollectHelper(object):
@@ -155,24 +177,9 @@ class TakeCollectHelper(object):
         return select_columns
 
     @staticmethod
-    def scala_rows_to_python(tc, scala_data, schema):
-        """converts list of lists of scala value to list of lists of python values, according to schema"""
-        row_schema = schema
-
-        def to_dtype(value, dtype):
-            try:
-                if type(dtype) == sparktk.dtypes.vector:
-                    value = tc.jutils.convert.from_scala_vector(value)
-                if type(dtype) == sparktk.dtypes._Matrix:
-                    value = tc.jutils.convert.from_scala_matrix(value)
-                return dtypes.cast(value, dtype)
-            except:
-                return None
-
-        def scala_row_to_python(scala_row):
-            num_cols = scala_row.length()
-            return [to_dtype(scala_row.get(i), row_schema[i][1]) for i in xrange(num_cols)]
-
-        python_data = map(scala_row_to_python, list(scala_data))
-
-        return python_data
+    def pickled_batch_to_python(pickled_batch, schema):
+        """
+        converts the pickled columnar record batch returned by a Scala take or collect to a list of lists of python
+        values, according to schema (the rows arrive in one transfer, rather than a py4j call per cell)
+        """
+        return columnar.decode_batch(cPickle.loads(bytes(pickled_batch)), schema)
@@ -15,6 +15,19 @@
 #  limitations under the License.
 #
 
+from collections import OrderedDict
+import threading
+import Queue
+import numpy as np
+from dateutil.tz import tzlocal
+from pyspark.rdd import RDD
+
+from sparktk import dtypes
+from sparktk.arguments import affirm_type, require_type
+from sparktk.frame import columnar
+from sparktk.frame.schema import schema_to_python, get_schema_for_columns
+from sparktk.frame.ops.take import TakeCollectHelper, get_partition_ranges
+
 
 def to_pandas(self, n=None, offset=0, columns=None):
     """
@@ -31,6 +44,10 @@ def to_pandas(self, n=None, offset=0, columns=None):
     :param columns: (Optional(List[str])) Column filter.  The list of names to be included.  Default is all columns.
     :return: (pandas.DataFrame) A new pandas dataframe object containing the taken frame data.
 
+    The data is streamed from the frame's partitions straight into typed numpy column arrays, which are sized up
+    front from the frame's partition row counts.  Only the partitions which hold the requested rows are read.
+    (See 'to_pandas_iter' to process a frame in pieces which fit in driver memory)
+
     Examples
     --------
 
@@ -66,54 +83,246 @@ def to_pandas(self, n=None, offset=0, columns=None):
         3      Judy  555-2183
 
     """
+    pandas = _import_pandas()
+    if n is not None:
+        require_type.non_negative_int(n, "n")
+    require_type.non_negative_int(offset, "offset")
+    if columns is not None:
+        columns = affirm_type.list_of_str(columns, "columns")
+
+    schema, batch_rdd, partition_counts = _get_columnar_source(self, columns)
+    if n is None:
+        n = max(0, sum(partition_counts) - offset)
+    ranges = get_partition_ranges(partition_counts, offset, n)
+    num_rows = sum(end - start for start, end in ranges.values())
+    for buffers in _iter_column_buffers(schema, _iter_partitions(self._tc.sc, batch_rdd, ranges), [num_rows]):
+        return buffers.to_pandas(pandas)
+    return _ColumnBuffers(schema, 0).to_pandas(pandas)
+
+
+def to_pandas_iter(self, batch_rows=None, columns=None):
+    """
+    Iterates over the frame's data as a sequence of local pandas dataframes.
+
+    Parameters
+    ----------
+
+    :param batch_rows: (Optional(int)) The maximum number of rows in each pandas dataframe.  By default, there is
+                       one pandas dataframe per partition of the frame.
+    :param columns: (Optional(List[str])) Column filter.  The list of names to be included.  Default is all columns.
+    :return: (iterator of pandas.DataFrame) pandas dataframes holding the frame's rows, in order
+
+    Only one piece of the frame is held by the driver at a time, while the next partition is fetched in the
+    background, so frames which are larger than the driver's memory can be processed.  The index of each pandas
+    dataframe continues where the previous one ended.
+
+    Examples
+    --------
+
+        >>> frame = tc.frame.create([['Fred', 39], ['Susan', 33], ['Thurston', 65], ['Judy', 44]],
+        ...                         schema=[('name', str), ('age', int)])
+
+        >>> [len(df) for df in frame.to_pandas_iter(batch_rows=3)]
+        [3, 1]
+
+        >>> total_age = 0
+        >>> for df in frame.to_pandas_iter(batch_rows=3):
+        ...     total_age += df['age'].sum()
+        >>> total_age
+        181
+
+    """
+    pandas = _import_pandas()
+    if batch_rows is not None:
+        require_type.non_negative_int(batch_rows, "batch_rows")
+        if batch_rows == 0:
+            raise ValueError("batch_rows must be greater than 0")
+    if columns is not None:
+        columns = affirm_type.list_of_str(columns, "columns")
+
+    schema, batch_rdd, partition_counts = _get_columnar_source(self, columns)
+    ranges = get_partition_ranges(partition_counts, 0, sum(partition_counts))
+    if batch_rows is None:
+        chunk_sizes = [ranges[index][1] for index in sorted(ranges.keys())]
+    else:
+        total = sum(partition_counts)
+        chunk_sizes = [batch_rows] * (total // batch_rows) + ([total % batch_rows] if total % batch_rows else [])
+    return _iter_pandas(pandas, schema, _iter_partitions(self._tc.sc, batch_rdd, ranges), chunk_sizes)
+
+
+def _iter_pandas(pandas, schema, partitions, chunk_sizes):
+    row_index = 0
+    for buffers in _iter_column_buffers(schema, partitions, chunk_sizes):
+        yield buffers.to_pandas(pandas, row_index)
+        row_index += buffers.num_rows
+
+
+def _import_pandas():
     try:
         import pandas
     except:
         raise RuntimeError("pandas module not found, unable to download.  Install pandas or try the take command.")
-    from sparktk.frame.ops.take import take_rich
+    return pandas
+
 
-    result = take_rich(self, n, offset, columns)
-    headers, data_types = zip(*result.schema)
-    frame_data = result.data
+def _get_columnar_source(frame, columns):
+    """
+    Gets the data to stream for the given frame columns
+
+    :return: tuple of (python schema, pyspark RDD of columnar record batches, number of rows in each partition)
+    """
+    sc = frame._tc.sc
+    if frame._is_scala:
+        scala_frame = frame._scala
+        scala_rdd = scala_frame.rdd()
+        scala_schema = scala_frame.schema()
+        if columns:
+            scala_rdd = sc._jvm.org.trustedanalytics.sparktk.frame.internal.rdd.FrameRdd(scala_schema, scala_rdd)\
+                .selectColumns(frame._tc.jutils.convert.to_scala_list_string(columns))
+            scala_schema = scala_rdd.frameSchema()
+        python_java_rdd = sc._jvm.org.trustedanalytics.sparktk.frame.internal.rdd.PythonJavaRdd
+        batch_rdd = RDD(python_java_rdd.scalaToPythonColumnar(scala_rdd, scala_schema, columnar.default_batch_size), sc)
+        return schema_to_python(sc, scala_schema), batch_rdd, list(scala_frame.partitionRowCounts())
 
-    from sparktk import dtypes
-    import datetime
+    python_frame = frame._python
+    rdd = python_frame.rdd
+    schema = python_frame.schema
+    if columns:
+        rdd = rdd.map(TakeCollectHelper.get_select_columns_function(schema, columns))
+        schema = get_schema_for_columns(schema, columns)
+    batch_rdd = rdd.mapPartitions(columnar.get_encode_partition_function(schema))
+    return schema, batch_rdd, python_frame.partition_counts()
 
-    date_time_columns = [i for i, x in enumerate(self.schema) if x[1] in (dtypes.datetime, datetime.datetime)]
-    has_date_time = len(date_time_columns) > 0
 
-    # translate our datetime long to datetime, so that it gets into the pandas df as a datetime column
-    def long_to_date_time(row):
-        for i in date_time_columns:
-            if isinstance(row[i], long):
-                row[i] = datetime.datetime.fromtimestamp(row[i]//1000).replace(microsecond=row[i]%1000*1000)
-        return row
+def _iter_partitions(sc, batch_rdd, ranges):
+    """
+    Fetches the record batches of each partition in ranges, in partition order, running the job for the next
+    partition in a background thread while the current one is being consumed
 
-    if (has_date_time):
-        frame_data = map(long_to_date_time, frame_data)
+    :return: iterator of (record batches, start row, end row) per partition
+    """
+    partitions = sorted(ranges.keys())
+    results = Queue.Queue(maxsize=1)
+    stopped = threading.Event()  # set when the consumer is done, so the fetcher does not wait on a full queue forever
 
-    # create pandas df
-    pandas_df = pandas.DataFrame(frame_data, columns=headers)
+    def put(result):
+        while not stopped.is_set():
+            try:
+                results.put(result, timeout=0.1)
+                return True
+            except Queue.Full:
+                pass
+        return False
 
-    for i, dtype in enumerate(data_types):
-        dtype_str = _sparktk_dtype_to_pandas_str(dtype)
+    def fetch():
         try:
-            pandas_df[[headers[i]]] = pandas_df[[headers[i]]].astype(dtype_str)
-        except (TypeError, ValueError):
-            if dtype_str.startswith("int"):
-                # DataFrame does not handle missing values in int columns. If we get this error, use the 'object' datatype instead.
-                print "WARNING - Encountered problem casting column %s to %s, possibly due to missing values (i.e. presence of None).  Continued by casting column %s as 'object'" % (headers[i], dtype_str, headers[i])
-                pandas_df[[headers[i]]] = pandas_df[[headers[i]]].astype("object")
+            for index in partitions:
+                if stopped.is_set() or not put((sc.runJob(batch_rdd, lambda iterator: iterator, [index]), None)):
+                    return
+        except Exception as e:
+            put((None, e))
+
+    fetcher = threading.Thread(target=fetch, name="sparktk-to-pandas-prefetch")
+    fetcher.daemon = True
+    fetcher.start()
+    try:
+        for index in partitions:
+            batches, error = results.get()
+            if error is not None:
+                raise error
+            start, end = ranges[index]
+            yield batches, start, end
+    finally:
+        stopped.set()
+
+
+def _iter_column_buffers(schema, partitions, chunk_sizes):
+    """
+    Copies the requested rows of each partition's record batches into _ColumnBuffers of the given sizes
+
+    :return: iterator of filled _ColumnBuffers, one per chunk size
+    """
+    chunk_sizes = iter(chunk_sizes)
+    buffers = None
+    for batches, start, end in partitions:
+        row = 0  # index within the partition of the batch's first row
+        for batch in batches:
+            batch_size = batch[0]
+            low, high = max(start - row, 0), min(end - row, batch_size)
+            if low < high:
+                arrays = columnar.decode_batch_arrays(batch, schema)
+                while low < high:
+                    if buffers is None:
+                        buffers = _ColumnBuffers(schema, next(chunk_sizes))
+                    count = min(high - low, buffers.num_rows - buffers.position)
+                    buffers.append(arrays, low, low + count)
+                    low += count
+                    if buffers.position == buffers.num_rows:
+                        yield buffers
+                        buffers = None
+            row += batch_size
+
+
+class _ColumnBuffers(object):
+    """Preallocated typed numpy arrays, one per column, filled from decoded record batches"""
+
+    def __init__(self, schema, num_rows):
+        self.schema = schema
+        self.num_rows = num_rows
+        self.position = 0
+        self.values = [np.empty(num_rows, dtype=_get_buffer_numpy_type(data_type)) for name, data_type in schema]
+        self.missing = [None] * len(schema)
+
+    def append(self, arrays, start, end):
+        """copies rows [start, end) of the decoded batch arrays (see columnar.decode_batch_arrays)"""
+        target = slice(self.position, self.position + end - start)
+        for i, (values, missing) in enumerate(arrays):
+            if isinstance(values, np.ndarray):
+                self.values[i][target] = values[start:end]
             else:
-                raise
-    return pandas_df
-
-
-def _sparktk_dtype_to_pandas_str(dtype):
-    """maps spark-tk schema types to types understood by pandas, returns string"""
-    from sparktk import dtypes
-    if dtype ==dtypes.datetime:
-        return "datetime64[ns]"
-    elif dtypes.dtypes.is_primitive_type(dtype):
-        return dtypes.dtypes.to_string(dtype)
-    return "object"
+                # assign one by one, so numpy does not try to broadcast vector or matrix values
+                column = self.values[i]
+                for j, value in enumerate(values[start:end], self.position):
+                    column[j] = value
+            if missing is not None:
+                if self.missing[i] is None:
+                    self.missing[i] = np.zeros(self.num_rows, dtype=bool)
+                self.missing[i][target] = missing[start:end]
+        self.position += end - start
+
+    def to_pandas(self, pandas, first_index=0):
+        """builds a pandas DataFrame from the buffers, with its index starting at first_index"""
+        data = OrderedDict()
+        for (name, data_type), values, missing in zip(self.schema, self.values, self.missing):
+            dtype = dtypes.dtypes.get_from_type(data_type)
+            if dtype is dtypes.datetime:
+                values = values.astype('datetime64[ms]')
+                if missing is not None:
+                    values[missing] = np.datetime64('NaT')
+                # sparktk datetimes are ms since epoch, presented in the local time zone
+                values = pandas.DatetimeIndex(values).tz_localize('UTC').tz_convert(tzlocal()).tz_localize(None).values
+            elif missing is not None:
+                if values.dtype.kind == 'f':
+                    values[missing] = np.nan
+                else:
+                    # DataFrame does not handle missing values in int columns, so use the 'object' datatype instead
+                    print "WARNING - Encountered missing values (i.e. presence of None) in column %s.  Continued by casting column %s as 'object'" % (name, name)
+                    values = values.astype(object)
+                    values[missing] = None
+            data[name] = values
+        index = pandas.RangeIndex(first_index, first_index + self.num_rows) if hasattr(pandas, 'RangeIndex') \
+            else range(first_index, first_index + self.num_rows)
+        return pandas.DataFrame(data, columns=[name for name, data_type in self.schema], index=index)
+
+
+_buffer_numpy_types = {
+    int: np.int32,
+    long: np.int64,
+    float: np.float64,
+    dtypes.datetime: np.int64,  # ms since epoch
+}
+
+
+def _get_buffer_numpy_type(data_type):
+    """numpy type of the column buffer for the given sparktk data type"""
+    return _buffer_numpy_types.get(dtypes.dtypes.get_from_type(data_type), object)
@@ -0,0 +1,29 @@
+# vim: set encoding=utf-8
+
+#  Copyright (c) 2016 Intel Corporation 
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+def unpersist(self):
+    """
+    Remove the frame's persisted data from memory and disk.
+
+    Releases everything persisted for the frame with persist, including data persisted before a backend
+    conversion or before later transforms.  (See persist)
+    """
+    frame_cache = self._tc.sc._jvm.org.trustedanalytics.sparktk.frame.internal.FrameCache
+    for rdd_id in self._persisted_rdd_ids:
+        frame_cache.unpersist(self._tc.sc._jsc.sc(), rdd_id)
+    self._persisted_rdd_ids = []
+    self._storage_level = None
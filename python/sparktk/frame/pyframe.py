@@ -18,6 +18,82 @@
 class PythonFrame(object):
     """frame backend using a Python objects: pyspark.rdd.RDD, [(str, dtype), (str, dtype), ...]"""
 
-    def __init__(self, rdd, schema=None):
-        self.rdd = rdd
+    def __init__(self, rdd, schema=None, trusted_types=False):
+        self._rdd = rdd
+        self._pending = []  # per-partition transforms not yet applied to _rdd
         self.schema = schema
+        self.trusted_types = trusted_types  # whether every cell is known to already have its schema type
+        self._partition_counts = None  # rows per partition, computed on demand
+
+    @property
+    def rdd(self):
+        """the frame's RDD, with any queued transforms applied"""
+        self.flush()
+        return self._rdd
+
+    @rdd.setter
+    def rdd(self, value):
+        self._pending = []
+        self._rdd = value
+        self.trusted_types = False
+        self._partition_counts = None
+
+    @property
+    def num_partitions(self):
+        """number of partitions of the RDD (queued transforms work partition by partition, so they keep it)"""
+        return self._rdd.getNumPartitions()
+
+    @property
+    def has_pending(self):
+        """answers whether there are queued transforms which have not been applied to the RDD yet"""
+        return len(self._pending) > 0
+
+    def queue(self, partition_func, preserves_types=False):
+        """
+        Queues a transform to be applied lazily to the frame's rows
+
+        Consecutive queued transforms are compiled into a single mapPartitions stage the next time the rdd is
+        accessed, so each record makes only one trip through the Python worker for the whole sequence.
+
+        :param partition_func: function which takes an iterator of rows (lists) and returns an iterator of rows
+        :param preserves_types: True if the function only passes through existing cells (like a filter), so rows
+                                keep their trusted_types status
+        """
+        self._pending.append(partition_func)
+        self._partition_counts = None
+        if not preserves_types:
+            self.trusted_types = False
+
+    def flush(self):
+        """applies the queued transforms to the RDD as one fused mapPartitions stage"""
+        if self._pending:
+            self._rdd = self._map_partitions(self._pending)
+            self._pending = []
+
+    def partition_counts(self):
+        """
+        Returns the number of rows in each partition of the RDD, in partition order
+
+        The counts are computed with one pass over the data the first time they are needed, and kept until the
+        frame's rows change.
+        """
+        if self._partition_counts is None:
+            counts = self.rdd.mapPartitionsWithIndex(lambda index, iterator: [(index, sum(1 for row in iterator))]).collect()
+            self._partition_counts = [count for index, count in sorted(counts)]
+        return self._partition_counts
+
+    def map_partitions(self, partition_func):
+        """
+        Returns a new RDD of this frame's rows passed through partition_func, fused into the same stage as any
+        transforms still queued on this frame (this frame itself is left unchanged)
+        """
+        return self._map_partitions(self._pending + [partition_func])
+
+    def _map_partitions(self, stages):
+        stages = list(stages)
+
+        def fused(iterator):
+            for stage in stages:
+                iterator = stage(iterator)
+            return iterator
+        return self._rdd.mapPartitions(fused, preservesPartitioning=True)
@@ -16,10 +16,13 @@
 #
 
 from collections import OrderedDict
+from datetime import datetime
 from sparktk.dtypes import dtypes
 
 class Row(object):
 
+    __slots__ = ('__schema_dict', '__data', '__dtypes', '__indices_dict', '__dtype_constructors')
+
     def __init__(self, schema, data=None):
         """
         Expects schema to as list of tuples
@@ -34,7 +37,7 @@ class Row(object):
         self.__dtype_constructors = [dtypes.get_constructor(t) for t in self.__dtypes]
 
     def __getattr__(self, name):
-        if name != "_Row__schema_dict" and name in self.__schema_dict.keys():
+        if name != "_Row__schema_dict" and name in self.__schema_dict:
             return self._get_cell_value(name)
         return super(Row, self).__getattribute__(name)
 
@@ -98,3 +101,73 @@ class Row(object):
             return con(self.__data[index])
         except IndexError:
             raise IndexError("Internal Error: improper index %d used in schema with %d columns" % (index, len(self.__schema_dict)))
+
+
+# types whose values are stored as-is by a validated backend, so reading them needs no constructor
+_trusted_types = [int, long, float, unicode, datetime]
+
+_row_classes = {}
+
+
+def _identity(value):
+    return value
+
+
+def _make_accessor(index, constructor):
+    if constructor is _identity:
+        return property(lambda self: self._Row__data[index])
+    return property(lambda self: constructor(self._Row__data[index]))
+
+
+def _rebuild_row(schema, trusted_types, data):
+    return get_row_class(schema, trusted_types)(data)
+
+
+def get_row_class(schema, trusted_types=False):
+    """
+    Returns a Row subclass specialized for the given schema
+
+    The subclass keeps the schema lookups at the class level, so instances only hold their data in a slot, and has
+    a property per column, so row.column_name does not go through __getattr__.  Classes are cached per schema.
+
+    :param schema: list of (name, type) tuples
+    :param trusted_types: if True, cells of primitive types are returned without passing through their type's
+                          constructor, which is only safe when the rows come from a backend that has already
+                          validated them against the schema
+    :return: Row subclass, whose constructor takes only the (optional) row data
+    """
+    standardized_schema = [(name, dtypes.get_from_type(t)) for name, t in schema]
+    key = (tuple((name, dtypes.to_string(t)) for name, t in standardized_schema), bool(trusted_types))
+    row_class = _row_classes.get(key, None)
+    if row_class is None:
+        row_class = _make_row_class(standardized_schema, bool(trusted_types))
+        _row_classes[key] = row_class
+    return row_class
+
+
+def _make_row_class(schema, trusted_types):
+    schema_dict = OrderedDict(schema)
+    constructors = [_identity if trusted_types and t in _trusted_types else dtypes.get_constructor(t)
+                    for t in schema_dict.values()]
+
+    def __init__(self, data=None):
+        self._Row__data = [] if data is None else data
+
+    def __reduce__(self):
+        return _rebuild_row, (schema, trusted_types, self._Row__data)
+
+    members = {'__slots__': (),
+               '__init__': __init__,
+               '__reduce__': __reduce__,
+               '_Row__schema_dict': schema_dict,
+               '_Row__dtypes': schema_dict.values(),
+               '_Row__indices_dict': dict([(k, i) for i, k in enumerate(schema_dict.keys())]),
+               '_Row__dtype_constructors': constructors}
+    for index, name in enumerate(schema_dict.keys()):
+        try:
+            name = str(name)
+        except UnicodeEncodeError:
+            continue  # left to __getattr__
+        if not name.startswith('__') and not hasattr(Row, name):
+            members[name] = _make_accessor(index, constructors[index])
+    return type('Row', (Row,), members)
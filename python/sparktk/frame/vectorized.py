@@ -0,0 +1,125 @@
+# vim: set encoding=utf-8
+
+#  Copyright (c) 2016 Intel Corporation 
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+"""
+Helpers for vectorized UDFs, which operate on a batch of rows as numpy column arrays instead of one Row at a time
+"""
+
+from collections import OrderedDict
+from itertools import islice
+from datetime import datetime
+import numpy as np
+
+from sparktk.dtypes import dtypes, _Vector
+
+default_batch_size = 10000
+
+_numpy_types = {
+    int: np.int32,
+    long: np.int64,
+    float: np.float64,
+    datetime: np.int64,  # ms since epoch
+}
+
+
+def _get_numpy_type(data_type):
+    return _numpy_types.get(dtypes.get_from_type(data_type), None)
+
+
+def batches(iterator, batch_size):
+    """groups an iterator of rows into lists of at most batch_size rows"""
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def rows_to_columns(rows, schema):
+    """
+    Converts a list of rows to an OrderedDict of column name -> numpy array
+
+    Numeric columns become typed arrays (int columns with missing values become float64 with NaN), datetime
+    columns are int64 ms since epoch, vector(n) columns are 2-D float64 arrays and all others are object arrays.
+    """
+    columns = OrderedDict()
+    for index, (name, data_type) in enumerate(schema):
+        values = [row[index] for row in rows]
+        numpy_type = _get_numpy_type(data_type)
+        if numpy_type is not None:
+            if any(v is None for v in values):
+                columns[name] = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+            else:
+                columns[name] = np.array(values, dtype=numpy_type)
+        elif isinstance(data_type, _Vector):
+            columns[name] = np.array([np.full(data_type.length, np.nan) if v is None else data_type.constructor(v) for v in values],
+                                     dtype=np.float64).reshape(len(values), data_type.length)
+        else:
+            column = np.empty(len(values), dtype=object)
+            column[:] = values
+            columns[name] = column
+    return columns
+
+
+def column_to_values(result, data_type, num_rows, column_name):
+    """
+    Validates a column array returned by a vectorized UDF against its schema entry and converts it to a list of
+    python values, with NaN in numeric columns becoming None
+    """
+    if isinstance(data_type, _Vector):
+        array = np.asarray(result, dtype=np.float64)
+        if array.shape != (num_rows, data_type.length):
+            raise ValueError("Vectorized UDF returned shape %s for column '%s', expected (%s, %s)"
+                             % (array.shape, column_name, num_rows, data_type.length))
+        return list(array)
+
+    array = np.asarray(result)
+    if array.ndim != 1 or len(array) != num_rows:
+        raise ValueError("Vectorized UDF returned %s values for column '%s', expected %s"
+                         % (array.shape, column_name, num_rows))
+    numpy_type = _get_numpy_type(data_type)
+    if numpy_type is not None and array.dtype.kind in 'biuf':
+        missing = np.isnan(array) if array.dtype.kind == 'f' else None
+        values = array.astype(numpy_type if missing is None else np.float64).tolist()
+        if missing is not None:
+            if numpy_type is not np.float64:
+                values = [None if m else long(v) if numpy_type is np.int64 else int(v) for v, m in zip(values, missing)]
+            else:
+                values = [None if m else v for v, m in zip(values, missing)]
+        return values
+    return [dtypes.cast(v, data_type) for v in array.tolist()]
+
+
+def results_to_columns(results, schema, num_rows):
+    """
+    Validates the output of a vectorized UDF against the given schema (a single (name, type) tuple or a list of
+    them) and returns a list of value lists, one per column
+    """
+    if isinstance(schema, list):
+        if not isinstance(results, (list, tuple)) or len(results) != len(schema):
+            raise ValueError("Vectorized UDF must return a list of %s column arrays to match the schema" % len(schema))
+        return [column_to_values(result, data_type, num_rows, name) for result, (name, data_type) in zip(results, schema)]
+    name, data_type = schema
+    return [column_to_values(results, data_type, num_rows, name)]
+
+
+def to_mask(result, num_rows):
+    """validates a boolean mask returned by a vectorized predicate"""
+    mask = np.asarray(result, dtype=bool)
+    if mask.shape != (num_rows,):
+        raise ValueError("Vectorized predicate returned mask of shape %s, expected (%s,)" % (mask.shape, num_rows))
+    return mask
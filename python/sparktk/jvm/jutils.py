@@ -22,6 +22,32 @@ class JUtils(object):
     def __init__(self, sc):
         self.sc = sc
         self.convert = JConvert(self)
+        self._py4j_call_count = 0
+        self._count_py4j_calls()
+
+    def _count_py4j_calls(self):
+        """wraps the py4j gateway client's send_command, which every call into the JVM goes through, to count calls"""
+        gateway_client = self.sc._gateway._gateway_client
+        # keep the original send_command on the client, so that every JUtils made for it wraps the original rather
+        # than adding another layer over the previous JUtils' wrapper
+        send_command = getattr(gateway_client, '_sparktk_send_command', None)
+        if send_command is None:
+            send_command = gateway_client.send_command
+            gateway_client._sparktk_send_command = send_command
+
+        def counting_send_command(*args, **kwargs):
+            self._py4j_call_count += 1
+            return send_command(*args, **kwargs)
+        gateway_client.send_command = counting_send_command
+
+    @property
+    def py4j_call_count(self):
+        """number of calls made into the JVM through py4j (since the last reset_py4j_call_count)"""
+        return self._py4j_call_count
+
+    def reset_py4j_call_count(self):
+        """resets py4j_call_count to 0"""
+        self._py4j_call_count = 0
 
     @staticmethod
     def is_java(item):
@@ -0,0 +1,92 @@
+# vim: set encoding=utf-8
+
+#  Copyright (c) 2016 Intel Corporation 
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+import unittest
+import cPickle
+import numpy as np
+
+import sparktk.dtypes as dtypes
+from sparktk.frame import columnar
+
+
+class TestColumnar(unittest.TestCase):
+
+    schema = [('i', int),
+              ('l', long),
+              ('f', float),
+              ('s', unicode),
+              ('t', dtypes.datetime),
+              ('v', dtypes.vector(2)),
+              ('m', dtypes.matrix)]
+
+    rows = [[1, 10L, 1.5, u'a', 1451606400000L, np.array([1.0, 2.0]), np.array([[1.0, 2.0], [3.0, 4.0]])],
+            [None, None, None, None, None, None, None],
+            [-3, 2L ** 62, -0.25, u'b', 0L, np.array([-1.0, 0.0]), np.array([[5.0, 6.0], [7.0, 8.0]])]]
+
+    def test_round_trip(self):
+        batch = columnar.encode_batch(self.rows, self.schema)
+        self.assertEqual(3, batch[0])
+        decoded = columnar.decode_batch(batch, self.schema)
+        self.assertEqual(3, len(decoded))
+        for expected, actual in zip(self.rows, decoded):
+            self.assertEqual(expected[:5], actual[:5])
+            for i in [5, 6]:
+                if expected[i] is None:
+                    self.assertIsNone(actual[i])
+                else:
+                    self.assertTrue(np.array_equal(expected[i], actual[i]))
+
+    def test_unconvertible_cells_become_none(self):
+        rows = [['abc', '12', 'x', 7, 'not a date', [1.0], 'not a matrix'],
+                [1, 2L, 3.5, u'd', 0L, [1.0, 2.0], [[1.0]]]]
+        batch = columnar.encode_batch(rows, self.schema)
+        decoded = columnar.decode_batch(batch, self.schema)
+        self.assertEqual([None, 12L, None, 7, None, None, None], decoded[0])
+        self.assertEqual([1, 2L, 3.5, u'd', 0L], decoded[1][:5])
+        self.assertTrue(np.array_equal(np.array([1.0, 2.0]), decoded[1][5]))
+        self.assertTrue(np.array_equal(np.array([[1.0]]), decoded[1][6]))
+
+    def test_no_validity_without_nulls(self):
+        batch = columnar.encode_batch([[1], [2]], [('i', int)])
+        self.assertIsNone(batch[1][0])
+
+    def test_encode_partition_batch_size(self):
+        encode = columnar.get_encode_partition_function([('i', int)], batch_size=4)
+        batches = list(encode(iter([[n] for n in xrange(10)])))
+        self.assertEqual([4, 4, 2], [b[0] for b in batches])
+        decode = columnar.get_decode_function([('i', int)])
+        self.assertEqual([[n] for n in xrange(10)], [row for b in batches for row in decode(b)])
+
+    def test_encode_column_array(self):
+        schema = [('i', int), ('t', dtypes.datetime), ('s', unicode)]
+        batch = [3,
+                 columnar.encode_column_array(np.array([1, 0, 3], dtype=np.int64), int, np.array([False, True, False])),
+                 columnar.encode_column_array(np.array([0, 1, 2], dtype=np.int64), dtypes.datetime),
+                 columnar.encode_column_array([u'a', None, u'c'], unicode)]
+        self.assertIsNone(batch[2][0])
+        self.assertEqual([[1, 0L, u'a'], [None, 1L, None], [3, 2L, u'c']], columnar.decode_batch(batch, schema))
+
+    def test_pickled_batch_to_python(self):
+        from sparktk.frame.ops.take import TakeCollectHelper
+        schema = self.schema[:5]
+        rows = [row[:5] for row in self.rows]
+        pickled_batch = bytearray(cPickle.dumps(columnar.encode_batch(rows, schema), 2))
+        self.assertEqual(rows, TakeCollectHelper.pickled_batch_to_python(pickled_batch, schema))
+
+
+if __name__ == '__main__':
+    unittest.main()
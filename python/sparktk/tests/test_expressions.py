@@ -0,0 +1,66 @@
+# vim: set encoding=utf-8
+
+#  Copyright (c) 2016 Intel Corporation 
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+import unittest
+
+from sparktk.frame.expressions import col, lit, expr, get_column_sql, is_expression
+
+
+class TestExpressions(unittest.TestCase):
+
+    def test_comparison_and_logic(self):
+        e = (col("age") > 30) & ~(col("name") == "O'Neil") | col("tenure").is_null()
+        self.assertEqual("(((`age` > 30) AND (NOT (`name` = 'O\\'Neil'))) OR (`tenure` IS NULL))", e.sql)
+
+    def test_arithmetic_with_literals_on_either_side(self):
+        self.assertEqual("((2 * `age`) - `tenure`)", (2 * col("age") - col("tenure")).sql)
+        self.assertEqual("(`a` / CAST(0.5 AS DOUBLE))", (col("a") / 0.5).sql)
+        self.assertEqual("(- `a`)", (-col("a")).sql)
+
+    def test_literals(self):
+        self.assertEqual("NULL", lit(None).sql)
+        self.assertEqual("true", lit(True).sql)
+        self.assertEqual("4294967296L", lit(2 ** 32).sql)
+        self.assertEqual("CAST('NaN' AS DOUBLE)", lit(float('nan')).sql)
+        self.assertEqual("CAST('-Infinity' AS DOUBLE)", lit(float('-inf')).sql)
+        self.assertEqual("'a\\\\b'", lit("a\\b").sql)
+
+    def test_column_names_are_quoted(self):
+        self.assertEqual("`odd``name`", col("odd`name").sql)
+        self.assertEqual("`firstname`", col("first name").sql)
+
+    def test_isin_and_between(self):
+        self.assertEqual("(`a` IN (1, 2, 3))", col("a").isin([1, 2, 3]).sql)
+        self.assertEqual("(`a` IN ('x'))", col("a").isin("x").sql)
+        self.assertEqual("(`a` BETWEEN 1 AND 5)", col("a").between(1, 5).sql)
+
+    def test_no_truth_value(self):
+        with self.assertRaises(TypeError):
+            if col("a") > 1 and col("b") > 1:
+                pass
+
+    def test_get_column_sql(self):
+        self.assertTrue(is_expression([col("a"), expr("b + 1")]))
+        self.assertFalse(is_expression(lambda row: row.a))
+        self.assertEqual(["`a`", "(b + 1)"], get_column_sql([col("a"), expr("b + 1")], [("a", int), ("b", int)]))
+        self.assertEqual(["(`a` % 2)"], get_column_sql(col("a") % 2, ("odd", int)))
+        with self.assertRaises(ValueError):
+            get_column_sql(col("a"), [("a", int), ("b", int)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+# vim: set encoding=utf-8
+
+#  Copyright (c) 2016 Intel Corporation 
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+import unittest
+
+from sparktk.jvm.jutils import JUtils
+
+
+class FakeGatewayClient(object):
+
+    def __init__(self):
+        self.commands = []
+
+    def send_command(self, command):
+        self.commands.append(command)
+        return "!yv"
+
+
+class FakeJvm(object):
+
+    def __getattr__(self, name):
+        return self
+
+
+class FakeGateway(object):
+
+    def __init__(self):
+        self._gateway_client = FakeGatewayClient()
+
+
+class FakeSparkContext(object):
+
+    def __init__(self):
+        self._gateway = FakeGateway()
+        self._jvm = FakeJvm()
+
+
+class TestJUtils(unittest.TestCase):
+
+    def test_py4j_call_count(self):
+        sc = FakeSparkContext()
+        jutils = JUtils(sc)
+        sc._gateway._gateway_client.send_command("c")
+        sc._gateway._gateway_client.send_command("c")
+        self.assertEqual(2, jutils.py4j_call_count)
+        jutils.reset_py4j_call_count()
+        self.assertEqual(0, jutils.py4j_call_count)
+
+    def test_send_command_wrapped_once(self):
+        sc = FakeSparkContext()
+        first = JUtils(sc)
+        second = JUtils(sc)
+        sc._gateway._gateway_client.send_command("c")
+        # the second JUtils wraps the original send_command, not the first JUtils' wrapper
+        self.assertEqual(0, first.py4j_call_count)
+        self.assertEqual(1, second.py4j_call_count)
+        self.assertEqual(["c"], sc._gateway._gateway_client.commands)
+
+
+if __name__ == '__main__':
+    unittest.main()
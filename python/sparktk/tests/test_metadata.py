@@ -0,0 +1,51 @@
+# vim: set encoding=utf-8
+
+#  Copyright (c) 2016 Intel Corporation 
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+import unittest
+
+from sparktk.frame.metadata import FrameMetadata
+
+
+class TestFrameMetadata(unittest.TestCase):
+
+    def test_column_indices_and_names(self):
+        metadata = FrameMetadata(object(), [('a', int), ('b', str)])
+        self.assertEqual({'a': 0, 'b': 1}, metadata.column_indices)
+        names = metadata.column_names
+        names.append('c')
+        self.assertEqual(['a', 'b'], metadata.column_names)
+
+    def test_is_current(self):
+        backend = object()
+        metadata = FrameMetadata(backend, [('a', int)], state_version=3)
+        self.assertTrue(metadata.is_current(backend, 3))
+        self.assertFalse(metadata.is_current(backend, 4))
+        self.assertFalse(metadata.is_current(object(), 3))
+
+    def test_num_partitions_read_once(self):
+        calls = []
+
+        def get_num_partitions():
+            calls.append(1)
+            return 8
+        metadata = FrameMetadata(object(), [('a', int)], get_num_partitions=get_num_partitions)
+        self.assertEqual(8, metadata.num_partitions)
+        self.assertEqual(8, metadata.num_partitions)
+        self.assertEqual(1, len(calls))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+# vim: set encoding=utf-8
+
+#  Copyright (c) 2016 Intel Corporation 
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+import unittest
+
+from sparktk.frame.pyframe import PythonFrame
+
+
+class ListRdd(object):
+    """minimal stand-in for a single-partition pyspark RDD"""
+
+    def __init__(self, data):
+        self.data = data
+        self.stages = 0
+
+    def mapPartitions(self, f, preservesPartitioning=False):
+        result = ListRdd(list(f(iter(self.data))))
+        result.stages = self.stages + 1
+        return result
+
+    def mapPartitionsWithIndex(self, f, preservesPartitioning=False):
+        result = ListRdd(list(f(0, iter(self.data))))
+        result.stages = self.stages + 1
+        return result
+
+    def collect(self):
+        return list(self.data)
+
+
+class TestPythonFrame(unittest.TestCase):
+
+    def test_queued_transforms_fuse_into_one_stage(self):
+        frame = PythonFrame(ListRdd([[1], [2], [3], [4]]), [('a', int)])
+        frame.queue(lambda it: (r + [r[0] * 10] for r in it))
+        frame.queue(lambda it: (r for r in it if r[0] % 2 == 0))
+        self.assertTrue(frame.has_pending)
+        rdd = frame.rdd
+        self.assertFalse(frame.has_pending)
+        self.assertEqual(1, rdd.stages)
+        self.assertEqual([[2, 20], [4, 40]], rdd.data)
+
+    def test_map_partitions_leaves_frame_unchanged(self):
+        frame = PythonFrame(ListRdd([[1], [2]]), [('a', int)])
+        frame.queue(lambda it: (r + [0] for r in it))
+        rdd = frame.map_partitions(lambda it: ([r[0]] for r in it))
+        self.assertEqual([[1], [2]], rdd.data)
+        self.assertTrue(frame.has_pending)
+        self.assertEqual([[1, 0], [2, 0]], frame.rdd.data)
+
+    def test_setting_rdd_drops_queue(self):
+        frame = PythonFrame(ListRdd([[1]]), [('a', int)])
+        frame.queue(lambda it: (r + [0] for r in it))
+        frame.rdd = ListRdd([[5]])
+        self.assertFalse(frame.has_pending)
+        self.assertEqual([[5]], frame.rdd.data)
+
+    def test_partition_counts_cached_until_rows_change(self):
+        frame = PythonFrame(ListRdd([[1], [2], [3]]), [('a', int)])
+        self.assertEqual([3], frame.partition_counts())
+        frame._rdd = ListRdd([])  # bypasses invalidation, so the cached counts are still returned
+        self.assertEqual([3], frame.partition_counts())
+        frame.queue(lambda it: it)
+        self.assertEqual([0], frame.partition_counts())
+
+    def test_get_partition_ranges(self):
+        from sparktk.frame.ops.take import get_partition_ranges
+        counts = [10, 0, 5, 20]
+        self.assertEqual({0: (0, 3)}, get_partition_ranges(counts, 0, 3))
+        self.assertEqual({0: (8, 10), 2: (0, 3)}, get_partition_ranges(counts, 8, 5))
+        self.assertEqual({2: (2, 5), 3: (0, 20)}, get_partition_ranges(counts, 12, 100))
+        self.assertEqual({}, get_partition_ranges(counts, 35, 5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+# vim: set encoding=utf-8
+
+#  Copyright (c) 2016 Intel Corporation 
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+import unittest
+import pickle
+
+import sparktk.dtypes as dtypes
+from sparktk.frame.row import Row, get_row_class
+
+
+class TestRow(unittest.TestCase):
+
+    schema = [('name', str), ('age', int), ('when', dtypes.datetime), ('keys', int)]
+
+    def test_generated_row_matches_row(self):
+        data = [u'Fred', 39, 1451606400000L, 7]
+        generic = Row(self.schema, data)
+        specialized = get_row_class(self.schema)(data)
+        self.assertTrue(isinstance(specialized, Row))
+        self.assertEqual(generic.name, specialized.name)
+        self.assertEqual(generic.age, specialized.age)
+        self.assertEqual(generic['when'], specialized['when'])
+        self.assertEqual(generic.items(), specialized.items())
+        self.assertEqual(7, specialized['keys'])  # a column named like a method is still reachable by key
+
+    def test_row_class_is_cached(self):
+        self.assertTrue(get_row_class(self.schema) is get_row_class(list(self.schema)))
+        self.assertFalse(get_row_class(self.schema) is get_row_class(self.schema, trusted_types=True))
+
+    def test_trusted_types_skip_casts(self):
+        self.assertEqual(39, get_row_class(self.schema)([u'Fred', '39', 0L, 0]).age)
+        self.assertEqual('39', get_row_class(self.schema, trusted_types=True)([u'Fred', '39', 0L, 0]).age)
+
+    def test_no_instance_dict(self):
+        row = get_row_class(self.schema)()
+        self.assertFalse(hasattr(row, '__dict__'))
+        with self.assertRaises(AttributeError):
+            row.not_a_column = 1
+
+    def test_pickle(self):
+        row = get_row_class(self.schema, trusted_types=True)([u'Judy', 44, 0L, 1])
+        copy = pickle.loads(pickle.dumps(row, 2))
+        self.assertEqual(type(row), type(copy))
+        self.assertEqual(44, copy.age)
+
+
+if __name__ == '__main__':
+    unittest.main()
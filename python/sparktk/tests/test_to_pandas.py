@@ -0,0 +1,83 @@
+# vim: set encoding=utf-8
+
+#  Copyright (c) 2016 Intel Corporation 
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+import unittest
+import threading
+import time
+from datetime import datetime
+import numpy as np
+import pandas
+
+from sparktk.frame import columnar
+from sparktk.frame.ops import to_pandas
+
+
+class TestToPandas(unittest.TestCase):
+
+    schema = [('s', unicode), ('i', int), ('f', float), ('t', datetime)]
+
+    def setUp(self):
+        rows = [[u'r%d' % k, k if k % 3 else None, k * 0.5 if k % 4 else None, 1451606400000L + k]
+                for k in xrange(23)]
+        encode = columnar.get_encode_partition_function(self.schema, batch_size=4)
+        self.partitions = [list(encode(iter(p))) for p in [rows[:10], [], rows[10:]]]
+        self.partition_counts = [10, 0, 13]
+
+    def _get_partitions(self, ranges):
+        for index in sorted(ranges.keys()):
+            start, end = ranges[index]
+            yield self.partitions[index], start, end
+
+    def test_offset_rows_across_partitions(self):
+        ranges = to_pandas.get_partition_ranges(self.partition_counts, 7, 9)
+        buffers = list(to_pandas._iter_column_buffers(self.schema, self._get_partitions(ranges), [9]))
+        self.assertEqual(1, len(buffers))
+        df = buffers[0].to_pandas(pandas)
+        self.assertEqual([u'r%d' % k for k in xrange(7, 16)], df['s'].tolist())
+        self.assertEqual('float64', str(df['f'].dtype))
+        self.assertTrue(np.isnan(df['f'][1]))  # row 8
+        self.assertEqual('object', str(df['i'].dtype))  # int column with missing values
+        self.assertIsNone(df['i'][2])  # row 9
+        self.assertEqual('datetime64[ns]', str(df['t'].dtype))
+
+    def test_chunks(self):
+        ranges = to_pandas.get_partition_ranges(self.partition_counts, 0, 23)
+        buffers = list(to_pandas._iter_column_buffers(self.schema, self._get_partitions(ranges), [5, 5, 5, 5, 3]))
+        self.assertEqual([5, 5, 5, 5, 3], [b.num_rows for b in buffers])
+        df = buffers[-1].to_pandas(pandas, 20)
+        self.assertEqual([20, 21, 22], df.index.tolist())
+        self.assertEqual([u'r20', u'r21', u'r22'], df['s'].tolist())
+
+    def test_prefetch_stops_when_consumer_stops(self):
+        test = self
+
+        class FakeContext(object):
+            def runJob(self, rdd, f, partitions):
+                return test.partitions[partitions[0]]
+
+        ranges = dict((index, (0, 1)) for index in xrange(3))
+        partitions = to_pandas._iter_partitions(FakeContext(), None, ranges)
+        self.assertEqual(self.partitions[0], next(partitions)[0])
+        partitions.close()
+        for attempt in xrange(50):
+            if not any(t.name == "sparktk-to-pandas-prefetch" for t in threading.enumerate()):
+                break
+            time.sleep(0.1)
+        self.assertFalse(any(t.name == "sparktk-to-pandas-prefetch" for t in threading.enumerate()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+# vim: set encoding=utf-8
+
+#  Copyright (c) 2016 Intel Corporation 
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+import unittest
+import numpy as np
+
+import sparktk.dtypes as dtypes
+from sparktk.frame import vectorized
+
+
+class TestVectorized(unittest.TestCase):
+
+    schema = [('name', unicode), ('age', int), ('score', float), ('v', dtypes.vector(2))]
+
+    rows = [[u'a', 30, 1.5, [1.0, 2.0]],
+            [u'b', None, None, None],
+            [u'c', 50, -2.0, [3.0, 4.0]]]
+
+    def test_batches(self):
+        self.assertEqual([3, 3, 1], [len(b) for b in vectorized.batches(iter(range(7)), 3)])
+
+    def test_rows_to_columns(self):
+        columns = vectorized.rows_to_columns(self.rows, self.schema)
+        self.assertEqual(['name', 'age', 'score', 'v'], columns.keys())
+        self.assertEqual(object, columns['name'].dtype)
+        self.assertEqual(np.float64, columns['age'].dtype)  # missing value promotes int to float
+        self.assertTrue(np.isnan(columns['age'][1]))
+        self.assertEqual((3, 2), columns['v'].shape)
+
+    def test_results_to_columns(self):
+        columns = vectorized.rows_to_columns(self.rows, self.schema)
+        result = vectorized.results_to_columns(columns['age'] * 2, ('double_age', int), 3)
+        self.assertEqual([[60, None, 100]], result)
+        self.assertEqual(int, type(result[0][0]))
+
+    def test_results_to_columns_list(self):
+        result = vectorized.results_to_columns([np.array([1, 2, 3]), [u'x', u'y', u'z']],
+                                               [('n', float), ('s', unicode)], 3)
+        self.assertEqual([[1.0, 2.0, 3.0], [u'x', u'y', u'z']], result)
+
+    def test_results_wrong_length(self):
+        with self.assertRaises(ValueError):
+            vectorized.results_to_columns(np.array([1, 2]), ('n', int), 3)
+
+    def test_results_wrong_column_count(self):
+        with self.assertRaises(ValueError):
+            vectorized.results_to_columns([np.array([1, 2, 3])], [('a', int), ('b', int)], 3)
+
+    def test_to_mask(self):
+        self.assertEqual([True, False], list(vectorized.to_mask(np.array([1, 0]), 2)))
+        with self.assertRaises(ValueError):
+            vectorized.to_mask(np.array([True]), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -297,6 +297,52 @@ class TkContext(object):
         from sparktk.frame.ops.group_by import agg
         return agg
 
+    def col(self, name):
+        """
+        Expression for the value of a frame column, which frame operations like filter, drop_rows, copy,
+        add_columns and map_columns evaluate in Spark SQL instead of calling a python UDF
+
+        Example
+        -------
+
+            >>> tc.col("age") > 30
+            Expression((`age` > 30))
+
+            >>> (tc.col("age") > 30) & (tc.col("name") != "Fred")
+            Expression(((`age` > 30) AND (`name` != 'Fred')))
+
+        """
+        from sparktk.frame.expressions import col
+        return col(name)
+
+    def lit(self, value):
+        """
+        Expression for a literal value (see col)
+
+        Example
+        -------
+
+            >>> tc.lit(2.5)
+            Expression(CAST(2.5 AS DOUBLE))
+
+        """
+        from sparktk.frame.expressions import lit
+        return lit(value)
+
+    def expr(self, sql):
+        """
+        Expression written in Spark SQL (see col)
+
+        Example
+        -------
+
+            >>> tc.expr("age * 2 + tenure")
+            Expression((age * 2 + tenure))
+
+        """
+        from sparktk.frame.expressions import expr
+        return expr(sql)
+
     @property
     def frame(self):
         """
@@ -457,6 +503,35 @@ class TkContext(object):
           raise RuntimeError("load expected to get type %s but got type %s" % (validate_type, type(python_obj)))
         return python_obj
 
+    def cache_report(self):
+        """
+        Reports the frames whose data is currently persisted (see frame.persist)
+
+        :return: (CacheReport) list of CachedFrameInfo, with the storage level, number of cached partitions,
+                 memory and disk size, and the number of actions which reused the cached data for each frame
+
+        Example
+        -------
+
+        <skip>
+            >>> frame.persist("MEMORY_AND_DISK")
+
+            >>> frame.count()
+            4
+
+            >>> frame.inspect()
+
+            >>> tc.cache_report()
+            rdd_id  storage_level                          cached_partitions  memory_size  disk_size  reuse_count
+            ========================================================================================================
+                12  Memory Deserialized 1x Replicated      2/2                       1496          0            1
+
+        </skip>
+
+        """
+        from sparktk.frame.cache import get_cache_report
+        return get_cache_report(self)
+
     def _create_python_proxy(self, scala_obj):
         """
         Create a python object for the scala_obj
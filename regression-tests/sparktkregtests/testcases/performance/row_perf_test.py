@@ -0,0 +1,64 @@
+# vim: set encoding=utf-8
+
+#  Copyright (c) 2016 Intel Corporation 
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+
+""" micro-benchmark of row udf attribute access, generic Row vs schema-specialized Row classes """
+
+import unittest
+import random
+
+from sparktk.frame.row import Row, get_row_class
+from sparktkregtests.lib import performance_utils as profiler
+
+
+class PerformanceRow(unittest.TestCase):
+
+    num_columns = 500
+    num_rows = 2000
+
+    def setUp(self):
+        """Build a wide schema with a mix of column types"""
+        types = [int, float, str]
+        self.schema = [("col_%d" % i, types[i % len(types)]) for i in xrange(self.num_columns)]
+        self.rows = [[types[i % len(types)](random.randint(0, 100)) for i in xrange(self.num_columns)]
+                     for _ in xrange(self.num_rows)]
+        # every udf call touches a handful of columns spread across the schema
+        self.names = ["col_%d" % i for i in xrange(0, self.num_columns, 50)]
+
+    def _read_all(self, row):
+        for r in self.rows:
+            row._set_data(r)
+            for name in self.names:
+                getattr(row, name)
+
+    def test_row_generic(self):
+        """Attribute access through Row.__getattr__"""
+        with profiler.Timer("profile." + self.id()):
+            self._read_all(Row(self.schema))
+
+    def test_row_specialized(self):
+        """Attribute access through a generated Row class's properties"""
+        with profiler.Timer("profile." + self.id()):
+            self._read_all(get_row_class(self.schema)())
+
+    def test_row_specialized_trusted_types(self):
+        """Attribute access through a generated Row class, skipping the type constructors"""
+        with profiler.Timer("profile." + self.id()):
+            self._read_all(get_row_class(self.schema, trusted_types=True)())
+
+
+if __name__ == '__main__':
+    unittest.main()
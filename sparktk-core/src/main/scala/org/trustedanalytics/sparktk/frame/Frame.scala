@@ -15,18 +15,20 @@
  */
 package org.trustedanalytics.sparktk.frame
 
+import org.apache.hadoop.fs.Path
 import org.apache.spark.SparkContext
 import org.apache.spark.api.java.JavaRDD
 import org.apache.spark.rdd.RDD
 import org.apache.spark.sql.{ DataFrame, Row }
 import org.json4s.JsonAST.JValue
 import org.trustedanalytics.sparktk.frame.internal.ops.matrix._
-import org.trustedanalytics.sparktk.frame.internal.{ BaseFrame, ValidationReport }
+import org.trustedanalytics.sparktk.frame.internal.{ BaseFrame, FramePartitioning, FrameStatisticsCatalog, SchemaValidationMode, SchemaValidationReturn, ValidationReport }
+import org.trustedanalytics.sparktk.frame.internal.rdd.FrameRdd
 import org.trustedanalytics.sparktk.frame.internal.ops._
 import org.trustedanalytics.sparktk.frame.internal.ops.binning.{ BinColumnTransformWithResult, HistogramSummarization, QuantileBinColumnTransformWithResult }
 import org.trustedanalytics.sparktk.frame.internal.ops.classificationmetrics.{ BinaryClassificationMetricsSummarization, MultiClassClassificationMetricsSummarization }
 import org.trustedanalytics.sparktk.frame.internal.ops.cumulativedist.{ CumulativePercentTransform, CumulativeSumTransform, EcdfSummarization, TallyPercentTransform, TallyTransform }
-import org.trustedanalytics.sparktk.frame.internal.ops.join.{ JoinInnerSummarization, JoinLeftSummarization, JoinOuterSummarization, JoinRightSummarization }
+import org.trustedanalytics.sparktk.frame.internal.ops.join.{ ExplainJoinSummarization, JoinInnerSummarization, JoinLeftSummarization, JoinOuterSummarization, JoinRightSummarization }
 import org.trustedanalytics.sparktk.frame.internal.ops.sample.AssignSampleTransform
 import org.trustedanalytics.sparktk.frame.internal.ops.exportdata.{ ExportToCsvSummarization, ExportToHbaseSummarization, ExportToHiveSummarization, ExportToJdbcSummarization, ExportToJsonSummarization }
 import org.trustedanalytics.sparktk.frame.internal.ops.flatten.FlattenColumnsTransform
@@ -36,17 +38,18 @@ import org.trustedanalytics.sparktk.frame.internal.ops.poweriterationclustering.
 import org.trustedanalytics.sparktk.frame.internal.ops.sortedk.SortedKSummarization
 import org.trustedanalytics.sparktk.frame.internal.ops.statistics.correlation.{ CorrelationMatrixSummarization, CorrelationSummarization }
 import org.trustedanalytics.sparktk.frame.internal.ops.statistics.covariance.{ CovarianceMatrixSummarization, CovarianceSummarization }
-import org.trustedanalytics.sparktk.frame.internal.ops.statistics.descriptives.{ CategoricalSummarySummarization, ColumnMedianSummarization, ColumnModeSummarization, ColumnSummaryStatisticsSummarization }
+import org.trustedanalytics.sparktk.frame.internal.ops.statistics.descriptives.{ CategoricalSummarySummarization, ColumnMedianSummarization, ColumnModeSummarization, ColumnSummaryStatisticsSummarization, SummaryStatisticsSummarization }
 import org.trustedanalytics.sparktk.frame.internal.ops.statistics.quantiles.QuantilesSummarization
 import org.trustedanalytics.sparktk.frame.internal.ops.timeseries.{ TimeSeriesFromObseravationsSummarization, TimeSeriesSliceSummarization, TimeSeriesDurbinWatsonTestSummarization, TimeSeriesAugmentedDickeyFullerTestSummarization, TimeSeriesBreuschGodfreyTestSummarization, TimeSeriesBreuschPaganTestSummarization }
 import org.trustedanalytics.sparktk.frame.internal.ops.topk.TopKSummarization
 import org.trustedanalytics.sparktk.frame.internal.ops.unflatten.UnflattenColumnsTransform
 import org.trustedanalytics.sparktk.frame.internal.rdd.{ FrameRdd, PythonJavaRdd }
-import org.trustedanalytics.sparktk.saveload.TkSaveableObject
+import org.trustedanalytics.sparktk.saveload.{ SaveLoad, TkSaveLoad, TkSaveableObject }
 
-class Frame(frameRdd: RDD[Row], frameSchema: Schema, validateSchema: Boolean = false) extends BaseFrame with Serializable // params named "frameRdd" and "frameSchema" because naming them "rdd" and "schema" masks the base members "rdd" and "schema" in this scope
+class Frame(frameRdd: RDD[Row], frameSchema: Schema, validateSchema: Boolean = false, validationMode: String = SchemaValidationMode.Eager) extends BaseFrame with Serializable // params named "frameRdd" and "frameSchema" because naming them "rdd" and "schema" masks the base members "rdd" and "schema" in this scope
     with AddColumnsTransform
     with AppendFrameTransform
+    with ApproxDistinctSummarization
     with AssignSampleTransform
     with BinColumnTransformWithResult
     with BinaryClassificationMetricsSummarization
@@ -70,6 +73,7 @@ class Frame(frameRdd: RDD[Row], frameSchema: Schema, validateSchema: Boolean = f
     with DropRowsTransform
     with EcdfSummarization
     with EntropySummarization
+    with ExplainJoinSummarization
     with ExportToCsvSummarization
     with ExportToHbaseSummarization
     with ExportToHiveSummarization
@@ -83,10 +87,13 @@ class Frame(frameRdd: RDD[Row], frameSchema: Schema, validateSchema: Boolean = f
     with JoinLeftSummarization
     with JoinOuterSummarization
     with JoinRightSummarization
+    with MapColumnsSummarization
     with MatrixCovarianceMatrixTransform
     with MatrixPcaTransform
     with MatrixSvdTransform
     with MultiClassClassificationMetricsSummarization
+    with PartitionByTransform
+    with PersistTransform
     with PowerIterationClusteringSummarization
     with QuantilesSummarization
     with QuantileBinColumnTransformWithResult
@@ -96,6 +103,7 @@ class Frame(frameRdd: RDD[Row], frameSchema: Schema, validateSchema: Boolean = f
     with SaveSummarization
     with SortTransform
     with SortedKSummarization
+    with SummaryStatisticsSummarization
     with TakeSummarization
     with TallyPercentTransform
     with TallyTransform
@@ -108,22 +116,36 @@ class Frame(frameRdd: RDD[Row], frameSchema: Schema, validateSchema: Boolean = f
     with TopKSummarization
     with UnflattenColumnsTransform {
 
-  val validationReport = init(frameRdd, frameSchema, validateSchema)
+  private val schemaValidation = init(frameRdd, frameSchema, validateSchema, validationMode)
+
+  /**
+   * (typically called from pyspark, which does not see the default for validationMode)
+   */
+  def this(frameRdd: RDD[Row], frameSchema: Schema, validateSchema: Boolean) = {
+    this(frameRdd, frameSchema, validateSchema, SchemaValidationMode.Eager)
+  }
 
   def this(frameRdd: FrameRdd, validateSchema: Boolean = false) = {
     this(frameRdd.rdd, frameRdd.schema, validateSchema)
   }
 
+  /**
+   * ValidationReport, if the data is validated against the schema.  With lazy validation, the report fills in as
+   * actions read the data.
+   */
+  def validationReport: Option[ValidationReport] = schemaValidation.map(_.validationReport)
+
   /**
    * Initialize the frame and call schema validation, if it's enabled.
    *
    * @param frameRdd RDD
    * @param frameSchema Schema
    * @param validateSchema Boolean indicating if schema validation should be performed.
-   * @return ValidationReport, if the data is validated against the schema.
+   * @param validationMode When to validate the data (see SchemaValidationMode)
+   * @return SchemaValidationReturn, if the data is validated against the schema.
    */
-  def init(frameRdd: RDD[Row], frameSchema: Schema, validateSchema: Boolean): Option[ValidationReport] = {
-    var validationReport: Option[ValidationReport] = None
+  def init(frameRdd: RDD[Row], frameSchema: Schema, validateSchema: Boolean, validationMode: String): Option[SchemaValidationReturn] = {
+    var schemaValidation: Option[SchemaValidationReturn] = None
 
     // Infer the schema, if a schema was not provided
     val updatedSchema = if (frameSchema == null) {
@@ -134,13 +156,13 @@ class Frame(frameRdd: RDD[Row], frameSchema: Schema, validateSchema: Boolean = f
 
     // Validate the data against the schema, if the validateSchema is enabled
     val updatedRdd = if (validateSchema) {
-      val schemaValidation = super.validateSchema(frameRdd, updatedSchema)
+      val validation = super.validateSchema(frameRdd, updatedSchema, validationMode)
 
-      if (schemaValidation.validationReport.numBadValues > 0)
-        logger.warn(s"Schema validation found ${schemaValidation.validationReport.numBadValues} bad values.")
+      if (validationMode != SchemaValidationMode.Lazy && validation.validationReport.numBadValues > 0)
+        logger.warn(s"Schema validation found ${validation.validationReport.numBadValues} bad values.")
 
-      validationReport = Some(schemaValidation.validationReport)
-      schemaValidation.validatedRdd
+      schemaValidation = Some(validation)
+      validation.validatedRdd
 
     }
     else
@@ -148,7 +170,7 @@ class Frame(frameRdd: RDD[Row], frameSchema: Schema, validateSchema: Boolean = f
 
     super.init(updatedRdd, updatedSchema)
 
-    validationReport
+    schemaValidation
   }
 
   /**
@@ -175,7 +197,7 @@ class Frame(frameRdd: RDD[Row], frameSchema: Schema, validateSchema: Boolean = f
 
 object Frame extends TkSaveableObject {
 
-  val tkFormatVersion = 1
+  val tkFormatVersion = 2
 
   /**
    * Loads a parquet file found at the given path and returns a Frame
@@ -187,10 +209,97 @@ object Frame extends TkSaveableObject {
    * @return
    */
   def loadTkSaveableObject(sc: SparkContext, path: String, formatVersion: Int = tkFormatVersion, tkMetadata: JValue = null): Any = {
-    require(tkFormatVersion == formatVersion, s"Frame load only supports version $tkFormatVersion.  Got version $formatVersion")
-    // no extra metadata in version 1
+    validateFormatVersion(formatVersion, 1, tkFormatVersion)
+    readParquet(sc, path, tkMetadataFromJValue(formatVersion, tkMetadata), None, None)
+  }
+
+  /**
+   * Loads a saved frame, reading only the given columns and rows from disk
+   *
+   * The projection and the where condition are handed to the parquet reader, so unrequested columns are never read,
+   * and row groups whose column statistics rule out the simple comparisons in the condition are skipped.  A frame
+   * saved with a partitioning (see partition_by) is loaded with the same partitioning, as long as the partitioning
+   * columns are loaded.
+   *
+   * @param sc active SparkContext
+   * @param path path to the saved frame
+   * @param columns names of the columns to load (default is all columns)
+   * @param where Spark SQL boolean expression selecting the rows to load (default is all rows)
+   * @return the loaded Frame
+   */
+  def load(sc: SparkContext, path: String, columns: Option[Seq[String]] = None, where: Option[String] = None): Frame = {
+    val tkMetadata = TkSaveLoad.loadTk(sc, path)
+    require(tkMetadata.formatId == formatId, s"Expected a frame stored at $path, but found '${tkMetadata.formatId}'")
+    validateFormatVersion(tkMetadata.formatVersion, 1, tkFormatVersion)
+    readParquet(sc, path, tkMetadataFromJValue(tkMetadata.formatVersion, tkMetadata.data), columns, where)
+  }
+
+  /**
+   * The TK metadata stored by save (version 1 metadata has none)
+   */
+  private def tkMetadataFromJValue(formatVersion: Int, tkMetadata: JValue): FrameTkMetadata = {
+    if (formatVersion < 2 || tkMetadata == null) FrameTkMetadata(None)
+    else SaveLoad.extractFromJValue[FrameTkMetadata](tkMetadata)
+  }
+
+  private def readParquet(sc: SparkContext,
+                          path: String,
+                          tkMetadata: FrameTkMetadata,
+                          columns: Option[Seq[String]],
+                          where: Option[String]): Frame = {
     val sqlContext = new org.apache.spark.sql.SQLContext(sc)
-    val df = sqlContext.read.parquet(path)
-    new Frame(df)
+    def select(parquet: DataFrame): DataFrame = {
+      // filter before selecting, so the condition may refer to columns which are not loaded
+      val filtered = where.map(condition => parquet.filter(condition)).getOrElse(parquet)
+      columns.map(names => filtered.select(names.map(filtered.col): _*)).getOrElse(filtered)
+    }
+
+    val partitioning = tkMetadata.partitioning.flatMap(p => columns.map(p.copySubset).getOrElse(Some(p)))
+    val buckets = partitioning.flatMap(p => bucketFiles(sc, path, p.numPartitions))
+    val frame = buckets match {
+      case Some(files) =>
+        // each bucket is read into one partition, so the rows stay in the partitions they were saved from
+        val bucketRdds = files.map(file => FrameRdd.toFrameRdd(select(sqlContext.read.parquet(file))))
+        val rdd = sc.union(bucketRdds.map(bucket =>
+          if (bucket.partitions.isEmpty) sc.parallelize(Seq.empty[Row], 1) else bucket.coalesce(1)))
+        new Frame(rdd, bucketRdds.head.frameSchema)
+      case None =>
+        new Frame(select(sqlContext.read.parquet(path)))
+    }
+    // the statistics describe every row, so they only still hold when no rows were filtered out
+    if (where.isEmpty) {
+      tkMetadata.statistics.foreach(catalog => frame.attachStatistics(columns.map(catalog.copySubset).getOrElse(catalog)))
+    }
+    if (buckets.isDefined) {
+      partitioning.foreach(frame.attachPartitioning)
+    }
+    frame
   }
+
+  /**
+   * Paths of the parquet files written for each partition of a partitioned frame, in partition order
+   *
+   * @return the paths, or None if the files at the path are not exactly one file for each of the partitions
+   */
+  private def bucketFiles(sc: SparkContext, path: String, numPartitions: Int): Option[Seq[String]] = {
+    val directory = new Path(path)
+    val fileSystem = directory.getFileSystem(sc.hadoopConfiguration)
+    val indexedFiles = fileSystem.listStatus(directory).toSeq.map(_.getPath).flatMap(file => file.getName match {
+      case BucketFileName(index) => Some((index.toInt, file.toString))
+      case _ => None
+    }).sortBy(_._1)
+    if (indexedFiles.map(_._1) == (0 until numPartitions)) Some(indexedFiles.map(_._2)) else None
+  }
+
+  // parquet files are named for the index of the partition they were written from
+  private val BucketFileName = """part-r-(\d+)-.*\.parquet""".r
 }
+
+/**
+ * TK metadata saved with a frame
+ *
+ * @param statistics statistics gathered while the frame was saved (None if they could not be gathered)
+ * @param partitioning partitioning of the frame when it was saved (see partition_by), stored as bucket metadata: the
+ *                     rows of each partition are in the parquet file named for the partition index
+ */
+case class FrameTkMetadata(statistics: Option[FrameStatisticsCatalog], partitioning: Option[FramePartitioning] = None)
@@ -15,8 +15,10 @@
  */
 package org.trustedanalytics.sparktk.frame.internal
 
+import org.apache.spark.{ Accumulator, AccumulatorParam }
 import org.apache.spark.rdd.RDD
 import org.apache.spark.sql.{ SQLContext, DataFrame, Row }
+import org.apache.spark.storage.StorageLevel
 
 import org.slf4j.LoggerFactory
 import org.trustedanalytics.sparktk.frame.Schema
@@ -28,6 +30,8 @@ trait BaseFrame {
 
   private var frameState: FrameState = null
 
+  private var frameStateVersion: Long = 0L
+
   lazy val logger = LoggerFactory.getLogger("sparktk")
 
   /**
@@ -40,6 +44,17 @@ trait BaseFrame {
    */
   def schema: Schema = if (frameState != null) frameState.schema else null
 
+  /**
+   * Number of times the frame's state has been set, so clients which cache frame metadata (like the schema on the
+   * Python side) can check whether it is still current with a single call
+   */
+  def stateVersion: Long = frameStateVersion
+
+  /**
+   * Number of partitions of the frame's RDD
+   */
+  def numPartitions: Int = rdd.partitions.length
+
   /**
    * The content of the frame as a Spark DataFrame
    */
@@ -55,44 +70,107 @@ trait BaseFrame {
    *
    * @param rddToValidate RDD of data to validate against the specified schema
    * @param schemaToValidate Schema to use to validate the data
+   * @param validationMode When to validate (see SchemaValidationMode): "eager" scans the data right away, so the
+   *                       validation report is complete on return, "lazy" validates the data as part of the next
+   *                       action that reads all of it, and "cached" also scans right away, but persists the
+   *                       validated data so the scan is reused by the next action.
    * @return RDD that has data parsed to the schema's data types
    */
-  protected def validateSchema(rddToValidate: RDD[Row], schemaToValidate: Schema): SchemaValidationReturn = {
+  protected def validateSchema(rddToValidate: RDD[Row],
+                               schemaToValidate: Schema,
+                               validationMode: String = SchemaValidationMode.Eager): SchemaValidationReturn = {
+    SchemaValidationMode.validate(validationMode)
     val columnCount = schemaToValidate.columns.length
-    val schemaWithIndex = schemaToValidate.columns.zipWithIndex
+    val dataTypes = schemaToValidate.columns.map(_.dataType).toArray
 
-    val badValueCount = rddToValidate.sparkContext.accumulator(0, "Frame bad values")
+    val badValueCounts = rddToValidate.sparkContext.accumulator(Map.empty[Int, Int], "Frame bad values")(BadValueCountsParam)
 
-    val validatedRdd = rddToValidate.map(row => {
-      if (row.length != columnCount)
-        throw new RuntimeException(s"Row length of ${row.length} does not match the number of columns in the schema (${columnCount}).")
+    val validatedRdd = rddToValidate.mapPartitionsWithIndex {
+      case (partitionIndex, rows) =>
+        new Iterator[Row] {
+          private var partitionBadValues = 0
+          private var reported = false
 
-      val parsedValues = schemaWithIndex.map {
-        case (column, index) =>
-          column.dataType.parse(row.get(index)) match {
-            case Success(value) => value
-            case Failure(e) =>
-              badValueCount += 1
-              null
+          override def hasNext: Boolean = {
+            val more = rows.hasNext
+            if (!more && !reported) {
+              // counts are only reported for fully read partitions, keyed by partition, so partitions which are
+              // read partly (like by a take) or recomputed are not miscounted
+              badValueCounts += Map(partitionIndex -> partitionBadValues)
+              reported = true
+            }
+            more
           }
-      }
 
-      Row.fromSeq(parsedValues)
-    })
+          override def next(): Row = {
+            val row = rows.next()
+            if (row.length != columnCount)
+              throw new RuntimeException(s"Row length of ${row.length} does not match the number of columns in the schema (${columnCount}).")
+
+            val parsedValues = new Array[Any](columnCount)
+            var index = 0
+            while (index < columnCount) {
+              parsedValues(index) = dataTypes(index).parse(row.get(index)) match {
+                case Success(value) => value
+                case Failure(e) =>
+                  partitionBadValues += 1
+                  null
+              }
+              index += 1
+            }
+            Row.fromSeq(parsedValues)
+          }
+        }
+    }
 
-    // Call count() to force rdd map to execute so that we can get the badValueCount from the accumulator.
-    validatedRdd.count()
+    if (validationMode == SchemaValidationMode.Cached) {
+      validatedRdd.persist(StorageLevel.MEMORY_AND_DISK)
+      FrameCache.register(validatedRdd)
+    }
+    if (validationMode != SchemaValidationMode.Lazy) {
+      // Call count() to force rdd map to execute so that we can get the bad value counts from the accumulator.
+      validatedRdd.count()
+    }
 
-    SchemaValidationReturn(validatedRdd, ValidationReport(badValueCount.value))
+    SchemaValidationReturn(validatedRdd, badValueCounts)
   }
 
   private[sparktk] def init(rdd: RDD[Row], schema: Schema): Unit = {
-    frameState = FrameState(rdd, schema)
+    setState(FrameState(rdd, schema))
+  }
+
+  /**
+   * Statistics catalog of the frame, if it is known without a pass over the data
+   */
+  def statistics: Option[FrameStatisticsCatalog] = if (frameState != null) frameState.statistics else None
+
+  /**
+   * Record the statistics of the current data, which does not change the data (or the state version)
+   */
+  private[sparktk] def attachStatistics(statistics: FrameStatisticsCatalog): Unit = {
+    frameState = frameState.copy(statistics = Some(statistics))
+  }
+
+  /**
+   * How the rows of the frame are hash partitioned (see partition_by), if known
+   */
+  def partitioning: Option[FramePartitioning] = if (frameState != null) frameState.partitioning else None
+
+  /**
+   * Record how the current data is partitioned, which does not change the data (or the state version)
+   */
+  private[sparktk] def attachPartitioning(partitioning: FramePartitioning): Unit = {
+    frameState = frameState.copy(partitioning = Some(partitioning))
+  }
+
+  private def setState(state: FrameState): Unit = {
+    frameState = state
+    frameStateVersion += 1
   }
 
   protected def execute(transform: FrameTransform): Unit = {
     logger.info("Frame transform {}", transform.getClass.getName)
-    frameState = transform.work(frameState)
+    setState(transform.work(frameState))
   }
 
   protected def execute[T](summarization: FrameSummarization[T]): T = {
@@ -103,7 +181,7 @@ trait BaseFrame {
   protected def execute[T](transform: FrameTransformWithResult[T]): T = {
     logger.info("Frame transform (with result) {}", transform.getClass.getName)
     val r = transform.work(frameState)
-    frameState = r.state
+    setState(r.state)
     r.result
   }
 }
@@ -112,17 +190,52 @@ trait BaseFrame {
  * Validation report for schema and rdd validation.
  *
  * @param numBadValues The number of values that were unable to be parsed to the column's data type.
+ * @param isComplete False when the data was validated lazily and not all of it has been read yet, in which case
+ *                   numBadValues only covers the data validated so far.
  */
-case class ValidationReport(numBadValues: Int)
+case class ValidationReport(numBadValues: Int, isComplete: Boolean = true)
 
 /**
  * Value to return from the function that validates the data against schema.
  *
  * @param validatedRdd RDD of data has been casted to the data types specified by the schema.
- * @param validationReport Validation report specifying how many values were unable to be parsed to the column's
- *                         data type.
+ * @param badValueCounts Number of values that were unable to be parsed to the column's data type, per validated
+ *                       partition index.
  */
-case class SchemaValidationReturn(validatedRdd: RDD[Row], validationReport: ValidationReport)
+case class SchemaValidationReturn(validatedRdd: RDD[Row], badValueCounts: Accumulator[Map[Int, Int]]) {
+
+  /**
+   * Validation report specifying how many values were unable to be parsed to the column's data type.
+   */
+  def validationReport: ValidationReport = {
+    val counts = badValueCounts.value
+    ValidationReport(counts.values.sum, counts.size == validatedRdd.partitions.length)
+  }
+}
+
+/**
+ * Schema validation modes (see BaseFrame.validateSchema)
+ */
+object SchemaValidationMode {
+  val Eager = "eager"
+  val Lazy = "lazy"
+  val Cached = "cached"
+
+  val modes = Seq(Eager, Lazy, Cached)
+
+  def validate(validationMode: String): Unit = {
+    require(modes.contains(validationMode), s"Invalid schema validation mode '$validationMode'.  Supported modes: ${modes.mkString(", ")}")
+  }
+}
+
+/**
+ * Accumulates bad value counts per partition index.  Adding a partition's count again replaces it.
+ */
+private[internal] object BadValueCountsParam extends AccumulatorParam[Map[Int, Int]] {
+  override def addInPlace(counts1: Map[Int, Int], counts2: Map[Int, Int]): Map[Int, Int] = counts1 ++ counts2
+
+  override def zero(initialValue: Map[Int, Int]): Map[Int, Int] = Map.empty[Int, Int]
+}
 
 trait FrameOperation extends Product {
   //def name: String
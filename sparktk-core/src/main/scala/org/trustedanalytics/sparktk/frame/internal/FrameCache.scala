@@ -0,0 +1,125 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal
+
+import org.apache.spark.SparkContext
+import org.apache.spark.rdd.RDD
+import org.apache.spark.scheduler.{ SparkListener, SparkListenerJobStart }
+import org.apache.spark.storage.StorageLevel
+
+import scala.collection.mutable
+
+/**
+ * Registry of the frame RDDs persisted through the frame persist API, for the cache report.
+ *
+ * A SparkListener counts the jobs whose stages include each registered RDD, so the report can show how many
+ * actions read a cached frame after the one that materialized it.
+ */
+object FrameCache {
+
+  private val jobCounts = mutable.LinkedHashMap[Int, Int]()
+  private var listenerContext: SparkContext = null
+
+  private class FrameCacheListener extends SparkListener {
+    override def onJobStart(jobStart: SparkListenerJobStart): Unit = {
+      recordJob(jobStart.stageInfos.flatMap(_.rddInfos.map(_.id)).toSet)
+    }
+  }
+
+  private def recordJob(rddIds: Set[Int]): Unit = synchronized {
+    rddIds.filter(jobCounts.contains).foreach(id => jobCounts(id) += 1)
+  }
+
+  /**
+   * Registers a persisted RDD, so it shows up in the cache report
+   *
+   * @param rdd persisted frame RDD
+   */
+  def register(rdd: RDD[_]): Unit = synchronized {
+    val sc = rdd.sparkContext
+    if (listenerContext ne sc) {
+      // first registration for this SparkContext
+      jobCounts.clear()
+      sc.addSparkListener(new FrameCacheListener)
+      listenerContext = sc
+    }
+    jobCounts.getOrElseUpdate(rdd.id, 0)
+  }
+
+  /**
+   * Unpersists a registered RDD and removes it from the registry
+   *
+   * @param sc active SparkContext
+   * @param rddId id of the RDD
+   */
+  def unpersist(sc: SparkContext, rddId: Int): Unit = synchronized {
+    sc.getPersistentRDDs.get(rddId).foreach(_.unpersist(blocking = false))
+    jobCounts.remove(rddId)
+  }
+
+  /**
+   * Reports the registered RDDs which are still persisted, in order of registration
+   *
+   * @param sc active SparkContext
+   * @return information on each cached frame RDD
+   */
+  def report(sc: SparkContext): Seq[CachedFrameInfo] = synchronized {
+    val persistentRdds = sc.getPersistentRDDs
+    // drop entries for RDDs which have been unpersisted some other way
+    jobCounts.keys.filterNot(persistentRdds.contains).toList.foreach(jobCounts.remove)
+
+    val storageInfo = sc.getRDDStorageInfo.map(info => info.id -> info).toMap
+    jobCounts.toSeq.map {
+      case (id, jobs) =>
+        val rdd = persistentRdds(id)
+        val info = storageInfo.get(id)
+        CachedFrameInfo(id,
+          rdd.toString,
+          rdd.getStorageLevel.description,
+          rdd.partitions.length,
+          info.map(_.numCachedPartitions).getOrElse(0),
+          info.map(_.memSize).getOrElse(0L),
+          info.map(_.diskSize).getOrElse(0L),
+          math.max(0, jobs - 1))
+    }
+  }
+
+  /**
+   * Answers whether the given storage level actually stores anything
+   */
+  def isCached(storageLevel: StorageLevel): Boolean = storageLevel != StorageLevel.NONE
+}
+
+/**
+ * Cache information for one persisted frame RDD
+ *
+ * @param rddId id of the RDD
+ * @param description RDD description, including where it was created
+ * @param storageLevel storage level description
+ * @param numPartitions number of partitions in the RDD
+ * @param numCachedPartitions number of partitions currently cached
+ * @param memorySize bytes held in memory
+ * @param diskSize bytes held on disk
+ * @param reuseCount number of actions which read the RDD after the one that first materialized it
+ */
+case class CachedFrameInfo(rddId: Int,
+                           description: String,
+                           storageLevel: String,
+                           numPartitions: Int,
+                           numCachedPartitions: Int,
+                           memorySize: Long,
+                           diskSize: Long,
+                           reuseCount: Int)
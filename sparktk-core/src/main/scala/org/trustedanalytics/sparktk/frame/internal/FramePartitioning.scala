@@ -0,0 +1,91 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal
+
+import org.apache.spark.HashPartitioner
+import org.apache.spark.rdd.RDD
+import org.apache.spark.sql.Row
+import org.trustedanalytics.sparktk.frame.Schema
+
+/**
+ * Hash partitioning of the rows of a frame by the values of some of its columns (see partition_by).
+ *
+ * A row is in the partition which a HashPartitioner with numPartitions partitions assigns to the list of its values
+ * in the partitioning columns.  So all rows with equal values in those columns are in the same partition, and two
+ * frames partitioned by columns of the same data types into the same number of partitions have equal keys in the
+ * partitions with the same index, which lets operations on those columns work partition by partition, without a
+ * shuffle.
+ *
+ * @param columns names of the partitioning columns
+ * @param numPartitions number of partitions
+ */
+case class FramePartitioning(columns: List[String], numPartitions: Int) {
+  require(columns != null && columns.nonEmpty, "partitioning columns are required")
+  require(numPartitions > 0, "number of partitions must be greater than zero")
+
+  /**
+   * Index of the partition holding the rows with the given values in the partitioning columns
+   */
+  def partitionOf(key: Seq[Any]): Int = new HashPartitioner(numPartitions).getPartition(key.toList)
+
+  /**
+   * Hash partitions rows by their values in the partitioning columns
+   *
+   * @param rdd rows to partition
+   * @param schema schema of the rows
+   * @return the rows, in numPartitions partitions laid out as described by this partitioning
+   */
+  def partition(rdd: RDD[Row], schema: Schema): RDD[Row] = {
+    val indices = schema.columnIndices(columns).toList
+    rdd.map(row => (indices.map(row.get), row)).partitionBy(new HashPartitioner(numPartitions)).values
+  }
+
+  /**
+   * True if all the rows with equal values in the given columns are in the same partition, which holds when the
+   * columns include all the partitioning columns
+   */
+  def colocates(columnNames: Seq[String]): Boolean = columns.forall(columnNames.contains)
+
+  /**
+   * True if rows of two frames with equal values in their join columns are in partitions with the same index
+   *
+   * @param schema schema of the frame with this partitioning
+   * @param joinColumns join columns of the frame with this partitioning
+   * @param other partitioning of the other frame
+   * @param otherSchema schema of the other frame
+   * @param otherJoinColumns join columns of the other frame, in the order matching joinColumns
+   */
+  def matches(schema: Schema,
+              joinColumns: Seq[String],
+              other: FramePartitioning,
+              otherSchema: Schema,
+              otherJoinColumns: Seq[String]): Boolean = {
+    // equal values of different types (like int32 and int64) do not hash alike
+    numPartitions == other.numPartitions &&
+      columns == joinColumns.toList &&
+      other.columns == otherJoinColumns.toList &&
+      columns.zip(other.columns).forall {
+        case (column, otherColumn) => schema.columnDataType(column).equalsDataType(otherSchema.columnDataType(otherColumn))
+      }
+  }
+
+  /**
+   * Partitioning of a frame holding only the named columns, if it still has every partitioning column
+   */
+  def copySubset(columnNames: Seq[String]): Option[FramePartitioning] = {
+    if (colocates(columnNames)) Some(this) else None
+  }
+}
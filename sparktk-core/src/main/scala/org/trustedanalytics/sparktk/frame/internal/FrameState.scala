@@ -19,4 +19,27 @@ import org.apache.spark.rdd.RDD
 import org.apache.spark.sql.Row
 import org.trustedanalytics.sparktk.frame.Schema
 
-case class FrameState(rdd: RDD[Row], schema: Schema)
+/**
+ * The data of a frame
+ *
+ * @param rdd rows of the frame
+ * @param schema frame schema
+ * @param statistics statistics of the rows, when they are known without a pass over the data (like after a save or
+ *                   a load).  Transforms produce a new FrameState without them, so they never describe stale data.
+ * @param partitioning how the rows are hash partitioned by the values of some columns (see partition_by), if known.
+ *                     Transforms drop it, unless they keep every row in its partition (like drop_duplicates
+ *                     on a partitioned frame).
+ */
+case class FrameState(rdd: RDD[Row],
+                      schema: Schema,
+                      statistics: Option[FrameStatisticsCatalog] = None,
+                      partitioning: Option[FramePartitioning] = None) {
+
+  /**
+   * Number of rows in each partition of the rdd, in partition order.
+   *
+   * Computed with one pass the first time an operation needs it (row count, offset takes).  Transforms produce a
+   * new FrameState, so the counts always describe the current rdd.
+   */
+  lazy val partitionRowCounts: Array[Long] = rdd.mapPartitions(rows => Iterator.single(rows.size.toLong)).collect()
+}
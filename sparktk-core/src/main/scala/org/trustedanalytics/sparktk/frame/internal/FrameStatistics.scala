@@ -0,0 +1,282 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal
+
+import com.clearspring.analytics.stream.cardinality.HyperLogLogPlus
+import org.apache.spark.AccumulatorParam
+import org.apache.spark.rdd.RDD
+import org.apache.spark.sql.Row
+import org.trustedanalytics.sparktk.frame.DataTypes.DataType
+import org.trustedanalytics.sparktk.frame.internal.ops.statistics.quantiles.QuantileSketch
+import org.trustedanalytics.sparktk.frame.{ DataTypes, Schema }
+
+/**
+ * Statistics of a frame, gathered while it is written by save and stored with it in the TK metadata.
+ *
+ * Operations which only need these numbers (like the row count) answer from the catalog rather than scanning the
+ * data, for as long as the frame is not modified.
+ *
+ * @param rowCount number of rows in the frame
+ * @param columns statistics of each column, in column order
+ */
+case class FrameStatisticsCatalog(rowCount: Long, columns: List[ColumnStatisticsEntry]) {
+
+  /**
+   * Statistics of the named column, if the catalog has them
+   */
+  def column(name: String): Option[ColumnStatisticsEntry] = {
+    // names are stored as they are written to parquet, without whitespace
+    val storedName = FrameStatisticsCatalog.storedColumnName(name)
+    columns.find(_.name == storedName)
+  }
+
+  /**
+   * Catalog for a frame holding only the named columns (and every row)
+   */
+  def copySubset(columnNames: Seq[String]): FrameStatisticsCatalog = {
+    FrameStatisticsCatalog(rowCount, columnNames.flatMap(column).toList)
+  }
+}
+
+/**
+ * Statistics of one column
+ *
+ * @param name column name
+ * @param nullCount number of missing values
+ * @param approxDistinctCount estimated number of distinct values (HyperLogLog++), None for vector and matrix columns
+ * @param numeric statistics of the values of a numerical column, None for other columns
+ */
+case class ColumnStatisticsEntry(name: String,
+                                 nullCount: Long,
+                                 approxDistinctCount: Option[Long],
+                                 numeric: Option[NumericColumnStatistics])
+
+/**
+ * Statistics of the values of a numerical column
+ *
+ * @param validCount number of finite values
+ * @param badCount number of missing, NaN or infinite values
+ * @param minimum smallest finite value, None when there are none
+ * @param maximum largest finite value, None when there are none
+ * @param mean mean of the finite values, 0 when there are none
+ * @param sumOfSquaredDeviations sum of the squared differences between the finite values and their mean
+ * @param sumOfLogs sum of the natural logarithms of the finite values, None when a value is not positive
+ * @param percentiles approximate values at percentiles 0, 1, ..., 100 (empty when there are no finite values)
+ */
+case class NumericColumnStatistics(validCount: Long,
+                                   badCount: Long,
+                                   minimum: Option[Double],
+                                   maximum: Option[Double],
+                                   mean: Double,
+                                   sumOfSquaredDeviations: Double,
+                                   sumOfLogs: Option[Double],
+                                   percentiles: List[Double])
+
+object FrameStatisticsCatalog {
+
+  /**
+   * Precision of the HyperLogLog++ sketches used for distinct counts (about 1.6% standard error)
+   */
+  val DistinctCountPrecision = 12
+
+  /**
+   * Capacity of the quantile sketches used for the percentiles
+   */
+  val QuantileSketchCapacity = 200
+
+  private[internal] def storedColumnName(name: String): String = name.replaceAll("\\s", "")
+
+  /**
+   * Wraps the rdd so that the catalog is gathered while the rows are read, without a separate pass.
+   *
+   * @param rdd rows of the frame
+   * @param schema frame schema
+   * @return the wrapped rdd, and a function which returns the catalog once every partition of the wrapped rdd has
+   *         been read in full (None if some were not)
+   */
+  def gatherWhileReading(rdd: RDD[Row], schema: Schema): (RDD[Row], () => Option[FrameStatisticsCatalog]) = {
+    val dataTypes = schema.columns.map(_.dataType).toArray
+    val partitionStatistics = rdd.sparkContext.accumulator(new PartitionStatistics(dataTypes), "Frame statistics")(PartitionStatisticsParam)
+
+    val gatheringRdd = rdd.mapPartitionsWithIndex {
+      case (partitionIndex, rows) =>
+        val statistics = new PartitionStatistics(dataTypes, Set(partitionIndex))
+        new Iterator[Row] {
+          private var reported = false
+
+          override def hasNext: Boolean = {
+            val more = rows.hasNext
+            if (!more && !reported) {
+              // tagged with the partition index, so the statistics of a recomputed partition are not added twice
+              partitionStatistics += statistics
+              reported = true
+            }
+            more
+          }
+
+          override def next(): Row = {
+            val row = rows.next()
+            statistics.add(row)
+            row
+          }
+        }
+    }
+
+    val numPartitions = rdd.partitions.length
+    val catalog = () => {
+      val merged = partitionStatistics.value
+      if (merged.partitionIndices.size != numPartitions) None
+      else {
+        val names = schema.columnNames.map(storedColumnName)
+        Some(FrameStatisticsCatalog(merged.rowCount, names.zip(merged.columns).map { case (name, column) => column.result(name) }.toList))
+      }
+    }
+    (gatheringRdd, catalog)
+  }
+}
+
+/**
+ * Running statistics of the rows of a set of partitions
+ *
+ * @param dataTypes data types of the columns
+ * @param partitionIndices indices of the partitions whose rows have been added
+ */
+private[internal] class PartitionStatistics(val dataTypes: Array[DataType],
+                                            var partitionIndices: Set[Int] = Set.empty[Int]) extends Serializable {
+  var rowCount = 0L
+  val columns: Array[ColumnStatisticsBuilder] = dataTypes.map(dataType => new ColumnStatisticsBuilder(dataType))
+
+  def add(row: Row): Unit = {
+    rowCount += 1
+    var i = 0
+    while (i < columns.length) {
+      columns(i).add(row.get(i))
+      i += 1
+    }
+  }
+
+  /**
+   * Adds the statistics of other partitions, unless some of them have already been added (as happens when a task
+   * is retried or a partition is recomputed)
+   */
+  def merge(other: PartitionStatistics): PartitionStatistics = {
+    if (other.partitionIndices.forall(index => !partitionIndices.contains(index))) {
+      partitionIndices ++= other.partitionIndices
+      rowCount += other.rowCount
+      columns.zip(other.columns).foreach { case (column, otherColumn) => column.merge(otherColumn) }
+    }
+    this
+  }
+}
+
+/**
+ * Running statistics of the values of one column.
+ *
+ * The mean and the sum of squared deviations are updated with Welford's method and merged with Chan's parallel
+ * formula, which avoid the cancellation of computing the variance from a sum of squares.
+ */
+private[internal] class ColumnStatisticsBuilder(dataType: DataType) extends Serializable {
+  private val isNumerical = dataType.isNumerical
+  private var nullCount = 0L
+  private var badCount = 0L
+  private var validCount = 0L
+  private var minimum = Double.PositiveInfinity
+  private var maximum = Double.NegativeInfinity
+  private var mean = 0.0
+  private var sumOfSquaredDeviations = 0.0
+  private var sumOfLogs = 0.0
+  private var hasNonPositive = false
+
+  private val distinct: Option[HyperLogLogPlus] =
+    if (dataType.isVector || dataType.equalsDataType(DataTypes.matrix)) None
+    else Some(new HyperLogLogPlus(FrameStatisticsCatalog.DistinctCountPrecision, 0))
+
+  private val sketch: Option[QuantileSketch] =
+    if (isNumerical) Some(new QuantileSketch(FrameStatisticsCatalog.QuantileSketchCapacity)) else None
+
+  def add(value: Any): Unit = {
+    if (value == null) {
+      nullCount += 1
+      badCount += 1
+    }
+    else {
+      distinct.foreach(_.offer(value))
+      if (isNumerical) {
+        val d = dataType.asDouble(value)
+        if (d.isNaN || d.isInfinite) {
+          badCount += 1
+        }
+        else {
+          validCount += 1
+          if (d < minimum) minimum = d
+          if (d > maximum) maximum = d
+          val delta = d - mean
+          mean += delta / validCount
+          sumOfSquaredDeviations += delta * (d - mean)
+          if (d <= 0) hasNonPositive = true else sumOfLogs += math.log(d)
+          sketch.get.add(d)
+        }
+      }
+    }
+  }
+
+  def merge(other: ColumnStatisticsBuilder): Unit = {
+    if (other.validCount > 0) {
+      val count = validCount + other.validCount
+      val delta = other.mean - mean
+      mean += delta * other.validCount / count
+      sumOfSquaredDeviations += other.sumOfSquaredDeviations + delta * delta * validCount / count * other.validCount
+      validCount = count
+    }
+    nullCount += other.nullCount
+    badCount += other.badCount
+    minimum = math.min(minimum, other.minimum)
+    maximum = math.max(maximum, other.maximum)
+    sumOfLogs += other.sumOfLogs
+    hasNonPositive = hasNonPositive || other.hasNonPositive
+    distinct.foreach(_.addAll(other.distinct.get))
+    sketch.foreach(_.merge(other.sketch.get))
+  }
+
+  def result(name: String): ColumnStatisticsEntry = {
+    // moments which overflowed cannot answer anything, and are not representable in the json metadata
+    val numeric = if (isNumerical && isFinite(mean) && isFinite(sumOfSquaredDeviations)) {
+      val percentiles = if (validCount > 0) sketch.get.quantiles((0 to 100).map(_ / 100.0)).toList else Nil
+      Some(NumericColumnStatistics(validCount,
+        badCount,
+        if (validCount > 0) Some(minimum) else None,
+        if (validCount > 0) Some(maximum) else None,
+        mean,
+        sumOfSquaredDeviations,
+        if (hasNonPositive) None else Some(sumOfLogs),
+        percentiles))
+    }
+    else None
+    ColumnStatisticsEntry(name, nullCount, distinct.map(_.cardinality()), numeric)
+  }
+
+  private def isFinite(d: Double): Boolean = !d.isNaN && !d.isInfinite
+}
+
+/**
+ * Merges partition statistics into one running total as they arrive.  Statistics of a partition which was already
+ * merged are dropped.
+ */
+private[internal] object PartitionStatisticsParam extends AccumulatorParam[PartitionStatistics] {
+  override def addInPlace(stats1: PartitionStatistics, stats2: PartitionStatistics): PartitionStatistics = stats1.merge(stats2)
+
+  override def zero(initialValue: PartitionStatistics): PartitionStatistics = new PartitionStatistics(initialValue.dataTypes)
+}
@@ -37,6 +37,18 @@ trait AddColumnsTransform extends BaseFrame {
     execute(AddColumns(rowFunction, newColumns))
   }
 
+  /**
+   * Adds columns to frame according to Spark SQL expressions
+   *
+   * The expressions are compiled by Spark SQL, so the frame does not need to leave the JVM.
+   *
+   * @param expressions Spark SQL expressions over the columns of the frame, one for each new column
+   * @param newColumns sequence of the new columns being added (Schema)
+   */
+  def addColumnsExpression(expressions: Seq[String], newColumns: Seq[Column]): Unit = {
+    execute(AddColumnsExpression(expressions, newColumns))
+  }
+
 }
 
 case class AddColumns(rowFunction: RowWrapper => Row,
@@ -48,4 +60,13 @@ case class AddColumns(rowFunction: RowWrapper => Row,
     val addedRdd = frameRdd.mapRows(row => Row.merge(row.data, rowFunction(row)))
     FrameState(addedRdd, state.schema.copy(columns = state.schema.columns ++ newColumns))
   }
-}
\ No newline at end of file
+}
+
+case class AddColumnsExpression(expressions: Seq[String],
+                                newColumns: Seq[Column]) extends FrameTransform {
+
+  override def work(state: FrameState): FrameState = {
+    SchemaHelper.validateIsMergeable(state.schema, new FrameSchema(newColumns))
+    (state: FrameRdd).selectExpressions(expressions, newColumns, keepColumns = true)
+  }
+}
@@ -0,0 +1,74 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal.ops
+
+import com.clearspring.analytics.stream.cardinality.HyperLogLogPlus
+import org.trustedanalytics.sparktk.frame.internal.ops.groupby.aggregators.ApproximateDistinctCountAggregator
+import org.trustedanalytics.sparktk.frame.internal.{ BaseFrame, FrameState, FrameStatisticsCatalog, FrameSummarization }
+
+trait ApproxDistinctSummarization extends BaseFrame {
+  /**
+   * Estimate the number of distinct values in each of the given columns, in a single pass over the frame.
+   *
+   * Each column is summarized by a HyperLogLog++ sketch of 2^precision registers, so the work and the data sent
+   * between tasks do not grow with the number of distinct values.  Missing values are not counted.  When the frame
+   * has the statistics gathered by save and the default precision is used, no pass is needed.
+   *
+   * @param columns Names of the columns to count the distinct values of.
+   * @param precision Number of bits used to index the sketch registers, between 4 and 18.  The relative standard
+   *                  error of the estimates is about 1.04 / sqrt(2^precision), so 1.6% with the default of 12.
+   * @return Map of column name to its estimated number of distinct values.
+   */
+  def approxDistinct(columns: Seq[String],
+                     precision: Int = ApproximateDistinctCountAggregator.DefaultPrecision): Map[String, Long] = {
+    execute(ApproxDistinct(columns, precision))
+  }
+}
+
+case class ApproxDistinct(columns: Seq[String], precision: Int) extends FrameSummarization[Map[String, Long]] {
+  require(columns != null && columns.nonEmpty, "at least one column is required")
+  require(precision >= ApproximateDistinctCountAggregator.MinPrecision && precision <= ApproximateDistinctCountAggregator.MaxPrecision,
+    s"precision must be between ${ApproximateDistinctCountAggregator.MinPrecision} and ${ApproximateDistinctCountAggregator.MaxPrecision}, but got $precision")
+
+  override def work(state: FrameState): Map[String, Long] = {
+    val columnIndices = columns.map(state.schema.columnIndex).toArray
+
+    val catalogCounts = if (precision == FrameStatisticsCatalog.DistinctCountPrecision) {
+      state.statistics.map(catalog => columns.map(column => catalog.column(column).flatMap(_.approxDistinctCount)))
+    }
+    else None
+
+    catalogCounts match {
+      case Some(counts) if counts.forall(_.isDefined) => columns.zip(counts.map(_.get)).toMap
+      case _ =>
+        val sketches = state.rdd.treeAggregate(Array.fill(columnIndices.length)(new HyperLogLogPlus(precision, 0)))(
+          (sketches, row) => {
+            var i = 0
+            while (i < columnIndices.length) {
+              val value = row(columnIndices(i))
+              if (value != null) sketches(i).offer(value)
+              i += 1
+            }
+            sketches
+          },
+          (sketches, other) => {
+            sketches.zip(other).foreach { case (sketch, otherSketch) => sketch.addAll(otherSketch) }
+            sketches
+          })
+        columns.zip(sketches.map(_.cardinality())).toMap
+    }
+  }
+}
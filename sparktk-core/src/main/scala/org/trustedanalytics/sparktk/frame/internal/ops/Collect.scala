@@ -18,6 +18,7 @@ package org.trustedanalytics.sparktk.frame.internal.ops
 import org.apache.spark.sql.Row
 import org.apache.spark.sql.catalyst.expressions.GenericRow
 import org.trustedanalytics.sparktk.frame.internal.{ FrameState, FrameSummarization, BaseFrame }
+import org.trustedanalytics.sparktk.frame.internal.rdd.ColumnarBatch
 
 trait CollectSummarization extends BaseFrame {
   /**
@@ -29,6 +30,16 @@ trait CollectSummarization extends BaseFrame {
   def collect(columns: Option[Seq[String]] = None): scala.Array[Row] = {
     execute(Collect(columns))
   }
+
+  /**
+   * Collect all the frame data locally, as a single pickled columnar record batch for Python (see ColumnarBatch)
+   *
+   * @param columns Name of columns; if specified, only data from these columns will be collected
+   * @return pickled record batch
+   */
+  def collectPython(columns: Option[Seq[String]]): scala.Array[Byte] = {
+    ColumnarBatch.pickle(collect(columns), columns.map(schema.copySubset).getOrElse(schema))
+  }
 }
 
 case class Collect(columns: Option[Seq[String]]) extends FrameSummarization[scala.Array[Row]] {
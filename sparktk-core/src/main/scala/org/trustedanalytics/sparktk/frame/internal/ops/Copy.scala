@@ -34,6 +34,19 @@ trait CopySummarization extends BaseFrame {
            where: Option[Row => Boolean] = None): Frame = {
     execute(Copy(columns, where))
   }
+
+  /**
+   * Copies specified columns into a new Frame object, keeping only the rows for which a Spark SQL boolean
+   * expression is true.
+   *
+   * @param columns Optional dictionary of column names to include in the copy and target names.  The default
+   *                behavior is that all columns will be included in the frame that is returned.
+   * @param where Spark SQL boolean expression over the columns of the frame
+   * @return New frame object.
+   */
+  def copyWhereExpression(columns: Option[Map[String, String]], where: String): Frame = {
+    execute(CopyWhereExpression(columns, where))
+  }
 }
 
 case class Copy(columns: Option[Map[String, String]] = None,
@@ -56,3 +69,13 @@ case class Copy(columns: Option[Map[String, String]] = None,
   }
 }
 
+case class CopyWhereExpression(columns: Option[Map[String, String]], where: String) extends FrameSummarization[Frame] {
+
+  require(where != null && where.trim.nonEmpty, "where expression is required")
+
+  override def work(state: FrameState): Frame = {
+    val filteredRdd = (state: FrameRdd).filterByExpression(where)
+    val copiedRdd = if (columns.isDefined) filteredRdd.selectColumnsWithRename(columns.get) else filteredRdd
+    new Frame(copiedRdd, copiedRdd.frameSchema)
+  }
+}
@@ -18,6 +18,8 @@ package org.trustedanalytics.sparktk.frame.internal.ops
 import org.trustedanalytics.sparktk.frame.internal.rdd.FrameRdd
 import org.trustedanalytics.sparktk.frame.internal.{ FrameState, FrameTransform, BaseFrame }
 
+import scala.collection.mutable
+
 trait DropDuplicatesTransform extends BaseFrame {
   /**
    * Modify the current frame, removing duplicate rows.
@@ -34,13 +36,30 @@ trait DropDuplicatesTransform extends BaseFrame {
 
 case class DropDuplicates(uniqueColumns: Option[Seq[String]]) extends FrameTransform {
   override def work(state: FrameState): FrameState = {
+    val colocated = state.partitioning.exists(_.colocates(uniqueColumns.getOrElse(state.schema.columnNames)))
     uniqueColumns match {
       case Some(columns) =>
         val columnNames = state.schema.validateColumnsExist(columns).toVector
-        (state: FrameRdd).dropDuplicatesByColumn(columnNames)
+        if (colocated) dropDuplicatesWithinPartitions(state, columnNames)
+        else (state: FrameRdd).dropDuplicatesByColumn(columnNames)
       case None =>
         // If no specific columns are specified, return distinct rows across all columns
-        FrameState(state.rdd.distinct(), state.schema)
+        if (colocated) dropDuplicatesWithinPartitions(state, state.schema.columnNames)
+        else FrameState(state.rdd.distinct(), state.schema)
     }
   }
+
+  /**
+   * Keeps the first row with each key, when all the rows with equal keys are in the same partition (like when the
+   * frame is partitioned by some of the key columns), so no shuffle is needed.  The rows stay in their partitions, so
+   * the frame keeps its partitioning.
+   */
+  private def dropDuplicatesWithinPartitions(state: FrameState, columnNames: Seq[String]): FrameState = {
+    val indices = state.schema.columnIndices(columnNames).toList
+    val rdd = state.rdd.mapPartitions(rows => {
+      val seen = mutable.HashSet[List[Any]]()
+      rows.filter(row => seen.add(indices.map(row.get)))
+    }, preservesPartitioning = true)
+    FrameState(rdd, state.schema, partitioning = state.partitioning)
+  }
 }
\ No newline at end of file
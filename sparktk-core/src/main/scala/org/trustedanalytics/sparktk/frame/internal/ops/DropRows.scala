@@ -33,6 +33,17 @@ trait DropRowsTransform extends BaseFrame {
     execute(DropRows(rowFunction))
   }
 
+  /**
+   * Drop all rows for which a Spark SQL boolean expression is true.
+   *
+   * Rows for which the expression evaluates to null are kept.
+   *
+   * @param condition Spark SQL boolean expression over the columns of the frame
+   */
+  def dropRowsExpression(condition: String): Unit = {
+    execute(DropRowsExpression(condition))
+  }
+
 }
 
 case class DropRows(rowFunction: Row => Boolean) extends FrameTransform {
@@ -48,3 +59,12 @@ case class DropRows(rowFunction: Row => Boolean) extends FrameTransform {
     FrameState(dropRowsRdd, state.schema)
   }
 }
+
+case class DropRowsExpression(condition: String) extends FrameTransform {
+
+  require(condition != null && condition.trim.nonEmpty, "condition is required")
+
+  override def work(state: FrameState): FrameState = {
+    (state: FrameRdd).filterByExpression(s"NOT coalesce(($condition), false)")
+  }
+}
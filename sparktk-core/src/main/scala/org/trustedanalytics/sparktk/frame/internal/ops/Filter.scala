@@ -34,6 +34,17 @@ trait FilterTransform extends BaseFrame {
     execute(Filter(rowFunction))
   }
 
+  /**
+   * Select all rows for which a Spark SQL boolean expression is true.
+   *
+   * Unlike a row function, the expression is compiled by Spark SQL, so the frame does not need to leave the JVM.
+   *
+   * @param condition Spark SQL boolean expression over the columns of the frame
+   */
+  def filterExpression(condition: String): Unit = {
+    execute(FilterExpression(condition))
+  }
+
 }
 
 case class Filter(rowFunction: Row => Boolean) extends FrameTransform {
@@ -44,4 +55,13 @@ case class Filter(rowFunction: Row => Boolean) extends FrameTransform {
     val filterRdd = (state: FrameRdd).filter(rowFunction)
     FrameState(filterRdd, state.schema)
   }
+}
+
+case class FilterExpression(condition: String) extends FrameTransform {
+
+  require(condition != null && condition.trim.nonEmpty, "condition is required")
+
+  override def work(state: FrameState): FrameState = {
+    (state: FrameRdd).filterByExpression(condition)
+  }
 }
\ No newline at end of file
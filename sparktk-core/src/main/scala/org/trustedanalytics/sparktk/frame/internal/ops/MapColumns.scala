@@ -0,0 +1,45 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal.ops
+
+import org.trustedanalytics.sparktk.frame.{ Column, Frame }
+import org.trustedanalytics.sparktk.frame.internal.rdd.FrameRdd
+import org.trustedanalytics.sparktk.frame.internal.{ BaseFrame, FrameState, FrameSummarization }
+
+trait MapColumnsSummarization extends BaseFrame {
+  /**
+   * Create a new frame from the results of Spark SQL expressions evaluated over each row of the current frame.
+   *
+   * The expressions are compiled by Spark SQL, so the frame does not need to leave the JVM.
+   *
+   * @param expressions Spark SQL expressions over the columns of the frame, one for each column of the new frame
+   * @param newColumns the columns of the new frame
+   * @return New frame object.
+   */
+  def mapColumnsExpression(expressions: Seq[String], newColumns: Seq[Column]): Frame = {
+    execute(MapColumnsExpression(expressions, newColumns))
+  }
+}
+
+case class MapColumnsExpression(expressions: Seq[String], newColumns: Seq[Column]) extends FrameSummarization[Frame] {
+
+  require(newColumns != null && newColumns.nonEmpty, "at least one new column is required")
+
+  override def work(state: FrameState): Frame = {
+    val mappedRdd = (state: FrameRdd).selectExpressions(expressions, newColumns, keepColumns = false)
+    new Frame(mappedRdd, mappedRdd.frameSchema)
+  }
+}
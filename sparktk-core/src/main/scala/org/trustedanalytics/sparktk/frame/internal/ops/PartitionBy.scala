@@ -0,0 +1,46 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal.ops
+
+import org.trustedanalytics.sparktk.frame.internal.{ BaseFrame, FramePartitioning, FrameState, FrameTransform }
+
+trait PartitionByTransform extends BaseFrame {
+  /**
+   * Hash partitions the rows of the frame by the values of the given columns.
+   *
+   * The frame remembers its partitioning (until it is modified), and it is stored with the frame by save.  Joins of
+   * two frames partitioned by their join columns into the same number of partitions join partition by partition,
+   * and group by and drop duplicates on columns which include the partitioning columns work within each partition,
+   * so none of them shuffles the rows again.
+   *
+   * @param columns names of the columns whose values pick the partition of each row
+   * @param numPartitions number of partitions
+   */
+  def partitionBy(columns: List[String], numPartitions: Int): Unit = {
+    execute(PartitionBy(columns, numPartitions))
+  }
+}
+
+case class PartitionBy(columns: List[String], numPartitions: Int) extends FrameTransform {
+  require(columns != null && columns.nonEmpty, "partition columns are required")
+  require(numPartitions > 0, "number of partitions must be greater than zero")
+
+  override def work(state: FrameState): FrameState = {
+    state.schema.validateColumnsExist(columns)
+    val partitioning = FramePartitioning(columns, numPartitions)
+    FrameState(partitioning.partition(state.rdd, state.schema), state.schema, partitioning = Some(partitioning))
+  }
+}
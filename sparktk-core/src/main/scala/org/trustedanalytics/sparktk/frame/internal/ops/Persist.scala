@@ -0,0 +1,70 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal.ops
+
+import org.apache.spark.storage.StorageLevel
+import org.trustedanalytics.sparktk.frame.internal.{ BaseFrame, FrameCache, FrameState, FrameTransform }
+
+trait PersistTransform extends BaseFrame {
+  /**
+   * Persists the frame's data, so later actions reuse it instead of recomputing its lineage.
+   *
+   * Transforms on the frame build on the persisted data, which stays persisted until unpersist is called.
+   *
+   * @param storageLevel Spark storage level name, like "MEMORY_ONLY", "MEMORY_AND_DISK" or "DISK_ONLY"
+   */
+  def persist(storageLevel: String = "MEMORY_ONLY"): Unit = {
+    execute(Persist(storageLevel))
+  }
+
+  /**
+   * Removes the frame's current data from the cache
+   */
+  def unpersist(): Unit = {
+    execute(Unpersist())
+  }
+
+  /**
+   * True if the frame's current data is persisted
+   */
+  def isCached: Boolean = FrameCache.isCached(rdd.getStorageLevel)
+}
+
+case class Persist(storageLevel: String) extends FrameTransform {
+  require(storageLevel != null, "storage level is required")
+  private val level = StorageLevel.fromString(storageLevel)
+
+  override def work(state: FrameState): FrameState = {
+    val current = state.rdd.getStorageLevel
+    if (current != level) {
+      if (FrameCache.isCached(current)) {
+        // Spark does not allow changing the storage level of a persisted RDD
+        state.rdd.unpersist(blocking = false)
+      }
+      state.rdd.persist(level)
+    }
+    FrameCache.register(state.rdd)
+    state
+  }
+}
+
+case class Unpersist() extends FrameTransform {
+  override def work(state: FrameState): FrameState = {
+    FrameCache.unpersist(state.rdd.sparkContext, state.rdd.id)
+    state.rdd.unpersist(blocking = false)
+    state
+  }
+}
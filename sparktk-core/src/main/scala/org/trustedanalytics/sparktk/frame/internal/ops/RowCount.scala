@@ -24,12 +24,25 @@ trait RowCountSummarization extends BaseFrame {
    * @return The number of rows in the frame.
    */
   def rowCount(): Long = execute[Long](RowCount)
+
+  /**
+   * Counts the rows in each partition of the frame.
+   *
+   * @return The number of rows in each partition, in partition order.
+   */
+  def partitionRowCounts(): Array[Long] = execute[Array[Long]](PartitionRowCounts)
 }
 
 /**
- * Number of rows in the current frame
+ * Number of rows in the current frame (from its statistics catalog, when it has one)
  */
 case object RowCount extends FrameSummarization[Long] {
-  def work(frame: FrameState): Long = frame.rdd.count()
+  def work(frame: FrameState): Long = frame.statistics.map(_.rowCount).getOrElse(frame.partitionRowCounts.sum)
 }
 
+/**
+ * Number of rows in each partition of the current frame
+ */
+case object PartitionRowCounts extends FrameSummarization[Array[Long]] {
+  def work(frame: FrameState): Array[Long] = frame.partitionRowCounts
+}
@@ -16,31 +16,39 @@
 package org.trustedanalytics.sparktk.frame.internal.ops
 
 import org.apache.spark.sql.DataFrame
-import org.trustedanalytics.sparktk.frame.Frame
+import org.trustedanalytics.sparktk.frame.{ Frame, FrameTkMetadata }
 import org.trustedanalytics.sparktk.frame.internal.rdd.FrameRdd
-import org.trustedanalytics.sparktk.frame.internal.{ FrameState, FrameSummarization, BaseFrame }
+import org.trustedanalytics.sparktk.frame.internal.{ BaseFrame, FrameState, FrameStatisticsCatalog, FrameSummarization }
 import org.trustedanalytics.sparktk.saveload.TkSaveLoad
 
 trait SaveSummarization extends BaseFrame {
   /**
    * Save the current frame.
    *
+   * Statistics of every column are gathered while the frame is written, and stored with it.  They stay attached to
+   * this frame (and to the frame later loaded from the path) until the frame is modified.  The partitioning of a
+   * partitioned frame (see partition_by) is stored too, and the frame loaded from the path has the same partitioning.
+   *
    * @param path The destination path.
    */
   def save(path: String): Unit = {
-    execute(Save(path))
+    execute(Save(path)).foreach(attachStatistics)
   }
 }
 
-case class Save(path: String) extends FrameSummarization[Unit] {
+case class Save(path: String) extends FrameSummarization[Option[FrameStatisticsCatalog]] {
 
-  override def work(state: FrameState): Unit = {
-    val frameRdd = new FrameRdd(state.schema, state.rdd)
+  override def work(state: FrameState): Option[FrameStatisticsCatalog] = {
+    val (gatheringRdd, statistics) = FrameStatisticsCatalog.gatherWhileReading(state.rdd, state.schema)
+    val frameRdd = new FrameRdd(state.schema, gatheringRdd)
     val df: DataFrame = frameRdd.toDataFrame
     df.write.parquet(path)
+    val catalog = statistics()
     val formatId = Frame.formatId
     val formatVersion = Frame.tkFormatVersion
-    TkSaveLoad.saveTk(state.rdd.sparkContext, path, formatId, formatVersion, "No Metadata")
+    // the rows are written one parquet file per partition, so the partitioning holds for the saved files
+    val partitioning = state.partitioning.map(p => p.copy(columns = p.columns.map(FrameStatisticsCatalog.storedColumnName)))
+    TkSaveLoad.saveTk(state.rdd.sparkContext, path, formatId, formatVersion, FrameTkMetadata(catalog, partitioning))
+    catalog
   }
 }
-
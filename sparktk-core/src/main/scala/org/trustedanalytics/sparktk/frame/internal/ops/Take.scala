@@ -15,11 +15,11 @@
  */
 package org.trustedanalytics.sparktk.frame.internal.ops
 
+import org.apache.spark.TaskContext
 import org.apache.spark.sql.Row
 import org.apache.spark.sql.catalyst.expressions.GenericRow
 import org.trustedanalytics.sparktk.frame.internal.{ FrameState, FrameSummarization, BaseFrame }
-
-import scala.collection.mutable.ListBuffer
+import org.trustedanalytics.sparktk.frame.internal.rdd.ColumnarBatch
 
 trait TakeSummarization extends BaseFrame {
   /**
@@ -34,7 +34,17 @@ trait TakeSummarization extends BaseFrame {
     execute(Take(n, offset, columns))
   }
 
-  //def takePython(n: Int): scala.Array[Any]Scala.Array[Byte]]
+  /**
+   * Get data subset, as a single pickled columnar record batch for Python (see ColumnarBatch)
+   *
+   * @param n Number of rows to take
+   * @param offset Offset into the frame where the take will start
+   * @param columns Name of columns; if specified, only data from these columns will be collected
+   * @return pickled record batch
+   */
+  def takePython(n: Int, offset: Int, columns: Option[Seq[String]]): scala.Array[Byte] = {
+    ColumnarBatch.pickle(take(n, offset, columns), columns.map(schema.copySubset).getOrElse(schema))
+  }
 }
 
 case class Take(n: Int, offset: Int, columns: Option[Seq[String]]) extends FrameSummarization[scala.Array[Row]] {
@@ -50,33 +60,50 @@ case class Take(n: Int, offset: Int, columns: Option[Seq[String]]) extends Frame
       }
     }
     else {
-      // have an offset, so deal slowly with an iterator
-
-      val it = state.rdd.toLocalIterator
-      val array = new Array[Row](n)
-
+      // have an offset, so use the partition row counts to read only the partitions holding [offset, offset + n)
       val indices = columns match {
         case None => null
-        case Some(cols) => state.schema.columnIndices(cols)
+        case Some(cols) => state.schema.columnIndices(cols).toArray
       }
-
-      var row_index = 0
-
-      // skip records
-      while (row_index < offset && it.hasNext) {
-        row_index += 1
-        it.next()
+      val ranges = Take.partitionRanges(state.partitionRowCounts, offset, n)
+      if (ranges.isEmpty) {
+        scala.Array.empty[Row]
       }
-      // collect record
-      row_index = 0
-      while (row_index < n && it.hasNext) {
-        val row = it.next()
-        array(row_index) = if (indices == null) { row } else { new GenericRow(indices.map(i => row(i)).toArray).asInstanceOf[Row] }
-        row_index += 1
+      else {
+        val slices = state.rdd.sparkContext.runJob(state.rdd, (context: TaskContext, rows: Iterator[Row]) => {
+          val (skip, until) = ranges(context.partitionId())
+          rows.slice(skip, until).map(row => {
+            if (indices == null) row else new GenericRow(indices.map(i => row(i))).asInstanceOf[Row]
+          }).toArray
+        }, ranges.keys.toSeq.sorted)
+        slices.flatten
       }
-
-      // check if we need to truncate
-      if (row_index < n) { array.slice(0, row_index) } else array
     }
   }
 }
+
+object Take {
+
+  /**
+   * Finds the partitions which hold the rows [offset, offset + n)
+   *
+   * @param partitionRowCounts number of rows in each partition
+   * @param offset index of the first row
+   * @param n number of rows
+   * @return map of partition index to the (start, end) row slice of that partition
+   */
+  def partitionRanges(partitionRowCounts: Array[Long], offset: Long, n: Long): Map[Int, (Int, Int)] = {
+    val end = offset + n
+    var partitionStart = 0L
+    partitionRowCounts.zipWithIndex.flatMap {
+      case (count, partition) =>
+        val partitionEnd = partitionStart + count
+        val range = if (count > 0 && partitionEnd > offset && partitionStart < end) {
+          Some(partition -> ((math.max(offset, partitionStart) - partitionStart).toInt, (math.min(end, partitionEnd) - partitionStart).toInt))
+        }
+        else None
+        partitionStart = partitionEnd
+        range
+    }.toMap
+  }
+}
@@ -18,6 +18,7 @@ package org.trustedanalytics.sparktk.frame.internal.ops.binning
 import org.apache.spark.rdd.RDD
 import org.apache.spark.sql.Row
 import org.apache.spark.sql.catalyst.expressions.GenericRow
+import org.trustedanalytics.sparktk.frame.internal.ops.statistics.quantiles.QuantilesFunctions
 
 import scala.math.BigDecimal
 import scala.math._
@@ -261,6 +262,29 @@ object DiscretizationFunctions extends Serializable {
     new RddWithCutoffs(cutoffs.toArray, binnedRdd)
   }
 
+  /**
+   * Bin column at index into bins of approximately equal depth, cut at quantiles of a sketch built in a single pass
+   * instead of ranking every element.
+   *
+   * Each cutoff is a value of the column whose rank is within relativeError * m of its bin boundary.  Cutoffs which
+   * repeat because of repeated values are merged, so there may be fewer than numBins bins.
+   *
+   * @param index column index
+   * @param numBins requested number of bins
+   * @param relativeError acceptable rank error of the cutoffs, as a fraction of the number of values
+   * @param rdd RDD for binning
+   * @return new RDD with binned column appended
+   */
+  def binApproximateEqualDepth(index: Int, numBins: Int, relativeError: Double, rdd: RDD[Row]): RddWithCutoffs = {
+    require(numBins >= 1, "number of bins must be 1 or greater")
+    val sketch = QuantilesFunctions.quantileSketch(rdd, index, relativeError)
+    require(!sketch.isEmpty, "Column values cannot be binned: the column has no finite values")
+    val cutoffs = sketch.quantiles((0 to numBins).map(_.toDouble / numBins)).distinct
+    // like equal width binning, a single value makes one bin
+    val binCutoffs = if (cutoffs.length == 1) Seq(cutoffs.head, cutoffs.head) else cutoffs
+    binColumns(index, binCutoffs, lowerInclusive = true, strictBinning = false, rdd)
+  }
+
   def binUsingBroadcast(index: Int, binNumberMap: Map[Double, Int], rdd: RDD[Row]): RDD[Row] = {
     val broadcastBinMap = rdd.sparkContext.broadcast(binNumberMap)
     rdd.map(row => new GenericRow(row.toSeq.toArray :+ (broadcastBinMap.value.get(toDouble(row(index))).get - 1).asInstanceOf[Any]))
@@ -74,9 +74,19 @@ case class Histogram(column: String,
       case None => None
     }
 
-    val computedNumBins: Int = HistogramFunctions.getNumBins(numBins, state.rdd)
+    val computedNumBins: Int = HistogramFunctions.getNumBins(numBins, state.statistics match {
+      case Some(catalog) => catalog.rowCount
+      case None => state.rdd.count()
+    })
 
-    computeHistogram(state.rdd, columnIndex, weightColumnIndex, computedNumBins, binType == "equalwidth")
+    // a statistics catalog knows the range of a column without missing or non-finite values
+    val range = for {
+      catalog <- state.statistics
+      numeric <- catalog.column(column).flatMap(_.numeric)
+      if numeric.badCount == 0 && numeric.minimum.isDefined
+    } yield (numeric.minimum.get, numeric.maximum.get)
+
+    computeHistogram(state.rdd, columnIndex, weightColumnIndex, computedNumBins, binType == "equalwidth", range)
   }
 
   /**
@@ -87,6 +97,7 @@ case class Histogram(column: String,
    *                          will assume to equal 1 if not included
    * @param numBins number of bins to compute
    * @param equalWidth true if we are using equalwidth binning false if not
+   * @param range optional known (minimum, maximum) of the column, which saves a pass for equalwidth binning
    * @return a map containing the cutoffs (list containing the edges of each bin), hist (list containing count of
    *         the weighted observations found in each bin), and density (list containing a decimal containing the
    *         percentage of observations found in the total set per bin).
@@ -95,8 +106,13 @@ case class Histogram(column: String,
                                         columnIndex: Int,
                                         weightColumnIndex: Option[Int],
                                         numBins: Int,
-                                        equalWidth: Boolean = true): Map[String, Seq[Double]] = {
-    val binnedResults = if (equalWidth)
+                                        equalWidth: Boolean = true,
+                                        range: Option[(Double, Double)] = None): Map[String, Seq[Double]] = {
+    val binnedResults = if (equalWidth && range.isDefined) {
+      val cutoffs = DiscretizationFunctions.getBinEqualWidthCutoffs(numBins, range.get._1, range.get._2)
+      DiscretizationFunctions.binColumns(columnIndex, cutoffs.toList, lowerInclusive = true, strictBinning = false, dataFrame)
+    }
+    else if (equalWidth)
       DiscretizationFunctions.binEqualWidth(columnIndex, numBins, dataFrame)
     else
       DiscretizationFunctions.binEqualDepth(columnIndex, numBins, weightColumnIndex, dataFrame)
@@ -130,11 +146,16 @@ object HistogramFunctions {
   val MAX_COMPUTED_NUMBER_OF_BINS: Int = 1000
   val UNWEIGHTED_OBSERVATION_SIZE: Double = 1.0
 
-  def getNumBins(numBins: Option[Int], rdd: RDD[Row]): Int = {
+  def getNumBins(numBins: Option[Int], rdd: RDD[Row]): Int = getNumBins(numBins, rdd.count)
+
+  /**
+   * @param rowCount number of rows, only evaluated when numBins is not given
+   */
+  def getNumBins(numBins: Option[Int], rowCount: => Long): Int = {
     numBins match {
       case Some(n) => n
       case None =>
-        math.min(math.floor(math.sqrt(rdd.count)), HistogramFunctions.MAX_COMPUTED_NUMBER_OF_BINS).toInt
+        math.min(math.floor(math.sqrt(rowCount)), HistogramFunctions.MAX_COMPUTED_NUMBER_OF_BINS).toInt
     }
   }
 }
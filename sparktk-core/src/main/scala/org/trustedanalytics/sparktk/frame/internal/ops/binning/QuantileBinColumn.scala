@@ -16,6 +16,7 @@
 package org.trustedanalytics.sparktk.frame.internal.ops.binning
 
 import org.trustedanalytics.sparktk.frame.internal.{ FrameTransformReturn, FrameTransformWithResult, BaseFrame, FrameState }
+import org.trustedanalytics.sparktk.frame.internal.ops.statistics.quantiles.QuantileSketch
 import org.trustedanalytics.sparktk.frame.{ Column, DataTypes }
 
 trait QuantileBinColumnTransformWithResult extends BaseFrame {
@@ -46,24 +47,40 @@ trait QuantileBinColumnTransformWithResult extends BaseFrame {
    * @param numBins The maximum number of quantiles.  Default is the Square-root choice
    *                :math:`\lfloor \sqrt{m} \rfloor`, where :math:`m` is the number of rows.
    * @param binColumnName The name for the new column holding the grouping labels. Default is <column>_binned.
+   * @param approximate If true, the cutoffs come from a quantile sketch built in a single pass over the data, instead
+   *                    of from ranking every element.  Each cutoff is then a value of the column whose rank is within
+   *                    relativeError * m of the bin boundary, and elements are binned by the cutoffs (an element equal
+   *                    to a cutoff goes into the bin starting there).
+   * @param relativeError Acceptable rank error of the approximate cutoffs, as a fraction of the number of rows.
    */
   def quantileBinColumn(column: String,
                         numBins: Option[Int] = None,
-                        binColumnName: Option[String] = None): Seq[Double] = {
-    execute(QuantileBinColumn(column, numBins, binColumnName))
+                        binColumnName: Option[String] = None,
+                        approximate: Boolean = false,
+                        relativeError: Double = QuantileSketch.DefaultRelativeError): Seq[Double] = {
+    execute(QuantileBinColumn(column, numBins, binColumnName, approximate, relativeError))
   }
 }
 
 case class QuantileBinColumn(column: String,
                              numBins: Option[Int],
-                             binColumnName: Option[String]) extends FrameTransformWithResult[Seq[Double]] {
+                             binColumnName: Option[String],
+                             approximate: Boolean = false,
+                             relativeError: Double = QuantileSketch.DefaultRelativeError) extends FrameTransformWithResult[Seq[Double]] {
+  require(relativeError > 0 && relativeError < 1, "relative error must be between 0 and 1")
 
   override def work(state: FrameState): FrameTransformReturn[Seq[Double]] = {
     val columnIndex = state.schema.columnIndex(column)
     state.schema.requireColumnIsNumerical(column)
     val newColumnName = binColumnName.getOrElse(state.schema.getNewColumnName(s"${column}_binned"))
-    val calculatedNumBins = HistogramFunctions.getNumBins(numBins, state.rdd)
-    val binnedRdd = DiscretizationFunctions.binEqualDepth(columnIndex, calculatedNumBins, None, state.rdd)
+    val calculatedNumBins = HistogramFunctions.getNumBins(numBins, state.statistics match {
+      case Some(catalog) => catalog.rowCount
+      case None => state.rdd.count()
+    })
+    val binnedRdd = if (approximate)
+      DiscretizationFunctions.binApproximateEqualDepth(columnIndex, calculatedNumBins, relativeError, state.rdd)
+    else
+      DiscretizationFunctions.binEqualDepth(columnIndex, calculatedNumBins, None, state.rdd)
 
     FrameTransformReturn(FrameState(binnedRdd.rdd, state.schema.copy(columns = state.schema.columns :+ Column(newColumnName, DataTypes.int32))), binnedRdd.cutoffs)
   }
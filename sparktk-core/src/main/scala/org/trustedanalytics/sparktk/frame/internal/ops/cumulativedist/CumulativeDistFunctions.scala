@@ -15,11 +15,16 @@
  */
 package org.trustedanalytics.sparktk.frame.internal.ops.cumulativedist
 
+import org.trustedanalytics.sparktk.frame.internal.ops.statistics.quantiles.QuantilesFunctions
 import org.trustedanalytics.sparktk.frame.internal.rdd.FrameRdd
 import org.trustedanalytics.sparktk.frame.{ Column, DataTypes }
+import org.trustedanalytics.sparktk.frame.DataTypes.DataType
 import org.apache.spark.sql.Row
 import org.apache.spark.rdd.RDD
 
+import scala.collection.mutable.ListBuffer
+import scala.reflect.ClassTag
+
 /**
  * Functions for computing various types of cumulative distributions
  *
@@ -45,35 +50,51 @@ object CumulativeDistFunctions extends Serializable {
       (sample, 1)
     }).reduceByKey(_ + _).sortByKey().cache()
 
-    // compute the partition sums
-    val partSums: Array[Double] = 0.0 +: sortedRdd.mapPartitionsWithIndex {
-      case (index, partition) => Iterator(partition.map { case (sample, count) => count }.sum.toDouble)
-    }.collect()
+    // compute empirical cumulative distribution
+    val (sumsRdd, numValues) = prefixSums(sortedRdd, (sampleCount: (Double, Int)) => sampleCount._2.toDouble)
 
-    // get sample size
-    val numValues = partSums.sum
+    sumsRdd.map {
+      case ((value, _), valueSum) => ecdfRow(value, valueSum / numValues, sampleColumn.dataType)
+    }
+  }
 
-    // compute empirical cumulative distribution
-    val sumsRdd = sortedRdd.mapPartitionsWithIndex {
-      case (index, partition) => {
-        var startValue = 0.0
-        for (i <- 0 to index) {
-          startValue += partSums(i)
-        }
-        partition.scanLeft((0.0, startValue))((prev, curr) => (curr._1, prev._2 + curr._2)).drop(1)
+  /**
+   * Approximate the empirical cumulative distribution for an input dataframe column from a quantile sketch built in
+   * a single pass, instead of sorting the column
+   *
+   * The distribution is given at the values held by the sketch, and is within relativeError of the exact one at each
+   * of them.  Missing, NaN and infinite values are ignored.
+   *
+   * @param frameRdd rdd for a Frame
+   * @param sampleColumn column containing the sample data
+   * @param relativeError acceptable error of the distribution values
+   * @return rows containing sample values held by the sketch and their ecdf value, in ascending order
+   */
+  def approximateEcdf(frameRdd: FrameRdd, sampleColumn: Column, relativeError: Double): Seq[Row] = {
+    val columnIndex = frameRdd.frameSchema.columnIndex(sampleColumn.name)
+    val sketch = QuantilesFunctions.quantileSketch(frameRdd, columnIndex, relativeError)
+    val (values, weights) = sketch.sortedValuesWithWeights
+    val numValues = sketch.count.toDouble
+
+    val rows = ListBuffer[Row]()
+    var valueSum = 0L
+    for (i <- values.indices) {
+      valueSum += weights(i)
+      // a value may be held more than once, but is reported once with its total
+      if (i == values.length - 1 || values(i + 1) != values(i)) {
+        rows += ecdfRow(values(i), valueSum / numValues, sampleColumn.dataType)
       }
     }
+    rows.toList
+  }
 
-    sumsRdd.map {
-      case (value, valueSum) => {
-        sampleColumn.dataType match {
-          case DataTypes.int32 => Row(value.toInt, valueSum / numValues)
-          case DataTypes.int64 => Row(value.toLong, valueSum / numValues)
-          case DataTypes.float32 => Row(value.toFloat, valueSum / numValues)
-          case DataTypes.float64 => Row(value.toDouble, valueSum / numValues)
-          case _ => Row(value, valueSum / numValues)
-        }
-      }
+  private def ecdfRow(value: Double, ecdf: Double, dataType: DataType): Row = {
+    dataType match {
+      case DataTypes.int32 => Row(value.toInt, ecdf)
+      case DataTypes.int64 => Row(value.toLong, ecdf)
+      case DataTypes.float32 => Row(value.toFloat, ecdf)
+      case DataTypes.float64 => Row(value.toDouble, ecdf)
+      case _ => Row(value, ecdf)
     }
   }
 
@@ -86,7 +107,8 @@ object CumulativeDistFunctions extends Serializable {
    */
   def cumulativeSum(frameRdd: FrameRdd, sampleColumnName: String): RDD[Row] = {
 
-    cumulativeCount(tupleRdd(frameRdd, sampleColumnName))
+    val (sums, _) = prefixSums(frameRdd, columnValue(frameRdd, sampleColumnName))
+    addCumulativeCountToRow(sums)
   }
 
   /**
@@ -99,7 +121,8 @@ object CumulativeDistFunctions extends Serializable {
    */
   def cumulativeCount(frameRdd: FrameRdd, sampleColumnName: String, countValue: String): RDD[Row] = {
 
-    cumulativeCount(pairedRdd(frameRdd, sampleColumnName, countValue))
+    val (counts, _) = prefixSums(frameRdd, countedValue(frameRdd, sampleColumnName, countValue))
+    addCumulativeCountToRow(counts)
   }
 
   /**
@@ -111,7 +134,8 @@ object CumulativeDistFunctions extends Serializable {
    */
   def cumulativePercentSum(frameRdd: FrameRdd, sampleColumnName: String): RDD[Row] = {
 
-    cumulativePercentCount(tupleRdd(frameRdd, sampleColumnName))
+    val (sums, numValues) = prefixSums(frameRdd, columnValue(frameRdd, sampleColumnName))
+    addCumulativePercentToRow(sums, numValues)
   }
 
   /**
@@ -124,7 +148,8 @@ object CumulativeDistFunctions extends Serializable {
    */
   def cumulativePercentCount(frameRdd: FrameRdd, sampleColumnName: String, countValue: String): RDD[Row] = {
 
-    cumulativePercentCount(pairedRdd(frameRdd, sampleColumnName, countValue))
+    val (counts, numValues) = prefixSums(frameRdd, countedValue(frameRdd, sampleColumnName, countValue))
+    addCumulativePercentToRow(counts, numValues)
   }
 
   /**
@@ -136,7 +161,8 @@ object CumulativeDistFunctions extends Serializable {
    */
   def tupleRdd(frameRdd: FrameRdd, sampleColumnName: String): RDD[(Row, Double)] = {
 
-    frameRdd.mapRows(rowWrapper => (rowWrapper.row, rowWrapper.doubleValue(sampleColumnName)))
+    val value = columnValue(frameRdd, sampleColumnName)
+    frameRdd.map(row => (row, value(row)))
   }
 
   /**
@@ -147,7 +173,7 @@ object CumulativeDistFunctions extends Serializable {
    */
   def cumulativeCountAsPairedRDD(pairedRdd: RDD[(Row, Double)]): RDD[(Row, Double)] = {
 
-    totalPartitionSums(pairedRdd, partitionSums(pairedRdd.values))
+    prefixSums(pairedRdd, (pair: (Row, Double)) => pair._2)._1.map { case ((row, _), valueSum) => (row, valueSum) }
   }
 
   /**
@@ -158,7 +184,7 @@ object CumulativeDistFunctions extends Serializable {
    */
   def columnSum(frameRdd: FrameRdd, columnName: String): Double = {
 
-    partitionSums(tupleRdd(frameRdd, columnName).values).sum
+    partitionSums(frameRdd.map(columnValue(frameRdd, columnName))).sum
   }
 
   /**
@@ -174,71 +200,46 @@ object CumulativeDistFunctions extends Serializable {
   }
 
   /**
-   * Compute the cumulative percent count of the input frameRdd
+   * Running sums of a value over the items of an RDD, with a two-phase parallel prefix scan
    *
-   * @param pairedRdd input paired RDD
-   * @return an RDD of row containing (originalValue, cumulativePercentCountAtThisValue)
-   */
-  private def cumulativePercentCount(pairedRdd: RDD[(Row, Double)]): RDD[Row] = {
-
-    val cumulativeCounts = cumulativeCountAsPairedRDD(pairedRdd)
-    val numValues = pairedRdd.map { case (row, columnValue) => columnValue }.sum()
-
-    addCumulativePercentToRow(cumulativeCounts, numValues)
-  }
-
-  /**
-   * Compute the cumulative count of the input frameRdd
+   * The first phase sums the values of each partition, collecting one total per partition.  The totals of the
+   * partitions before each partition are broadcast as its offset, and the second phase adds the running sum of each
+   * partition's values to its offset in a single mapPartitions pass.  Items keep their partitions and their order,
+   * so the running sums follow the existing order of the frame without sorting it.
    *
-   * @param pairedRdd input paired RDD
-   * @return an RDD of row containing (originalValue, cumulativeCountAtThisValue)
+   * @param rdd the input RDD
+   * @param value the value of an item to sum
+   * @return an RDD of each item with the sum of the values up to and including it, and the sum of all the values
    */
-  private def cumulativeCount(pairedRdd: RDD[(Row, Double)]): RDD[Row] = {
-
-    val cumulativeCounts = cumulativeCountAsPairedRDD(pairedRdd)
+  private def prefixSums[T: ClassTag](rdd: RDD[T], value: T => Double): (RDD[(T, Double)], Double) = {
+    val offsets = partitionSums(rdd.map(value)).scanLeft(0.0)(_ + _).tail
+    val partitionOffsets = rdd.sparkContext.broadcast(offsets)
 
-    addCumulativeCountToRow(cumulativeCounts)
+    val sums = rdd.mapPartitionsWithIndex({
+      (index, partition) =>
+        var valueSum = partitionOffsets.value(index)
+        partition.map(item => {
+          valueSum += value(item)
+          (item, valueSum)
+        })
+    }, preservesPartitioning = true)
+    (sums, offsets.last)
   }
 
   /**
-   * Builds a pairedRdd from frame
-   *
-   * @param frameRdd input frame RDD
-   * @param sampleColumnName column name whose values will be used to calculate the output pairedRdd
-   * @param countValue a count value
-   * @return an RDD of row and 0.0 or 1.0
+   * Value of a numeric column, as a function of the row
    */
-  private def pairedRdd(frameRdd: FrameRdd, sampleColumnName: String, countValue: String): RDD[(Row, Double)] = {
-
-    frameRdd.mapRows(rowWrapper => {
-      val sampleValue = rowWrapper.stringValue(sampleColumnName)
-      if (sampleValue.equals(countValue)) {
-        (rowWrapper.row, 1.0)
-      }
-      else {
-        (rowWrapper.row, 0.0)
-      }
-    })
+  private def columnValue(frameRdd: FrameRdd, columnName: String): Row => Double = {
+    val columnIndex = frameRdd.frameSchema.columnIndex(columnName)
+    row => DataTypes.toDouble(row.get(columnIndex))
   }
 
   /**
-   * Compute the total sums across partitions
-   *
-   * @param rdd the input RDD
-   * @param partSums the sums for each partition
-   * @return RDD of (value, cumulativeSum)
+   * 1.0 for a row whose column value is countValue, else 0.0
    */
-  private def totalPartitionSums(rdd: RDD[(Row, Double)], partSums: Array[Double]): RDD[(Row, Double)] = {
-    rdd.mapPartitionsWithIndex({
-      (index, partition) =>
-        var startValue = 0.0
-        for (i <- 0 to index) {
-          startValue += partSums(i)
-        }
-        // startValue updated, so drop first value
-        partition.scanLeft((Row(), startValue))((prev, curr) => (curr._1, prev._2 + curr._2)).drop(1)
-    }, preservesPartitioning = true
-    )
+  private def countedValue(frameRdd: FrameRdd, columnName: String, countValue: String): Row => Double = {
+    val columnIndex = frameRdd.frameSchema.columnIndex(columnName)
+    row => if (countValue.equals(DataTypes.toStr(row.get(columnIndex)))) 1.0 else 0.0
   }
 
   /**
@@ -44,6 +44,7 @@ case class CumulativeSum(sampleCol: String) extends FrameTransform {
     val updatedSchema = state.schema.addColumnFixName(Column(sampleCol + "_cumulative_sum", DataTypes.float64))
 
     // return result
-    FrameState(cumulativeDistRdd, updatedSchema)
+    // the rows keep their partitions, so the frame stays partitioned by its partition columns
+    FrameState(cumulativeDistRdd, updatedSchema, partitioning = state.partitioning)
   }
 }
\ No newline at end of file
@@ -18,6 +18,7 @@ package org.trustedanalytics.sparktk.frame.internal.ops.cumulativedist
 import org.apache.commons.lang.StringUtils
 import org.trustedanalytics.sparktk.frame.{ Frame, FrameSchema, Column, DataTypes }
 import org.trustedanalytics.sparktk.frame.internal.{ FrameState, FrameSummarization, BaseFrame }
+import org.trustedanalytics.sparktk.frame.internal.ops.statistics.quantiles.QuantileSketch
 
 trait EcdfSummarization extends BaseFrame {
   /**
@@ -26,14 +27,25 @@ trait EcdfSummarization extends BaseFrame {
    * Generates the :term:`empirical cumulative distribution` for the input column.
    *
    * @param column The name of the input column containing sample
+   * @param approximate If true, the distribution comes from a quantile sketch built in a single pass over the data,
+   *                    instead of from a sort of the column.  It is then given at the sample values held by the
+   *                    sketch (a number which grows with 1 / relativeError, but only logarithmically with the number
+   *                    of rows), each within relativeError of the exact distribution, and missing or non-finite values
+   *                    are ignored.
+   * @param relativeError Acceptable error of the approximate distribution values.
    */
-  def ecdf(column: String): Frame = {
-    execute(Ecdf(column))
+  def ecdf(column: String,
+           approximate: Boolean = false,
+           relativeError: Double = QuantileSketch.DefaultRelativeError): Frame = {
+    execute(Ecdf(column, approximate, relativeError))
   }
 }
 
-case class Ecdf(column: String) extends FrameSummarization[Frame] {
+case class Ecdf(column: String,
+                approximate: Boolean = false,
+                relativeError: Double = QuantileSketch.DefaultRelativeError) extends FrameSummarization[Frame] {
   require(StringUtils.isNotEmpty(column), "column is required")
+  require(relativeError > 0 && relativeError < 1, "relative error must be between 0 and 1")
 
   override def work(state: FrameState): Frame = {
     val sampleColumn = state.schema.column(column)
@@ -41,7 +53,13 @@ case class Ecdf(column: String) extends FrameSummarization[Frame] {
     val ecdfSchema = FrameSchema(Vector(sampleColumn.copy(), Column(sampleColumn.name + "_ecdf", DataTypes.float64)))
 
     // Create new frame with the result
-    new Frame(CumulativeDistFunctions.ecdf(state, sampleColumn), ecdfSchema)
+    if (approximate) {
+      val rows = CumulativeDistFunctions.approximateEcdf(state, sampleColumn, relativeError)
+      new Frame(state.rdd.sparkContext.parallelize(rows, 1), ecdfSchema)
+    }
+    else {
+      new Frame(CumulativeDistFunctions.ecdf(state, sampleColumn), ecdfSchema)
+    }
   }
 }
 
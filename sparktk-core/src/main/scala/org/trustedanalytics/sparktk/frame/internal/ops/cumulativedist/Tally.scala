@@ -44,6 +44,7 @@ case class Tally(sampleCol: String,
     // run the operation
     val cumulativeDistRdd = CumulativeDistFunctions.cumulativeCount(state, sampleCol, countVal)
     val updatedSchema = state.schema.addColumnFixName(Column(sampleCol + "_tally", DataTypes.float64))
-    FrameState(cumulativeDistRdd, updatedSchema)
+    // the rows keep their partitions, so the frame stays partitioned by its partition columns
+    FrameState(cumulativeDistRdd, updatedSchema, partitioning = state.partitioning)
   }
 }
\ No newline at end of file
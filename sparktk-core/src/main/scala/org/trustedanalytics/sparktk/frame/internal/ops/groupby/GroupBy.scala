@@ -49,7 +49,7 @@ case class GroupBy(groupByColumns: List[String], aggregations: List[GroupByAggre
     val groupByColumnList: Iterable[Column] = frame.frameSchema.columns(columnNames = groupByColumns)
 
     // run the operation and save results
-    val groupByRdd = GroupByAggregationHelper.aggregation(frame, groupByColumnList.toList, aggregations)
+    val groupByRdd = GroupByAggregationHelper.aggregation(frame, groupByColumnList.toList, aggregations, state.partitioning)
     new Frame(groupByRdd, groupByRdd.frameSchema)
 
   }
@@ -19,6 +19,7 @@ import org.apache.spark.rdd.{ PairRDDFunctions, RDD }
 import org.apache.spark.sql.Row
 import org.trustedanalytics.sparktk.frame.internal.ops.groupby.aggregators.{ GroupByAggregator, ColumnAggregator }
 
+import scala.collection.mutable
 import scala.collection.mutable.ListBuffer
 
 /**
@@ -64,6 +65,29 @@ case class GroupByAggregateByKey(pairedRDD: RDD[(Seq[Any], Seq[Any])],
       }
   }
 
+  /**
+   * Computes the aggregated values like aggregateByKey, when all the rows of each key are in the same partition
+   * (like when the frame is partitioned by some of the group-by columns), so each partition is aggregated on its own,
+   * without a shuffle.
+   *
+   * @return Row RDD with results of aggregation
+   */
+  def aggregateWithinPartitions(): RDD[Row] = {
+    pairedRDD.mapPartitions(rows => {
+      val aggregates = mutable.HashMap[Seq[Any], Seq[Any]]()
+      rows.foreach {
+        case (key, row) =>
+          // some aggregators update their aggregate value in place, so each key gets new zero values
+          val aggregateValues = aggregates.getOrElse(key, columnAggregators.map(_.aggregator.zero))
+          aggregates(key) = addAll(aggregateValues, mapAll(key, row)._2)
+      }
+      aggregates.iterator.map {
+        case (key, row) =>
+          getResults(key, row)
+      }
+    })
+  }
+
   /**
    * Transforms the column values into the input values expected by the aggregators
    *
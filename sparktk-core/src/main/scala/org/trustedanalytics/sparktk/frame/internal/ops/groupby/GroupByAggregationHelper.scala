@@ -16,6 +16,9 @@
 package org.trustedanalytics.sparktk.frame.internal.ops.groupby
 
 import org.apache.spark.rdd.RDD
+import org.apache.spark.sql.functions._
+import org.apache.spark.sql.types.DoubleType
+import org.trustedanalytics.sparktk.frame.internal.FramePartitioning
 import org.trustedanalytics.sparktk.frame.internal.ops.groupby.aggregators._
 import org.trustedanalytics.sparktk.frame.{ Schema, Column, FrameSchema }
 import org.trustedanalytics.sparktk.frame.internal.rdd.FrameRdd
@@ -47,29 +50,91 @@ case class GroupByAggregationArgs(function: String, columnName: String, newColum
  */
 private object GroupByAggregationHelper extends Serializable {
 
+  /**
+   * Aggregation functions which Spark SQL computes with the same results as the custom aggregators
+   */
+  private val sqlAggregationFunctions = Set("COUNT", "SUM", "AVG", "MIN", "MAX", "VAR", "STDEV")
+
+  /**
+   * Column data types which convert to Spark SQL primitive types
+   */
+  private val sqlPrimitiveDataTypes = List(DataTypes.int32, DataTypes.int64, DataTypes.float32, DataTypes.float64, DataTypes.string)
+
   /**
    * Create a Summarized Frame with Aggregations (Avg, Count, Max, Min, ...).
    *
    * For example, grouping a frame by gender and age, and computing the average income.
    *
+   * When the frame is partitioned by some of the group-by columns (see partition_by), every group is within one
+   * partition, so the custom aggregators run on each partition without a shuffle.  Otherwise, when the group-by and
+   * aggregated columns are primitive and every aggregation is one Spark SQL supports, the aggregation runs as a
+   * DataFrame plan (see sqlAggregation), and it runs the custom aggregators in all other cases.
+   *
    * New aggregations can be added by implementing a GroupByAggregator.
    *
    * @see GroupByAggregator
    * @param frameRdd Input frame
    * @param groupByColumns List of columns to group by
    * @param aggregationArguments List of aggregation arguments
+   * @param partitioning How the rows of the frame are partitioned, if known
    * @return Summarized frame with aggregations
    */
   def aggregation(frameRdd: FrameRdd,
                   groupByColumns: List[Column],
-                  aggregationArguments: List[GroupByAggregationArgs]): FrameRdd = {
+                  aggregationArguments: List[GroupByAggregationArgs],
+                  partitioning: Option[FramePartitioning] = None): FrameRdd = {
+    if (partitioning.exists(_.colocates(groupByColumns.map(_.name))))
+      rddAggregation(frameRdd, groupByColumns, aggregationArguments, withinPartitions = true)
+    else if (supportsSqlAggregation(frameRdd.frameSchema, groupByColumns, aggregationArguments))
+      sqlAggregation(frameRdd, groupByColumns, aggregationArguments)
+    else
+      rddAggregation(frameRdd, groupByColumns, aggregationArguments)
+  }
+
+  /**
+   * True if the aggregations can be compiled to a Spark SQL plan
+   *
+   * @param frameSchema Frame schema
+   * @param groupByColumns List of columns to group by
+   * @param aggregationArguments List of aggregation arguments
+   */
+  def supportsSqlAggregation(frameSchema: Schema,
+                             groupByColumns: List[Column],
+                             aggregationArguments: List[GroupByAggregationArgs]): Boolean = {
+    def isPrimitive(dataType: DataTypes.DataType) = sqlPrimitiveDataTypes.exists(_.equalsDataType(dataType))
+
+    groupByColumns.nonEmpty && aggregationArguments.nonEmpty &&
+      groupByColumns.forall(column => isPrimitive(column.dataType)) &&
+      aggregationArguments.forall(arg => {
+        val dataType = frameSchema.columnDataType(arg.columnName)
+        sqlAggregationFunctions.contains(arg.function) && isPrimitive(dataType) &&
+          (dataType.isNumerical || Set("COUNT", "MIN", "MAX").contains(arg.function))
+      })
+  }
+
+  /**
+   * Create a Summarized Frame with the custom aggregators, grouping rows by key with aggregateByKey
+   *
+   * @param frameRdd Input frame
+   * @param groupByColumns List of columns to group by
+   * @param aggregationArguments List of aggregation arguments
+   * @param withinPartitions True if all the rows of each group are in the same partition, so each partition can be
+   *                         aggregated on its own, without a shuffle
+   * @return Summarized frame with aggregations
+   */
+  def rddAggregation(frameRdd: FrameRdd,
+                     groupByColumns: List[Column],
+                     aggregationArguments: List[GroupByAggregationArgs],
+                     withinPartitions: Boolean = false): FrameRdd = {
 
     val frameSchema = frameRdd.frameSchema
     val columnAggregators = createColumnAggregators(frameSchema, aggregationArguments)
 
     val pairedRowRDD = pairRowsByGroupByColumns(frameRdd, groupByColumns, aggregationArguments)
 
-    val aggregationRDD = GroupByAggregateByKey(pairedRowRDD, columnAggregators).aggregateByKey()
+    val groupByAggregateByKey = GroupByAggregateByKey(pairedRowRDD, columnAggregators)
+    val aggregationRDD = if (withinPartitions) groupByAggregateByKey.aggregateWithinPartitions()
+    else groupByAggregateByKey.aggregateByKey()
 
     val newColumns = groupByColumns ++ columnAggregators.map(_.column)
     val newSchema = FrameSchema(newColumns.toVector)
@@ -77,6 +142,56 @@ private object GroupByAggregationHelper extends Serializable {
     new FrameRdd(newSchema, aggregationRDD)
   }
 
+  /**
+   * Create a Summarized Frame with a DataFrame groupBy().agg() plan, so values stay unboxed and Tungsten generates
+   * the aggregation code.
+   *
+   * The results match the custom aggregators: COUNT counts every row, SUM treats nulls as zero, AVG, VAR and STDEV
+   * omit nulls and NaNs, VAR and STDEV are sample statistics which are null for fewer than two values, and MIN and
+   * MAX ignore nulls.
+   *
+   * @param frameRdd Input frame, whose group-by and aggregated columns are primitive (see supportsSqlAggregation)
+   * @param groupByColumns List of columns to group by
+   * @param aggregationArguments List of aggregation arguments
+   * @return Summarized frame with aggregations
+   */
+  def sqlAggregation(frameRdd: FrameRdd,
+                     groupByColumns: List[Column],
+                     aggregationArguments: List[GroupByAggregationArgs]): FrameRdd = {
+
+    val frameSchema = frameRdd.frameSchema
+    val columnAggregators = createColumnAggregators(frameSchema, aggregationArguments)
+
+    // only the group-by and aggregated columns are converted for Spark SQL
+    val columnNames = (groupByColumns.map(_.name) ++ aggregationArguments.map(_.columnName)).distinct
+    val dataFrame = (if (columnNames.length < frameSchema.columns.length) frameRdd.selectColumns(columnNames) else frameRdd).toDataFrame
+    def sqlColumn(columnName: String) = dataFrame.col("`" + columnName.replaceAll("\\s", "") + "`")
+
+    val aggregations = aggregationArguments.zip(columnAggregators).map {
+      case (arg, columnAggregator) =>
+        val value = sqlColumn(arg.columnName)
+        val newDataType = FrameRdd.schemaDataTypeToSqlDataType(columnAggregator.column.dataType)
+        lazy val number = if (frameSchema.columnDataType(arg.columnName).isInteger) value.cast(DoubleType)
+        else when(not(isnan(value.cast(DoubleType))), value.cast(DoubleType))
+        val aggregated = arg.function match {
+          case "COUNT" => count(lit(1))
+          case "SUM" => coalesce(sum(value.cast(newDataType)), lit(0).cast(newDataType))
+          case "AVG" => avg(number)
+          case "VAR" => when(count(number) > 1, var_samp(number))
+          case "STDEV" => when(count(number) > 1, stddev_samp(number))
+          case "MIN" => min(value)
+          case "MAX" => max(value)
+        }
+        aggregated.cast(newDataType).as(columnAggregator.column.name)
+    }
+
+    val aggregated = dataFrame.groupBy(groupByColumns.map(column => sqlColumn(column.name)): _*)
+      .agg(aggregations.head, aggregations.tail: _*)
+
+    val newColumns = groupByColumns ++ columnAggregators.map(_.column)
+    new FrameRdd(FrameSchema(newColumns.toVector), aggregated.rdd)
+  }
+
   /**
    * Returns a list of columns and corresponding accumulators used to aggregate values
    *
@@ -95,6 +210,8 @@ private object GroupByAggregationHelper extends Serializable {
             ColumnAggregator(Column(arg.newColumnName, DataTypes.int64), i, CountAggregator())
           case "COUNT_DISTINCT" =>
             ColumnAggregator(Column(arg.newColumnName, DataTypes.int64), i, DistinctCountAggregator())
+          case function if function.startsWith("COUNT_DISTINCT_APPROX") =>
+            ColumnAggregator.getApproximateDistinctCountColumnAggregator(arg, i)
           case "MIN" =>
             ColumnAggregator(Column(arg.newColumnName, column.dataType), i, MinAggregator())
           case "MAX" =>
@@ -0,0 +1,78 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal.ops.groupby.aggregators
+
+import com.clearspring.analytics.stream.cardinality.HyperLogLogPlus
+import org.trustedanalytics.sparktk.frame.DataTypes.DataType
+
+/**
+ * Aggregator for estimating the number of distinct column values with a HyperLogLog++ sketch.
+ *
+ * Unlike the DistinctCountAggregator, the aggregate value has a fixed size (2^precision registers) whatever the
+ * number of distinct values, so it suits high-cardinality columns.  Missing values are not counted.
+ *
+ * @param precision number of bits used to index the sketch registers; the relative standard error of the estimate
+ *                  is about 1.04 / sqrt(2^precision)
+ */
+case class ApproximateDistinctCountAggregator(precision: Int = ApproximateDistinctCountAggregator.DefaultPrecision) extends GroupByAggregator {
+  require(precision >= ApproximateDistinctCountAggregator.MinPrecision && precision <= ApproximateDistinctCountAggregator.MaxPrecision,
+    s"precision must be between ${ApproximateDistinctCountAggregator.MinPrecision} and ${ApproximateDistinctCountAggregator.MaxPrecision}, but got $precision")
+
+  /** Type for aggregate values that corresponds to type U in Spark's aggregateByKey() */
+  override type AggregateType = HyperLogLogPlus
+
+  /** Output type of the map function that corresponds to type V in Spark's aggregateByKey() */
+  override type ValueType = Any
+
+  /** The 'empty' or 'zero' or default value for the aggregator */
+  override def zero = new HyperLogLogPlus(precision, 0)
+
+  /**
+   * Outputs column value
+   */
+  override def mapFunction(columnValue: Any, columnDataType: DataType): ValueType = columnValue
+
+  /**
+   * Add map value to the sketch.
+   */
+  override def add(sketch: AggregateType, mapValue: ValueType): AggregateType = {
+    if (mapValue != null) sketch.offer(mapValue)
+    sketch
+  }
+
+  /**
+   * Merge two sketches.
+   */
+  override def merge(sketch1: AggregateType, sketch2: AggregateType) = {
+    sketch1.addAll(sketch2)
+    sketch1
+  }
+
+  /**
+   * Returns the estimated count of distinct column values
+   */
+  override def getResult(sketch: AggregateType): Any = sketch.cardinality() // Long, like the exact count
+}
+
+object ApproximateDistinctCountAggregator {
+
+  /** Default precision, which gives about 1.6% relative standard error */
+  val DefaultPrecision = 12
+
+  val MinPrecision = 4
+
+  val MaxPrecision = 18
+}
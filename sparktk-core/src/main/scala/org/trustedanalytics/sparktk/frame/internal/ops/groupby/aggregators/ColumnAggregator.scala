@@ -42,6 +42,27 @@ object ColumnAggregator {
     ColumnAggregator(Column(newColumnName, DataTypes.vector(histogramAggregator.cutoffs.length - 1)), columnIndex, histogramAggregator)
   }
 
+  /**
+   * Get the column aggregator for approximate distinct counts
+   *
+   * The function is COUNT_DISTINCT_APPROX, optionally followed by =precision
+   *
+   * @param aggregationArgs Aggregation arguments
+   * @param columnIndex Index of new column
+   * @return Column aggregator for approximate distinct counts
+   */
+  def getApproximateDistinctCountColumnAggregator(aggregationArgs: GroupByAggregationArgs, columnIndex: Int): ColumnAggregator = {
+    val functionName = aggregationArgs.function
+    require(functionName.matches("""COUNT_DISTINCT_APPROX(\s*=\s*\d+)?"""), s"Unsupported aggregation function for approximate distinct count: $functionName")
+
+    val newColumnName = aggregationArgs.newColumnName.split("=")(0)
+    val precision = functionName.split("=").drop(1).headOption match {
+      case Some(p) => p.trim.toInt
+      case None => ApproximateDistinctCountAggregator.DefaultPrecision
+    }
+    ColumnAggregator(Column(newColumnName, DataTypes.int64), columnIndex, ApproximateDistinctCountAggregator(precision))
+  }
+
   /**
    * Parses the JSON for arguments and creates a new HistogramAggregator
    *
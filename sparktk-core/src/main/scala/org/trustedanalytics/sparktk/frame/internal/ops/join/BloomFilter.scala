@@ -0,0 +1,111 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal.ops.join
+
+import scala.util.hashing.MurmurHash3
+
+/**
+ * Mergeable set of join keys which may report keys it does not hold (false positives), but never misses a key added
+ * to it (a Bloom filter).
+ *
+ * A key sets numHashes bits of the filter, at positions from two MurmurHash3 hashes of the key (double hashing).
+ * The hashes use the cooperative hash codes (##) of the key's values, under which equal numbers of different types
+ * hash alike, so an int32 key finds the equal int64 key of a compatible join column.
+ *
+ * Filters of separate partitions combine with merge, so the filter of a frame's keys is built in a single aggregation.
+ *
+ * @param numBits number of bits of the filter
+ * @param numHashes number of bits set by each key
+ */
+class BloomFilter(val numBits: Int, val numHashes: Int) extends Serializable {
+  require(numBits >= 1, "bloom filter needs at least one bit")
+  require(numHashes >= 1, "bloom filter needs at least one hash")
+
+  private val words = new Array[Long]((numBits + 63) / 64)
+
+  /**
+   * Add a key to the filter
+   *
+   * @param key values of the join columns
+   */
+  def add(key: Seq[Any]): Unit = {
+    positions(key).foreach(i => words(i >>> 6) |= 1L << (i & 63))
+  }
+
+  /**
+   * True if the key may have been added to the filter, false if it certainly was not
+   *
+   * @param key values of the join columns
+   */
+  def mightContain(key: Seq[Any]): Boolean = {
+    positions(key).forall(i => (words(i >>> 6) & (1L << (i & 63))) != 0)
+  }
+
+  /**
+   * Merge another filter of the same size into this filter
+   *
+   * @param other filter with the same numBits and numHashes
+   * @return this filter, holding the keys of both
+   */
+  def merge(other: BloomFilter): BloomFilter = {
+    require(numBits == other.numBits && numHashes == other.numHashes, "only bloom filters of the same size can be merged")
+    for (i <- words.indices) {
+      words(i) |= other.words(i)
+    }
+    this
+  }
+
+  /**
+   * Bytes of the filter's bits
+   */
+  def sizeInBytes: Long = words.length * 8L
+
+  private def positions(key: Seq[Any]): Iterator[Int] = {
+    val hash1 = MurmurHash3.orderedHash(key, BloomFilter.Seed1).toLong
+    val hash2 = MurmurHash3.orderedHash(key, BloomFilter.Seed2).toLong
+    (0 until numHashes).iterator.map(i => {
+      val combined = (hash1 + i * hash2) % numBits
+      (if (combined < 0) combined + numBits else combined).toInt
+    })
+  }
+}
+
+object BloomFilter {
+
+  /**
+   * Largest number of bits of a filter (128 MB)
+   */
+  val MaxBits: Int = 1 << 30
+
+  private val Seed1 = 0x3c074a61
+  private val Seed2 = 0x7e1d3b2f
+
+  /**
+   * Create an empty filter sized to hold a number of keys at a false positive rate
+   *
+   * @param expectedKeys number of keys which will be added
+   * @param falsePositiveRate chance that a key which was not added is reported, between 0 and 1
+   * @return empty filter, of at most MaxBits bits
+   */
+  def apply(expectedKeys: Long, falsePositiveRate: Double): BloomFilter = {
+    require(falsePositiveRate > 0 && falsePositiveRate < 1, "bloom filter false positive rate must be between 0 and 1")
+    val keys = math.max(1L, expectedKeys).toDouble
+    val ln2 = math.log(2)
+    val numBits = math.min(MaxBits.toDouble, math.max(64.0, math.ceil(-keys * math.log(falsePositiveRate) / (ln2 * ln2)))).toInt
+    val numHashes = math.max(1, math.round(numBits / keys * ln2).toInt)
+    new BloomFilter(numBits, math.min(numHashes, 16))
+  }
+}
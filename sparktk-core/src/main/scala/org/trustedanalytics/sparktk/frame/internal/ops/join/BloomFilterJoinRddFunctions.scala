@@ -0,0 +1,145 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal.ops.join
+
+import org.apache.spark.rdd.RDD
+import org.apache.spark.sql.Row
+import org.slf4j.LoggerFactory
+import org.trustedanalytics.sparktk.frame.internal.FrameStatisticsCatalog
+import org.trustedanalytics.sparktk.frame.internal.rdd.FrameRdd
+
+/**
+ * Semi-join pre-filtering of joins with a Bloom filter (bloomFilter=true).
+ *
+ * A Bloom filter of the join keys of one frame is built with a single tree aggregation and broadcast, and the rows
+ * of the other frame whose keys are not in the filter are dropped before the shuffle, as they cannot match.  Rows
+ * with a null join key match nothing and are dropped too.  This pays off for selective joins, where most rows of a
+ * large frame find no match.
+ *
+ * Only a frame whose unmatched rows are not kept is filtered: the larger frame (by estimated size) of an inner
+ * join, the right frame of a left join and the left frame of a right join.  The estimated shuffle bytes saved are
+ * logged, from the share of a sample of the filtered frame's rows which the filter drops.
+ */
+object BloomFilterJoinRddFunctions extends Serializable {
+
+  @transient private lazy val logger = LoggerFactory.getLogger(this.getClass)
+
+  /**
+   * Chance that the filter keeps a row whose key is not in the other frame
+   */
+  val FalsePositiveRate = 0.01
+
+  private val SampledRows = 1000
+
+  /**
+   * Filter the larger frame of an inner join by the keys of the smaller one
+   *
+   * @param left join parameter for first data frame
+   * @param right join parameter for second data frame
+   * @param leftRows rows and statistics of the first data frame, for size estimates
+   * @param rightRows rows and statistics of the second data frame, for size estimates
+   * @return join parameters for the first and second data frames, one of them filtered
+   */
+  def prefilterInner(left: RddJoinParam,
+                     right: RddJoinParam,
+                     leftRows: (RDD[Row], Option[FrameStatisticsCatalog]),
+                     rightRows: (RDD[Row], Option[FrameStatisticsCatalog])): (RddJoinParam, RddJoinParam) = {
+    val leftSize = BroadcastJoinPlanner.estimateSize(leftRows._1, leftRows._2)
+    val rightSize = BroadcastJoinPlanner.estimateSize(rightRows._1, rightRows._2)
+    if (leftSize.bytes >= rightSize.bytes)
+      (filterByKeys(left, leftSize, right, rightRows, rightSize, "left"), right)
+    else
+      (left, filterByKeys(right, rightSize, left, leftRows, leftSize, "right"))
+  }
+
+  /**
+   * Filter a frame by the join keys of another frame
+   *
+   * @param filtered join parameter of the frame to filter
+   * @param filteredRows rows and statistics of the frame to filter, for size estimates
+   * @param keys join parameter of the frame whose keys are kept
+   * @param keysRows rows and statistics of the frame whose keys are kept, for size estimates
+   * @param side "left" or "right", the side of the frame to filter
+   * @return join parameter of the filtered frame
+   */
+  def prefilter(filtered: RddJoinParam,
+                filteredRows: (RDD[Row], Option[FrameStatisticsCatalog]),
+                keys: RddJoinParam,
+                keysRows: (RDD[Row], Option[FrameStatisticsCatalog]),
+                side: String): RddJoinParam = {
+    filterByKeys(filtered,
+      BroadcastJoinPlanner.estimateSize(filteredRows._1, filteredRows._2),
+      keys,
+      keysRows,
+      BroadcastJoinPlanner.estimateSize(keysRows._1, keysRows._2),
+      side)
+  }
+
+  private def filterByKeys(filtered: RddJoinParam,
+                           filteredSize: SizeEstimate,
+                           keys: RddJoinParam,
+                           keysRows: (RDD[Row], Option[FrameStatisticsCatalog]),
+                           keysSize: SizeEstimate,
+                           side: String): RddJoinParam = {
+    val expectedKeys = expectedKeyCount(keys, keysRows, keysSize)
+    val bloomFilter = buildFilter(keys, expectedKeys)
+    val filter = filtered.frame.sparkContext.broadcast(bloomFilter)
+    val keyIndices = filtered.frame.frameSchema.columnIndices(filtered.joinColumns)
+    val mightMatch = (row: Row) => {
+      val key = keyIndices.map(row.get)
+      !key.contains(null) && filter.value.mightContain(key)
+    }
+
+    val sample = filtered.frame.take(SampledRows)
+    val droppedShare = if (sample.isEmpty) 0.0 else sample.count(row => !mightMatch(row)).toDouble / sample.length
+    logger.info(s"Bloom filter join pre-filter of the $side frame: " +
+      s"filter of ${BroadcastJoinPlanner.formatBytes(bloomFilter.sizeInBytes)} over ~$expectedKeys keys " +
+      s"drops ~${math.round(droppedShare * 100)}% of ${sample.length} sampled rows, " +
+      s"saving ~${BroadcastJoinPlanner.formatBytes((filteredSize.bytes * droppedShare).toLong)} of shuffle " +
+      s"(frame size $filteredSize)")
+
+    RddJoinParam(new FrameRdd(filtered.frame.frameSchema, filtered.frame.filter(mightMatch)), filtered.joinColumns)
+  }
+
+  /**
+   * Bloom filter of the non-null join keys of a frame
+   */
+  private def buildFilter(param: RddJoinParam, expectedKeys: Long): BloomFilter = {
+    val keyIndices = param.frame.frameSchema.columnIndices(param.joinColumns)
+    param.frame.treeAggregate(BloomFilter(expectedKeys, FalsePositiveRate))(
+      (filter, row) => {
+        val key = keyIndices.map(row.get)
+        if (!key.contains(null)) {
+          filter.add(key)
+        }
+        filter
+      },
+      (filter1, filter2) => filter1.merge(filter2))
+  }
+
+  /**
+   * Number of keys the filter is sized for: the distinct count of a single join column from the frame's statistics,
+   * else the estimated row count, else (for cached frames) the row count
+   */
+  private def expectedKeyCount(param: RddJoinParam,
+                               rows: (RDD[Row], Option[FrameStatisticsCatalog]),
+                               size: SizeEstimate): Long = {
+    val distinctCount = rows._2.filter(_ => param.joinColumns.size == 1)
+      .flatMap(_.column(param.joinColumns.head))
+      .flatMap(_.approxDistinctCount)
+    distinctCount.orElse(size.rowCount).getOrElse(rows._1.count())
+  }
+}
@@ -0,0 +1,200 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal.ops.join
+
+import org.apache.spark.{ SparkContext, SparkEnv }
+import org.apache.spark.rdd.RDD
+import org.apache.spark.sql.Row
+import org.slf4j.LoggerFactory
+import org.trustedanalytics.sparktk.frame.internal.FrameStatisticsCatalog
+
+import scala.collection.mutable.ArrayBuffer
+
+/**
+ * Picks the side of a join to broadcast (use_broadcast="auto") from estimates of the serialized size of each side.
+ *
+ * The size of a fully cached frame is the size of its cached blocks.  Otherwise up to SampledPartitions evenly
+ * spaced partitions are read, and the first SampledRowsPerPartition rows of each are serialized with the Spark
+ * serializer.  The bytes per sampled row are multiplied by the row count, which comes from the statistics saved with
+ * the frame when it has them (see Save), and is extrapolated from the row counts of the sampled partitions otherwise.
+ *
+ * The smaller candidate side is broadcast when its estimate is at most the threshold, which is read from the Spark
+ * configuration (ThresholdConf, in bytes, -1 to never broadcast).  Otherwise the join is a shuffle join.
+ */
+object BroadcastJoinPlanner extends Serializable {
+
+  @transient private lazy val logger = LoggerFactory.getLogger(this.getClass)
+
+  /**
+   * Spark configuration key of the most bytes a broadcast side may take
+   */
+  val ThresholdConf = "spark.sparktk.join.autoBroadcastThreshold"
+
+  val DefaultThreshold: Long = 10L * 1024 * 1024
+
+  val SampledPartitions = 8
+
+  val SampledRowsPerPartition = 100
+
+  /**
+   * Most bytes a broadcast side may take, -1 to never broadcast
+   */
+  def threshold(sc: SparkContext): Long = sc.getConf.getLong(ThresholdConf, DefaultThreshold)
+
+  /**
+   * The side to broadcast for a join with use_broadcast="auto", logging the decision (see decide)
+   */
+  def broadcastSide(how: String,
+                    left: (RDD[Row], Option[FrameStatisticsCatalog]),
+                    right: (RDD[Row], Option[FrameStatisticsCatalog])): Option[String] = {
+    val decision = decide(how, left, right, threshold(left._1.sparkContext))
+    logger.info(decision.explain)
+    decision.broadcastSide
+  }
+
+  /**
+   * Decides which side of a join to broadcast
+   *
+   * @param how join method ("inner", "left", "right" or "outer")
+   * @param left rows and statistics of the left frame
+   * @param right rows and statistics of the right frame
+   * @param maxBytes most bytes the broadcast side may take, -1 to never broadcast
+   * @return the side to broadcast ("left" or "right", None for a shuffle join) and an explanation of the decision
+   */
+  def decide(how: String,
+             left: (RDD[Row], Option[FrameStatisticsCatalog]),
+             right: (RDD[Row], Option[FrameStatisticsCatalog]),
+             maxBytes: Long): BroadcastJoinDecision = {
+    // only the side whose rows are not all kept can be broadcast
+    val candidates = how match {
+      case "inner" => Seq("left" -> left, "right" -> right)
+      case "left" => Seq("right" -> right)
+      case "right" => Seq("left" -> left)
+      case "outer" => Seq.empty
+      case _ => throw new IllegalArgumentException(s"Unsupported join method: $how")
+    }
+    if (candidates.isEmpty) {
+      return BroadcastJoinDecision(None, s"$how join: shuffle (no side of an $how join can be broadcast)")
+    }
+
+    if (maxBytes < 0) {
+      return BroadcastJoinDecision(None, s"$how join: shuffle (broadcasting is disabled by $ThresholdConf)")
+    }
+    val estimates = candidates.map { case (side, (rdd, statistics)) => side -> estimateSize(rdd, statistics) }
+    val (smallestSide, smallest) = estimates.minBy(_._2.bytes)
+    val broadcastSide = if (smallest.bytes <= maxBytes) Some(smallestSide) else None
+
+    val sizes = estimates.map { case (side, estimate) => s"$side: $estimate" }.mkString(", ")
+    val explain = broadcastSide match {
+      case Some(side) => s"$how join: broadcast $side ($sizes; threshold ${formatBytes(maxBytes)})"
+      case None => s"$how join: shuffle ($sizes; over threshold ${formatBytes(maxBytes)})"
+    }
+    BroadcastJoinDecision(broadcastSide, explain)
+  }
+
+  /**
+   * Estimates the serialized size of the rows of a frame
+   *
+   * @param rdd rows of the frame
+   * @param statistics statistics of the rows, if known
+   * @return size estimate
+   */
+  def estimateSize(rdd: RDD[Row], statistics: Option[FrameStatisticsCatalog]): SizeEstimate = {
+    cachedSize(rdd).getOrElse(sampledSize(rdd, statistics))
+  }
+
+  /**
+   * Bytes held by the cached blocks of the rdd, if every partition is cached
+   */
+  private def cachedSize(rdd: RDD[Row]): Option[SizeEstimate] = {
+    rdd.sparkContext.getRDDStorageInfo.find(_.id == rdd.id)
+      .filter(info => info.numPartitions > 0 && info.numCachedPartitions == info.numPartitions)
+      .map(info => SizeEstimate(info.memSize + info.diskSize, None, "cached"))
+  }
+
+  private def sampledSize(rdd: RDD[Row], statistics: Option[FrameStatisticsCatalog]): SizeEstimate = {
+    val numPartitions = rdd.partitions.length
+    if (numPartitions == 0) {
+      return SizeEstimate(0L, Some(0L), "no partitions")
+    }
+    val sampleCount = math.min(numPartitions, SampledPartitions)
+    val partitions = (0 until sampleCount).map(i => (i.toLong * numPartitions / sampleCount).toInt)
+    val countRows = statistics.isEmpty
+    val rowsPerPartition = SampledRowsPerPartition
+
+    // (rows in the partition, sampled rows, serialized bytes of the sampled rows)
+    val samples = rdd.sparkContext.runJob(rdd, (rows: Iterator[Row]) => {
+      val sampled = new ArrayBuffer[Row]()
+      while (sampled.size < rowsPerPartition && rows.hasNext) {
+        sampled += rows.next()
+      }
+      var rowCount = sampled.size.toLong
+      if (countRows) {
+        while (rows.hasNext) {
+          rows.next()
+          rowCount += 1
+        }
+      }
+      val bytes = if (sampled.isEmpty) 0L
+      else SparkEnv.get.serializer.newInstance().serialize(sampled.toArray).limit().toLong
+      (rowCount, sampled.size.toLong, bytes)
+    }, partitions)
+
+    val sampledRows = samples.map(_._2).sum
+    val bytesPerRow = if (sampledRows == 0) 0.0 else samples.map(_._3).sum.toDouble / sampledRows
+    statistics match {
+      case Some(catalog) =>
+        SizeEstimate(math.ceil(bytesPerRow * catalog.rowCount).toLong,
+          Some(catalog.rowCount),
+          s"${catalog.rowCount} rows from saved statistics, $sampledRows sampled")
+      case None =>
+        val rowCount = math.ceil(samples.map(_._1).sum.toDouble / sampleCount * numPartitions).toLong
+        SizeEstimate(math.ceil(bytesPerRow * rowCount).toLong,
+          Some(rowCount),
+          s"~$rowCount rows extrapolated from $sampleCount of $numPartitions partitions, $sampledRows sampled")
+    }
+  }
+
+  private[join] def formatBytes(bytes: Long): String = {
+    val units = Seq("B", "KB", "MB", "GB", "TB")
+    var value = bytes.toDouble
+    var unit = 0
+    while (math.abs(value) >= 1024 && unit < units.size - 1) {
+      value /= 1024
+      unit += 1
+    }
+    if (unit == 0) s"$bytes B" else f"$value%.1f ${units(unit)}"
+  }
+}
+
+/**
+ * Estimated serialized size of the rows of a frame
+ *
+ * @param bytes estimated bytes
+ * @param rowCount estimated number of rows, if the estimate found it
+ * @param source how the estimate was made
+ */
+case class SizeEstimate(bytes: Long, rowCount: Option[Long], source: String) {
+  override def toString: String = s"${BroadcastJoinPlanner.formatBytes(bytes)} ($source)"
+}
+
+/**
+ * Broadcast decision of a join with use_broadcast="auto"
+ *
+ * @param broadcastSide side to broadcast ("left" or "right"), None for a shuffle join
+ * @param explain explanation of the decision, with the size estimates and the threshold
+ */
+case class BroadcastJoinDecision(broadcastSide: Option[String], explain: String)
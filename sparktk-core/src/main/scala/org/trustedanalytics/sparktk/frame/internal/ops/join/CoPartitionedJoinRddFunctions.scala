@@ -0,0 +1,139 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal.ops.join
+
+import org.apache.spark.sql.Row
+import org.apache.spark.sql.catalyst.expressions.GenericRow
+import org.trustedanalytics.sparktk.frame.internal.FramePartitioning
+import org.trustedanalytics.sparktk.frame.internal.rdd.FrameRdd
+
+import scala.collection.mutable
+import scala.collection.mutable.ArrayBuffer
+
+/**
+ * Joins of frames partitioned by their join columns (see partition_by).
+ *
+ * When both frames are hash partitioned by their join columns into the same number of partitions, the rows with
+ * equal keys are in partitions with the same index, so the partitions are zipped and joined pairwise, with a hash
+ * table of one partition of each pair, and no rows are shuffled.  Like the SQL joins, missing key values never match.
+ */
+object CoPartitionedJoinRddFunctions extends Serializable {
+
+  /**
+   * True if rows of the two frames with equal join keys are in partitions with the same index
+   *
+   * @param left join parameter for first data frame
+   * @param leftPartitioning partitioning of the first data frame, if known
+   * @param right join parameter for second data frame
+   * @param rightPartitioning partitioning of the second data frame, if known
+   */
+  def isCoPartitioned(left: RddJoinParam,
+                      leftPartitioning: Option[FramePartitioning],
+                      right: RddJoinParam,
+                      rightPartitioning: Option[FramePartitioning]): Boolean = {
+    (leftPartitioning, rightPartitioning) match {
+      case (Some(leftPartitions), Some(rightPartitions)) =>
+        leftPartitions.matches(left.frame.frameSchema,
+          left.joinColumns,
+          rightPartitions,
+          right.frame.frameSchema,
+          right.joinColumns) && left.frame.partitions.length == right.frame.partitions.length
+      case _ => false
+    }
+  }
+
+  /**
+   * Perform a join of co-partitioned frames (see isCoPartitioned)
+   *
+   * @param left join parameter for first data frame
+   * @param right join parameter for second data frame
+   * @param how join method ("inner", "left", "right" or "outer")
+   * @return Joined RDD, with the same columns as the joins of JoinRddFunctions
+   */
+  def join(left: RddJoinParam, right: RddJoinParam, how: String): FrameRdd = {
+    val leftKey = left.frame.frameSchema.columnIndices(left.joinColumns).toList
+    val rightKey = right.frame.frameSchema.columnIndices(right.joinColumns).toList
+    val leftIndices = left.frame.frameSchema.columns.indices.toArray
+    // the inner join rows leave out the right join columns (see JoinRddFunctions.dropJoinColumn)
+    val rightIndices = right.frame.frameSchema.columns.indices
+      .filterNot(index => how == "inner" && rightKey.contains(index)).toArray
+
+    val joinedRdd = left.frame.zipPartitions(right.frame) { (leftRows, rightRows) =>
+      // the rows of the frame whose rows are all kept are looked up in a hash table of the other frame's rows
+      val pairs = how match {
+        case "inner" => joinPartition(leftRows, leftKey, rightRows, rightKey, keepUnmatchedProbe = false, keepUnmatchedBuild = false)
+        case "left" => joinPartition(leftRows, leftKey, rightRows, rightKey, keepUnmatchedProbe = true, keepUnmatchedBuild = false)
+        case "outer" => joinPartition(leftRows, leftKey, rightRows, rightKey, keepUnmatchedProbe = true, keepUnmatchedBuild = true)
+        case "right" =>
+          joinPartition(rightRows, rightKey, leftRows, leftKey, keepUnmatchedProbe = true, keepUnmatchedBuild = false)
+            .map { case (rightRow, leftRow) => (leftRow, rightRow) }
+      }
+      pairs.map {
+        case (leftRow, rightRow) =>
+          new GenericRow(values(leftRow, leftIndices) ++ values(rightRow, rightIndices)): Row
+      }
+    }
+    JoinRddFunctions.createJoinedFrame(joinedRdd, left, right, how)
+  }
+
+  /**
+   * Joins the rows of one pair of partitions
+   *
+   * @param probeRows rows looked up in the hash table
+   * @param probeKey indices of the join columns of the probe rows
+   * @param buildRows rows put in the hash table
+   * @param buildKey indices of the join columns of the build rows
+   * @param keepUnmatchedProbe true to pair probe rows without a match with null
+   * @param keepUnmatchedBuild true to pair build rows without a match with null
+   * @return pairs of matching probe and build rows
+   */
+  private def joinPartition(probeRows: Iterator[Row],
+                            probeKey: List[Int],
+                            buildRows: Iterator[Row],
+                            buildKey: List[Int],
+                            keepUnmatchedProbe: Boolean,
+                            keepUnmatchedBuild: Boolean): Iterator[(Row, Row)] = {
+    val built = buildRows.toArray
+    val buildIndex = mutable.HashMap[List[Any], ArrayBuffer[Int]]()
+    for (i <- built.indices) {
+      val key = buildKey.map(built(i).get)
+      if (!key.contains(null)) {
+        buildIndex.getOrElseUpdate(key, new ArrayBuffer[Int]()) += i
+      }
+    }
+    val matched = new Array[Boolean](built.length)
+
+    // keys with missing values are not in the hash table, so they never match
+    val probed: Iterator[(Row, Row)] = probeRows.flatMap(row => buildIndex.get(probeKey.map(row.get)) match {
+      case Some(matches) =>
+        matches.foreach(i => matched(i) = true)
+        matches.iterator.map(i => (row, built(i)))
+      case None =>
+        if (keepUnmatchedProbe) Iterator.single((row, null: Row)) else Iterator.empty
+    })
+    if (keepUnmatchedBuild) {
+      // appended lazily, once every probe row has marked its matches
+      probed ++ built.indices.iterator.filterNot(i => matched(i)).map(i => (null: Row, built(i)))
+    }
+    else {
+      probed
+    }
+  }
+
+  private def values(row: Row, indices: Array[Int]): Array[Any] = {
+    if (row == null) new Array[Any](indices.length) else indices.map(row.get)
+  }
+}
@@ -0,0 +1,47 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal.ops.join
+
+import org.trustedanalytics.sparktk.frame.Frame
+import org.trustedanalytics.sparktk.frame.internal.{ FrameState, FrameSummarization, BaseFrame }
+
+trait ExplainJoinSummarization extends BaseFrame {
+
+  /**
+   * Explains how a join of this frame with another frame would be run with use_broadcast="auto": which side would
+   * be broadcast, if any, with the size estimates of the sides and the threshold the decision was based on.
+   *
+   * @param right Another frame to join with.
+   * @param how   Join method: "inner", "left", "right" or "outer".  Default is "inner".
+   * @return description of the broadcast decision
+   */
+  def explainJoin(right: Frame, how: String = "inner"): String = {
+    execute(ExplainJoin(right, how))
+  }
+}
+
+case class ExplainJoin(right: Frame, how: String) extends FrameSummarization[String] {
+
+  require(right != null, "right frame is required")
+  require(Set("inner", "left", "right", "outer").contains(how), "how should be 'inner', 'left', 'right' or 'outer'")
+
+  override def work(state: FrameState): String = {
+    BroadcastJoinPlanner.decide(how,
+      (state.rdd, state.statistics),
+      (right.rdd, right.statistics),
+      BroadcastJoinPlanner.threshold(state.rdd.sparkContext)).explain
+  }
+}
@@ -28,27 +28,38 @@ trait JoinInnerSummarization extends BaseFrame {
    * @param leftOn       Names of the columns in the left frame used to match up the two frames.
    * @param rightOn      Names of the columns in the right frame used to match up the two frames. Default is the same as the left frame.
    * @param useBroadcast If one of your tables is small enough to fit in the memory of a single machine, you can use a broadcast join.
-   *                     Specify which table to broadcast (left or right). Default is None.
+   *                     Specify which table to broadcast (left or right), or "auto" to broadcast the smaller
+   *                     table when its estimated size is under a threshold (see BroadcastJoinPlanner). Default is None.
+   * @param skew         "auto" to spread the rows of hot join keys over several tasks by salting them (see
+   *                     SkewJoinRddFunctions).  Ignored for broadcast joins.  Default is None.
+   * @param bloomFilter  True to drop the rows of the larger table whose keys cannot match before the shuffle, with a
+   *                     Bloom filter of the other table's keys (see BloomFilterJoinRddFunctions).  Ignored for
+   *                     broadcast joins.  Default is False.
    */
   def joinInner(right: Frame,
                 leftOn: List[String],
                 rightOn: Option[List[String]] = None,
-                useBroadcast: Option[String] = None): Frame = {
-    execute(JoinInner(right, leftOn, rightOn, useBroadcast))
+                useBroadcast: Option[String] = None,
+                skew: Option[String] = None,
+                bloomFilter: Boolean = false): Frame = {
+    execute(JoinInner(right, leftOn, rightOn, useBroadcast, skew, bloomFilter))
   }
 }
 
 case class JoinInner(right: Frame,
                      leftOn: List[String],
                      rightOn: Option[List[String]],
-                     useBroadcast: Option[String]) extends FrameSummarization[Frame] {
+                     useBroadcast: Option[String],
+                     skew: Option[String] = None,
+                     bloomFilter: Boolean = false) extends FrameSummarization[Frame] {
 
   require(right != null, "right frame is required")
   require(leftOn != null || leftOn.nonEmpty, "left join column is required")
   require(rightOn != null, "right join column is required")
   require(useBroadcast.isEmpty
-    || (useBroadcast.get == "left" || useBroadcast.get == "right"),
-    "useBroadcast join type should be 'left' or 'right'. Default is none")
+    || (useBroadcast.get == "left" || useBroadcast.get == "right" || useBroadcast.get == "auto"),
+    "useBroadcast join type should be 'left', 'right' or 'auto'. Default is none")
+  require(skew.isEmpty || skew.get == "auto", "skew should be 'auto'. Default is none")
 
   override def work(state: FrameState): Frame = {
 
@@ -62,11 +73,38 @@ case class JoinInner(right: Frame,
     //First validates join columns are valid and checks left join column is compatible with right join columns
     SchemaHelper.checkValidColumnsExistAndCompatible(leftFrame, rightFrame, leftColumns, rightColumns)
 
-    val joinedFrame = JoinRddFunctions.innerJoin(
-      RddJoinParam(leftFrame, leftColumns),
-      RddJoinParam(rightFrame, rightColumns),
-      useBroadcast
-    )
+    val leftParam = RddJoinParam(leftFrame, leftColumns)
+    val rightParam = RddJoinParam(rightFrame, rightColumns)
+
+    // frames partitioned by their join columns are joined partition by partition, unless a side must be broadcast
+    val joinedFrame = if (useBroadcast.forall(_ == "auto") && skew.isEmpty &&
+      CoPartitionedJoinRddFunctions.isCoPartitioned(leftParam, state.partitioning, rightParam, right.partitioning)) {
+      CoPartitionedJoinRddFunctions.join(leftParam, rightParam, "inner")
+    }
+    else {
+      val broadcast = useBroadcast match {
+        case Some("auto") => BroadcastJoinPlanner.broadcastSide("inner",
+          (state.rdd, state.statistics),
+          (right.rdd, right.statistics))
+        case _ => useBroadcast
+      }
+
+      val (filteredLeft, filteredRight) = if (bloomFilter && broadcast.isEmpty) {
+        BloomFilterJoinRddFunctions.prefilterInner(leftParam, rightParam,
+          (state.rdd, state.statistics),
+          (right.rdd, right.statistics))
+      }
+      else {
+        (leftParam, rightParam)
+      }
+
+      if (skew.isDefined && broadcast.isEmpty) {
+        SkewJoinRddFunctions.innerJoin(filteredLeft, filteredRight)
+      }
+      else {
+        JoinRddFunctions.innerJoin(filteredLeft, filteredRight, broadcast)
+      }
+    }
     new Frame(joinedFrame, joinedFrame.schema)
   }
 }
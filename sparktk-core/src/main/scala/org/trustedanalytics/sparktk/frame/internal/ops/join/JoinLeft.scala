@@ -29,23 +29,38 @@ trait JoinLeftSummarization extends BaseFrame {
    * @param rightOn Names of the columns in the right frame used to match up the two frames. Default is the same as the left frame.
    * @param useBroadcastRight If right table is small enough to fit in the memory of a single machine, you can set useBroadcastRight to True to perform broadcast join.
    * Default is False.
+   * @param skew "auto" to spread the rows of hot join keys of the left frame over several tasks by salting them (see
+   *             SkewJoinRddFunctions).  Ignored for broadcast joins.  Default is None.
+   * @param autoBroadcast True to broadcast the right table when its estimated size is under a threshold (see
+   *                      BroadcastJoinPlanner), instead of setting useBroadcastRight.  Default is False.
+   * @param bloomFilter True to drop the rows of the right table whose keys cannot match before the shuffle, with a
+   *                    Bloom filter of the left table's keys (see BloomFilterJoinRddFunctions).  Ignored for
+   *                    broadcast joins.  Default is False.
    */
   def joinLeft(right: Frame,
                leftOn: List[String],
                rightOn: Option[List[String]] = None,
-               useBroadcastRight: Boolean = false): Frame = {
-    execute(JoinLeft(right, leftOn, rightOn, useBroadcastRight))
+               useBroadcastRight: Boolean = false,
+               skew: Option[String] = None,
+               autoBroadcast: Boolean = false,
+               bloomFilter: Boolean = false): Frame = {
+    execute(JoinLeft(right, leftOn, rightOn, useBroadcastRight, skew, autoBroadcast, bloomFilter))
   }
 }
 
 case class JoinLeft(right: Frame,
                     leftOn: List[String],
                     rightOn: Option[List[String]],
-                    useBroadcastRight: Boolean) extends FrameSummarization[Frame] {
+                    useBroadcastRight: Boolean,
+                    skew: Option[String] = None,
+                    autoBroadcast: Boolean = false,
+                    bloomFilter: Boolean = false) extends FrameSummarization[Frame] {
 
   require(right != null, "right frame is required")
   require(leftOn != null || leftOn.nonEmpty, "left join column is required")
   require(rightOn != null, "right join column is required")
+  require(skew.isEmpty || skew.get == "auto", "skew should be 'auto'. Default is none")
+  require(!(useBroadcastRight && autoBroadcast), "useBroadcastRight and autoBroadcast cannot both be set")
 
   override def work(state: FrameState): Frame = {
 
@@ -59,11 +74,34 @@ case class JoinLeft(right: Frame,
     //First validates join columns are valid and checks left join column is compatible with right join columns
     SchemaHelper.checkValidColumnsExistAndCompatible(leftFrame, rightFrame, leftColumns, rightColumns)
 
-    val joinedFrame = JoinRddFunctions.leftJoin(
-      RddJoinParam(leftFrame, leftColumns),
-      RddJoinParam(rightFrame, rightColumns),
-      useBroadcastRight
-    )
+    val leftParam = RddJoinParam(leftFrame, leftColumns)
+    val rightParam = RddJoinParam(rightFrame, rightColumns)
+
+    // frames partitioned by their join columns are joined partition by partition, unless a side must be broadcast
+    val joinedFrame = if (!useBroadcastRight && skew.isEmpty &&
+      CoPartitionedJoinRddFunctions.isCoPartitioned(leftParam, state.partitioning, rightParam, right.partitioning)) {
+      CoPartitionedJoinRddFunctions.join(leftParam, rightParam, "left")
+    }
+    else {
+      val broadcastRight = useBroadcastRight || (autoBroadcast && BroadcastJoinPlanner.broadcastSide("left",
+        (state.rdd, state.statistics),
+        (right.rdd, right.statistics)).isDefined)
+
+      val (filteredLeft, filteredRight) = if (bloomFilter && !broadcastRight) {
+        (leftParam, BloomFilterJoinRddFunctions.prefilter(rightParam, (right.rdd, right.statistics),
+          leftParam, (state.rdd, state.statistics), "right"))
+      }
+      else {
+        (leftParam, rightParam)
+      }
+
+      if (skew.isDefined && !broadcastRight) {
+        SkewJoinRddFunctions.leftJoin(filteredLeft, filteredRight)
+      }
+      else {
+        JoinRddFunctions.leftJoin(filteredLeft, filteredRight, broadcastRight)
+      }
+    }
     new Frame(joinedFrame, joinedFrame.schema)
   }
 }
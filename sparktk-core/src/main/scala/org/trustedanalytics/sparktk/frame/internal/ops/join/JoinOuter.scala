@@ -27,22 +27,27 @@ trait JoinOuterSummarization extends BaseFrame {
    * @param right        Another frame to join with.
    * @param leftOn       Names of the columns in the left frame used to match up the two frames.
    * @param rightOn      Names of the columns in the right frame used to match up the two frames. Default is the same as the left frame.
+   * @param skew         "auto" to spread the rows of hot join keys of the left frame over several tasks by salting them
+   *                     (see SkewJoinRddFunctions).  Default is None.
    */
   def joinOuter(right: Frame,
                 leftOn: List[String],
-                rightOn: Option[List[String]] = None): Frame = {
-    execute(JoinOuter(right, leftOn, rightOn))
+                rightOn: Option[List[String]] = None,
+                skew: Option[String] = None): Frame = {
+    execute(JoinOuter(right, leftOn, rightOn, skew))
   }
 
 }
 
 case class JoinOuter(right: Frame,
                      leftOn: List[String],
-                     rightOn: Option[List[String]]) extends FrameSummarization[Frame] {
+                     rightOn: Option[List[String]],
+                     skew: Option[String] = None) extends FrameSummarization[Frame] {
 
   require(right != null, "right frame is required")
   require(leftOn != null || leftOn.nonEmpty, "left join column is required")
   require(rightOn != null, "right join column is required")
+  require(skew.isEmpty || skew.get == "auto", "skew should be 'auto'. Default is none")
 
   override def work(state: FrameState): Frame = {
 
@@ -56,10 +61,20 @@ case class JoinOuter(right: Frame,
     //First validates join columns are valid and checks left join column is compatible with right join columns
     SchemaHelper.checkValidColumnsExistAndCompatible(leftFrame, rightFrame, leftColumns, rightColumns)
 
-    val joinedFrame = JoinRddFunctions.outerJoin(
-      RddJoinParam(leftFrame, leftColumns),
-      RddJoinParam(rightFrame, rightColumns)
-    )
+    val leftParam = RddJoinParam(leftFrame, leftColumns)
+    val rightParam = RddJoinParam(rightFrame, rightColumns)
+
+    // frames partitioned by their join columns are joined partition by partition
+    val joinedFrame = if (skew.isEmpty &&
+      CoPartitionedJoinRddFunctions.isCoPartitioned(leftParam, state.partitioning, rightParam, right.partitioning)) {
+      CoPartitionedJoinRddFunctions.join(leftParam, rightParam, "outer")
+    }
+    else if (skew.isDefined) {
+      SkewJoinRddFunctions.outerJoin(leftParam, rightParam)
+    }
+    else {
+      JoinRddFunctions.outerJoin(leftParam, rightParam)
+    }
     new Frame(joinedFrame, joinedFrame.schema)
   }
 }
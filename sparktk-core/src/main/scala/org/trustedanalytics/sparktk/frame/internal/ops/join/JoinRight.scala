@@ -29,23 +29,38 @@ trait JoinRightSummarization extends BaseFrame {
    * @param rightOn      Names of the columns in the right frame used to match up the two frames. Default is the same as the left frame.
    * @param useBroadcastLeft If left table is small enough to fit in the memory of a single machine, you can set useBroadcastLeft to True to perform broadcast join.
    * Default is False.
+   * @param skew         "auto" to spread the rows of hot join keys of the right frame over several tasks by salting them
+   *                     (see SkewJoinRddFunctions).  Ignored for broadcast joins.  Default is None.
+   * @param autoBroadcast True to broadcast the left table when its estimated size is under a threshold (see
+   *                      BroadcastJoinPlanner), instead of setting useBroadcastLeft.  Default is False.
+   * @param bloomFilter True to drop the rows of the left table whose keys cannot match before the shuffle, with a
+   *                    Bloom filter of the right table's keys (see BloomFilterJoinRddFunctions).  Ignored for
+   *                    broadcast joins.  Default is False.
    */
   def joinRight(right: Frame,
                 leftOn: List[String],
                 rightOn: Option[List[String]] = None,
-                useBroadcastLeft: Boolean = false): Frame = {
-    execute(JoinRight(right, leftOn, rightOn, useBroadcastLeft))
+                useBroadcastLeft: Boolean = false,
+                skew: Option[String] = None,
+                autoBroadcast: Boolean = false,
+                bloomFilter: Boolean = false): Frame = {
+    execute(JoinRight(right, leftOn, rightOn, useBroadcastLeft, skew, autoBroadcast, bloomFilter))
   }
 }
 
 case class JoinRight(right: Frame,
                      leftOn: List[String],
                      rightOn: Option[List[String]],
-                     useBroadcastLeft: Boolean) extends FrameSummarization[Frame] {
+                     useBroadcastLeft: Boolean,
+                     skew: Option[String] = None,
+                     autoBroadcast: Boolean = false,
+                     bloomFilter: Boolean = false) extends FrameSummarization[Frame] {
 
   require(right != null, "right frame is required")
   require(leftOn != null || leftOn.nonEmpty, "left join column is required")
   require(rightOn != null, "right join column is required")
+  require(skew.isEmpty || skew.get == "auto", "skew should be 'auto'. Default is none")
+  require(!(useBroadcastLeft && autoBroadcast), "useBroadcastLeft and autoBroadcast cannot both be set")
 
   override def work(state: FrameState): Frame = {
 
@@ -59,11 +74,34 @@ case class JoinRight(right: Frame,
     //First validates join columns are valid and checks left join column is compatible with right join columns
     SchemaHelper.checkValidColumnsExistAndCompatible(leftFrame, rightFrame, leftColumns, rightColumns)
 
-    val joinedFrame = JoinRddFunctions.rightJoin(
-      RddJoinParam(leftFrame, leftColumns),
-      RddJoinParam(rightFrame, rightColumns),
-      useBroadcastLeft
-    )
+    val leftParam = RddJoinParam(leftFrame, leftColumns)
+    val rightParam = RddJoinParam(rightFrame, rightColumns)
+
+    // frames partitioned by their join columns are joined partition by partition, unless a side must be broadcast
+    val joinedFrame = if (!useBroadcastLeft && skew.isEmpty &&
+      CoPartitionedJoinRddFunctions.isCoPartitioned(leftParam, state.partitioning, rightParam, right.partitioning)) {
+      CoPartitionedJoinRddFunctions.join(leftParam, rightParam, "right")
+    }
+    else {
+      val broadcastLeft = useBroadcastLeft || (autoBroadcast && BroadcastJoinPlanner.broadcastSide("right",
+        (state.rdd, state.statistics),
+        (right.rdd, right.statistics)).isDefined)
+
+      val (filteredLeft, filteredRight) = if (bloomFilter && !broadcastLeft) {
+        (BloomFilterJoinRddFunctions.prefilter(leftParam, (state.rdd, state.statistics),
+          rightParam, (right.rdd, right.statistics), "left"), rightParam)
+      }
+      else {
+        (leftParam, rightParam)
+      }
+
+      if (skew.isDefined && !broadcastLeft) {
+        SkewJoinRddFunctions.rightJoin(filteredLeft, filteredRight)
+      }
+      else {
+        JoinRddFunctions.rightJoin(filteredLeft, filteredRight, broadcastLeft)
+      }
+    }
     new Frame(joinedFrame, joinedFrame.schema)
   }
-}
\ No newline at end of file
+}
@@ -0,0 +1,235 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal.ops.join
+
+import org.apache.spark.broadcast.Broadcast
+import org.apache.spark.sql.Row
+import org.slf4j.LoggerFactory
+import org.trustedanalytics.sparktk.frame.DataTypes
+import org.trustedanalytics.sparktk.frame.internal.ops.statistics.descriptives.FrequentItemsSketch
+import org.trustedanalytics.sparktk.frame.internal.rdd.FrameRdd
+
+import scala.util.Random
+
+/**
+ * Joins which spread the rows of hot keys over several tasks (skew="auto").
+ *
+ * A frequent items sketch of the join keys of the skewed frame finds the keys which hold more than HotKeyFactor times
+ * the rows of an average shuffle partition.  Each row of such a key is given a random salt in 0 until n (n grows with
+ * the key's rows, up to MaxSalts), while the rows of that key in the other frame are replicated once for every salt.
+ * Other rows get salt 0 in both frames, and the frames are joined on their join columns and the salt, so a hot key
+ * is joined by n tasks.  The salted keys are logged.
+ *
+ * The skewed frame is the larger frame for inner joins, and the frame whose rows are all kept otherwise (the left
+ * frame for left and outer joins, the right frame for right joins).  Replicated rows of the other frame would show
+ * up unmatched in an outer join, so the rows of hot keys are joined separately there, with a left join, and added to
+ * the outer join of the other rows.
+ */
+object SkewJoinRddFunctions extends Serializable {
+
+  @transient private lazy val logger = LoggerFactory.getLogger(this.getClass)
+
+  /**
+   * A key is hot when it holds more than this many times the rows of an average shuffle partition
+   */
+  val HotKeyFactor = 2.0
+
+  /**
+   * Most salts for one key, which bounds the replication of the other frame's rows
+   */
+  val MaxSalts = 64
+
+  private val SketchCapacity = 1024
+
+  /**
+   * Perform inner join, salting the hot keys of the larger frame
+   *
+   * @param left  join parameter for first data frame
+   * @param right join parameter for second data frame
+   * @param shufflePartitions number of shuffle partitions which sets the hot key threshold, by default
+   *                          spark.sql.shuffle.partitions
+   * @return Joined RDD
+   */
+  def innerJoin(left: RddJoinParam, right: RddJoinParam, shufflePartitions: Option[Int] = None): FrameRdd = {
+    val (leftRowCount, leftHotKeys) = findHotKeys(left, shufflePartitions)
+    val (rightRowCount, rightHotKeys) = findHotKeys(right, shufflePartitions)
+    if (leftRowCount >= rightRowCount)
+      saltedJoin(left, right, leftHotKeys, saltLeft = true, leftSaltKept = true)(JoinRddFunctions.innerJoin(_, _, None))
+    else
+      saltedJoin(left, right, rightHotKeys, saltLeft = false, leftSaltKept = true)(JoinRddFunctions.innerJoin(_, _, None))
+  }
+
+  /**
+   * Perform left-outer join, salting the hot keys of the left frame
+   *
+   * @param left  join parameter for first data frame
+   * @param right join parameter for second data frame
+   * @param shufflePartitions number of shuffle partitions which sets the hot key threshold, by default
+   *                          spark.sql.shuffle.partitions
+   * @return Joined RDD
+   */
+  def leftJoin(left: RddJoinParam, right: RddJoinParam, shufflePartitions: Option[Int] = None): FrameRdd = {
+    saltedJoin(left, right, findHotKeys(left, shufflePartitions)._2, saltLeft = true, leftSaltKept = true)(
+      JoinRddFunctions.leftJoin(_, _, useBroadcastRight = false))
+  }
+
+  /**
+   * Perform right-outer join, salting the hot keys of the right frame
+   *
+   * @param left  join parameter for first data frame
+   * @param right join parameter for second data frame
+   * @param shufflePartitions number of shuffle partitions which sets the hot key threshold, by default
+   *                          spark.sql.shuffle.partitions
+   * @return Joined RDD
+   */
+  def rightJoin(left: RddJoinParam, right: RddJoinParam, shufflePartitions: Option[Int] = None): FrameRdd = {
+    saltedJoin(left, right, findHotKeys(right, shufflePartitions)._2, saltLeft = false, leftSaltKept = false)(
+      JoinRddFunctions.rightJoin(_, _, useBroadcastLeft = false))
+  }
+
+  /**
+   * Perform full-outer join, joining the rows of the hot keys of the left frame with a salted left join
+   *
+   * Every hot key occurs in the left frame, so all the right frame's rows with a hot key are matched by the left join.
+   *
+   * @param left  join parameter for first data frame
+   * @param right join parameter for second data frame
+   * @param shufflePartitions number of shuffle partitions which sets the hot key threshold, by default
+   *                          spark.sql.shuffle.partitions
+   * @return Joined RDD
+   */
+  def outerJoin(left: RddJoinParam, right: RddJoinParam, shufflePartitions: Option[Int] = None): FrameRdd = {
+    val hotKeys = findHotKeys(left, shufflePartitions)._2
+    if (hotKeys.isEmpty) {
+      logger.info("Skew join found no hot keys in the left frame")
+      JoinRddFunctions.outerJoin(left, right)
+    }
+    else {
+      val keys = left.frame.sparkContext.broadcast(hotKeys)
+      def split(param: RddJoinParam, hot: Boolean): RddJoinParam = {
+        val keyIndices = param.frame.frameSchema.columnIndices(param.joinColumns)
+        val rows = param.frame.filter(row => keyOf(row, keyIndices).exists(keys.value.contains) == hot)
+        RddJoinParam(new FrameRdd(param.frame.frameSchema, rows), param.joinColumns)
+      }
+
+      val coldJoin = JoinRddFunctions.outerJoin(split(left, hot = false), split(right, hot = false))
+      val hotJoin = saltedJoin(split(left, hot = true), split(right, hot = true), hotKeys,
+        saltLeft = true, leftSaltKept = true)(JoinRddFunctions.leftJoin(_, _, useBroadcastRight = false))
+      new FrameRdd(coldJoin.frameSchema, coldJoin.union(hotJoin))
+    }
+  }
+
+  /**
+   * Join the frames on their join columns and a salt, which spreads the hot keys of one frame over several salts
+   *
+   * @param left     join parameter for first data frame
+   * @param right    join parameter for second data frame
+   * @param hotKeys  number of salts of each hot key of the salted frame
+   * @param saltLeft true to salt the left frame and replicate the right, false for the reverse
+   * @param leftSaltKept true if the join keeps the salt column of the left frame, last of the left frame's columns
+   *                     (inner and left joins drop the right join columns), false if it keeps the salt column of the
+   *                     right frame, last of all columns (right joins drop the left join columns)
+   * @param join     join of the salted frames
+   * @return Joined RDD, without salt
+   */
+  private def saltedJoin(left: RddJoinParam,
+                         right: RddJoinParam,
+                         hotKeys: Map[String, Int],
+                         saltLeft: Boolean,
+                         leftSaltKept: Boolean)(join: (RddJoinParam, RddJoinParam) => FrameRdd): FrameRdd = {
+    val saltedSide = if (saltLeft) "left" else "right"
+    if (hotKeys.isEmpty) {
+      logger.info(s"Skew join found no hot keys in the $saltedSide frame")
+      join(left, right)
+    }
+    else {
+      logger.info(s"Skew join salted ${hotKeys.size} hot keys of the $saltedSide frame: " +
+        hotKeys.map { case (key, salts) => s"[${key.replace(KeySeparator, ", ")}] into $salts" }.mkString("; "))
+
+      // the inner join matches equally named join columns by name, and otherwise needs distinct names
+      val existingNames = left.frame.frameSchema.columnNames ++ right.frame.frameSchema.columnNames
+      val leftSaltColumn = Iterator.from(0).map(i => s"join_salt_$i")
+        .find(name => !existingNames.contains(name) && !existingNames.contains(name + "_r")).get
+      val rightSaltColumn = if (left.joinColumns.sorted == right.joinColumns.sorted) leftSaltColumn else leftSaltColumn + "_r"
+      val salts = left.frame.sparkContext.broadcast(hotKeys)
+
+      val joined = join(salt(left, salts, leftSaltColumn, replicate = !saltLeft),
+        salt(right, salts, rightSaltColumn, replicate = saltLeft))
+      // the join drops the salt column of one side along with that side's join columns
+      val saltIndex = if (leftSaltKept) left.frame.frameSchema.columns.length else joined.frameSchema.columns.length - 1
+      joined.dropColumns(List(joined.frameSchema.column(saltIndex).name))
+    }
+  }
+
+  /**
+   * Add a salt column to a frame and to its join columns
+   *
+   * @param param     join parameter of the frame
+   * @param salts     number of salts of each hot key
+   * @param saltColumn name of the salt column
+   * @param replicate true to replicate the rows of a hot key for every salt, false to give each a random salt
+   * @return join parameter of the salted frame
+   */
+  private def salt(param: RddJoinParam, salts: Broadcast[Map[String, Int]], saltColumn: String, replicate: Boolean): RddJoinParam = {
+    val keyIndices = param.frame.frameSchema.columnIndices(param.joinColumns)
+    val rows = param.frame.mapPartitionsWithIndex((partition, rows) => {
+      val random = new Random(partition)
+      rows.flatMap(row => {
+        val saltCount = keyOf(row, keyIndices).flatMap(salts.value.get).getOrElse(1)
+        val rowSalts = if (replicate) 0 until saltCount else Seq(random.nextInt(saltCount))
+        rowSalts.map(rowSalt => Row.fromSeq(row.toSeq :+ rowSalt))
+      })
+    })
+    RddJoinParam(new FrameRdd(param.frame.frameSchema.addColumn(saltColumn, DataTypes.int32), rows), param.joinColumns :+ saltColumn)
+  }
+
+  /**
+   * Count the rows of a frame and find its hot join keys
+   *
+   * @param param join parameter of the frame
+   * @param shufflePartitions number of shuffle partitions which sets the hot key threshold, by default
+   *                          spark.sql.shuffle.partitions
+   * @return the row count, and the number of salts of each hot key
+   */
+  private[join] def findHotKeys(param: RddJoinParam, shufflePartitions: Option[Int] = None): (Long, Map[String, Int]) = {
+    val keyIndices = param.frame.frameSchema.columnIndices(param.joinColumns)
+    val (rowCount, sketch) = param.frame.treeAggregate((0L, new FrequentItemsSketch(SketchCapacity)))(
+      (counts, row) => {
+        keyOf(row, keyIndices).foreach(counts._2.add)
+        (counts._1 + 1, counts._2)
+      },
+      (counts1, counts2) => (counts1._1 + counts2._1, counts1._2.merge(counts2._2)))
+
+    val partitions = shufflePartitions.getOrElse(
+      param.frame.sparkContext.getConf.getInt("spark.sql.shuffle.partitions", 200))
+    val averageRows = math.max(1.0, rowCount.toDouble / partitions)
+    val hotKeys = sketch.itemCounts.collect {
+      case (key, (_, lowerBound)) if lowerBound > HotKeyFactor * averageRows =>
+        (key, math.min(MaxSalts, math.ceil(lowerBound / averageRows).toInt))
+    }
+    (rowCount, hotKeys)
+  }
+
+  private val KeySeparator = "\u0000"
+
+  /**
+   * The join key of a row as a string, or None when a key value is null (such rows match nothing)
+   */
+  private def keyOf(row: Row, keyIndices: Seq[Int]): Option[String] = {
+    val values = keyIndices.map(row.get)
+    if (values.contains(null)) None else Some(values.mkString(KeySeparator))
+  }
+}
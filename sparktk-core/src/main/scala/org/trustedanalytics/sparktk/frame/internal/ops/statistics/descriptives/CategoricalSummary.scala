@@ -15,6 +15,9 @@
  */
 package org.trustedanalytics.sparktk.frame.internal.ops.statistics.descriptives
 
+import java.util.{ ArrayList => JArrayList }
+
+import net.razorvine.pickle.Pickler
 import org.trustedanalytics.sparktk.frame.internal.{ FrameState, FrameSummarization, BaseFrame }
 import org.trustedanalytics.sparktk.frame.internal.rdd.FrameRdd
 
@@ -60,6 +63,28 @@ trait CategoricalSummarySummarization extends BaseFrame {
     val thresholdValues = threshold.getOrElse(Seq.fill(columns.size) { None })
     execute(CategoricalSummary(columns, topKValues, thresholdValues))
   }
+
+  /**
+   * Compute a summary of the data in a column(s), as a single pickled list for Python with a
+   * [column, [[level, frequency, percentage], ...]] entry per column (see categoricalSummary)
+   */
+  def categoricalSummaryPython(columns: Seq[String],
+                               topK: Option[Seq[Option[Int]]],
+                               threshold: Option[Seq[Option[Double]]]): Array[Byte] = {
+    def toJavaList(values: Any*): JArrayList[Any] = {
+      val list = new JArrayList[Any](values.length)
+      values.foreach(value => list.add(value))
+      list
+    }
+
+    val summaries = new JArrayList[Any]()
+    categoricalSummary(columns, topK, threshold).foreach(summary => {
+      val levels = new JArrayList[Any]()
+      summary.levels.foreach(levelData => levels.add(toJavaList(levelData.level, levelData.frequency, levelData.percentage)))
+      summaries.add(toJavaList(summary.column, levels))
+    })
+    new Pickler().dumps(summaries)
+  }
 }
 
 case class CategoricalSummary(columns: Seq[String],
@@ -74,14 +99,12 @@ case class CategoricalSummary(columns: Seq[String],
     s"The number of threshold values (${threshold.size}) must match the number of column names provided (${columns.size}).")
 
   override def work(state: FrameState): Array[CategoricalSummaryOutput] = {
-    (for ((columnName, topKValue, thresholdValue) <- (columns, topK, threshold).zipped)
-      yield CategoricalSummaryFunctions.getSummaryStatistics(
-      (state: FrameRdd).selectColumn(columnName),
-      state.rdd.count.asInstanceOf[Double],
-      topKValue,
-      thresholdValue,
+    CategoricalSummaryFunctions.getSummaryStatistics((state: FrameRdd),
+      columns,
+      topK,
+      threshold,
       defaultTopK,
-      defaultThreshold)).toArray
+      defaultThreshold)
   }
 }
 
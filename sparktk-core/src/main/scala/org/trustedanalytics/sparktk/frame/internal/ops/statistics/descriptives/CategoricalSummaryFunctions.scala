@@ -17,57 +17,182 @@ package org.trustedanalytics.sparktk.frame.internal.ops.statistics.descriptives
 
 import org.trustedanalytics.sparktk.frame.internal.rdd.FrameRdd
 import org.apache.spark.rdd.RDD
+import org.apache.spark.sql.Row
 import org.apache.spark.storage.StorageLevel
 import scala.math.Ordering._
 
 /**
- * Compute categorical summary for an RDD with a single column
+ * Compute categorical summaries for the columns of an RDD
  */
 object CategoricalSummaryFunctions {
 
+  private val MinSketchCapacity = 1024
+  private val MaxSketchCapacity = 1 << 16
+
   /**
-   * Compute Categorical Summary for a FrameRdd with a single column
-   * @param rdd FrameRdd containing data and schema information for a single column
-   * @param rowCount Number of rows in the FrameRdd
-   * @param topK User input to display top k most occurring items in the column
-   * @param threshold User input to display all categories which appear more than the threshold percentage
+   * Compute Categorical Summary for several columns of a FrameRdd
+   *
+   * All columns are summarized together.  A first pass counts the rows and missing values and keeps a frequent items
+   * sketch of the levels of each column.  The sketch monitors every level frequent enough to be reported, so a second
+   * pass counts exactly just those candidate levels.  A column whose levels all fit in its sketch needs no second
+   * pass, while a column whose reported levels cannot be bounded by its sketch (such as a threshold of 0.0 with no
+   * top k) has all its levels counted in the second pass.
+   *
+   * @param rdd FrameRdd containing data and schema information
+   * @param columns Names of the columns to summarize
+   * @param topK User input to display top k most occurring items in each column
+   * @param threshold User input to display all categories which appear more than the threshold percentage, for each
+   *                  column
    * @param default_top_k Default top k value from plugin configuration
    * @param default_threshold Default threshold value from plugin configuration
-   * @return CategoricalSummaryOutput consisting of (Category, Frequency, Percentage) for a single column
+   * @return CategoricalSummaryOutput consisting of (Category, Frequency, Percentage) for each column
    */
   def getSummaryStatistics(rdd: FrameRdd,
-                           rowCount: Double,
-                           topK: Option[Int],
-                           threshold: Option[Double],
+                           columns: Seq[String],
+                           topK: Seq[Option[Int]],
+                           threshold: Seq[Option[Double]],
                            default_top_k: Int,
-                           default_threshold: Double): CategoricalSummaryOutput = {
-
-    val mappedRdd = rdd.mapRows(elem => (elem.values().head, 1)).persist(StorageLevel.MEMORY_AND_DISK)
-    val filteredRdd = mappedRdd.filter(!matchMissingValues(_))
-      .map { case (s, c) => (s.toString, c) }
-      .reduceByKey(_ + _)
-      .map { case (level: Any, count: Int) => (level.toString, count) }
-    implicit val count = rowCount
-
-    // Pruning logic here
-    val res: Array[(Int, Double, String)] = (topK.getOrElse(None), threshold.getOrElse(None)) match {
-      case (tk: Int, None) => pruneRddForTopK(filteredRdd, tk)
-      case (None, th: Double) => pruneRddWithThreshold(filteredRdd, th)
-      case (tk: Int, th: Double) => pruneRddWithTopKAndThreshold(filteredRdd, tk, th)
-      case _ => pruneRddWithTopKAndThreshold(filteredRdd, default_top_k, default_threshold)
+                           default_threshold: Double): Array[CategoricalSummaryOutput] = {
+
+    val columnIndices = columns.map(rdd.frameSchema.columnIndex)
+    val pruning = topK.zip(threshold).map {
+      case (None, None) => (Some(default_top_k), Some(default_threshold))
+      case pruningOptions => pruningOptions
+    }
+
+    val levels = rdd.treeAggregate(new LevelsSummary(pruning.map { case (tk, th) => sketchCapacity(tk, th) }))(
+      (summary, row) => summary.add(row, columnIndices),
+      (summary, other) => summary.merge(other))
+    implicit val count = levels.rowCount.toDouble
+
+    // None when the sketch of a column is exact, otherwise the levels to count in a second pass (None for all levels)
+    val candidates: Seq[Option[Option[Set[String]]]] = pruning.zip(levels.sketches).map {
+      case (_, sketch) if sketch.isExact => None
+      case ((tk, th), sketch) => Some(candidateLevels(sketch, tk, th))
+    }
+
+    val countedLevels = if (candidates.forall(_.isEmpty)) None else {
+      val countedColumns = rdd.sparkContext.broadcast(columnIndices.zip(candidates).zipWithIndex.collect {
+        case ((columnIndex, Some(columnCandidates)), column) => (column, columnIndex, columnCandidates)
+      })
+      Some(rdd.flatMap(row => countedColumns.value.flatMap {
+        case (column, columnIndex, columnCandidates) =>
+          val value = row(columnIndex)
+          if (matchMissingValues((value, 1)) || !columnCandidates.forall(_.contains(value.toString))) None
+          else Some(((column, value.toString), 1))
+      }).reduceByKey(_ + _).persist(StorageLevel.MEMORY_AND_DISK))
     }
 
-    val categoricalSummaryLevels = res.map(elem => (elem._3, elem._1, elem._2)).map(elem => LevelData(elem._1, elem._2, elem._3)).toList
+    // candidate levels are few enough to prune locally, while columns with all their levels counted are pruned in place
+    val countedCandidates = countedLevels.map(counted => {
+      val candidateColumns = candidates.zipWithIndex.collect { case (Some(Some(_)), column) => column }.toSet
+      counted.filter { case ((column, _), _) => candidateColumns.contains(column) }.collect().groupBy(_._1._1)
+    }).getOrElse(Map.empty[Int, Array[((Int, String), Int)]])
+
+    val summaries = columns.indices.map(column => {
+      val (tk, th) = pruning(column)
+      val res: Array[(Int, Double, String)] = candidates(column) match {
+        case None => pruneLevels(levels.sketches(column).itemCounts.toSeq.map { case (level, (c, _)) => (level, c.toInt) }, tk, th)
+        case Some(Some(_)) => pruneLevels(countedCandidates.getOrElse(column, Array.empty[((Int, String), Int)]).map { case ((_, level), c) => (level, c) }, tk, th)
+        case Some(None) =>
+          val filteredRdd = countedLevels.get.filter { case ((c, _), _) => c == column }.map { case ((_, level), c) => (level, c) }
+          (tk, th) match {
+            case (Some(k), None) => pruneRddForTopK(filteredRdd, k)
+            case (None, Some(t)) => pruneRddWithThreshold(filteredRdd, t)
+            case (Some(k), Some(t)) => pruneRddWithTopKAndThreshold(filteredRdd, k, t)
+            case _ => throw new IllegalArgumentException("top k or threshold is required")
+          }
+      }
+
+      val categoricalSummaryLevels = res.map(elem => LevelData(elem._3, elem._1, elem._2)).toList
+
+      val missingCount = levels.missingCounts(column).toInt
+      val missingCategoryLevel = LevelData("<Missing>", missingCount, missingCount / count)
+
+      val otherCategoryLevel = getOtherCategoryLevel(categoricalSummaryLevels, missingCount)
+
+      CategoricalSummaryOutput(columns(column), (categoricalSummaryLevels :+ missingCategoryLevel :+ otherCategoryLevel).toArray)
+    })
+
+    countedLevels.foreach(_.unpersist())
+
+    summaries.toArray
+  }
 
-    val missingCategoryLevel = getMissingCategoryLevel(mappedRdd)
+  /**
+   * Levels of a column that may be reported, given its frequent items sketch
+   *
+   * Every level of the top k has a count of at least the k-th largest lower bound in the sketch, so only the levels
+   * whose upper bound reaches it are candidates, provided no level outside the sketch can reach it.  Likewise every
+   * level above the threshold is a candidate when no level outside the sketch can reach the threshold.
+   *
+   * @return the candidate levels, or None when levels outside the sketch may be reported
+   */
+  private def candidateLevels(sketch: FrequentItemsSketch,
+                              topK: Option[Int],
+                              threshold: Option[Double])(implicit rowCount: Double): Option[Set[String]] = {
+    val itemCounts = sketch.itemCounts
+    val minimumCount: Option[Double] = topK match {
+      case Some(k) if k <= 0 => Some(Double.PositiveInfinity)
+      case Some(k) =>
+        val lowerBounds = itemCounts.values.map(_._2).toSeq.sorted(Ordering[Long].reverse)
+        if (lowerBounds.length >= k && lowerBounds(k - 1) > sketch.unmonitoredBound) Some(lowerBounds(k - 1).toDouble) else None
+      case None =>
+        threshold.map(_ * rowCount).filter(_ > sketch.unmonitoredBound)
+    }
+    minimumCount.map(minimum => itemCounts.collect { case (level, (upperBound, _)) if upperBound >= minimum => level }.toSet)
+  }
 
-    val otherCategoryLevel = getOtherCategoryLevel(categoricalSummaryLevels, missingCategoryLevel.frequency)
+  /**
+   * Number of levels a column's frequent items sketch keeps, enough to tell the reported levels from the rest
+   */
+  private def sketchCapacity(topK: Option[Int], threshold: Option[Double]): Int = {
+    val required = topK match {
+      case Some(k) => 16L * k
+      case None => threshold.filter(_ > 0).map(th => math.ceil(4 / th).toLong).getOrElse(0L)
+    }
+    math.min(MaxSketchCapacity, math.max(MinSketchCapacity, required)).toInt
+  }
 
-    val finalResultWithAdditionalLevels = categoricalSummaryLevels :+ missingCategoryLevel :+ otherCategoryLevel
+  /**
+   * Row count, missing value counts and frequent items sketches of the levels of several columns
+   */
+  private class LevelsSummary(capacities: Seq[Int]) extends Serializable {
+    var rowCount = 0L
+    val missingCounts = Array.fill(capacities.length)(0L)
+    val sketches = capacities.map(capacity => new FrequentItemsSketch(capacity)).toArray
+
+    def add(row: Row, columnIndices: Seq[Int]): LevelsSummary = {
+      rowCount += 1
+      var column = 0
+      while (column < sketches.length) {
+        val value = row(columnIndices(column))
+        if (matchMissingValues((value, 1))) missingCounts(column) += 1 else sketches(column).add(value.toString)
+        column += 1
+      }
+      this
+    }
 
-    mappedRdd.unpersist()
+    def merge(other: LevelsSummary): LevelsSummary = {
+      rowCount += other.rowCount
+      var column = 0
+      while (column < sketches.length) {
+        missingCounts(column) += other.missingCounts(column)
+        sketches(column).merge(other.sketches(column))
+        column += 1
+      }
+      this
+    }
+  }
 
-    CategoricalSummaryOutput(rdd.frameSchema.columnNames.head, finalResultWithAdditionalLevels.toArray)
+  /**
+   * Prune the grouped values of a column with frequency based on topk and/or threshold, as the prune functions for
+   * RDDs do
+   */
+  def pruneLevels(levelCounts: Seq[(String, Int)], topK: Option[Int], threshold: Option[Double])(implicit rowCount: Double): Array[(Int, Double, String)] = {
+    val sorted = levelCounts.map(_.swap).sorted(Ordering[(Int, String)].reverse)
+    val pruned = topK.map(k => sorted.take(k)).getOrElse(sorted).map { case (cnt, data) => (cnt, cnt / rowCount, data) }
+    threshold.map(th => pruned.filter(elem => elem._2 >= th)).getOrElse(pruned).toArray
   }
 
   /**
@@ -89,6 +214,7 @@ object CategoricalSummaryFunctions {
     filteredRdd.map(_.swap)
       .map { case (cnt, data) => (cnt, cnt / rowCount, data) }
       .filter(elem => elem._2 >= threshold).collect()
+      .sorted(Ordering[(Int, Double, String)].reverse)
   }
 
   /**
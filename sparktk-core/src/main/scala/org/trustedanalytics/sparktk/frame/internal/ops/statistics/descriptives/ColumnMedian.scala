@@ -17,6 +17,7 @@ package org.trustedanalytics.sparktk.frame.internal.ops.statistics.descriptives
 
 import org.trustedanalytics.sparktk.frame.DataTypes.DataType
 import org.trustedanalytics.sparktk.frame.internal.{ FrameState, FrameSummarization, BaseFrame }
+import org.trustedanalytics.sparktk.frame.internal.ops.statistics.quantiles.{ QuantileSketch, QuantilesFunctions }
 
 trait ColumnMedianSummarization extends BaseFrame {
   /**
@@ -34,35 +35,57 @@ trait ColumnMedianSummarization extends BaseFrame {
    * @param weightsColumn The column that provides weights (frequencies) for the median calculation.
    *                      Must contain numerical data.
    *                      Default is all items have a weight of 1.
+   * @param approximate If true, the median comes from a quantile sketch built in a single pass over the data (or from
+   *                    the frame's statistics catalog), instead of from a sort of the column.  It is then a value of
+   *                    the column whose rank is within relativeError * n of the middle, missing or non-finite values
+   *                    are ignored, and no weights column may be given.
+   * @param relativeError Acceptable rank error of the approximate median, as a fraction of the number of values.
    * @return The median of the values.<br>If a weight column is provided and no weights are finite numbers greater
    *         than 0, None is returned. The type of the median returned is the same as the contents of the data column,
    *         so a column of longs will result in a ''long'' median and a column of floats will result in a
    *         ''float'' median.
    */
-  def columnMedian(dataColumn: String, weightsColumn: Option[String]): Option[ColumnMedianReturn] = {
-    execute(ColumnMedian(dataColumn, weightsColumn))
+  def columnMedian(dataColumn: String,
+                   weightsColumn: Option[String],
+                   approximate: Boolean = false,
+                   relativeError: Double = QuantileSketch.DefaultRelativeError): Option[ColumnMedianReturn] = {
+    execute(ColumnMedian(dataColumn, weightsColumn, approximate, relativeError))
   }
 }
 
-case class ColumnMedian(dataColumn: String, weightsColumn: Option[String]) extends FrameSummarization[Option[ColumnMedianReturn]] {
+case class ColumnMedian(dataColumn: String,
+                        weightsColumn: Option[String],
+                        approximate: Boolean = false,
+                        relativeError: Double = QuantileSketch.DefaultRelativeError) extends FrameSummarization[Option[ColumnMedianReturn]] {
   require(dataColumn != null, "data column is required")
+  require(!approximate || weightsColumn.isEmpty, "the approximate median does not support a weights column")
+  require(relativeError > 0 && relativeError < 1, "relative error must be between 0 and 1")
 
   override def work(state: FrameState): Option[ColumnMedianReturn] = {
     val columnIndex = state.schema.columnIndex(dataColumn)
     val valueDataType = state.schema.columnDataType(dataColumn)
 
-    // run the operation and return results
-    val weightsColumnIndexAndType: Option[(Int, DataType)] = weightsColumn match {
-      case None =>
-        None
-      case Some(weightColumnName) =>
-        Some((state.schema.columnIndex(weightsColumn.get), state.schema.columnDataType(weightsColumn.get)))
+    if (approximate) {
+      state.schema.requireColumnIsNumerical(dataColumn)
+      val median = QuantilesFunctions.catalogQuantiles(state.statistics, dataColumn, Seq(50.0), relativeError)
+        .getOrElse(QuantilesFunctions.approximateQuantiles(state.rdd, Seq(50.0), columnIndex, relativeError))
+      // the sketch holds column values as doubles, so give the median back in the column's type
+      median.headOption.map(value => ColumnMedianReturn(valueDataType.parse(value).get))
     }
+    else {
+      // run the operation and return results
+      val weightsColumnIndexAndType: Option[(Int, DataType)] = weightsColumn match {
+        case None =>
+          None
+        case Some(weightColumnName) =>
+          Some((state.schema.columnIndex(weightsColumn.get), state.schema.columnDataType(weightsColumn.get)))
+      }
 
-    val ret = ColumnStatistics.columnMedian(columnIndex, valueDataType, weightsColumnIndexAndType, state.rdd)
-    ret match {
-      case None => None
-      case Some(value) => Some(ColumnMedianReturn(value))
+      val ret = ColumnStatistics.columnMedian(columnIndex, valueDataType, weightsColumnIndexAndType, state.rdd)
+      ret match {
+        case None => None
+        case Some(value) => Some(ColumnMedianReturn(value))
+      }
     }
   }
 }
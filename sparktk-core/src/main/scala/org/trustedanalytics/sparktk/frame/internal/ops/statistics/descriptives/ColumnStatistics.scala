@@ -16,6 +16,7 @@
 package org.trustedanalytics.sparktk.frame.internal.ops.statistics.descriptives
 
 import org.trustedanalytics.sparktk.frame.DataTypes.DataType
+import org.trustedanalytics.sparktk.frame.internal.NumericColumnStatistics
 import org.apache.spark.sql.Row
 import org.trustedanalytics.sparktk.frame.internal.ops.statistics.numericalstatistics._
 import org.trustedanalytics.sparktk.frame.internal.ops.statistics.{ FrequencyStatistics, OrderStatistics }
@@ -122,8 +123,66 @@ object ColumnStatistics extends Serializable {
     val dataWeightPairs: RDD[(Option[Double], Option[Double])] =
       getDoubleWeightPairs(dataColumnIndex, dataType, weightsColumnIndexOption, weightsTypeOption, rowRDD)
 
-    val stats = new NumericalStatistics(dataWeightPairs, usePopulationVariance)
+    summaryStatisticsReturn(new NumericalStatistics(dataWeightPairs, usePopulationVariance))
+  }
+
+  /**
+   * Calculate summary statistics of several data columns in a single pass, possibly weighted by an optional weights
+   * column.  Rows are logged and thrown out per column, as for a single column.
+   *
+   * @param dataColumnIndices Indices of the columns providing the data. Must be numerical data.
+   * @param dataTypes The types of the data columns.
+   * @param weightsColumnIndexOption Option for index of column providing the weights. Must be numerical data.
+   * @param weightsTypeOption Option for the datatype of the weights.
+   * @param rowRDD RDD of input rows.
+   * @param usePopulationVariance If true, variance is calculated as population variance. If false, variance is
+   *                              calculated as sample variance.
+   * @return Summary statistics of each column, in order.
+   */
+  def columnsSummaryStatistics(dataColumnIndices: Seq[Int],
+                               dataTypes: Seq[DataType],
+                               weightsColumnIndexOption: Option[Int],
+                               weightsTypeOption: Option[DataType],
+                               rowRDD: RDD[Row],
+                               usePopulationVariance: Boolean): Seq[ColumnSummaryStatisticsReturn] = {
+
+    if (weightsColumnIndexOption.nonEmpty && weightsTypeOption.isEmpty) {
+      throw new IllegalArgumentException("Cannot specify weights column without specifying its datatype.")
+    }
+    val columns = dataColumnIndices.zip(dataTypes)
+
+    val dataWeightPairs: RDD[Seq[(Option[Double], Option[Double])]] = rowRDD.map(row => {
+      val weight = weightsColumnIndexOption match {
+        case Some(weightsColumnIndex) => extractColumnValueAsDoubleFromRow(row, weightsColumnIndex, weightsTypeOption.get)
+        case None => Some(1.toDouble)
+      }
+      columns.map { case (index, dataType) => (extractColumnValueAsDoubleFromRow(row, index, dataType), weight) }
+    })
+
+    NumericalStatistics.forEachDistribution(dataWeightPairs, columns.length, usePopulationVariance).map(summaryStatisticsReturn)
+  }
+
+  /**
+   * Calculate unweighted summary statistics of a column from the running moments kept in a frame's statistics catalog.
+   *
+   * @param numeric Catalog statistics of the column.
+   * @param usePopulationVariance If true, variance is calculated as population variance. If false, variance is
+   *                              calculated as sample variance.
+   * @return Summary statistics of the column.
+   */
+  def columnSummaryStatistics(numeric: NumericColumnStatistics,
+                              usePopulationVariance: Boolean): ColumnSummaryStatisticsReturn = {
+    summaryStatisticsReturn(NumericalStatistics.fromMoments(numeric.validCount,
+      numeric.badCount,
+      numeric.mean,
+      numeric.sumOfSquaredDeviations,
+      numeric.sumOfLogs,
+      numeric.minimum,
+      numeric.maximum,
+      usePopulationVariance))
+  }
 
+  private def summaryStatisticsReturn(stats: NumericalStatistics): ColumnSummaryStatisticsReturn = {
     ColumnSummaryStatisticsReturn(mean = stats.weightedMean,
       geometricMean = stats.weightedGeometricMean,
       variance = stats.weightedVariance,
@@ -114,22 +114,32 @@ case class ColumnSummaryStatistics(dataColumn: String,
   require(dataColumn != null, "data column is required but not provided")
 
   override def work(state: FrameState): ColumnSummaryStatisticsReturn = {
-    val (weightsColumnIndexOption, weightsDataTypeOption) = if (weightsColumn.isEmpty) {
-      (None, None)
-    }
-    else {
-      val weightsColumnIndex = state.schema.columnIndex(weightsColumn.get)
-      (Some(weightsColumnIndex), Some(state.schema.columnDataType(weightsColumn.get)))
+    // unweighted summaries of a saved or loaded frame are answered from its statistics catalog
+    val catalogStatistics = if (weightsColumn.isEmpty) {
+      state.statistics.flatMap(_.column(dataColumn)).flatMap(_.numeric)
     }
+    else None
+
+    catalogStatistics match {
+      case Some(numeric) => ColumnStatistics.columnSummaryStatistics(numeric, usePopulationVariance)
+      case None =>
+        val (weightsColumnIndexOption, weightsDataTypeOption) = if (weightsColumn.isEmpty) {
+          (None, None)
+        }
+        else {
+          val weightsColumnIndex = state.schema.columnIndex(weightsColumn.get)
+          (Some(weightsColumnIndex), Some(state.schema.columnDataType(weightsColumn.get)))
+        }
 
-    // run the operation and return the results
-    ColumnStatistics.columnSummaryStatistics(
-      state.schema.columnIndex(dataColumn),
-      state.schema.columnDataType(dataColumn),
-      weightsColumnIndexOption,
-      weightsDataTypeOption,
-      state.rdd,
-      usePopulationVariance)
+        // run the operation and return the results
+        ColumnStatistics.columnSummaryStatistics(
+          state.schema.columnIndex(dataColumn),
+          state.schema.columnDataType(dataColumn),
+          weightsColumnIndexOption,
+          weightsDataTypeOption,
+          state.rdd,
+          usePopulationVariance)
+    }
   }
 
 }
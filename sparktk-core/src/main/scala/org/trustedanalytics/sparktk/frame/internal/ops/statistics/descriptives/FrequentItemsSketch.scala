@@ -0,0 +1,119 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal.ops.statistics.descriptives
+
+import scala.collection.mutable
+
+/**
+ * Mergeable summary of the most frequent items of a stream in bounded space (a SpaceSaving sketch).
+ *
+ * The sketch monitors up to twice its capacity items, each with an upper bound on its count and the most by which
+ * that bound may overestimate it.  An item that is not monitored is added with the bound of the unmonitored items
+ * as its error.  When the monitored items exceed twice the capacity, only the capacity items with the largest counts
+ * are kept and the bound of the unmonitored items is raised to the largest count dropped.  Every item whose true
+ * count exceeds that bound is therefore monitored, and the bound is at most about n / capacity.
+ *
+ * Sketches of separate partitions combine with merge, so several columns are summarized in a single aggregation.
+ * While nothing has been dropped (unmonitoredBound is zero) the counts are exact.
+ *
+ * @param capacity number of items kept when the sketch is compacted
+ */
+class FrequentItemsSketch(val capacity: Int) extends Serializable {
+  require(capacity >= 1, "frequent items sketch capacity must be at least 1")
+
+  private val counters = mutable.HashMap[String, FrequentItemsSketch.Counter]()
+  private var bound = 0L
+
+  /**
+   * Largest count an item that is not monitored may have
+   */
+  def unmonitoredBound: Long = bound
+
+  /**
+   * True if the counts of the monitored items are exact and no other item occurred
+   */
+  def isExact: Boolean = bound == 0
+
+  /**
+   * Monitored items with the (upper bound, lower bound) of their counts
+   */
+  def itemCounts: Map[String, (Long, Long)] = counters.map {
+    case (item, counter) => (item, (counter.count, counter.count - counter.error))
+  }.toMap
+
+  /**
+   * Add an occurrence of an item to the sketch
+   *
+   * @param item item occurring
+   * @return this sketch
+   */
+  def add(item: String): this.type = {
+    counters.get(item) match {
+      case Some(counter) => counter.count += 1
+      case None =>
+        counters(item) = new FrequentItemsSketch.Counter(bound + 1, bound)
+        if (counters.size > 2 * capacity) compact()
+    }
+    this
+  }
+
+  /**
+   * Add the items summarized by another sketch to this sketch
+   *
+   * @param other sketch to merge into this one (it is not modified)
+   * @return this sketch
+   */
+  def merge(other: FrequentItemsSketch): this.type = {
+    counters.foreach {
+      case (item, counter) => if (!other.counters.contains(item)) {
+        counter.count += other.bound
+        counter.error += other.bound
+      }
+    }
+    other.counters.foreach {
+      case (item, otherCounter) => counters.get(item) match {
+        case Some(counter) =>
+          counter.count += otherCounter.count
+          counter.error += otherCounter.error
+        case None =>
+          counters(item) = new FrequentItemsSketch.Counter(bound + otherCounter.count, bound + otherCounter.error)
+      }
+    }
+    bound += other.bound
+    if (counters.size > 2 * capacity) compact()
+    this
+  }
+
+  /**
+   * Keep the capacity items with the largest counts
+   */
+  private def compact(): Unit = {
+    val dropped = counters.toSeq.sortBy { case (_, counter) => -counter.count }.drop(capacity)
+    dropped.foreach {
+      case (item, counter) =>
+        bound = math.max(bound, counter.count)
+        counters.remove(item)
+    }
+  }
+}
+
+object FrequentItemsSketch {
+
+  /**
+   * Upper bound on the count of an item, and the most by which it may exceed the true count
+   */
+  private class Counter(var count: Long, var error: Long) extends Serializable
+}
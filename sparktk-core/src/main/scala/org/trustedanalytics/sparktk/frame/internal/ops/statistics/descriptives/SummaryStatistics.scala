@@ -0,0 +1,105 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal.ops.statistics.descriptives
+
+import org.apache.spark.sql.Row
+import org.trustedanalytics.sparktk.frame.{ Column, DataTypes, Frame, FrameSchema }
+import org.trustedanalytics.sparktk.frame.internal.{ BaseFrame, FrameState, FrameSummarization }
+
+trait SummaryStatisticsSummarization extends BaseFrame {
+  /**
+   * Calculate summary statistics of several columns in a single pass over the frame.
+   *
+   * The statistics of each column are those of columnSummaryStatistics, with the same treatment of bad rows and
+   * weights, but all the columns are summarized by one job instead of one job each.  Unweighted statistics of a
+   * column are taken from the frame's statistics catalog when it has one.
+   *
+   * @param columns The columns to be statistically summarized.  Must contain numerical data.
+   * @param weightsColumn Name of column holding weights of column values.
+   * @param usePopulationVariance If true, the variance is calculated as the population variance.
+   *                              If false, the variance calculated as the sample variance.
+   * @return A new frame with a row for each column, in order: the column name (''column'') and its statistics
+   *         (''mean'', ''geometric_mean'', ''variance'', ''standard_deviation'', ''total_weight'', ''minimum'',
+   *         ''maximum'', ''mean_confidence_lower'', ''mean_confidence_upper'', ''bad_row_count'',
+   *         ''good_row_count'', ''positive_weight_count'' and ''non_positive_weight_count'').
+   */
+  def summaryStatistics(columns: Seq[String],
+                        weightsColumn: Option[String] = None,
+                        usePopulationVariance: Boolean = false): Frame = {
+    execute(SummaryStatistics(columns, weightsColumn, usePopulationVariance))
+  }
+}
+
+case class SummaryStatistics(columns: Seq[String],
+                             weightsColumn: Option[String] = None,
+                             usePopulationVariance: Boolean = false) extends FrameSummarization[Frame] {
+  require(columns != null && columns.nonEmpty, "at least one column is required")
+
+  override def work(state: FrameState): Frame = {
+    columns.foreach(state.schema.requireColumnIsNumerical)
+    weightsColumn.foreach(state.schema.requireColumnIsNumerical)
+
+    // unweighted statistics of a saved or loaded frame are answered from its statistics catalog
+    val catalogStatistics = columns.map(column => {
+      if (weightsColumn.isEmpty) state.statistics.flatMap(_.column(column)).flatMap(_.numeric) else None
+    })
+    val scannedColumns = columns.zip(catalogStatistics).collect { case (column, None) => column }
+    val scannedStatistics = if (scannedColumns.isEmpty) Nil else {
+      ColumnStatistics.columnsSummaryStatistics(scannedColumns.map(state.schema.columnIndex),
+        scannedColumns.map(state.schema.columnDataType),
+        weightsColumn.map(state.schema.columnIndex),
+        weightsColumn.map(state.schema.columnDataType),
+        state.rdd,
+        usePopulationVariance)
+    }
+    val scanned = scannedColumns.zip(scannedStatistics).toMap
+
+    val rows = columns.zip(catalogStatistics).map {
+      case (column, catalog) =>
+        val stats = catalog match {
+          case Some(numeric) => ColumnStatistics.columnSummaryStatistics(numeric, usePopulationVariance)
+          case None => scanned(column)
+        }
+        Row(column,
+          stats.mean,
+          stats.geometricMean,
+          stats.variance,
+          stats.standardDeviation,
+          stats.totalWeight,
+          stats.minimum,
+          stats.maximum,
+          stats.meanConfidenceLower,
+          stats.meanConfidenceUpper,
+          stats.badRowCount,
+          stats.goodRowCount,
+          stats.positiveWeightCount,
+          stats.nonPositiveWeightCount)
+    }
+    new Frame(state.rdd.sparkContext.parallelize(rows, 1), SummaryStatistics.schema)
+  }
+}
+
+object SummaryStatistics {
+
+  /**
+   * Schema of the frame of summary statistics, which has a row per summarized column
+   */
+  val schema = FrameSchema(Vector(Column("column", DataTypes.string)) ++
+    Vector("mean", "geometric_mean", "variance", "standard_deviation", "total_weight", "minimum", "maximum",
+      "mean_confidence_lower", "mean_confidence_upper").map(name => Column(name, DataTypes.float64)) ++
+    Vector("bad_row_count", "good_row_count", "positive_weight_count", "non_positive_weight_count")
+    .map(name => Column(name, DataTypes.int64)))
+}
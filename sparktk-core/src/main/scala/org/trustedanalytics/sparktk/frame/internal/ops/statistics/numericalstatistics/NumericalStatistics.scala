@@ -20,9 +20,16 @@ import org.apache.spark.rdd.RDD
  * Statistics calculator for weighted numerical data. Data elements with non-positive weights are thrown out and do
  * not affect stastics (excepting the count of entries with non-postive weights).
  *
- * @param dataWeightPairs RDD of pairs of  the form (data, weight)
+ * @param firstPassStatistics computes the single pass statistics of the data when they are first needed
  */
-class NumericalStatistics(dataWeightPairs: RDD[(Option[Double], Option[Double])], usePopulationVariance: Boolean) extends Serializable {
+class NumericalStatistics private[numericalstatistics] (firstPassStatistics: () => FirstPassStatistics,
+                                                        usePopulationVariance: Boolean) extends Serializable {
+
+  /**
+   * @param dataWeightPairs RDD of pairs of  the form (data, weight)
+   */
+  def this(dataWeightPairs: RDD[(Option[Double], Option[Double])], usePopulationVariance: Boolean) =
+    this(() => StatisticsRddFunctions.generateFirstPassStatistics(dataWeightPairs), usePopulationVariance)
 
   /*
    * Incoming weights and data are Doubles, but internal running sums are represented as BigDecimal to improve
@@ -33,7 +40,7 @@ class NumericalStatistics(dataWeightPairs: RDD[(Option[Double], Option[Double])]
    * values over many, many entries.
    */
 
-  private lazy val singlePassStatistics: FirstPassStatistics = StatisticsRddFunctions.generateFirstPassStatistics(dataWeightPairs)
+  private lazy val singlePassStatistics: FirstPassStatistics = firstPassStatistics()
 
   /**
    * The weighted mean of the data.
@@ -138,3 +145,55 @@ class NumericalStatistics(dataWeightPairs: RDD[(Option[Double], Option[Double])]
       Double.NaN
 
 }
+
+object NumericalStatistics {
+
+  /**
+   * Statistics of several distributions, computed in a single pass over the data.
+   *
+   * @param dataWeightPairs For each element, the (data, weight) pair of each distribution.
+   * @param numDistributions The number of distributions.
+   * @return The statistics of each distribution, in order.
+   */
+  def forEachDistribution(dataWeightPairs: RDD[Seq[(Option[Double], Option[Double])]],
+                          numDistributions: Int,
+                          usePopulationVariance: Boolean): Seq[NumericalStatistics] = {
+    StatisticsRddFunctions.generateFirstPassStatisticsByDistribution(dataWeightPairs, numDistributions)
+      .map(firstPass => new NumericalStatistics(() => firstPass, usePopulationVariance))
+  }
+
+  /**
+   * Unweighted statistics from the running moments of the finite values of a column, such as those kept in a
+   * frame's statistics catalog.
+   *
+   * @param validCount number of finite values
+   * @param badCount number of missing, NaN or infinite values
+   * @param mean mean of the finite values
+   * @param sumOfSquaredDeviations sum of the squared differences between the finite values and their mean
+   * @param sumOfLogs sum of the logarithms of the finite values, None when a value is not positive
+   * @param minimum smallest finite value, None when there are none
+   * @param maximum largest finite value, None when there are none
+   */
+  def fromMoments(validCount: Long,
+                  badCount: Long,
+                  mean: Double,
+                  sumOfSquaredDeviations: Double,
+                  sumOfLogs: Option[Double],
+                  minimum: Option[Double],
+                  maximum: Option[Double],
+                  usePopulationVariance: Boolean): NumericalStatistics = {
+    val totalWeight = BigDecimal(validCount)
+    val firstPass = FirstPassStatistics(mean = BigDecimal(mean),
+      weightedSumOfSquares = BigDecimal(sumOfSquaredDeviations) + BigDecimal(mean) * BigDecimal(mean) * totalWeight,
+      weightedSumOfSquaredDistancesFromMean = BigDecimal(sumOfSquaredDeviations),
+      weightedSumOfLogs = sumOfLogs.map(BigDecimal(_)),
+      minimum = minimum.getOrElse(Double.PositiveInfinity),
+      maximum = maximum.getOrElse(Double.NegativeInfinity),
+      totalWeight = totalWeight,
+      positiveWeightCount = validCount,
+      nonPositiveWeightCount = 0,
+      badRowCount = badCount,
+      goodRowCount = validCount)
+    new NumericalStatistics(() => firstPass, usePopulationVariance)
+  }
+}
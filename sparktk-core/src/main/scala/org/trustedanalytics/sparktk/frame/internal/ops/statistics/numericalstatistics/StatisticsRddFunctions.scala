@@ -39,18 +39,6 @@ object StatisticsRddFunctions extends Serializable {
 
     val accumulatorParam = new FirstPassStatisticsAccumulatorParam()
 
-    val initialValue = new FirstPassStatistics(mean = 0,
-      weightedSumOfSquares = 0,
-      weightedSumOfSquaredDistancesFromMean = 0,
-      weightedSumOfLogs = Some(BigDecimal(0)),
-      minimum = Double.PositiveInfinity,
-      maximum = Double.NegativeInfinity,
-      totalWeight = 0,
-      positiveWeightCount = 0,
-      nonPositiveWeightCount = 0,
-      badRowCount = 0,
-      goodRowCount = 0)
-
     val accumulator = dataWeightPairs.sparkContext.accumulator[FirstPassStatistics](initialValue)(accumulatorParam)
 
     dataWeightPairs.map(StatisticsRddFunctions.convertDataWeightPairToFirstPassStats).foreach(x => accumulator.add(x))
@@ -58,6 +46,40 @@ object StatisticsRddFunctions extends Serializable {
     accumulator.value
   }
 
+  /**
+   * Generates the first-pass statistics of several distributions in a single pass.
+   * @param dataWeightPairs For each element, the (data, weight) pair of each distribution.
+   * @param numDistributions The number of distributions.
+   * @return The first-pass statistics of each distribution, in order.
+   */
+  def generateFirstPassStatisticsByDistribution(dataWeightPairs: RDD[Seq[(Option[Double], Option[Double])]],
+                                                numDistributions: Int): Seq[FirstPassStatistics] = {
+
+    val accumulatorParam = new FirstPassStatisticsAccumulatorParam()
+
+    val initialValues = Vector.fill(numDistributions)(initialValue)
+
+    dataWeightPairs.treeAggregate(initialValues)(
+      (statistics, pairs) => statistics.zip(pairs).map {
+        case (stats, pair) => accumulatorParam.addInPlace(stats, convertDataWeightPairToFirstPassStats(pair))
+      },
+      (statistics1, statistics2) => statistics1.zip(statistics2).map {
+        case (stats1, stats2) => accumulatorParam.addInPlace(stats1, stats2)
+      })
+  }
+
+  private val initialValue = new FirstPassStatistics(mean = 0,
+    weightedSumOfSquares = 0,
+    weightedSumOfSquaredDistancesFromMean = 0,
+    weightedSumOfLogs = Some(BigDecimal(0)),
+    minimum = Double.PositiveInfinity,
+    maximum = Double.NegativeInfinity,
+    totalWeight = 0,
+    positiveWeightCount = 0,
+    nonPositiveWeightCount = 0,
+    badRowCount = 0,
+    goodRowCount = 0)
+
   private def convertDataWeightPairToFirstPassStats(p: (Option[Double], Option[Double])): FirstPassStatistics = {
     (p._1, p._2) match {
       case (None, None) | (None, _) | (_, None) => firstPassStatsOfBadEntry
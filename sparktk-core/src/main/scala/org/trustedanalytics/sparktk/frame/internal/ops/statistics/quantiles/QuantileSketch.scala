@@ -0,0 +1,196 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal.ops.statistics.quantiles
+
+import scala.collection.mutable.ArrayBuffer
+
+/**
+ * Mergeable summary of a numeric distribution in bounded space, which answers quantile queries approximately.
+ *
+ * Values are kept in a stack of levels, where each value in level h stands for 2^h input values.  When a level
+ * reaches its capacity, it is sorted and every other value moves up a level (alternating between the values at even
+ * and odd positions from one compaction to the next).  A compaction of level h moves the rank of any value by at most
+ * 2^h, so the rank error of a quantile is bounded by about log2(n / capacity) / capacity, while the sketch holds
+ * about capacity * log2(n / capacity) values.  In practice the errors of successive compactions largely cancel.
+ *
+ * Sketches of separate partitions combine with merge, so a column is summarized in a single aggregation.
+ *
+ * @param capacity number of values a level holds before it is compacted
+ */
+class QuantileSketch(val capacity: Int) extends Serializable {
+  require(capacity >= 2, "quantile sketch capacity must be at least 2")
+
+  private val levels = ArrayBuffer(new ArrayBuffer[Double]())
+  private var compactOddPositions = false
+  private var valueCount = 0L
+  private var minimum = Double.PositiveInfinity
+  private var maximum = Double.NegativeInfinity
+
+  /**
+   * Number of values summarized
+   */
+  def count: Long = valueCount
+
+  def isEmpty: Boolean = valueCount == 0
+
+  /**
+   * Add a value to the sketch
+   *
+   * @param value finite value
+   * @return this sketch
+   */
+  def add(value: Double): this.type = {
+    levels(0) += value
+    valueCount += 1
+    if (value < minimum) minimum = value
+    if (value > maximum) maximum = value
+    if (levels(0).length >= capacity) compact(0)
+    this
+  }
+
+  /**
+   * Add the values summarized by another sketch to this sketch
+   *
+   * @param other sketch to merge into this one (it is not modified)
+   * @return this sketch
+   */
+  def merge(other: QuantileSketch): this.type = {
+    var level = 0
+    while (level < other.levels.length) {
+      if (level == levels.length) levels += new ArrayBuffer[Double]()
+      levels(level) ++= other.levels(level)
+      level += 1
+    }
+    valueCount += other.valueCount
+    minimum = math.min(minimum, other.minimum)
+    maximum = math.max(maximum, other.maximum)
+    level = 0
+    while (level < levels.length) {
+      if (levels(level).length >= capacity) compact(level)
+      level += 1
+    }
+    this
+  }
+
+  /**
+   * Approximate values at the given quantiles.  Quantile 0 is the exact minimum and quantile 1 the exact maximum.
+   *
+   * @param quantiles quantiles, each between 0 and 1
+   * @return the value at each quantile, in the same order
+   */
+  def quantiles(quantiles: Seq[Double]): Seq[Double] = {
+    require(!isEmpty, "cannot compute quantiles of an empty sketch")
+    quantiles.foreach(q => require(q >= 0 && q <= 1, s"quantile must be between 0 and 1, but got $q"))
+    val (values, weights) = sortedValuesWithWeights
+    quantiles.map(q => {
+      if (q == 0) minimum
+      else if (q == 1) maximum
+      else {
+        val targetRank = q * valueCount
+        var cumulativeWeight = 0L
+        var i = 0
+        while (i < values.length - 1 && cumulativeWeight + weights(i) < targetRank) {
+          cumulativeWeight += weights(i)
+          i += 1
+        }
+        values(i)
+      }
+    })
+  }
+
+  /**
+   * Approximate fraction of the values which are less than or equal to the given value
+   */
+  def cumulativeFraction(value: Double): Double = {
+    require(!isEmpty, "cannot compute the cumulative fraction of an empty sketch")
+    if (value < minimum) 0.0
+    else if (value >= maximum) 1.0
+    else {
+      var weight = 0L
+      var level = 0
+      while (level < levels.length) {
+        levels(level).foreach(v => if (v <= value) weight += 1L << level)
+        level += 1
+      }
+      weight.toDouble / valueCount
+    }
+  }
+
+  /**
+   * The values held by the sketch in ascending order, with the number of input values each stands for
+   */
+  def sortedValuesWithWeights: (Array[Double], Array[Long]) = {
+    val weighted = levels.zipWithIndex.flatMap { case (level, h) => level.map(v => (v, 1L << h)) }.sortBy(_._1)
+    (weighted.map(_._1).toArray, weighted.map(_._2).toArray)
+  }
+
+  private def compact(level: Int): Unit = {
+    val sorted = levels(level).toArray
+    java.util.Arrays.sort(sorted)
+    if (level + 1 == levels.length) levels += new ArrayBuffer[Double]()
+    val nextLevel = levels(level + 1)
+    // with an odd number of values, the largest stays in this level, so the total weight is unchanged
+    val pairedLength = sorted.length - sorted.length % 2
+    var i = if (compactOddPositions) 1 else 0
+    while (i < pairedLength) {
+      nextLevel += sorted(i)
+      i += 2
+    }
+    compactOddPositions = !compactOddPositions
+    levels(level).clear()
+    if (pairedLength < sorted.length) levels(level) += sorted(sorted.length - 1)
+  }
+}
+
+object QuantileSketch {
+
+  /**
+   * Relative error of the approximate quantile operations when none is given
+   */
+  val DefaultRelativeError = 0.01
+
+  /**
+   * Number of compacted levels assumed when sizing a sketch for a relative error, which covers capacity * 2^20 values
+   */
+  private val ExpectedLevels = 20
+
+  /**
+   * Sketch sized so that the rank error of any quantile is at most relativeError * n, for up to capacity * 2^20
+   * values (past that, the bound grows slowly with the number of levels)
+   *
+   * @param relativeError acceptable rank error, as a fraction of the number of values (between 0 and 1)
+   * @return an empty sketch
+   */
+  def withRelativeError(relativeError: Double): QuantileSketch = {
+    require(relativeError > 0 && relativeError < 1, s"relative error must be between 0 and 1, but got $relativeError")
+    new QuantileSketch(math.ceil((ExpectedLevels + 2) / relativeError).toInt + 1)
+  }
+
+  /**
+   * Guaranteed bound on the rank error of a sketch of the given capacity over count values, as a fraction of count.
+   *
+   * Level h only compacts once count / 2^h values reached it, and each compaction, which shifts ranks by at most 2^h,
+   * consumes capacity - 1 of them; so every compacted level adds at most count / (capacity - 1), and picking a held
+   * value adds at most the top weight.
+   */
+  def relativeErrorBound(capacity: Int, count: Long): Double = {
+    if (count < capacity) 0.0
+    else {
+      val compactedLevels = math.floor(math.log(count.toDouble / capacity) / math.log(2)) + 1
+      (compactedLevels + 2) / (capacity - 1)
+    }
+  }
+}
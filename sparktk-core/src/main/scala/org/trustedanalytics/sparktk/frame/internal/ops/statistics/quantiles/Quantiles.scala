@@ -15,6 +15,7 @@
  */
 package org.trustedanalytics.sparktk.frame.internal.ops.statistics.quantiles
 
+import org.apache.spark.sql.Row
 import org.trustedanalytics.sparktk.frame.internal.{ FrameState, FrameSummarization, BaseFrame }
 import org.trustedanalytics.sparktk.frame.{ Column, FrameSchema, DataTypes, Frame }
 
@@ -24,18 +25,29 @@ trait QuantilesSummarization extends BaseFrame {
    *
    * @param column The name of the column to calculate quantiles off of.
    * @param quantiles The quantile cutoffs being requested
+   * @param approximate If true, the values come from a quantile sketch built in a single pass over the data (or from
+   *                    the frame's statistics catalog), instead of from a sort of the column.  Each value is then a
+   *                    value of the column whose rank is within relativeError * n of the requested quantile, and
+   *                    missing or non-finite values are ignored.
+   * @param relativeError Acceptable rank error of the approximate values, as a fraction of the number of values.
    * @return A new frame with two columns (''float64''): requested quantiles and their respective values.
    */
   def quantiles(column: String,
-                quantiles: List[Double]): Frame = {
+                quantiles: List[Double],
+                approximate: Boolean = false,
+                relativeError: Double = QuantileSketch.DefaultRelativeError): Frame = {
 
-    execute(Quantiles(column, quantiles))
+    execute(Quantiles(column, quantiles, approximate, relativeError))
   }
 }
 
-case class Quantiles(column: String, quantiles: List[Double]) extends FrameSummarization[Frame] {
+case class Quantiles(column: String,
+                     quantiles: List[Double],
+                     approximate: Boolean = false,
+                     relativeError: Double = QuantileSketch.DefaultRelativeError) extends FrameSummarization[Frame] {
   require(quantiles.forall(x => x > 0.0d), "Quantile cutoffs must be positive")
   require(quantiles.forall(x => x <= 100.0d), "Quantile cutoffs must be less than equal to 100")
+  require(relativeError > 0 && relativeError < 1, "relative error must be between 0 and 1")
 
   override def work(state: FrameState): Frame = {
     val columnIndex = state.schema.columnIndex(column)
@@ -43,8 +55,19 @@ case class Quantiles(column: String, quantiles: List[Double]) extends FrameSumma
     // New schema for the quantiles frame
     val schema = FrameSchema(Vector(Column("Quantiles", DataTypes.float64), Column(column + "_QuantileValue", DataTypes.float64)))
 
-    // return frame with quantile values
-    new Frame(QuantilesFunctions.quantiles(state.rdd, quantiles, columnIndex, state.rdd.count()), schema)
+    if (approximate) {
+      state.schema.requireColumnIsNumerical(column)
+      // like the exact values, one row per distinct quantile in ascending order
+      val targets = quantiles.distinct.sorted
+      val values = QuantilesFunctions.catalogQuantiles(state.statistics, column, targets, relativeError)
+        .getOrElse(QuantilesFunctions.approximateQuantiles(state.rdd, targets, columnIndex, relativeError))
+      val rows = targets.zip(values).map { case (q, value) => Row(q, value) }
+      new Frame(state.rdd.sparkContext.parallelize(rows, 1), schema)
+    }
+    else {
+      // return frame with quantile values
+      new Frame(QuantilesFunctions.quantiles(state.rdd, quantiles, columnIndex, state.rdd.count()), schema)
+    }
   }
 }
 
@@ -16,6 +16,7 @@
 package org.trustedanalytics.sparktk.frame.internal.ops.statistics.quantiles
 
 import org.trustedanalytics.sparktk.frame.DataTypes
+import org.trustedanalytics.sparktk.frame.internal.FrameStatisticsCatalog
 import org.apache.spark.rdd.RDD
 import org.apache.spark.sql.Row
 import org.apache.spark.sql.catalyst.expressions.GenericRow
@@ -144,4 +145,58 @@ object QuantilesFunctions extends Serializable {
     mapping.map { case (elementIndex, targets) => (elementIndex, targets.toSeq) }.toMap
   }
 
+  /**
+   * Build a quantile sketch of a numerical column in a single pass.  Missing, NaN and infinite values are skipped.
+   *
+   * @param rdd input rdd
+   * @param columnIndex the index of column to summarize
+   * @param relativeError acceptable rank error of the sketch, as a fraction of the number of values
+   */
+  def quantileSketch(rdd: RDD[Row], columnIndex: Int, relativeError: Double): QuantileSketch = {
+    rdd.treeAggregate(QuantileSketch.withRelativeError(relativeError))((sketch, row) => {
+      val value = row(columnIndex)
+      if (value != null) {
+        val d = DataTypes.toDouble(value)
+        if (!d.isNaN && !d.isInfinite) sketch.add(d)
+      }
+      sketch
+    }, (sketch, other) => sketch.merge(other))
+  }
+
+  /**
+   * Calculate approximate quantile values from a single-pass sketch of the column
+   *
+   * Each value is one of the column's values, whose rank is within relativeError * n of the requested quantile.
+   *
+   * @param rdd input rdd
+   * @param quantiles seq of quantiles (0 to 100) to find value for
+   * @param columnIndex the index of column to calculate quantile
+   * @param relativeError acceptable rank error, as a fraction of the number of values
+   * @return the value for each quantile, in the same order (empty when the column has no finite values)
+   */
+  def approximateQuantiles(rdd: RDD[Row], quantiles: Seq[Double], columnIndex: Int, relativeError: Double): Seq[Double] = {
+    val sketch = quantileSketch(rdd, columnIndex, relativeError)
+    if (sketch.isEmpty) Seq() else sketch.quantiles(quantiles.map(_ / 100))
+  }
+
+  /**
+   * Approximate quantile values from the percentiles in a frame's statistics catalog, when the quantiles are whole
+   * percentiles and the catalog's sketch is guaranteed to be within the relative error
+   *
+   * @param statistics statistics catalog of the frame, if any
+   * @param column the column to calculate quantiles on
+   * @param quantiles seq of quantiles (0 to 100) to find value for
+   * @param relativeError acceptable rank error, as a fraction of the number of values
+   */
+  def catalogQuantiles(statistics: Option[FrameStatisticsCatalog],
+                       column: String,
+                       quantiles: Seq[Double],
+                       relativeError: Double): Option[Seq[Double]] = {
+    for {
+      catalog <- statistics
+      numeric <- catalog.column(column).flatMap(_.numeric)
+      if numeric.percentiles.nonEmpty && quantiles.forall(q => q == math.rint(q))
+      if QuantileSketch.relativeErrorBound(FrameStatisticsCatalog.QuantileSketchCapacity, numeric.validCount) <= relativeError
+    } yield quantiles.map(q => numeric.percentiles(q.toInt))
+  }
 }
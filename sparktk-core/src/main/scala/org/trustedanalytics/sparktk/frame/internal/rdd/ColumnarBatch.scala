@@ -0,0 +1,249 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal.rdd
+
+import java.nio.{ ByteBuffer, ByteOrder }
+import java.util.{ ArrayList => JArrayList, List => JList }
+
+import net.razorvine.pickle.Pickler
+import org.apache.spark.mllib.linalg.DenseMatrix
+import org.apache.spark.sql.Row
+import org.apache.spark.sql.catalyst.expressions.GenericRow
+import org.trustedanalytics.sparktk.frame.{ DataTypes, Schema }
+import org.trustedanalytics.sparktk.frame.DataTypes.DataType
+
+import scala.collection.mutable.ArrayBuffer
+import scala.util.Try
+
+/**
+ * Columnar record batch format used to move frame data between the JVM and Python workers.
+ *
+ * A batch is a list of the form [numRows, column_0, column_1, ...].  Each column is itself a list of
+ * [validity, payload]:
+ *
+ *   validity - null if the column has no missing values, otherwise a byte array with one byte per row (1 = present)
+ *   payload  - depends on the column data type:
+ *                int32             little-endian 4 byte ints
+ *                int64, datetime   little-endian 8 byte longs (datetime as ms since epoch)
+ *                float32, float64  little-endian 8 byte doubles (Python only has doubles)
+ *                vector(n)         little-endian 8 byte doubles, n per row
+ *                string            list of strings
+ *                matrix            list of [numRows, numCols, little-endian 8 byte doubles in row-major order]
+ *
+ * Missing values in fixed-width payloads are written as zeros and masked out by the validity bytes.
+ *
+ * Byte arrays pickle to Python bytearrays, which numpy can read without copying each value into a Python object.
+ */
+object ColumnarBatch {
+
+  /**
+   * Default number of rows in a record batch
+   */
+  val DefaultBatchSize = 4096
+
+  /**
+   * Groups the rows of a partition into columnar record batches
+   *
+   * @param rows partition iterator
+   * @param schema frame schema describing the rows
+   * @param batchSize maximum number of rows per batch
+   * @return iterator of record batches
+   */
+  def encode(rows: Iterator[Row], schema: Schema, batchSize: Int = DefaultBatchSize): Iterator[JList[Any]] = {
+    require(batchSize > 0, s"batchSize must be greater than 0, received $batchSize")
+    val dataTypes = schema.columns.map(_.dataType).toArray
+    rows.grouped(batchSize).map(group => encodeBatch(group, dataTypes))
+  }
+
+  /**
+   * Converts record batches back into rows
+   *
+   * @param batches record batches, as produced by the Python side of the bridge
+   * @param schema frame schema describing the batches
+   * @return iterator of rows
+   */
+  def decode(batches: Iterator[Any], schema: Schema): Iterator[Row] = {
+    val dataTypes = schema.columns.map(_.dataType).toArray
+    batches.flatMap(batch => decodeBatch(batch.asInstanceOf[JList[Any]], dataTypes))
+  }
+
+  /**
+   * Encodes rows held by the driver as a single pickled record batch, so they reach Python in one transfer instead
+   * of a py4j call per cell
+   *
+   * @param rows rows to encode
+   * @param schema frame schema describing the rows
+   * @return pickled record batch
+   */
+  def pickle(rows: Seq[Row], schema: Schema): Array[Byte] = {
+    new Pickler().dumps(encodeBatch(rows, schema.columns.map(_.dataType).toArray))
+  }
+
+  private[rdd] def encodeBatch(rows: Seq[Row], dataTypes: Array[DataType]): JList[Any] = {
+    val numRows = rows.length
+    val batch = new JArrayList[Any](dataTypes.length + 1)
+    batch.add(numRows)
+    dataTypes.zipWithIndex.foreach {
+      case (dataType, columnIndex) =>
+        val cells = convertColumn(rows, columnIndex, dataType)
+        val column = new JArrayList[Any](2)
+        column.add(encodeValidity(cells))
+        column.add(encodeColumn(cells, dataType))
+        batch.add(column)
+    }
+    batch
+  }
+
+  private[rdd] def decodeBatch(batch: JList[Any], dataTypes: Array[DataType]): Iterator[Row] = {
+    require(batch.size() == dataTypes.length + 1,
+      s"Record batch has ${batch.size() - 1} columns, but the schema has ${dataTypes.length} columns")
+    val numRows = batch.get(0).asInstanceOf[Number].intValue()
+    val columns = dataTypes.zipWithIndex.map {
+      case (dataType, columnIndex) =>
+        val column = batch.get(columnIndex + 1).asInstanceOf[JList[Any]]
+        val values = decodeColumn(column.get(1), numRows, dataType)
+        val validity = column.get(0).asInstanceOf[Array[Byte]]
+        if (validity != null) {
+          for (i <- 0 until numRows if validity(i) == 0) values(i) = null
+        }
+        values
+    }
+    (0 until numRows).iterator.map(rowIndex => new GenericRow(columns.map(_(rowIndex))).asInstanceOf[Row])
+  }
+
+  private def encodeValidity(cells: Array[Any]): Array[Byte] = {
+    if (cells.contains(null)) cells.map(cell => if (cell == null) 0.toByte else 1.toByte)
+    else null
+  }
+
+  private def buffer(size: Int): ByteBuffer = ByteBuffer.allocate(size).order(ByteOrder.LITTLE_ENDIAN)
+
+  private def wrap(bytes: Array[Byte]): ByteBuffer = ByteBuffer.wrap(bytes).order(ByteOrder.LITTLE_ENDIAN)
+
+  /**
+   * Converts a column's cells to the values packed into the payload, leaving null for any cell that cannot be
+   * converted to the column's data type (the same per-cell fallback as the row-at-a-time bridge)
+   */
+  private def convertColumn(rows: Seq[Row], columnIndex: Int, dataType: DataType): Array[Any] = {
+    val convert: Any => Any = dataType match {
+      case DataTypes.int32 => DataTypes.toInt
+      case DataTypes.int64 => DataTypes.toLong
+      case DataTypes.datetime => {
+        case n: Number => DataTypes.toLong(n)
+        case other => DataTypes.datetime.parse(other).get
+      }
+      case DataTypes.float32 | DataTypes.float64 => DataTypes.toDouble
+      case DataTypes.vector(length) => DataTypes.toVector(length)
+      case DataTypes.matrix => { case m: DenseMatrix => m }
+      case _ => {
+        case s: String => s
+        case other => dataType.asString(other)
+      }
+    }
+    rows.map(row => if (row.isNullAt(columnIndex)) null else Try(convert(row.get(columnIndex))).getOrElse(null)).toArray
+  }
+
+  private def encodeColumn(cells: Array[Any], dataType: DataType): Any = {
+    dataType match {
+      case DataTypes.int32 =>
+        val b = buffer(cells.length * 4)
+        cells.foreach(v => b.putInt(if (v == null) 0 else v.asInstanceOf[Int]))
+        b.array()
+      case DataTypes.int64 | DataTypes.datetime =>
+        val b = buffer(cells.length * 8)
+        cells.foreach(v => b.putLong(if (v == null) 0L else v.asInstanceOf[Long]))
+        b.array()
+      case DataTypes.float32 | DataTypes.float64 =>
+        val b = buffer(cells.length * 8)
+        cells.foreach(v => b.putDouble(if (v == null) 0d else v.asInstanceOf[Double]))
+        b.array()
+      case DataTypes.vector(length) =>
+        val b = buffer(cells.length * length.toInt * 8)
+        cells.foreach {
+          case null => (0 until length.toInt).foreach(_ => b.putDouble(0d))
+          case v => v.asInstanceOf[Seq[Double]].foreach(d => b.putDouble(d))
+        }
+        b.array()
+      case DataTypes.matrix =>
+        val payload = new JArrayList[Any](cells.length)
+        cells.foreach {
+          case null => payload.add(null)
+          case m: DenseMatrix =>
+            val b = buffer(m.numRows * m.numCols * 8)
+            for (i <- 0 until m.numRows; j <- 0 until m.numCols) b.putDouble(m(i, j))
+            val entry = new JArrayList[Any](3)
+            entry.add(m.numRows)
+            entry.add(m.numCols)
+            entry.add(b.array())
+            payload.add(entry)
+        }
+        payload
+      case _ =>
+        val payload = new JArrayList[Any](cells.length)
+        cells.foreach(v => payload.add(v))
+        payload
+    }
+  }
+
+  private def decodeColumn(payload: Any, numRows: Int, dataType: DataType): Array[Any] = {
+    val values = new Array[Any](numRows)
+    dataType match {
+      case DataTypes.int32 =>
+        val b = wrap(payload.asInstanceOf[Array[Byte]])
+        for (i <- 0 until numRows) values(i) = b.getInt()
+      case DataTypes.int64 | DataTypes.datetime =>
+        val b = wrap(payload.asInstanceOf[Array[Byte]])
+        for (i <- 0 until numRows) values(i) = b.getLong()
+      case DataTypes.float32 =>
+        val b = wrap(payload.asInstanceOf[Array[Byte]])
+        for (i <- 0 until numRows) values(i) = b.getDouble().toFloat
+      case DataTypes.float64 =>
+        val b = wrap(payload.asInstanceOf[Array[Byte]])
+        for (i <- 0 until numRows) values(i) = b.getDouble()
+      case DataTypes.vector(length) =>
+        val b = wrap(payload.asInstanceOf[Array[Byte]])
+        for (i <- 0 until numRows) {
+          val v = new ArrayBuffer[Double](length.toInt)
+          for (_ <- 0 until length.toInt) v += b.getDouble()
+          values(i) = v.toVector
+        }
+      case DataTypes.matrix =>
+        val cells = payload.asInstanceOf[JList[Any]]
+        for (i <- 0 until numRows) {
+          values(i) = cells.get(i) match {
+            case null => null
+            case entry: JList[_] =>
+              val numMatrixRows = entry.get(0).asInstanceOf[Number].intValue()
+              val numMatrixCols = entry.get(1).asInstanceOf[Number].intValue()
+              val b = wrap(entry.get(2).asInstanceOf[Array[Byte]])
+              // payload is row-major, DenseMatrix is column-major
+              val columnMajor = new Array[Double](numMatrixRows * numMatrixCols)
+              for (r <- 0 until numMatrixRows; c <- 0 until numMatrixCols) columnMajor(c * numMatrixRows + r) = b.getDouble()
+              new DenseMatrix(numMatrixRows, numMatrixCols, columnMajor)
+          }
+        }
+      case _ =>
+        val cells = payload.asInstanceOf[JList[Any]]
+        for (i <- 0 until numRows) {
+          values(i) = cells.get(i) match {
+            case null => null
+            case v => Try(dataType.parse(v).get).getOrElse(null)
+          }
+        }
+    }
+    values
+  }
+}
@@ -253,6 +253,43 @@ class FrameRdd(val frameSchema: Schema, val prev: RDD[Row])
     new FrameRdd(frameSchema.copySubsetWithRename(columnNamesWithRename), mapRows(row => row.valuesAsRow(preservedOrderColumnNames)))
   }
 
+  /**
+   * Select the rows for which a Spark SQL boolean expression is true
+   *
+   * The expression is compiled by Catalyst, so no row function is called.  Rows where it evaluates to null are
+   * not selected.
+   *
+   * @param condition Spark SQL boolean expression over the columns of the frame
+   * @return the new FrameRdd
+   */
+  def filterByExpression(condition: String): FrameRdd = {
+    new FrameRdd(frameSchema, toDataFrame.filter(condition).rdd)
+  }
+
+  /**
+   * Evaluate Spark SQL expressions for every row, each result cast to the data type of its new column
+   *
+   * @param expressions Spark SQL expressions over the columns of the frame, one for each new column
+   * @param newColumns the columns which hold the results of the expressions
+   * @param keepColumns true to keep the existing columns ahead of the new ones, false to keep only the new ones
+   * @return the new FrameRdd
+   */
+  def selectExpressions(expressions: Seq[String], newColumns: Seq[Column], keepColumns: Boolean): FrameRdd = {
+    require(expressions.length == newColumns.length,
+      s"got ${expressions.length} expressions for ${newColumns.length} new columns")
+    val dataFrame = toDataFrame
+    val existingColumns = if (keepColumns) dataFrame.columns.toSeq.map(dataFrame.col) else Seq()
+    val evaluatedColumns = expressions.zip(newColumns).map {
+      case (expression, column) =>
+        val evaluated = org.apache.spark.sql.functions.expr(expression)
+        val cast = if (column.dataType.isVector || column.dataType.equalsDataType(DataTypes.matrix)) evaluated
+        else evaluated.cast(FrameRdd.schemaDataTypeToSqlDataType(column.dataType))
+        cast.as(column.name)
+    }
+    val schema = if (keepColumns) frameSchema.copy(columns = frameSchema.columns ++ newColumns) else FrameSchema(newColumns.toVector)
+    new FrameRdd(schema, dataFrame.select(existingColumns ++ evaluatedColumns: _*).rdd)
+  }
+
   /* Please see documentation. Zip works if 2 SchemaRDDs have the same number of partitions and same number of elements
   in  each partition */
   def zipFrameRdd(frameRdd: FrameRdd): FrameRdd = {
@@ -533,39 +570,36 @@ object FrameRdd {
       list += new Column(field.name, sparkDataTypeToSchemaDataType(field.dataType))
     }
     val schema = new FrameSchema(list.toVector)
+    // resolve each column's conversion once, rather than matching the data type for every cell
+    val converters: Array[Any => Any] = fields.map(field => toFrameValueConverter(field.dataType)).toArray
     val convertedRdd: RDD[org.apache.spark.sql.Row] = rdd.map(row => {
       val rowArray = new Array[Any](row.length)
-      row.toSeq.zipWithIndex.foreach {
-        case (o, i) =>
-          if (o == null) {
-            rowArray(i) = null
-          }
-          else if (fields(i).dataType.getClass == TimestampType.getClass || fields(i).dataType.getClass == DateType.getClass) {
-            rowArray(i) = row.getTimestamp(i).getTime
-          }
-          else if (fields(i).dataType.getClass == ShortType.getClass) {
-            rowArray(i) = row.getShort(i).toInt
-          }
-          else if (fields(i).dataType.getClass == BooleanType.getClass) {
-            rowArray(i) = row.getBoolean(i).compareTo(false)
-          }
-          else if (fields(i).dataType.getClass == ByteType.getClass) {
-            rowArray(i) = row.getByte(i).toInt
-          }
-          else if (fields(i).dataType.getClass == classOf[DecimalType]) { // DecimalType.getClass return value (DecimalType$) differs from expected DecimalType
-            rowArray(i) = row.getAs[java.math.BigDecimal](i).doubleValue()
-          }
-          else {
-            val colType = schema.columns(i).dataType
-            rowArray(i) = o.asInstanceOf[colType.ScalaType]
-          }
+      var i = 0
+      while (i < rowArray.length) {
+        val o = row.get(i)
+        rowArray(i) = if (o == null) null else converters(i)(o)
+        i += 1
       }
       new GenericRow(rowArray)
-    }
-    )
+    })
     new FrameRdd(schema, convertedRdd)
   }
 
+  /**
+   * Returns the function which converts a non-null value of the given Spark SQL data type to the value stored in a
+   * frame.  Date/times become ms since epoch, so date/time columns never need a pass outside of the JVM.
+   */
+  private def toFrameValueConverter(dataType: org.apache.spark.sql.types.DataType): Any => Any = {
+    dataType match {
+      case TimestampType | DateType => (o: Any) => o.asInstanceOf[java.util.Date].getTime
+      case ShortType => (o: Any) => o.asInstanceOf[Short].toInt
+      case BooleanType => (o: Any) => o.asInstanceOf[Boolean].compareTo(false)
+      case ByteType => (o: Any) => o.asInstanceOf[Byte].toInt
+      case _: DecimalType => (o: Any) => o.asInstanceOf[java.math.BigDecimal].doubleValue()
+      case _ => (o: Any) => o
+    }
+  }
+
   /**
    * Converts row object from an RDD[Array[Any]] to an RDD[Product] so that it can be used to create a SchemaRDD
    *
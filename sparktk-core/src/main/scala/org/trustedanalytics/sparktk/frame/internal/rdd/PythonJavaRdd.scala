@@ -50,6 +50,40 @@ object PythonJavaRdd {
     toRowRdd(raa.rdd, scalaSchema)
   }
 
+  /**
+   * Converts an RDD of Rows to pickled columnar record batches (see ColumnarBatch)
+   *
+   * Unlike scalaToPython, cells are packed into typed buffers per column, so the Python side decodes
+   * a whole batch at once instead of unpickling each value
+   *
+   * @param rdd rows to convert
+   * @param scalaSchema schema of the rows
+   * @param batchSize maximum number of rows per record batch
+   * @return pickled record batches, one Python object per batch
+   */
+  def scalaToPythonColumnar(rdd: RDD[Row], scalaSchema: Schema, batchSize: Int): JavaRDD[Array[Byte]] = {
+    rdd.mapPartitions(rows => ColumnarBatch.encode(rows, scalaSchema, batchSize))
+      .mapPartitions { iter => new SparkAliases.AutoBatchedPickler(iter) }
+  }
+
+  def scalaToPythonColumnar(rdd: RDD[Row], scalaSchema: Schema): JavaRDD[Array[Byte]] = {
+    scalaToPythonColumnar(rdd, scalaSchema, ColumnarBatch.DefaultBatchSize)
+  }
+
+  /**
+   * Converts pickled columnar record batches produced by the Python side (see ColumnarBatch) to an RDD of Rows
+   *
+   * Values are read directly as the schema's types, so no per-cell parsing is needed
+   *
+   * @param jrdd pickled record batches
+   * @param scalaSchema schema of the batches
+   * @return rows
+   */
+  def pythonToScalaColumnar(jrdd: JavaRDD[Array[Byte]], scalaSchema: Schema): RDD[Row] = {
+    SparkAliases.SerDeUtil.pythonToJava(jrdd, batched = true).rdd
+      .mapPartitions(batches => ColumnarBatch.decode(batches, scalaSchema))
+  }
+
   private def pythonToJava(jrdd: JavaRDD[Array[Byte]]): JavaRDD[Array[Any]] = {
     // calling SparkAliases.MLLibSerDe, internally registers DenseVectorPickler, DenseMatrixPickler, SparseMatrixPickler, SparseVectorPickler for serialization purpose.
     val j = SparkAliases.MLLibSerDe.pythonToJava(jrdd, batched = true)
@@ -0,0 +1,55 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal
+
+import org.apache.spark.sql.Row
+import org.scalatest.Matchers
+import org.trustedanalytics.sparktk.frame.{ Column, DataTypes, FrameSchema }
+import org.trustedanalytics.sparktk.testutils.TestingSparkContextWordSpec
+
+class FrameStatisticsTest extends TestingSparkContextWordSpec with Matchers {
+
+  "FrameStatisticsCatalog.gatherWhileReading" should {
+    val schema = FrameSchema(Vector(Column("x", DataTypes.float64)))
+    // a large offset, which makes the variance cancel out when computed from a sum of squares
+    val rows = (1 to 1000).flatMap(_ => Seq(4.0, 7.0, 13.0, 16.0)).map(d => Row(1e9 + d))
+
+    "keep the variance of values with a large offset" in {
+      val (gatheringRdd, catalog) = FrameStatisticsCatalog.gatherWhileReading(sparkContext.parallelize(rows, 7), schema)
+      gatheringRdd.count() shouldBe 4000
+
+      val numeric = catalog().get.column("x").get.numeric.get
+      numeric.validCount shouldBe 4000
+      numeric.mean shouldBe 1e9 + 10 +- 1e-6
+      (numeric.sumOfSquaredDeviations / numeric.validCount) shouldBe 22.5 +- 1e-6
+    }
+
+    "not add the statistics of recomputed partitions twice" in {
+      val (gatheringRdd, catalog) = FrameStatisticsCatalog.gatherWhileReading(sparkContext.parallelize(rows, 7), schema)
+      gatheringRdd.count()
+      gatheringRdd.count()
+
+      catalog().get.rowCount shouldBe 4000
+      catalog().get.column("x").get.numeric.get.validCount shouldBe 4000
+    }
+
+    "have no catalog until every partition is read" in {
+      val (gatheringRdd, catalog) = FrameStatisticsCatalog.gatherWhileReading(sparkContext.parallelize(rows, 7), schema)
+      gatheringRdd.take(1)
+      catalog() shouldBe None
+    }
+  }
+}
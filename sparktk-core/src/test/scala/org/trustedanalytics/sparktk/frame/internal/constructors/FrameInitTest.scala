@@ -17,8 +17,10 @@ package org.trustedanalytics.sparktk.frame.internal.constructors
 
 import org.apache.spark.sql.Row
 import org.apache.spark.sql.catalyst.expressions.GenericRow
+import org.apache.spark.storage.StorageLevel
 import org.trustedanalytics.sparktk.testutils.TestingSparkContextWordSpec
 import org.trustedanalytics.sparktk.frame.{ FrameSchema, Frame, Column, DataTypes }
+import org.trustedanalytics.sparktk.frame.internal.ValidationReport
 
 class FrameInitTest extends TestingSparkContextWordSpec {
   "Frame init" should {
@@ -123,6 +125,20 @@ class FrameInitTest extends TestingSparkContextWordSpec {
       assert(20 == frame.validationReport.get.numBadValues)
     }
 
+    "fill in the validation report when an action reads the data, if validation is lazy" in {
+      val intRows: Array[Row] = Array.fill(100) { new GenericRow(Array[Any](1)) }
+      val floatRows: Array[Row] = Array.fill(20) { new GenericRow(Array[Any]("a")) }
+      val rdd = sparkContext.parallelize(intRows ++ floatRows, 3)
+      val frame = new Frame(rdd, null, validateSchema = true, validationMode = "lazy")
+      assert(frame.validationReport.get == ValidationReport(0, isComplete = false))
+      assert(frame.rowCount == 120)
+      assert(frame.validationReport.get == ValidationReport(20, isComplete = true))
+      // reading the data again does not count the bad values twice (the rdd is not cached, so this recomputes it)
+      assert(frame.rdd.getStorageLevel == StorageLevel.NONE)
+      assert(frame.rdd.map(_.get(0)).filter(_ == null).count() == 20)
+      assert(20 == frame.validationReport.get.numBadValues)
+    }
+
     "no exception if data past the first 100 rows does not match the schema, if validation is disabled" in {
       val intRows: Array[Row] = Array.fill(100) { new GenericRow(Array[Any](1)) }
       val floatRows: Array[Row] = Array.fill(20) { new GenericRow(Array[Any]("a")) }
@@ -134,6 +150,16 @@ class FrameInitTest extends TestingSparkContextWordSpec {
       assert(frame.validationReport.isDefined == false)
     }
 
+    "increment the state version when the frame changes, but not when it is summarized" in {
+      val rdd = sparkContext.parallelize(Array[Row](new GenericRow(Array[Any](1)), new GenericRow(Array[Any](2))))
+      val frame = new Frame(rdd, FrameSchema(Vector(Column("a", DataTypes.int32))))
+      val version = frame.stateVersion
+      frame.rowCount
+      assert(frame.stateVersion == version)
+      frame.renameColumns(Map("a" -> "b"))
+      assert(frame.stateVersion == version + 1)
+    }
+
     "throw an exception for duplicate column names" in {
       intercept[IllegalArgumentException] {
         // duplicate column names should cause an exception
@@ -0,0 +1,52 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal.ops
+
+import org.apache.spark.sql.Row
+import org.scalatest.Matchers
+import org.trustedanalytics.sparktk.frame.internal.ops.groupby.GroupByAggregationArgs
+import org.trustedanalytics.sparktk.frame.{ Column, DataTypes, Frame, FrameSchema }
+import org.trustedanalytics.sparktk.testutils.TestingSparkContextWordSpec
+
+class ApproxDistinctTest extends TestingSparkContextWordSpec with Matchers {
+
+  val schema = FrameSchema(Vector(Column("region", DataTypes.string), Column("user", DataTypes.int32)))
+
+  // 20000 distinct users, split between two regions, each appearing twice
+  def rows = (0 until 40000).map(i => Row(if (i % 20000 < 5000) "east" else "west", i % 20000))
+
+  "approxDistinct" should {
+    "estimate the distinct values of several columns in one pass, skipping missing values" in {
+      val frame = new Frame(sparkContext.parallelize(rows :+ Row(null, null), 4), schema)
+      val counts = frame.approxDistinct(Seq("region", "user"))
+      counts("region") shouldBe 2L
+      counts("user").toDouble shouldBe 20000.0 +- 20000 * 0.05
+    }
+  }
+
+  "groupBy with COUNT_DISTINCT_APPROX" should {
+    "estimate the distinct values in each group" in {
+      val frame = new Frame(sparkContext.parallelize(rows, 4), schema)
+      val grouped = frame.groupBy(List("region"), List(
+        GroupByAggregationArgs("COUNT_DISTINCT_APPROX=14", "user", "user_COUNT_DISTINCT_APPROX=14")))
+      grouped.schema.columnNames.toList shouldBe List("region", "user_COUNT_DISTINCT_APPROX")
+
+      val counts = grouped.collect().map(row => (row.getString(0), row.getLong(1))).toMap
+      counts("east").toDouble shouldBe 5000.0 +- 5000 * 0.03
+      counts("west").toDouble shouldBe 15000.0 +- 15000 * 0.03
+    }
+  }
+}
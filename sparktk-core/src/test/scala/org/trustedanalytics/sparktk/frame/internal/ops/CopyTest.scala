@@ -109,5 +109,15 @@ class CopyTest extends TestingSparkContextWordSpec with Matchers {
       assert(newFrameValues.length == newFrameStringColumn.rdd.count.toInt)
       newFrameValues.foreach((r: Row) => assert(r.length == 1)) // each row should only have one column
     }
+
+    "filter rows with a Spark SQL where expression" in {
+      val rdd = sparkContext.parallelize(rows)
+      val frame = new Frame(rdd, schema)
+
+      val newFrame = frame.copyWhereExpression(Some(Map("number_str" -> "number")), "number_int > 2")
+      assert(newFrame.schema.columnNames.toList == List("number"))
+      assert(newFrame.take(10).map(_.getString(0)).toList == List("three", "four", "five"))
+      assert(frame.rdd.count == 5)
+    }
   }
 }
\ No newline at end of file
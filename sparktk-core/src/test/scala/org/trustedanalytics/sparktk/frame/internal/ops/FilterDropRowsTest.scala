@@ -75,5 +75,34 @@ class FilterDropRowsTest extends TestingSparkContextWordSpec with Matchers {
       frame.rowCount() shouldBe 4
 
     }
+
+    "filter, drop rows and add columns with Spark SQL expressions" in {
+      val rows = List(
+        Row("John", 1, 10L),
+        Row("Kathy", 2, null),
+        Row("Peter", 3, 30L))
+
+      val schema = FrameSchema(Vector(
+        Column("name", DataTypes.string),
+        Column("id", DataTypes.int32),
+        Column("score", DataTypes.int64)))
+
+      val frame = new Frame(sparkContext.parallelize(rows), schema)
+
+      // rows where the condition is null are dropped by filter, but kept by dropRows
+      frame.dropRowsExpression("score > 20")
+      frame.take(10).map(_.getString(0)) shouldBe Array("John", "Kathy")
+
+      frame.addColumnsExpression(Seq("id * 1.5", "upper(name)"), Seq(Column("weighted", DataTypes.float64), Column("upper_name", DataTypes.string)))
+      frame.schema.columnNames.toList shouldBe List("name", "id", "score", "weighted", "upper_name")
+      frame.take(10).map(row => (row.getDouble(3), row.getString(4))) shouldBe Array((1.5, "JOHN"), (3.0, "KATHY"))
+
+      frame.filterExpression("score < 20")
+      frame.take(10).map(_.getString(0)) shouldBe Array("John")
+
+      val mapped = frame.mapColumnsExpression(Seq("id + score"), Seq(Column("total", DataTypes.int32)))
+      mapped.schema.columnNames.toList shouldBe List("total")
+      mapped.take(10) shouldBe Array(Row(11))
+    }
   }
 }
@@ -0,0 +1,146 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal.ops
+
+import java.io.File
+
+import org.apache.spark.ShuffleDependency
+import org.apache.spark.rdd.RDD
+import org.apache.spark.sql.Row
+import org.scalatest.Matchers
+import org.trustedanalytics.sparktk.frame.internal.FramePartitioning
+import org.trustedanalytics.sparktk.frame.internal.ops.groupby.GroupByAggregationArgs
+import org.trustedanalytics.sparktk.frame.{ Column, DataTypes, Frame, FrameSchema }
+import org.trustedanalytics.sparktk.testutils.{ DirectoryUtils, TestingSparkContextWordSpec }
+
+class PartitionByTest extends TestingSparkContextWordSpec with Matchers {
+
+  val clickSchema = FrameSchema(Vector(Column("user", DataTypes.int32), Column("page", DataTypes.string)))
+  val clicks = (0 until 200).map(i => Row(if (i % 17 == 0) null else i % 23, s"page${i % 7}")).toList
+
+  val userSchema = FrameSchema(Vector(Column("id", DataTypes.int32), Column("name", DataTypes.string)))
+  val users = ((5 until 30).map(i => Row(i, s"user$i")) :+ Row(null, "nobody") :+ Row(7, "again")).toList
+
+  /**
+   * Number of shuffles in the lineage of the rdd
+   */
+  def shuffles(rdd: RDD[_]): Int = rdd.dependencies.map(dependency => dependency match {
+    case _: ShuffleDependency[_, _, _] => 1 + shuffles(dependency.rdd)
+    case _ => shuffles(dependency.rdd)
+  }).sum
+
+  "partitionBy" should {
+    "put the rows with equal keys in the partition of the key, and remember the partitioning" in {
+      val frame = new Frame(sparkContext.parallelize(clicks, 3), clickSchema)
+      frame.partitioning shouldBe None
+      frame.partitionBy(List("user"), 5)
+
+      val partitioning = FramePartitioning(List("user"), 5)
+      frame.partitioning shouldBe Some(partitioning)
+      frame.rdd.partitions.length shouldBe 5
+      frame.rdd.mapPartitionsWithIndex((index, rows) => rows.map(row => (index, row.get(0)))).collect().foreach {
+        case (index, user) => index shouldBe partitioning.partitionOf(Seq(user))
+      }
+      frame.rowCount() shouldBe clicks.size
+
+      frame.dropColumns(List("page"))
+      frame.partitioning shouldBe None
+    }
+  }
+
+  "joins of co-partitioned frames" should {
+    "give the same results as the shuffle joins, without shuffling again" in {
+      def partitionedFrames(numClickPartitions: Int, numUserPartitions: Int) = {
+        val clickFrame = new Frame(sparkContext.parallelize(clicks, 3), clickSchema)
+        val userFrame = new Frame(sparkContext.parallelize(users, 2), userSchema)
+        clickFrame.partitionBy(List("user"), numClickPartitions)
+        userFrame.partitionBy(List("id"), numUserPartitions)
+        (clickFrame, userFrame)
+      }
+      val (clickFrame, userFrame) = partitionedFrames(4, 4)
+      val plainClicks = new Frame(sparkContext.parallelize(clicks, 3), clickSchema)
+      val plainUsers = new Frame(sparkContext.parallelize(users, 2), userSchema)
+
+      val joins = Seq(
+        (clickFrame.joinInner(userFrame, List("user"), Some(List("id"))), plainClicks.joinInner(plainUsers, List("user"), Some(List("id")))),
+        (clickFrame.joinLeft(userFrame, List("user"), Some(List("id"))), plainClicks.joinLeft(plainUsers, List("user"), Some(List("id")))),
+        (clickFrame.joinRight(userFrame, List("user"), Some(List("id"))), plainClicks.joinRight(plainUsers, List("user"), Some(List("id")))),
+        (clickFrame.joinOuter(userFrame, List("user"), Some(List("id"))), plainClicks.joinOuter(plainUsers, List("user"), Some(List("id")))))
+
+      for ((coPartitionedJoin, shuffleJoin) <- joins) {
+        coPartitionedJoin.schema shouldBe shuffleJoin.schema
+        coPartitionedJoin.rdd.collect() should contain theSameElementsAs shuffleJoin.rdd.collect()
+        // only the shuffles of partitionBy
+        shuffles(coPartitionedJoin.rdd) shouldBe 2
+      }
+
+      // frames with different numbers of partitions are joined with a shuffle
+      val (otherClicks, otherUsers) = partitionedFrames(4, 3)
+      val shuffled = otherClicks.joinInner(otherUsers, List("user"), Some(List("id")))
+      shuffled.rdd.collect() should contain theSameElementsAs joins.head._2.rdd.collect()
+      shuffles(shuffled.rdd) should be > 2
+    }
+  }
+
+  "group by and drop duplicates of a partitioned frame" should {
+    "work within the partitions when the columns include the partitioning columns" in {
+      val frame = new Frame(sparkContext.parallelize(clicks, 3), clickSchema)
+      val plainFrame = new Frame(sparkContext.parallelize(clicks, 3), clickSchema)
+      frame.partitionBy(List("user"), 4)
+
+      val aggregations = List(GroupByAggregationArgs("COUNT", "page", "page_COUNT"),
+        GroupByAggregationArgs("COUNT_DISTINCT", "page", "page_COUNT_DISTINCT"),
+        GroupByAggregationArgs("MIN", "page", "page_MIN"))
+      for (groupByColumns <- Seq(List("user"), List("page", "user"))) {
+        val grouped = frame.groupBy(groupByColumns, aggregations)
+        val expected = plainFrame.groupBy(groupByColumns, aggregations)
+        grouped.schema shouldBe expected.schema
+        grouped.rdd.collect() should contain theSameElementsAs expected.rdd.collect()
+        shuffles(grouped.rdd) shouldBe 1
+      }
+
+      frame.dropDuplicates(Some(Seq("user")))
+      plainFrame.dropDuplicates(Some(Seq("user")))
+      frame.rdd.collect().map(_.get(0)) should contain theSameElementsAs plainFrame.rdd.collect().map(_.get(0))
+      shuffles(frame.rdd) shouldBe 1
+      frame.partitioning shouldBe Some(FramePartitioning(List("user"), 4))
+    }
+  }
+
+  "a saved partitioned frame" should {
+    "be loaded with its partitioning, as long as the partitioning columns are loaded" in {
+      val frame = new Frame(sparkContext.parallelize(clicks, 3), clickSchema)
+      frame.partitionBy(List("user"), 5)
+      val layout = frame.rdd.mapPartitionsWithIndex((index, rows) => rows.map(row => (index, row))).collect()
+
+      val tmpDir = DirectoryUtils.createTempDirectory("frame-partition-by-test")
+      try {
+        val path = new File(tmpDir, "clicks").getAbsolutePath
+        frame.save(path)
+
+        val loaded = Frame.load(sparkContext, path)
+        loaded.partitioning shouldBe frame.partitioning
+        loaded.rdd.mapPartitionsWithIndex((index, rows) => rows.map(row => (index, row))).collect() should contain theSameElementsAs layout
+
+        Frame.load(sparkContext, path, None, Some("page = 'page1'")).partitioning shouldBe frame.partitioning
+        Frame.load(sparkContext, path, Some(Seq("page"))).partitioning shouldBe None
+      }
+      finally {
+        DirectoryUtils.deleteTempDirectory(tmpDir)
+      }
+    }
+  }
+}
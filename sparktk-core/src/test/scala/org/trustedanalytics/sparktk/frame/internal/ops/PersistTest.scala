@@ -0,0 +1,69 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal.ops
+
+import org.scalatest.Matchers
+import org.trustedanalytics.sparktk.frame.{ Frame, Column, DataTypes, FrameSchema }
+import org.trustedanalytics.sparktk.frame.internal.FrameCache
+import org.trustedanalytics.sparktk.frame.internal.rdd.FrameRdd
+import org.trustedanalytics.sparktk.testutils.TestingSparkContextWordSpec
+
+class PersistTest extends TestingSparkContextWordSpec with Matchers {
+
+  "frame persist" should {
+    "cache the frame's rdd and report it" in {
+      val schema = FrameSchema(Vector(Column("num", DataTypes.int32)))
+      val rows = FrameRdd.toRowRDD(schema, sparkContext.parallelize((1 to 100).map(i => Array[Any](i)), 4))
+      val frame = new Frame(rows, schema)
+
+      frame.isCached shouldBe false
+      frame.persist("MEMORY_ONLY")
+      frame.isCached shouldBe true
+      frame.rowCount() shouldBe 100
+
+      val info = FrameCache.report(sparkContext).find(_.rddId == frame.rdd.id).get
+      info.numPartitions shouldBe 4
+      info.numCachedPartitions shouldBe 4
+      info.memorySize should be > 0L
+
+      frame.unpersist()
+      frame.isCached shouldBe false
+      FrameCache.report(sparkContext).exists(_.rddId == frame.rdd.id) shouldBe false
+    }
+
+    "change the storage level of a persisted frame" in {
+      val schema = FrameSchema(Vector(Column("num", DataTypes.int32)))
+      val rows = FrameRdd.toRowRDD(schema, sparkContext.parallelize((1 to 10).map(i => Array[Any](i))))
+      val frame = new Frame(rows, schema)
+
+      frame.persist("MEMORY_ONLY")
+      frame.persist("DISK_ONLY")
+      frame.rdd.getStorageLevel.useDisk shouldBe true
+      frame.rdd.getStorageLevel.useMemory shouldBe false
+      frame.unpersist()
+    }
+
+    "reject an invalid storage level" in {
+      val schema = FrameSchema(Vector(Column("num", DataTypes.int32)))
+      val rows = FrameRdd.toRowRDD(schema, sparkContext.parallelize((1 to 10).map(i => Array[Any](i))))
+      val frame = new Frame(rows, schema)
+
+      intercept[IllegalArgumentException] {
+        frame.persist("NOT_A_LEVEL")
+      }
+    }
+  }
+}
@@ -0,0 +1,106 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal.ops
+
+import java.io.File
+
+import org.apache.spark.sql.Row
+import org.scalatest.Matchers
+import org.trustedanalytics.sparktk.frame.{ Column, DataTypes, Frame, FrameSchema }
+import org.trustedanalytics.sparktk.testutils.{ DirectoryUtils, TestingSparkContextWordSpec }
+
+class SaveLoadTest extends TestingSparkContextWordSpec with Matchers {
+
+  "Frame load" should {
+
+    "read only the requested columns and the rows which satisfy the where condition" in {
+      val schema = FrameSchema(Vector(
+        Column("name", DataTypes.string),
+        Column("age", DataTypes.int32),
+        Column("tenure", DataTypes.int32)))
+      val rows = List(Row("Fred", 39, 16), Row("Susan", 33, 3), Row("Thurston", 65, 26), Row("Judy", 44, 14))
+      val frame = new Frame(sparkContext.parallelize(rows, 2), schema)
+
+      val tmpDir = DirectoryUtils.createTempDirectory("frame-load-test")
+      try {
+        val path = new File(tmpDir, "people").getAbsolutePath
+        frame.save(path)
+
+        val loaded = Frame.load(sparkContext, path, Some(Seq("name")), Some("age > 35 AND tenure < 20"))
+        loaded.schema.columnNames.toList shouldBe List("name")
+        loaded.take(10).map(_.getString(0)).sorted shouldBe Array("Fred", "Judy")
+
+        val all = Frame.load(sparkContext, path)
+        all.schema.columnNames.toList shouldBe List("name", "age", "tenure")
+        all.rowCount() shouldBe 4
+      }
+      finally {
+        DirectoryUtils.deleteTempDirectory(tmpDir)
+      }
+    }
+  }
+
+  "Frame save" should {
+
+    "gather statistics which the saved and loaded frames answer from, until they are transformed" in {
+      val schema = FrameSchema(Vector(
+        Column("name", DataTypes.string),
+        Column("score", DataTypes.float64)))
+      val rows = List(Row("a", 1.0), Row("b", 2.0), Row("c", null), Row("d", 5.0), Row("a", 8.0))
+      val frame = new Frame(sparkContext.parallelize(rows, 2), schema)
+      frame.statistics shouldBe None
+      val expected = frame.columnSummaryStatistics("score", None)
+
+      val tmpDir = DirectoryUtils.createTempDirectory("frame-statistics-test")
+      try {
+        val path = new File(tmpDir, "scores").getAbsolutePath
+        frame.save(path)
+
+        val catalog = frame.statistics.get
+        catalog.rowCount shouldBe 5
+        val name = catalog.column("name").get
+        name.nullCount shouldBe 0
+        name.approxDistinctCount.get shouldBe 4L +- 1L
+        name.numeric shouldBe None
+        val score = catalog.column("score").get.numeric.get
+        catalog.column("score").get.nullCount shouldBe 1
+        score.validCount shouldBe 4
+        score.badCount shouldBe 1
+        score.minimum shouldBe Some(1.0)
+        score.maximum shouldBe Some(8.0)
+        score.percentiles.length shouldBe 101
+
+        val answered = frame.columnSummaryStatistics("score", None)
+        answered.copy(geometricMean = expected.geometricMean) shouldBe expected
+        answered.geometricMean shouldBe expected.geometricMean +- 1e-9
+
+        val loaded = Frame.load(sparkContext, path)
+        loaded.statistics.map(_.rowCount) shouldBe Some(5)
+        loaded.rowCount() shouldBe 5
+        loaded.columnSummaryStatistics("score", None).mean shouldBe expected.mean
+        Frame.load(sparkContext, path, Some(Seq("score"))).statistics.get.columns.map(_.name) shouldBe List("score")
+        Frame.load(sparkContext, path, None, Some("score > 1")).statistics shouldBe None
+
+        loaded.dropRows(row => row.getString(0) == "a")
+        loaded.statistics shouldBe None
+        loaded.rowCount() shouldBe 3
+      }
+      finally {
+        DirectoryUtils.deleteTempDirectory(tmpDir)
+      }
+    }
+  }
+}
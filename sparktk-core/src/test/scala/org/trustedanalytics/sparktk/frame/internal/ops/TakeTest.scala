@@ -0,0 +1,70 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal.ops
+
+import net.razorvine.pickle.Unpickler
+import org.apache.spark.sql.Row
+import org.scalatest.Matchers
+import org.trustedanalytics.sparktk.frame.{ Frame, Column, DataTypes, FrameSchema }
+import org.trustedanalytics.sparktk.frame.internal.rdd.{ ColumnarBatch, FrameRdd }
+import org.trustedanalytics.sparktk.testutils.TestingSparkContextWordSpec
+
+class TakeTest extends TestingSparkContextWordSpec with Matchers {
+
+  "Take.partitionRanges" should {
+    "find the partitions overlapping the requested rows" in {
+      val counts = Array(10L, 0L, 5L, 20L)
+      Take.partitionRanges(counts, 0, 3) shouldBe Map(0 -> (0, 3))
+      Take.partitionRanges(counts, 8, 5) shouldBe Map(0 -> (8, 10), 2 -> (0, 3))
+      Take.partitionRanges(counts, 12, 100) shouldBe Map(2 -> (2, 5), 3 -> (0, 20))
+      Take.partitionRanges(counts, 35, 5) shouldBe Map()
+    }
+  }
+
+  "frame take" should {
+    val schema = FrameSchema(Vector(Column("num", DataTypes.int32), Column("name", DataTypes.string)))
+
+    "take from an offset across partitions" in {
+      val rows = FrameRdd.toRowRDD(schema, sparkContext.parallelize((0 until 100).map(i => Array[Any](i, s"row$i")), 7))
+      val frame = new Frame(rows, schema)
+
+      frame.take(5, 48).map(_.getInt(0)) shouldBe Array(48, 49, 50, 51, 52)
+      frame.take(10, 95).map(_.getInt(0)) shouldBe Array(95, 96, 97, 98, 99)
+      frame.take(10, 100) shouldBe empty
+    }
+
+    "take selected columns from an offset" in {
+      val rows = FrameRdd.toRowRDD(schema, sparkContext.parallelize((0 until 20).map(i => Array[Any](i, s"row$i")), 3))
+      val frame = new Frame(rows, schema)
+
+      val result = frame.take(2, 9, Some(Seq("name")))
+      result.map(_.length) shouldBe Array(1, 1)
+      result.map(_.getString(0)) shouldBe Array("row9", "row10")
+    }
+
+    "send cells which do not match the column type to Python as nulls" in {
+      val rows = sparkContext.parallelize(Seq(Row(1, "a"), Row("not a number", "b"), Row(3L, 4)), 2)
+      val frame = new Frame(rows, schema)
+      val expected = List(Seq(1, "a"), Seq(null, "b"), Seq(3, "4"))
+
+      def fromPython(pickled: Array[Byte]) = {
+        ColumnarBatch.decode(Iterator(new Unpickler().loads(pickled)), schema).map(_.toSeq).toList
+      }
+      fromPython(frame.takePython(3, 0, None)) shouldBe expected
+      fromPython(frame.collectPython(None)) shouldBe expected
+    }
+  }
+}
@@ -264,4 +264,20 @@ class CumulativeDistTest extends TestingSparkContextWordSpec with Matchers {
       assert(result === Array(0.0, 1.0, 7.0, 30.0, 50.0, 100.0, 0.0))
     }
   }
+
+  "cumulative functions" should {
+    "follow the existing row order across uneven and empty partitions" in {
+      val values = (1 to 100).map(i => (i * 7 % 11).toDouble)
+      // more partitions than rows, so some partitions are empty
+      val rdd = sparkContext.parallelize(values.map(v => Row(v.toInt)), 128)
+      val frame = new FrameRdd(FrameSchema(Vector(Column("v", DataTypes.int32))), rdd)
+      val runningSums = values.scanLeft(0.0)(_ + _).tail
+
+      CumulativeDistFunctions.cumulativeSum(frame, "v").collect().map(_.getDouble(1)) shouldBe runningSums.toArray
+      CumulativeDistFunctions.cumulativePercentSum(frame, "v").collect().map(_.getDouble(1)) shouldBe
+        runningSums.map(_ / values.sum).toArray
+      CumulativeDistFunctions.cumulativeCount(frame, "v", "0").collect().map(_.getDouble(1)) shouldBe
+        values.scanLeft(0.0)((count, v) => if (v == 0) count + 1 else count).tail.toArray
+    }
+  }
 }
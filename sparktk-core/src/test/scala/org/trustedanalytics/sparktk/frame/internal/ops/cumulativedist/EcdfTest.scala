@@ -96,6 +96,14 @@ class EcdfTest extends TestingSparkContextWordSpec with Matchers {
       resultThree.apply(3) shouldBe Row(1, 0.8)
       resultThree.apply(4) shouldBe Row(2, 1.0)
     }
-  }
 
+    "compute the exact ecdf when approximating a sample smaller than the sketch" in {
+      val colA = Column("a", DataTypes.int32)
+      val schema = FrameSchema(Vector(colA))
+      val frameRdd = new FrameRdd(schema, sparkContext.parallelize(sampleTwoList, 2))
+
+      CumulativeDistFunctions.approximateEcdf(frameRdd, colA, 0.01) shouldBe
+        List(Row(0, 0.5), Row(4, 0.625), Row(5, 0.75), Row(6, 0.875), Row(7, 1.0))
+    }
+  }
 }
@@ -0,0 +1,81 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal.ops.groupby
+
+import org.apache.spark.sql.Row
+import org.scalatest.Matchers
+import org.trustedanalytics.sparktk.frame.{ Column, DataTypes, FrameSchema }
+import org.trustedanalytics.sparktk.frame.internal.rdd.FrameRdd
+import org.trustedanalytics.sparktk.testutils.TestingSparkContextWordSpec
+
+class GroupByAggregationHelperTest extends TestingSparkContextWordSpec with Matchers {
+
+  val schema = FrameSchema(Vector(Column("key", DataTypes.string),
+    Column("i", DataTypes.int32),
+    Column("d", DataTypes.float64),
+    Column("s", DataTypes.string)))
+
+  val rows = List(
+    Row("a", 1, 1.5, "x"),
+    Row("a", 3, Double.NaN, "y"),
+    Row("a", null, 2.5, null),
+    Row("b", 7, null, "z"),
+    Row("b", null, null, null),
+    Row(null, 2, 4.0, "w"),
+    Row(null, 4, 6.0, "v"))
+
+  val aggregations = for {
+    (function, columnName) <- List(("COUNT", "i"), ("SUM", "i"), ("SUM", "d"), ("AVG", "i"), ("AVG", "d"),
+      ("VAR", "i"), ("VAR", "d"), ("STDEV", "d"), ("MIN", "i"), ("MAX", "d"), ("MIN", "s"), ("MAX", "s"))
+  } yield GroupByAggregationArgs(function, columnName, s"${columnName}_$function")
+
+  def collectByKey(frameRdd: FrameRdd): Map[Any, Seq[Any]] = {
+    frameRdd.collect().map(row => (row.get(0), row.toSeq.tail)).toMap
+  }
+
+  "GroupByAggregationHelper" should {
+    "aggregate with Spark SQL when the columns and functions allow it" in {
+      val frameRdd = new FrameRdd(schema, sparkContext.parallelize(rows, 2))
+      val groupByColumns = List(schema.column("key"))
+      GroupByAggregationHelper.supportsSqlAggregation(schema, groupByColumns, aggregations) shouldBe true
+      GroupByAggregationHelper.supportsSqlAggregation(schema, groupByColumns,
+        List(GroupByAggregationArgs("COUNT_DISTINCT", "i", "i_COUNT_DISTINCT"))) shouldBe false
+      GroupByAggregationHelper.supportsSqlAggregation(schema, groupByColumns,
+        List(GroupByAggregationArgs("HISTOGRAM={\"cutoffs\": [0, 5, 10]}", "i", "i_HISTOGRAM"))) shouldBe false
+    }
+
+    "compute the same results with Spark SQL as with the custom aggregators" in {
+      val frameRdd = new FrameRdd(schema, sparkContext.parallelize(rows, 2))
+      val groupByColumns = List(schema.column("key"))
+
+      val sqlFrame = GroupByAggregationHelper.sqlAggregation(frameRdd, groupByColumns, aggregations)
+      val rddFrame = GroupByAggregationHelper.rddAggregation(frameRdd, groupByColumns, aggregations)
+      sqlFrame.frameSchema shouldBe rddFrame.frameSchema
+
+      val sqlResults = collectByKey(sqlFrame)
+      val rddResults = collectByKey(rddFrame)
+      sqlResults.keySet shouldBe Set("a", "b", null)
+      sqlResults.keySet shouldBe rddResults.keySet
+      for (key <- rddResults.keys; (expected, actual) <- rddResults(key).zip(sqlResults(key))) {
+        (expected, actual) match {
+          case (e: Double, a: Double) if e.isNaN => a.isNaN shouldBe true
+          case (e: Double, a: Double) => a shouldBe e +- 1e-9
+          case _ => actual shouldBe expected
+        }
+      }
+    }
+  }
+}
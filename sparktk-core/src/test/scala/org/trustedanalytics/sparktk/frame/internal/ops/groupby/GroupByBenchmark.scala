@@ -0,0 +1,75 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal.ops.groupby
+
+import org.apache.spark.sql.Row
+import org.apache.spark.storage.StorageLevel
+import org.apache.spark.{ SparkConf, SparkContext }
+import org.trustedanalytics.sparktk.frame.{ Column, DataTypes, FrameSchema }
+import org.trustedanalytics.sparktk.frame.internal.rdd.FrameRdd
+
+/**
+ * Benchmark of group-by aggregation with Spark SQL against the custom aggregators.
+ *
+ * Not a test, run it with the test classpath, for example
+ * {{{
+ *   spark-submit --class org.trustedanalytics.sparktk.frame.internal.ops.groupby.GroupByBenchmark \
+ *     <sparktk-core test jar> [rows] [groups] [partitions]
+ * }}}
+ * The default is 100M rows in 1M groups.  The rows are generated and persisted before either path is timed.
+ */
+object GroupByBenchmark {
+
+  val schema = FrameSchema(Vector(Column("key", DataTypes.int64),
+    Column("count", DataTypes.int32),
+    Column("amount", DataTypes.float64)))
+
+  val aggregations = for {
+    (function, columnName) <- List(("COUNT", "count"), ("SUM", "count"), ("AVG", "amount"), ("MIN", "amount"),
+      ("MAX", "amount"), ("STDEV", "amount"))
+  } yield GroupByAggregationArgs(function, columnName, s"${columnName}_$function")
+
+  def main(args: Array[String]): Unit = {
+    val rowCount = if (args.length > 0) args(0).toLong else 100000000L
+    val groupCount = if (args.length > 1) args(1).toLong else 1000000L
+
+    val sparkContext = new SparkContext(new SparkConf().setAppName("GroupByBenchmark"))
+    val partitions = if (args.length > 2) args(2).toInt else sparkContext.defaultParallelism
+
+    val rows = sparkContext.range(0, rowCount, 1, partitions).map(i => {
+      val hash = i * 0x9E3779B97F4A7C15L
+      Row(math.abs(hash % groupCount), (i % 100).toInt, (hash >>> 11) * 1.0 / (1L << 53))
+    }).persist(StorageLevel.MEMORY_AND_DISK_SER)
+    rows.count()
+
+    val frameRdd = new FrameRdd(schema, rows)
+    val groupByColumns = List(schema.column("key"))
+    println(s"group by over $rowCount rows in $groupCount groups, $partitions partitions")
+    for (round <- 1 to 2) {
+      time(s"round $round, custom aggregators", GroupByAggregationHelper.rddAggregation(frameRdd, groupByColumns, aggregations).count())
+      time(s"round $round, Spark SQL", GroupByAggregationHelper.sqlAggregation(frameRdd, groupByColumns, aggregations).count())
+    }
+
+    rows.unpersist()
+    sparkContext.stop()
+  }
+
+  private def time(name: String, run: => Long): Unit = {
+    val start = System.nanoTime()
+    val groups = run
+    println(f"$name%-40s ${(System.nanoTime() - start) / 1e9}%8.2f s ($groups groups)")
+  }
+}
@@ -0,0 +1,55 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal.ops.join
+
+import org.scalatest.{ Matchers, WordSpec }
+
+class BloomFilterTest extends WordSpec with Matchers {
+
+  "BloomFilter" should {
+
+    "contain every key added to it, after merging" in {
+      val keys = (0 until 20000).map(i => Seq(i, s"key$i"))
+      val merged = keys.grouped(5000).map(group => {
+        val filter = BloomFilter(keys.size, 0.01)
+        group.foreach(filter.add)
+        filter
+      }).reduce(_ merge _)
+
+      keys.forall(merged.mightContain) shouldBe true
+    }
+
+    "report few keys which were not added" in {
+      val filter = BloomFilter(10000, 0.01)
+      (0 until 10000).foreach(i => filter.add(Seq(i)))
+
+      val falsePositives = (10000 until 110000).count(i => filter.mightContain(Seq(i)))
+      falsePositives should be < 2000
+    }
+
+    "find integer keys of other widths with the same values" in {
+      val filter = BloomFilter(100, 0.01)
+      filter.add(Seq[Any](7, 2.5))
+      filter.mightContain(Seq[Any](7L, 2.5f)) shouldBe true
+    }
+
+    "only merge filters of the same size" in {
+      intercept[IllegalArgumentException] {
+        BloomFilter(100, 0.01).merge(BloomFilter(100000, 0.01))
+      }
+    }
+  }
+}
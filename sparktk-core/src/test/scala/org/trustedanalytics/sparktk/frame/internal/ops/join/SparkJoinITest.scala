@@ -18,7 +18,8 @@ package org.trustedanalytics.sparktk.frame.internal.ops.join
 import org.apache.spark.sql.Row
 import org.apache.spark.sql.catalyst.expressions.GenericRow
 import org.scalatest.Matchers
-import org.trustedanalytics.sparktk.frame.{ Column, DataTypes, FrameSchema }
+import org.trustedanalytics.sparktk.frame.{ Column, DataTypes, Frame, FrameSchema }
+import org.trustedanalytics.sparktk.frame.internal.FrameStatisticsCatalog
 import org.trustedanalytics.sparktk.testutils.TestingSparkContextWordSpec
 import org.trustedanalytics.sparktk.frame.internal.rdd.FrameRdd
 
@@ -587,4 +588,130 @@ class SparkJoinITest extends TestingSparkContextWordSpec with Matchers {
     }
   }
 
+  "skew joins" should {
+    "give the same results as the plain joins, with hot keys on either side" in {
+      // key 0 holds most of the rows of the clicks, key 1 most of the users; keys 2000 and up only have clicks
+      val clicks = new FrameRdd(FrameSchema(Vector(Column("user", DataTypes.int32), Column("click", DataTypes.int32))),
+        sparkContext.parallelize((0 until 3000).map(i => Row(if (i < 2000) 0 else i % 2500, i)) :+ Row(null, -1), 4))
+      val users = new FrameRdd(FrameSchema(Vector(Column("id", DataTypes.int32), Column("name", DataTypes.str))),
+        sparkContext.parallelize((0 until 600).map(i => Row(if (i < 500) 1 else i, s"user$i")) :+ Row(0, "hot"), 3))
+
+      // the same clicks, with the join column named as in the users
+      val visits = new FrameRdd(FrameSchema(Vector(Column("id", DataTypes.int32), Column("click", DataTypes.int32))), clicks)
+
+      // the test context has 2 shuffle partitions, under which no key holds more than twice the average rows
+      val shufflePartitions = Some(20)
+      SkewJoinRddFunctions.findHotKeys(RddJoinParam(clicks, Seq("user")), shufflePartitions)._2.keySet shouldBe Set("0")
+      SkewJoinRddFunctions.findHotKeys(RddJoinParam(users, Seq("id")), shufflePartitions)._2.keySet shouldBe Set("1")
+
+      // (users, clicks) salts the larger right frame of the inner join
+      for ((left, right) <- Seq((clicks, users), (users, clicks), (visits, users))) {
+        val leftParam = RddJoinParam(left, Seq(left.frameSchema.columnNames.head))
+        val rightParam = RddJoinParam(right, Seq(right.frameSchema.columnNames.head))
+
+        val joins = Seq(
+          (SkewJoinRddFunctions.innerJoin(leftParam, rightParam, shufflePartitions),
+            JoinRddFunctions.innerJoin(leftParam, rightParam, None)),
+          (SkewJoinRddFunctions.leftJoin(leftParam, rightParam, shufflePartitions),
+            JoinRddFunctions.leftJoin(leftParam, rightParam, useBroadcastRight = false)),
+          (SkewJoinRddFunctions.rightJoin(leftParam, rightParam, shufflePartitions),
+            JoinRddFunctions.rightJoin(leftParam, rightParam, useBroadcastLeft = false)),
+          (SkewJoinRddFunctions.outerJoin(leftParam, rightParam, shufflePartitions),
+            JoinRddFunctions.outerJoin(leftParam, rightParam)))
+
+        for ((skewJoin, plainJoin) <- joins) {
+          skewJoin.frameSchema shouldBe plainJoin.frameSchema
+          skewJoin.collect() should contain theSameElementsAs plainJoin.collect()
+        }
+      }
+    }
+  }
+
+  "auto broadcast joins" should {
+    "broadcast the smaller side when it is under the threshold" in {
+      val codes = sparkContext.parallelize(idCountryCodes)
+      val many = sparkContext.parallelize((0 until 10000).map(i => Row(i, s"name$i", "x")), 4)
+
+      val small = BroadcastJoinPlanner.decide("inner", (codes, None), (many, None), 1024 * 1024)
+      small.broadcastSide shouldBe Some("left")
+      small.explain should startWith("inner join: broadcast left")
+
+      BroadcastJoinPlanner.decide("inner", (many, None), (codes, None), 1024 * 1024).broadcastSide shouldBe Some("right")
+      BroadcastJoinPlanner.decide("inner", (codes, None), (many, None), -1).broadcastSide shouldBe None
+
+      val large = BroadcastJoinPlanner.decide("inner", (codes, None), (many, None), 10)
+      large.broadcastSide shouldBe None
+      large.explain should include("over threshold")
+    }
+
+    "only broadcast a side whose rows are not all kept" in {
+      val codes = sparkContext.parallelize(idCountryCodes)
+      val names = sparkContext.parallelize(idCountryNames)
+      val maxBytes = 1024 * 1024
+
+      BroadcastJoinPlanner.decide("left", (codes, None), (names, None), maxBytes).broadcastSide shouldBe Some("right")
+      BroadcastJoinPlanner.decide("right", (codes, None), (names, None), maxBytes).broadcastSide shouldBe Some("left")
+      BroadcastJoinPlanner.decide("outer", (codes, None), (names, None), maxBytes).broadcastSide shouldBe None
+    }
+
+    "estimate sizes from the cache, the saved statistics or the sampled partitions" in {
+      val rdd = sparkContext.parallelize((0 until 8000).map(i => Row(i, s"name$i")), 16)
+
+      val sampled = BroadcastJoinPlanner.estimateSize(rdd, None)
+      sampled.source should include("~8000 rows")
+
+      val saved = BroadcastJoinPlanner.estimateSize(rdd, Some(FrameStatisticsCatalog(80000, Nil)))
+      saved.bytes should be > 5 * sampled.bytes
+
+      val cachedRdd = rdd.cache()
+      cachedRdd.count()
+      BroadcastJoinPlanner.estimateSize(cachedRdd, None).source shouldBe "cached"
+      cachedRdd.unpersist()
+    }
+
+    "give the same results as the explicit broadcast joins" in {
+      val countryCode = new Frame(sparkContext.parallelize(idCountryCodes), codeSchema)
+      val countryNames = new Frame(sparkContext.parallelize(idCountryNames), countrySchema)
+
+      val autoJoin = countryCode.joinInner(countryNames, List("col_0"), useBroadcast = Some("auto"))
+      val broadcastJoin = countryCode.joinInner(countryNames, List("col_0"), useBroadcast = Some("left"))
+      autoJoin.rdd.collect() should contain theSameElementsAs broadcastJoin.rdd.collect()
+
+      val autoLeftJoin = countryCode.joinLeft(countryNames, List("col_0"), autoBroadcast = true)
+      val broadcastLeftJoin = countryCode.joinLeft(countryNames, List("col_0"), useBroadcastRight = true)
+      autoLeftJoin.rdd.collect() should contain theSameElementsAs broadcastLeftJoin.rdd.collect()
+
+      countryCode.explainJoin(countryNames) should startWith("inner join: broadcast")
+    }
+  }
+
+  "bloom filter joins" should {
+    "give the same results as the plain joins" in {
+      val countryCode = new Frame(sparkContext.parallelize(idCountryCodes), codeSchema)
+      val countryNames = new Frame(sparkContext.parallelize(idCountryNames), countrySchema)
+
+      countryCode.joinInner(countryNames, List("col_0"), bloomFilter = true).rdd.collect() should
+        contain theSameElementsAs countryCode.joinInner(countryNames, List("col_0")).rdd.collect()
+      countryCode.joinLeft(countryNames, List("col_0"), bloomFilter = true).rdd.collect() should
+        contain theSameElementsAs countryCode.joinLeft(countryNames, List("col_0")).rdd.collect()
+      countryCode.joinRight(countryNames, List("col_0"), bloomFilter = true).rdd.collect() should
+        contain theSameElementsAs countryCode.joinRight(countryNames, List("col_0")).rdd.collect()
+    }
+
+    "drop the rows of the larger frame which cannot match" in {
+      val facts = new FrameRdd(codeSchema, sparkContext.parallelize((0 until 5000).map(i => Row(i, i + 1, s"row$i")), 4))
+      val dimension = new FrameRdd(countrySchema, sparkContext.parallelize(idCountryNames))
+
+      val (filteredFacts, filteredDimension) = BloomFilterJoinRddFunctions.prefilterInner(
+        RddJoinParam(facts, Seq("col_0")),
+        RddJoinParam(dimension, Seq("col_0")),
+        (facts, None),
+        (dimension, None))
+
+      filteredDimension.frame shouldBe dimension
+      val keptKeys = filteredFacts.frame.map(_.getInt(0)).collect()
+      keptKeys.length should be < 100
+      idCountryNames.map(_.getInt(0)).forall(keptKeys.contains) shouldBe true
+    }
+  }
 }
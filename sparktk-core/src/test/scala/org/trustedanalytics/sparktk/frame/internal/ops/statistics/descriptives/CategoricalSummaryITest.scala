@@ -15,8 +15,13 @@
  */
 package org.trustedanalytics.sparktk.frame.internal.ops.statistics.descriptives
 
+import org.apache.spark.sql.Row
 import org.scalatest.Matchers
+import org.trustedanalytics.sparktk.frame.{ Column, DataTypes, FrameSchema }
+import org.trustedanalytics.sparktk.frame.internal.rdd.FrameRdd
 import org.trustedanalytics.sparktk.testutils.TestingSparkContextWordSpec
+
+import scala.util.Random
 /**
  * Exercises the categorical summary functions. Primarily checks that correct column indices and options are piped
  * through to the underlying statistics engines. Thorough evaluation of the statistical operations is done by the
@@ -79,4 +84,40 @@ class CategoricalSummaryITest extends TestingSparkContextWordSpec with Matchers
       CategoricalSummaryFunctions.getMissingCategoryLevel(rowRDD) shouldBe LevelData("<Missing>", 2, 0.2)
     }
   }
+
+  "getSummaryStatistics" should {
+    "summarize several columns with the levels of an exact count" in {
+      val random = new Random(3)
+      // a skewed column with far more levels than its sketch keeps, and a column with few levels
+      val rows = (0 until 20000).map(i => {
+        val skewed = if (i % 10 == 0) "" else if (i % 2 == 0) s"unique$i" else (math.abs(random.nextGaussian()) * 50).toInt.toString
+        Row(skewed, (i % 7).toString)
+      })
+      val schema = FrameSchema(Vector(Column("skewed", DataTypes.string), Column("few", DataTypes.string)))
+      val frameRdd = new FrameRdd(schema, sparkContext.parallelize(rows, 4))
+
+      val pruning: Seq[(Option[Int], Option[Double])] = Seq((Some(5), None), (None, Some(0.001)), (Some(3), Some(0.1)), (None, Some(0.0)))
+      for ((topK, threshold) <- pruning) {
+        val summaries = CategoricalSummaryFunctions.getSummaryStatistics(frameRdd,
+          Seq("skewed", "few"),
+          Seq(topK, topK),
+          Seq(threshold, threshold),
+          10,
+          0.0)
+
+        summaries.map(_.column) shouldBe Array("skewed", "few")
+        summaries.zipWithIndex.foreach {
+          case (summary, column) =>
+            implicit val rowCount: Double = rows.size
+            val levelCounts = rows.map(_.getString(column)).filter(_ != "").groupBy(identity).mapValues(_.size).toSeq
+            val expected = CategoricalSummaryFunctions.pruneLevels(levelCounts, topK, threshold)
+              .map(elem => LevelData(elem._3, elem._1, elem._2)).toList
+            val missingCount = rows.count(_.getString(column) == "")
+            summary.levels.toList shouldBe expected :+
+              LevelData("<Missing>", missingCount, missingCount / rowCount) :+
+              CategoricalSummaryFunctions.getOtherCategoryLevel(expected, missingCount)
+        }
+      }
+    }
+  }
 }
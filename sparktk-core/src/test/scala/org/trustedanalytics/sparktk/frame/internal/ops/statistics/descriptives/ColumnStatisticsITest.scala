@@ -79,6 +79,40 @@ class ColumnStatisticsITest extends TestingSparkContextWordSpec with Matchers {
     }
   }
 
+  "ColumnStatistics.columnsSummaryStatistics" should {
+    "match the single column summary statistics of each column" in new ColumnStatisticsTest() {
+      val columns = Seq((2, DataTypes.float32), (3, DataTypes.int32), (5, DataTypes.float32))
+
+      for (weights <- Seq(None, Some((4, DataTypes.int32)))) {
+        val stats = ColumnStatistics.columnsSummaryStatistics(columns.map(_._1),
+          columns.map(_._2),
+          weights.map(_._1),
+          weights.map(_._2),
+          rowRDD,
+          usePopulationVariance = false)
+
+        stats.size shouldBe columns.size
+        columns.zip(stats).foreach {
+          case ((index, dataType), multiColumnStats) =>
+            val singleColumnStats = ColumnStatistics.columnSummaryStatistics(index,
+              dataType,
+              weights.map(_._1),
+              weights.map(_._2),
+              rowRDD,
+              usePopulationVariance = false)
+
+            Math.abs(multiColumnStats.mean - singleColumnStats.mean) should be < epsilon
+            Math.abs(multiColumnStats.variance - singleColumnStats.variance) should be < epsilon
+            Math.abs(multiColumnStats.totalWeight - singleColumnStats.totalWeight) should be < epsilon
+            multiColumnStats.minimum shouldBe singleColumnStats.minimum
+            multiColumnStats.maximum shouldBe singleColumnStats.maximum
+            multiColumnStats.goodRowCount shouldBe singleColumnStats.goodRowCount
+            multiColumnStats.badRowCount shouldBe singleColumnStats.badRowCount
+        }
+      }
+    }
+  }
+
   "ColumnStatistics.columnMedian" should {
     "support unweighted float median" in new ColumnStatisticsTest() {
       val median = ColumnStatistics.columnMedian(2, DataTypes.float32, None, rowRDD)
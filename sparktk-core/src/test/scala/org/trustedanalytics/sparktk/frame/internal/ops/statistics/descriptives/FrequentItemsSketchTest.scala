@@ -0,0 +1,56 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal.ops.statistics.descriptives
+
+import org.scalatest.{ Matchers, WordSpec }
+
+import scala.util.Random
+
+class FrequentItemsSketchTest extends WordSpec with Matchers {
+
+  "FrequentItemsSketch" should {
+
+    "be exact while the items fit in its capacity" in {
+      val sketch = new FrequentItemsSketch(10)
+      Seq("a", "b", "a", "c", "a", "b").foreach(sketch.add)
+      sketch.isExact shouldBe true
+      sketch.itemCounts shouldBe Map("a" -> (3L, 3L), "b" -> (2L, 2L), "c" -> (1L, 1L))
+    }
+
+    "bound the counts of all items after merging" in {
+      val random = new Random(11)
+      val items = Array.fill(100000)((math.abs(random.nextGaussian()) * 1000).toInt.toString)
+      val merged = items.grouped(10000).map(group => {
+        val sketch = new FrequentItemsSketch(100)
+        group.foreach(sketch.add)
+        sketch
+      }).reduce(_ merge _)
+
+      merged.isExact shouldBe false
+      merged.unmonitoredBound should be <= (items.length / 100).toLong
+      val counts = items.groupBy(identity).mapValues(_.length.toLong)
+      val itemCounts = merged.itemCounts
+      counts.foreach {
+        case (item, count) => itemCounts.get(item) match {
+          case Some((upperBound, lowerBound)) =>
+            upperBound should be >= count
+            lowerBound should be <= count
+          case None => count should be <= merged.unmonitoredBound
+        }
+      }
+    }
+  }
+}
@@ -60,4 +60,23 @@ class QuantileITest extends TestingSparkContextWordSpec with Matchers {
     //    result(1) shouldBe(40, 400000)
     //  }
   }
+
+  "QuantilesFunctions.approximateQuantiles" should {
+    "return column values within the relative error of the requested ranks" in {
+      val rows = (1 to 10000).map(i => new GenericRow(Array[Any](i, "")))
+      val rdd: RDD[Row] = sparkContext.parallelize(scala.util.Random.shuffle(rows), 4)
+      val result = QuantilesFunctions.approximateQuantiles(rdd, Seq(0, 25, 50, 99, 100), 0, 0.01)
+      result(0) shouldBe 1.0
+      result(1) shouldBe 2500.0 +- 100.0
+      result(2) shouldBe 5000.0 +- 100.0
+      result(3) shouldBe 9900.0 +- 100.0
+      result(4) shouldBe 10000.0
+    }
+
+    "skip missing values and return nothing for a column without values" in {
+      val rdd: RDD[Row] = sparkContext.parallelize(List[Row](new GenericRow(Array[Any](null)), new GenericRow(Array[Any](4))), 2)
+      QuantilesFunctions.approximateQuantiles(rdd, Seq(50), 0, 0.01) shouldBe Seq(4.0)
+      QuantilesFunctions.approximateQuantiles(rdd.filter(_.get(0) == null), Seq(50), 0, 0.01) shouldBe Seq()
+    }
+  }
 }
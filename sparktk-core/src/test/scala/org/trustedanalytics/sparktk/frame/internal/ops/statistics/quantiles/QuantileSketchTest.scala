@@ -0,0 +1,61 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal.ops.statistics.quantiles
+
+import org.scalatest.{ Matchers, WordSpec }
+
+import scala.util.Random
+
+class QuantileSketchTest extends WordSpec with Matchers {
+
+  "QuantileSketch" should {
+
+    "be exact while the values fit in its capacity" in {
+      val sketch = new QuantileSketch(200)
+      (1 to 100).reverse.foreach(i => sketch.add(i.toDouble))
+      sketch.count shouldBe 100
+      sketch.quantiles(Seq(0.0, 0.5, 1.0)) shouldBe Seq(1.0, 50.0, 100.0)
+      sketch.cumulativeFraction(25.0) shouldBe 0.25
+    }
+
+    "keep the rank error within its relative error after merging" in {
+      val random = new Random(7)
+      val values = Array.fill(100000)(random.nextGaussian())
+      val sketches = values.grouped(10000).map(group => {
+        val sketch = QuantileSketch.withRelativeError(0.01)
+        group.foreach(sketch.add)
+        sketch
+      }).toList
+      val merged = sketches.reduce(_ merge _)
+      merged.count shouldBe values.length
+
+      val sorted = values.sorted
+      val targets = Seq(0.01, 0.25, 0.5, 0.75, 0.99)
+      merged.quantiles(targets).zip(targets).foreach {
+        case (value, target) =>
+          val rank = sorted.count(_ <= value).toDouble / sorted.length
+          rank shouldBe target +- 0.01
+      }
+      merged.quantiles(Seq(0.0, 1.0)) shouldBe Seq(sorted.head, sorted.last)
+    }
+
+    "guarantee the requested relative error for the sketch it sizes" in {
+      val sketch = QuantileSketch.withRelativeError(0.01)
+      QuantileSketch.relativeErrorBound(sketch.capacity, sketch.capacity - 1) shouldBe 0.0
+      QuantileSketch.relativeErrorBound(sketch.capacity, sketch.capacity.toLong << 18) should be <= 0.01
+    }
+  }
+}
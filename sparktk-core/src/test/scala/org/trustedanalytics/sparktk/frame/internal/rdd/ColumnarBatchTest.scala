@@ -0,0 +1,86 @@
+/**
+ *  Copyright (c) 2016 Intel Corporation 
+ *
+ *  Licensed under the Apache License, Version 2.0 (the "License");
+ *  you may not use this file except in compliance with the License.
+ *  You may obtain a copy of the License at
+ *
+ *       http://www.apache.org/licenses/LICENSE-2.0
+ *
+ *  Unless required by applicable law or agreed to in writing, software
+ *  distributed under the License is distributed on an "AS IS" BASIS,
+ *  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ *  See the License for the specific language governing permissions and
+ *  limitations under the License.
+ */
+package org.trustedanalytics.sparktk.frame.internal.rdd
+
+import org.apache.spark.mllib.linalg.DenseMatrix
+import org.apache.spark.sql.Row
+import net.razorvine.pickle.Unpickler
+import org.scalatest.{ Matchers, WordSpec }
+import org.trustedanalytics.sparktk.frame.{ Column, DataTypes, FrameSchema }
+
+class ColumnarBatchTest extends WordSpec with Matchers {
+
+  val schema = FrameSchema(Vector(Column("i", DataTypes.int32),
+    Column("l", DataTypes.int64),
+    Column("f", DataTypes.float32),
+    Column("d", DataTypes.float64),
+    Column("s", DataTypes.string),
+    Column("t", DataTypes.datetime),
+    Column("v", DataTypes.vector(2)),
+    Column("m", DataTypes.matrix)))
+
+  val matrix = new DenseMatrix(2, 3, Array(1.0, 4.0, 2.0, 5.0, 3.0, 6.0))
+
+  val rows = List(
+    Row(1, 10L, 1.5f, 2.5, "a", 1451606400000L, Vector(1.0, 2.0), matrix),
+    Row(null, null, null, null, null, null, null, null),
+    Row(-3, Long.MaxValue, -0.5f, Double.MaxValue, "ü", 0L, Vector(-1.0, 0.0), matrix))
+
+  "ColumnarBatch" should {
+    "round trip every data type" in {
+      val batches = ColumnarBatch.encode(rows.iterator, schema).toList
+      batches.size shouldBe 1
+      val decoded = ColumnarBatch.decode(batches.iterator, schema).toList
+      decoded.size shouldBe 3
+      decoded(0).toSeq.take(7) shouldBe rows(0).toSeq.take(7)
+      decoded(1).toSeq shouldBe rows(1).toSeq
+      decoded(2).toSeq.take(7) shouldBe rows(2).toSeq.take(7)
+      decoded(0).get(7).asInstanceOf[DenseMatrix].toArray shouldBe matrix.toArray
+    }
+
+    "write float32 columns as doubles, which is the only float type on the Python side" in {
+      val batch = ColumnarBatch.encode(rows.iterator, schema).next()
+      val payload = batch.get(3).asInstanceOf[java.util.List[Any]].get(1).asInstanceOf[Array[Byte]]
+      payload.length shouldBe 3 * 8
+    }
+
+    "pickle rows held by the driver as a single batch" in {
+      val batch = new Unpickler().loads(ColumnarBatch.pickle(rows, schema))
+      val decoded = ColumnarBatch.decode(Iterator(batch), schema).toList
+      decoded.map(_.toSeq.take(7)) shouldBe rows.map(_.toSeq.take(7))
+    }
+
+    "split partitions into batches of the requested size" in {
+      val numbers = FrameSchema(Vector(Column("n", DataTypes.int32)))
+      val batches = ColumnarBatch.encode((1 to 10).map(Row(_)).iterator, numbers, batchSize = 4).toList
+      batches.map(_.get(0)) shouldBe List(4, 4, 2)
+      ColumnarBatch.decode(batches.iterator, numbers).map(_.getInt(0)).toList shouldBe (1 to 10).toList
+    }
+
+    "turn cells which cannot be converted to the column type into nulls" in {
+      val badRows = List(Row("abc", "12", "x", "2.5", 7, "2016-01-01T00:00:00.000Z", "[1.0]", "not a matrix"))
+      val decoded = ColumnarBatch.decode(ColumnarBatch.encode(badRows.iterator, schema), schema).toList
+      decoded.map(_.toSeq) shouldBe List(Seq(null, 12L, null, 2.5, "7", 1451606400000L, null, null))
+    }
+
+    "reject batches which do not match the schema" in {
+      val batches = ColumnarBatch.encode(rows.iterator, schema).toList
+      intercept[IllegalArgumentException] {
+        ColumnarBatch.decode(batches.iterator, FrameSchema(Vector(Column("i", DataTypes.int32)))).toList
+      }
+    }
+  }
+}